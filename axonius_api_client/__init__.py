@@ -5,9 +5,11 @@ See Also:
     :obj:`connect.Connect` for creating a client for using this package.
 
 """
+import importlib
 import logging
-import sys
 import pathlib
+import sys
+import typing as t
 
 from . import setup_env, version
 
@@ -38,71 +40,102 @@ POST_DOTENV: dict = setup_env.get_env_ax()
 """AX.* env variables after loading dotenv."""
 
 # short term hack for projects until they are moved to their own repos
-try:
-    sys.path.insert(0, str(PROJECTS_PATH))
-    from .projects import cf_token, cert_human, url_parser
-
-except Exception:  # pragma: no cover
-    raise
-
-
-try:
-    # noinspection PyCompatibility
-    from . import (
-        api,
-        auth,
-        cli,
-        constants,
-        data,
-        exceptions,
-        http,
-        logs,
-        tools,
-        projects,
-    )
-
-    from .api import (
-        ActivityLogs,
-        Adapters,
-        ApiEndpoints,
-        Cnx,
-        Dashboard,
-        DashboardSpaces,
-        Devices,
-        Enforcements,
-        Instances,
-        Meta,
-        RemoteSupport,
-        Runner,
-        SettingsGlobal,
-        SettingsGui,
-        SettingsLifecycle,
-        Signup,
-        SystemRoles,
-        SystemUsers,
-        Users,
-        Vulnerabilities,
-        Wizard,
-        WizardCsv,
-        WizardText,
-        json_api,
-    )
-    from .auth import AuthApiKey, AuthCredentials, AuthModel, AuthNull
-    from .connect import Connect
-    from .features import Features
-    from .http import Http
-except Exception:  # pragma: no cover
-    raise
-
-
-LOG = logs.LOG
+sys.path.insert(0, str(PROJECTS_PATH))
+
+LAZY_MODULES: t.Tuple[str, ...] = (
+    "api",
+    "auth",
+    "caching",
+    "cli",
+    "connect",
+    "connect_async",
+    "constants",
+    "data",
+    "exceptions",
+    "features",
+    "http",
+    "logs",
+    "tools",
+    "projects",
+)
+"""sub-modules of this package that are imported on first access."""
+
+LAZY_ATTRS: t.Dict[str, str] = {
+    "ActivityLogs": "api",
+    "Adapters": "api",
+    "ApiEndpoints": "api",
+    "Cnx": "api",
+    "Dashboard": "api",
+    "DashboardSpaces": "api",
+    "Devices": "api",
+    "Enforcements": "api",
+    "Instances": "api",
+    "Meta": "api",
+    "RemoteSupport": "api",
+    "Runner": "api",
+    "SettingsGlobal": "api",
+    "SettingsGui": "api",
+    "SettingsLifecycle": "api",
+    "Signup": "api",
+    "SystemRoles": "api",
+    "SystemUsers": "api",
+    "Users": "api",
+    "Vulnerabilities": "api",
+    "Wizard": "api",
+    "WizardCsv": "api",
+    "WizardText": "api",
+    "json_api": "api",
+    "AuthApiKey": "auth",
+    "AuthCredentials": "auth",
+    "AuthModel": "auth",
+    "AuthNull": "auth",
+    "CacheManager": "caching",
+    "Connect": "connect",
+    "AsyncConnect": "connect_async",
+    "Features": "features",
+    "Http": "http",
+    "RateLimiter": "http",
+    "RetryPolicy": "http",
+    "cf_token": "projects.cf_token",
+    "cert_human": "projects.cert_human",
+    "url_parser": "projects.url_parser",
+}
+"""attributes of this package that are imported from sub-modules on first access."""
+
+
+def __getattr__(name: str) -> t.Any:
+    """Import sub-modules and the objects they provide on first access (PEP 562).
+
+    Notes:
+        Importing the API models, the CLI, and the projects takes most of the time spent
+        importing this package, so they are only imported when they are used.
+    """
+    if name in LAZY_MODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    elif name in LAZY_ATTRS:
+        module = importlib.import_module(f".{LAZY_ATTRS[name]}", __name__)
+        value = module if module.__name__.endswith(f".{name}") else getattr(module, name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> t.List[str]:
+    """Get the attributes of this package, including the ones imported on first access."""
+    return sorted({*globals(), *LAZY_MODULES, *LAZY_ATTRS})
+
 
 __all__ = (
     "PACKAGE_ROOT",
     # API client
     "Connect",
+    "AsyncConnect",
     # HTTP client
     "Http",
+    "RetryPolicy",
+    "RateLimiter",
+    "CacheManager",
     # API authentication
     "AuthApiKey",
     "AuthModel",
@@ -139,6 +172,7 @@ __all__ = (
     # modules
     "api",
     "auth",
+    "caching",
     "cli",
     "constants",
     "data",
@@ -1,31 +1,76 @@
 # -*- coding: utf-8 -*-
 """API library package."""
-from . import api_endpoints, json_api
-from .adapters import Adapters, Cnx
-from .api_endpoint import ApiEndpoint
-from .api_endpoints import ApiEndpoints
-from .assets import Devices, Runner, Users, Vulnerabilities, AssetMixin
-from .enforcements import Enforcements
-from .folders import Folders
-from .mixins import ChildMixins, ModelMixins
-from .openapi import OpenAPISpec
-from .system import (
-    ActivityLogs,
-    Dashboard,
-    DashboardSpaces,
-    DataScopes,
-    Instances,
-    Meta,
-    RemoteSupport,
-    SettingsGlobal,
-    SettingsGui,
-    SettingsIdentityProviders,
-    SettingsLifecycle,
-    Signup,
-    SystemRoles,
-    SystemUsers,
+import importlib
+import typing as t
+
+LAZY_ATTRS: t.Dict[str, str] = {
+    "Adapters": "adapters",
+    "Cnx": "adapters",
+    "ApiEndpoint": "api_endpoint",
+    "ApiEndpoints": "api_endpoints",
+    "AssetMixin": "assets",
+    "Devices": "assets",
+    "Runner": "assets",
+    "Users": "assets",
+    "Vulnerabilities": "assets",
+    "Enforcements": "enforcements",
+    "Folders": "folders",
+    "ChildMixins": "mixins",
+    "ModelMixins": "mixins",
+    "OpenAPISpec": "openapi",
+    "ActivityLogs": "system",
+    "Dashboard": "system",
+    "DashboardSpaces": "system",
+    "DataScopes": "system",
+    "Instances": "system",
+    "Meta": "system",
+    "RemoteSupport": "system",
+    "SettingsGlobal": "system",
+    "SettingsGui": "system",
+    "SettingsIdentityProviders": "system",
+    "SettingsLifecycle": "system",
+    "Signup": "system",
+    "SystemRoles": "system",
+    "SystemUsers": "system",
+    "Wizard": "wizards",
+    "WizardCsv": "wizards",
+    "WizardText": "wizards",
+}
+"""attributes of this package that are imported from sub-modules on first access."""
+
+LAZY_MODULES: t.Tuple[str, ...] = (
+    "adapters",
+    "api_endpoint",
+    "api_endpoints",
+    "asset_callbacks",
+    "assets",
+    "enforcements",
+    "folders",
+    "json_api",
+    "mixins",
+    "openapi",
+    "system",
+    "wizards",
 )
-from .wizards import Wizard, WizardCsv, WizardText
+"""sub-modules of this package that are imported on first access."""
+
+
+def __getattr__(name: str) -> t.Any:
+    """Import sub-modules and the API models they provide on first access (PEP 562)."""
+    if name in LAZY_MODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    elif name in LAZY_ATTRS:
+        value = getattr(importlib.import_module(f".{LAZY_ATTRS[name]}", __name__), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> t.List[str]:
+    """Get the attributes of this package, including the ones imported on first access."""
+    return sorted({*globals(), *LAZY_MODULES, *LAZY_ATTRS})
+
 
 __all__ = (
     "Adapters",
@@ -4,8 +4,7 @@ import datetime
 import pathlib
 import typing as t
 
-from cachetools import TTLCache, cached
-
+from ...caching import cached
 from ...constants.ctypes import PatternLikeListy
 from ...exceptions import ApiError, NotFoundError  # , StopFetch
 from ...parsers.config import config_build, config_unchanged, config_unknown
@@ -30,9 +29,6 @@ HIST_MOD = AdapterFetchHistory
 HIST_GEN = t.Generator[HIST_MOD, None, None]
 HIST_LIST = t.List[HIST_MOD]
 
-CACHE_HISTORY_FILTERS: TTLCache = TTLCache(maxsize=4096, ttl=60)
-CACHE_GET_BASIC: TTLCache = TTLCache(maxsize=1024, ttl=60)
-
 
 class Adapters(ModelMixins):
     """API model for working with adapters.
@@ -154,7 +150,7 @@ class Adapters(ModelMixins):
         err = f"No adapter named {name!r} found on instance {node_name!r}"
         raise NotFoundError(tablize_adapters(adapters=adapters, err=err))
 
-    @cached(cache=CACHE_GET_BASIC)
+    @cached(name="adapters.get_basic_cached")
     def get_basic_cached(self) -> AdaptersList:
         """Get basic adapter data cached."""
         return self.get_basic()
@@ -163,7 +159,7 @@ class Adapters(ModelMixins):
         """Get basic adapter data."""
         return self._get_basic()
 
-    @cached(cache=CACHE_HISTORY_FILTERS)
+    @cached(name="adapters.get_fetch_history_filters", maxsize=4096)
     def get_fetch_history_filters(self) -> AdapterFetchHistoryFilters:
         """Get filter values for use in adapters history."""
         return self._get_fetch_history_filters()
@@ -43,6 +43,13 @@ from ..json_api.adapters import CnxCreate, CnxDelete, CnxLabels, Cnxs, CnxUpdate
 from ..json_api.instances import Tunnel
 from ..mixins import ChildMixins
 
+CACHES_MUTATED: List[str] = [
+    "adapters.get_basic_cached",
+    "wizard.get_adapters",
+    "wizard.get_cnx_labels",
+]
+"""Caches holding connections, invalidated when a connection is added, updated, or deleted."""
+
 
 class Cnx(ChildMixins):
     """API model for working with adapter connections.
@@ -923,12 +930,14 @@ class Cnx(ChildMixins):
             request_payload["internal_axon_tenant_id"] = internal_axon_tenant_id
 
         request_obj = api_endpoint.load_request(**request_payload)
-        return api_endpoint.perform_request(
+        response = api_endpoint.perform_request(
             http=self.auth.http,
             request_obj=request_obj,
             adapter_name=adapter_name,
             response_status_hook=response_status_hook,
         )
+        self.http.CACHES.invalidate(*CACHES_MUTATED)
+        return response
 
     def _test(
         self,
@@ -1019,13 +1028,15 @@ class Cnx(ChildMixins):
             delete_entities=delete_entities,
             is_instances_mode=is_instances_mode,
         )
-        return api_endpoint.perform_request(
+        response = api_endpoint.perform_request(
             http=self.auth.http,
             request_obj=request_obj,
             adapter_name=adapter_name,
             uuid=uuid,
             response_status_hook=response_status_hook,
         )
+        self.http.CACHES.invalidate(*CACHES_MUTATED)
+        return response
 
     def _update(
         self,
@@ -1081,13 +1092,15 @@ class Cnx(ChildMixins):
             save_and_fetch=save_and_fetch,
             connection_label=connection_label,
         )
-        return api_endpoint.perform_request(
+        response = api_endpoint.perform_request(
             http=self.auth.http,
             request_obj=request_obj,
             adapter_name=adapter_name,
             uuid=uuid,
             response_status_hook=response_status_hook,
         )
+        self.http.CACHES.invalidate(*CACHES_MUTATED)
+        return response
 
     def get_response_status_hook(self, cnx: dict) -> Callable:
         """Check if the result of updating a connection shows that the connection is gone.
@@ -22,7 +22,14 @@ from ..exceptions import (
 )
 from ..http import Http
 from ..logs import set_log_level
-from ..tools import combo_dicts, get_cls_path, json_log
+from ..tools import (
+    JsonCodec,
+    combo_dicts,
+    get_cls_path,
+    get_profiler,
+    json_log,
+    profile_stage,
+)
 from .json_api.base import BaseModel, BaseSchema, BaseSchemaJson
 
 LOGGER: logging.Logger = logging.getLogger(name=__name__)
@@ -95,6 +102,9 @@ class ApiEndpoint:
 
     response_json_error: bool = True
     """Throw errors if the JSON can not be serialized."""
+
+    idempotent: t.Optional[bool] = None
+    """Request is safe to retry after it may have been processed, if None decided by method."""
     log: t.ClassVar[logging.Logger] = LOGGER.getChild("ApiEndpoint")
 
     def __str__(self):
@@ -224,7 +234,11 @@ class ApiEndpoint:
                     f"{self!r} Loading response with data type {type(data)}, load_cls={load_cls}"
                 )
                 try:
-                    data = load_cls.load_response(data=data, http=http, **kwargs)
+                    with profile_stage(
+                        profiler=get_profiler(),
+                        name=f"load_response.{load_cls.__name__}",
+                    ):
+                        data = load_cls.load_response(data=data, http=http, **kwargs)
                 except Exception as exc:
                     if kwargs["reraise"]:
                         raise
@@ -265,7 +279,10 @@ class ApiEndpoint:
             data = response.text
             self.check_response_status(http=http, response=response, **kwargs)
         else:
-            data = self.get_response_json(response=response, **kwargs)
+            with profile_stage(profiler=get_profiler(), name="http.json_decode"):
+                data = self.get_response_json(
+                    response=response, codec=getattr(http, "JSON_CODEC", None), **kwargs
+                )
             self.check_response_status(http=http, response=response, **kwargs)
             data = self.load_response(
                 http=http, response=response, **combo_dicts(kwargs, data=data)
@@ -277,11 +294,14 @@ class ApiEndpoint:
                 pass
         return data
 
-    def get_response_json(self, response: requests.Response, **kwargs) -> JSON_TYPES:
+    def get_response_json(
+        self, response: requests.Response, codec: t.Optional[JsonCodec] = None, **kwargs
+    ) -> JSON_TYPES:
         """Get the JSON from a response.
 
         Args:
             response (requests.Response): response to handle
+            codec (t.Optional[JsonCodec]): JSON codec to deserialize the response with
 
         Raises:
             JsonInvalidError: if response can not be deserialized from JSON
@@ -292,7 +312,7 @@ class ApiEndpoint:
         reraise = kwargs.get("reraise", RERAISE)
 
         try:
-            return response.json()
+            return codec.loads_response(response) if codec else response.json()
         except Exception as exc:
             if reraise:
                 raise
@@ -368,7 +388,7 @@ class ApiEndpoint:
         self.check_request_obj(request_obj=request_obj)
         data_args: dict = self.dump_object(request_obj=request_obj, **kwargs)
         path: str = self.dump_path(request_obj=request_obj, http_args=http_args, **kwargs)
-        base_args: dict = dict(path=path, method=self.method)
+        base_args: dict = dict(path=path, method=self.method, idempotent=self.idempotent)
         args: dict = combo_dicts(self.http_args, data_args, base_args, http_args)
         self.check_missing_args(args=args)
         return args
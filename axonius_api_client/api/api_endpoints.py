@@ -88,6 +88,7 @@ class DashboardSpaces(ApiEndpointGroup):
         request_model_cls=json_api.dashboard_spaces.ExportSpacesRequest,
         response_schema_cls=None,
         response_model_cls=None,
+        idempotent=True,
     )
 
     import_spaces: ApiEndpoint = ApiEndpoint(
@@ -120,6 +121,7 @@ class Assets(ApiEndpointGroup):
         request_model_cls=json_api.assets.AssetRequest,
         response_schema_cls=None,
         response_model_cls=json_api.assets.AssetsPage,
+        idempotent=True,
     )
     # PBUG: include_notes=True ignored if fields are specified
 
@@ -141,6 +143,7 @@ class Assets(ApiEndpointGroup):
         request_model_cls=json_api.assets.CountRequest,
         response_schema_cls=json_api.assets.CountSchema,
         response_model_cls=json_api.assets.Count,
+        idempotent=True,
     )
     # PBUG: returns None until celery finished, want a blocking return until celery returns
 
@@ -414,6 +417,7 @@ class SavedQueries(ApiEndpointGroup):
         request_model_cls=json_api.saved_queries.SavedQueryExport,
         response_schema_cls=None,
         response_model_cls=None,
+        idempotent=True,
     )
 
     sq_import: ApiEndpoint = ApiEndpoint(
@@ -1182,6 +1186,7 @@ class Adapters(ApiEndpointGroup):
         response_model_cls=json_api.adapters.AdapterFetchHistory,
         # response_schema_cls=None,
         # response_model_cls=None,
+        idempotent=True,
     )
 
     settings_get: ApiEndpoint = ApiEndpoint(
@@ -1,9 +1,12 @@
 # -*- coding: utf-8 -*-
 """Callbacks for formatting asset data and exporting to various formats."""
 from .base import Base, ExportMixins
+from .base_arrow import Arrow
 from .base_csv import Csv
 from .base_json import Json
 from .base_json_to_csv import JsonToCsv
+from .base_parquet import Parquet
+from .base_sqlite import Sqlite
 from .base_table import Table
 from .base_xlsx import Xlsx
 from .base_xml import Xml
@@ -18,6 +21,9 @@ __all__ = (
     "Xlsx",
     "Xml",
     "JsonToCsv",
+    "Parquet",
+    "Arrow",
+    "Sqlite",
     "get_callbacks_cls",
     "CB_MAP",
 )
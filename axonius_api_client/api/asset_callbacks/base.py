@@ -1,6 +1,9 @@
 # -*- coding: utf-8 -*-
 """Base callbacks."""
+import dataclasses
+import io
 import logging
+import os
 import pathlib
 import re
 import sys
@@ -8,7 +11,13 @@ import typing as t
 from typing import IO, Generator, List, Optional, Tuple, Union
 
 from ... import DEFAULT_PATH
-from ...constants.api import FIELD_JOINER, FIELD_TRIM_LEN, FIELD_TRIM_STR
+from ...constants.api import (
+    EXPORT_COMPRESS_BUFFER,
+    FIELD_JOINER,
+    FIELD_TRIM_LEN,
+    FIELD_TRIM_STR,
+    TAGS_CHUNK_SIZE,
+)
 from ...constants.fields import (
     AGG_ADAPTER_NAME,
     FIELDS_DETAILS,
@@ -16,9 +25,13 @@ from ...constants.fields import (
     FIELDS_ENTITY_PASSTHRU,
     SCHEMAS_CUSTOM,
 )
+from ...constants.general import COMPRESS_SUFFIXES
 from ...exceptions import ApiError
 from ...tools import (
+    JsonCodec,
     PathLike,
+    Profiler,
+    ThreadedWriter,
     calc_percent,
     check_path_is_not_dir,
     coerce_int,
@@ -27,16 +40,23 @@ from ...tools import (
     echo_error,
     echo_ok,
     echo_warn,
+    get_json_codec,
     get_path,
     get_paths_format,
     is_subclass_safe,
     join_kv,
     listify,
     longest_str,
+    open_compressed,
     path_backup_file,
+    profile_stage,
     strip_right,
+    use_profiler,
 )
 
+if t.TYPE_CHECKING:
+    from ..assets.labels import LabelsWorker
+
 
 # noinspection SpellCheckingInspection
 def crjoin(value):
@@ -45,6 +65,54 @@ def crjoin(value):
     return joiner + joiner.join(value)
 
 
+@dataclasses.dataclass
+class RowPlan:
+    """Execution plan compiled from the arguments and schemas of a callbacks object.
+
+    Notes:
+        Built once by :meth:`Base.plan` and every row is processed using these tables instead
+        of re-resolving arguments and re-checking schemas for each row. Only
+        :attr:`compress_keys` and :attr:`replace_keys` are filled in while processing rows.
+        :meth:`Base.set_arg_value` throws the plan away so it is built again.
+    """
+
+    stages: t.Tuple[t.Callable, ...]
+    """callbacks that are enabled, in the order to run them"""
+
+    null_value: t.Any = None
+    """value to use for missing simple fields"""
+
+    null_value_complex: t.Any = None
+    """value to use for missing complex fields"""
+
+    null_fields: t.Tuple[tuple, ...] = ()
+    """(field, is_complex, sub field tuples) for each field to add null values for"""
+
+    exclude_fields: t.FrozenSet[str] = frozenset()
+    """fields to remove from rows"""
+
+    exclude_sub_fields: t.Tuple[t.Tuple[str, t.Tuple[str, ...]], ...] = ()
+    """(complex field, sub fields) for each complex field with sub fields to remove"""
+
+    flatten_fields: t.Tuple[t.Tuple[str, t.Tuple[t.Tuple[str, str], ...]], ...] = ()
+    """(complex field, (qualified name, short name) of each sub field) to flatten"""
+
+    join_value: str = ""
+    """value to join list values with"""
+
+    join_trim: int = 0
+    """trim joined values longer than this"""
+
+    title_fields: t.Tuple[t.Tuple[str, str, t.Any], ...] = ()
+    """(field, title, default value) for each field to rename to its title"""
+
+    compress_keys: dict = dataclasses.field(default_factory=dict)
+    """cache of field names to compressed field names"""
+
+    replace_keys: dict = dataclasses.field(default_factory=dict)
+    """cache of field names to field names with replacements"""
+
+
 # noinspection PyProtectedMember,PyAttributeOutsideInit
 class Base:
     """Callbacks for formatting asset data.
@@ -111,6 +179,13 @@ class Base:
 
             >>> assets = apiobj.get(tags_add=["tag1", "tag2"], tags_remove=["tag3", "tag4"])
 
+            Add tags with one API call for every 50,000 assets while they are being fetched,
+            instead of with one API call when the fetch is done.
+
+            >>> assets = apiobj.get(tags_add=["tag1"], tags_chunk_size=50000)
+            >>> apiobj.LAST_CALLBACKS.TAG_SUMMARY["add"]
+            {'chunks': 2, 'ids_sent': 60000, 'modified': 60000, 'ids_supplied': 60000, ...}
+
             Generate a report of adapters that are missing from each asset.
 
             >>> assets = apiobj.get(report_adapters_missing=True)
@@ -140,6 +215,17 @@ class Base:
             ...
             >>> assets = apiobj.get(custom_cbs=[custom_cb1])
 
+            Process and write a page of rows at a time instead of one row at a time, this is
+            ignored if custom_cbs are supplied, see :attr:`page_batch`.
+
+            >>> assets = apiobj.get(page_batch=True)
+
+            Profile the time taken by each callback, sending requests, decoding JSON, and
+            loading pages, then export the results as JSON when the fetch is done.
+
+            >>> assets = apiobj.get(profile=True, profile_export="profile.json")
+            >>> stages = apiobj.LAST_CALLBACKS.PROFILER.metrics["stages"]
+
         See Also:
             * :meth:`args_map_custom` for callback specific arguments to format and export data.
 
@@ -148,6 +234,11 @@ class Base:
             :meth:`axonius_api_client.api.assets.users.Users.get` or
             :meth:`axonius_api_client.api.assets.devices.Devices.get`
 
+            Tags are added or removed while the fetch is still running when tags_chunk_size is
+            not 0, if the query filters on the tags being added or removed leave
+            ``tags_chunk_size=0`` so the results of the query do not change during the fetch.
+            If the fetch is stopped early, only the chunks already sent are tagged.
+
         """
         args = {}
         args.update(cls.args_map_base())
@@ -187,12 +278,17 @@ class Base:
             "tags_add_invert_selection": False,
             "tags_remove": [],
             "tags_remove_invert_selection": False,
+            "tags_chunk_size": TAGS_CHUNK_SIZE,
+            "tags_background": False,
             "report_adapters_missing": False,
             "report_software_whitelist": [],
             "page_progress": 10000,
+            "page_batch": False,
             "do_echo": False,
             "custom_cbs": [],
             "debug_timing": False,
+            "profile": False,
+            "profile_export": None,
             "explode_entities": False,
             "include_dates": False,
             "csv_field_flatten": True,
@@ -216,6 +312,9 @@ class Base:
             value: value to set for key
         """
         self.GETARGS[arg] = value
+        for attr in ["_plan", "_excluded_schemas", "_excluded_keys", "_field_replacements"]:
+            if hasattr(self, attr):
+                delattr(self, attr)
 
     def __init__(
         self,
@@ -244,7 +343,12 @@ class Base:
         self.GETARGS: dict = getargs or {}
         self.TAG_ROWS_ADD: List[dict] = []
         self.TAG_ROWS_REMOVE: List[dict] = []
+        self.TAG_IDS_ADD: t.Set[str] = set()
+        self.TAG_IDS_REMOVE: t.Set[str] = set()
+        self.TAG_WORKERS: t.Dict[str, LabelsWorker] = {}
+        self.TAG_SUMMARY: t.Dict[str, dict] = {}
         self.CUSTOM_CB_EXC: List[dict] = []
+        self.PROFILER: Optional[Profiler] = None
         self._init()
 
     def _init(self):
@@ -279,6 +383,7 @@ class Base:
 
         store = crjoin(join_kv(obj=self.STORE))
         self.echo(msg=f"Get Arguments: {store}")
+        self.start_profile()
 
     # noinspection PyUnusedLocal
     def echo_columns(self, **kwargs):
@@ -301,11 +406,76 @@ class Base:
 
     def stop(self, **kwargs):
         """Stop this callbacks object."""
-        self.do_tagging()
+        try:
+            with use_profiler(self.PROFILER), profile_stage(
+                profiler=self.PROFILER, name="callback.do_tagging"
+            ):
+                self.do_tagging()
+        finally:
+            self.close_tags()
+        self.stop_profile()
         self.echo(msg=f"Stopping {self}")
 
-    def echo_page_progress(self):
-        """Echo progress per N rows using an echo method."""
+    def start_profile(self):
+        """Start timing each callback and the requests of this fetch if profile is True.
+
+        Notes:
+            Requests are timed by fetching pages inside :func:`use_profiler` with
+            :attr:`PROFILER`, so other fetches using the same http object are not timed.
+        """
+        if not self.get_arg_value("profile"):
+            return
+
+        self.PROFILER = Profiler()
+        self.echo(msg="Profiling enabled", debug=True)
+
+    def stop_profile(self):
+        """Stop timing requests, echo the profile results and export them if profile_export."""
+        if not isinstance(self.PROFILER, Profiler):
+            return
+
+        self.echo(msg=f"Profile results: {crjoin(self.PROFILER.to_lines())}")
+
+        profile_export = self.get_arg_value("profile_export")
+        if profile_export:
+            path = get_path(obj=profile_export)
+            path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            path.write_text(self.PROFILER.to_json())
+            self.echo(msg=f"Exported profile results to {str(path)!r}")
+
+    @property
+    def resume(self) -> dict:
+        """Get the checkpoint of the fetch being resumed, empty if the fetch is not resumed."""
+        return self.STORE.get("resume") or {}
+
+    def get_checkpoint(self) -> dict:
+        """Get the state of this callbacks object to save in a checkpoint after each page.
+
+        Notes:
+            If the fetch is being resumed and the columns differ from the columns of the
+            checkpoint, a warning is echoed, since the callback arguments must be the same as
+            the fetch that saved the checkpoint.
+        """
+        final_columns = list(self.final_columns)
+        resume_columns = self.resume.get("final_columns")
+        if resume_columns and resume_columns != final_columns and not self._resume_warned:
+            self.echo(
+                msg=[
+                    "Columns differ from the columns of the checkpoint being resumed",
+                    f"   Checkpoint columns: {resume_columns}",
+                    f"   Current columns: {final_columns}",
+                ],
+                warning=True,
+            )
+            self._resume_warned = True
+        return {"final_columns": final_columns}
+
+    def echo_page_progress(self, count: int = 1):
+        """Echo progress per N rows using an echo method.
+
+        Args:
+            count: number of rows that were just processed
+        """
         page_progress = self.get_arg_value("page_progress")
         if not page_progress or not isinstance(page_progress, int):
             return
@@ -316,7 +486,8 @@ class Base:
         page_total = self.STATE.get("pages_to_fetch_total", 0) or 0
         page_num = self.STATE.get("page_number", 0) or 0
 
-        if not ((proc % page_progress == 0) or (proc >= total) or (proc <= 1)):
+        crossed = proc // page_progress != (proc - count) // page_progress
+        if not (crossed or (proc >= total) or (proc <= count)):
             return
 
         percent = calc_percent(part=proc, whole=total)
@@ -331,7 +502,18 @@ class Base:
 
         taken = f"{taken:.2f} seconds so far"
 
-        self.echo(msg=f"PROGRESS: {percent} {rows} {pages} in {taken}")
+        workers = self.STATE.get("workers_progress", {}) or {}
+        workers = [
+            f"{k}: {v['pages']} pages / {v['rows']} rows in {v['fetch_seconds']:.2f} seconds"
+            for k, v in workers.items()
+        ]
+        workers = f" [WORKERS: {', '.join(workers)}]" if workers else ""
+
+        prefetch = self.STATE.get("prefetch", 0) or 0
+        depth = self.STATE.get("prefetch_queue_depth", 0) or 0
+        prefetch = f" [PREFETCHED: {depth} / {prefetch}]" if prefetch else ""
+
+        self.echo(msg=f"PROGRESS: {percent} {rows} {pages} in {taken}{workers}{prefetch}")
 
     def do_pre_row(self, rows: Union[List[dict], dict]) -> List[dict]:
         """Pre-processing callbacks for current row.
@@ -358,6 +540,50 @@ class Base:
         rows = self.do_row(rows=rows)
         return rows
 
+    @property
+    def page_batch(self) -> bool:
+        """Check if rows should be processed a page at a time using :meth:`process_page`.
+
+        Notes:
+            Rows are processed one at a time using :meth:`process_row` unless page_batch is
+            True, no custom_cbs are supplied (they are called with one row at a time), and
+            :meth:`process_row` is not overridden by a subclass that does not also override
+            :meth:`process_page`.
+        """
+        if not self.get_arg_value("page_batch") or listify(self.get_arg_value("custom_cbs")):
+            return False
+
+        mro: t.List[type] = list(type(self).__mro__)
+        row_cls: type = next(x for x in mro if "process_row" in vars(x))
+        page_cls: type = next(x for x in mro if "process_page" in vars(x))
+        return mro.index(page_cls) <= mro.index(row_cls)
+
+    def do_pre_page(self, rows: List[dict]) -> List[dict]:
+        """Pre-processing callbacks for a page of rows.
+
+        Args:
+            rows: rows to process
+        """
+        rows = listify(rows)
+        # the selected fields only include the keys of the first row, same as do_pre_row
+        self.CURRENT_ROWS = rows[:1]
+        self.echo_columns()
+        self.CURRENT_ROWS = rows
+        self.STATE.setdefault("rows_processed_total", 0)
+        self.STATE["rows_processed_total"] += len(rows)
+        self.echo_page_progress(count=len(rows))
+        return rows
+
+    def process_page(self, rows: List[dict]) -> List[dict]:
+        """Process the callbacks for a page of rows at once.
+
+        Args:
+            rows: rows to process
+        """
+        rows = self.do_pre_page(rows=rows)
+        rows = self.do_row(rows=rows)
+        return rows
+
     @property
     def callbacks(self) -> list:
         """Get order of callbacks to run."""
@@ -379,6 +605,108 @@ class Base:
             self.do_change_field_replace,
         ]
 
+    @property
+    def plan(self) -> RowPlan:
+        """Get the execution plan for processing rows, building it on first use."""
+        if not hasattr(self, "_plan"):
+            self._plan = self.build_plan()
+        return self._plan
+
+    @property
+    def json_codec(self) -> JsonCodec:
+        """Get the JSON codec of the http object of :attr:`APIOBJ`."""
+        if not hasattr(self, "_json_codec"):
+            codec = getattr(getattr(self.APIOBJ, "http", None), "JSON_CODEC", None)
+            self._json_codec = get_json_codec(codec=codec)
+        return self._json_codec
+
+    def build_plan(self) -> RowPlan:
+        """Compile the arguments and selected schemas into an execution plan.
+
+        Notes:
+            The selected schemas include the keys of the first row, so this must not be
+            called before :meth:`do_pre_row` has seen the first row.
+        """
+        null_value = self.get_arg_value("field_null_value")
+        null_value_complex = self.get_arg_value("field_null_value_complex")
+        enabled = {
+            "do_custom_cbs": bool(listify(self.get_arg_value("custom_cbs"))),
+            "process_tags_to_add": bool(listify(self.get_arg_value("tags_add"))),
+            "process_tags_to_remove": bool(listify(self.get_arg_value("tags_remove"))),
+            "add_report_adapters_missing": bool(self.get_arg_value("report_adapters_missing")),
+            "add_report_software_whitelist": bool(
+                listify(self.get_arg_value("report_software_whitelist"))
+            ),
+            "add_include_dates": bool(self.get_arg_value("include_dates")),
+            "do_excludes": bool(self.get_arg_value("field_excludes")),
+            "do_add_null_values": bool(self.get_arg_value("field_null")),
+            "do_explode_entities": bool(self.get_arg_value("explode_entities")),
+            "do_flatten_fields": bool(self.get_arg_value("field_flatten")),
+            "do_explode_field": bool(self.get_arg_value("field_explode"))
+            and not self.is_excluded(schema=self.schema_to_explode),
+            "do_join_values": bool(self.get_arg_value("field_join")),
+            "do_change_field_titles": bool(self.get_arg_value("field_titles")),
+            "do_change_field_compress": bool(self.get_arg_value("field_compress")),
+            "do_change_field_replace": bool(self.field_replacements),
+        }
+        stages = tuple(x for x in self.callbacks if enabled.get(x.__name__, True))
+
+        def get_null_field(schema: dict, key: str) -> tuple:
+            subs = ()
+            if schema["is_complex"]:
+                subs = tuple(
+                    get_null_field(schema=x, key="name")
+                    for x in self.get_sub_schemas(schema=schema)
+                    if not x.get("is_details", False)
+                )
+            return schema[key], schema["is_complex"], subs
+
+        null_fields = []
+        exclude_fields = set()
+        exclude_sub_fields = []
+        flatten_fields = []
+        for schema in self.schemas_selected:
+            field = schema["name_qual"]
+            is_excluded = self.is_excluded(schema=schema)
+            is_details = schema.get("is_details", False)
+
+            if not is_excluded and not is_details:
+                null_fields.append(get_null_field(schema=schema, key="name_qual"))
+
+            if is_excluded:
+                exclude_fields.add(field)
+            elif schema["is_complex"]:
+                subs = tuple(x["name"] for x in schema["sub_fields"] if self.is_excluded(schema=x))
+                if subs:
+                    exclude_sub_fields.append((field, subs))
+
+            if (
+                schema["is_complex"]
+                and not is_excluded
+                and not is_details
+                and schema != self.schema_to_explode
+            ):
+                subs = tuple((x["name_qual"], x["name"]) for x in self.get_sub_schemas(schema))
+                flatten_fields.append((field, subs))
+
+        title_fields = []
+        for schema in self.final_schemas:
+            default = null_value_complex if schema["is_complex"] else null_value
+            title_fields.append((schema["name_qual"], schema["column_title"], default))
+
+        return RowPlan(
+            stages=stages,
+            null_value=null_value,
+            null_value_complex=null_value_complex,
+            null_fields=tuple(null_fields),
+            exclude_fields=frozenset(exclude_fields),
+            exclude_sub_fields=tuple(exclude_sub_fields),
+            flatten_fields=tuple(flatten_fields),
+            join_value=str(self.get_arg_value("field_join_value")),
+            join_trim=coerce_int(self.get_arg_value("field_join_trim")),
+            title_fields=tuple(title_fields),
+        )
+
     def do_row(self, rows: Union[List[dict], dict]) -> List[dict]:
         """Execute the callbacks for current row.
 
@@ -387,16 +715,22 @@ class Base:
         """
         debug_timing = self.get_arg_value("debug_timing")
 
+        profiler = self.PROFILER
+
         p_start = None
         cb_start = None
         if debug_timing:  # pragma: no cover
             p_start = dt_now()
 
-        for cb in self.callbacks:
+        for cb in self.plan.stages:
             if debug_timing:  # pragma: no cover
                 cb_start = dt_now()
 
-            rows = cb(rows=rows)
+            if profiler:
+                with profiler.stage(name=f"callback.{cb.__name__}"):
+                    rows = cb(rows=rows)
+            else:
+                rows = cb(rows=rows)
             # print(f"{cb} {json_dump(rows)}")
             if debug_timing and cb_start:  # pragma: no cover
                 cb_delta = dt_now() - cb_start
@@ -438,11 +772,29 @@ class Base:
         if not field_null:
             return rows
 
+        null_fields = self.plan.null_fields
         for row in rows:
-            for schema in self.schemas_selected:
-                self._do_add_null_values(row=row, schema=schema)
+            self._do_add_null_fields(row=row, fields=null_fields)
         return rows
 
+    def _do_add_null_fields(self, row: dict, fields: t.Tuple[tuple, ...]):
+        """Null out missing fields using the tables from :meth:`build_plan`.
+
+        Args:
+            row: row or complex field item being processed
+            fields: (field, is_complex, sub field tuples) for each field to add null values for
+        """
+        plan = self.plan
+        for field, is_complex, sub_fields in fields:
+            if is_complex:
+                if field not in row:
+                    row[field] = plan.null_value_complex
+
+                for item in row[field]:
+                    self._do_add_null_fields(row=item, fields=sub_fields)
+            elif field not in row:
+                row[field] = plan.null_value
+
     def _do_add_null_values(self, row: dict, schema: dict, key: str = "name_qual"):
         """Null out missing fields.
 
@@ -491,20 +843,14 @@ class Base:
         Args:
             row: row being processed
         """
-        for schema in self.schemas_selected:
-            field = schema["name_qual"]
-            if self.is_excluded(schema=schema) and field in row:
-                row.pop(field)
-                continue
+        plan = self.plan
+        for field in plan.exclude_fields:
+            row.pop(field, None)
 
-            if schema["is_complex"]:
-                items = listify(row.get(field, []))
-                for sub_schema in schema["sub_fields"]:
-                    if self.is_excluded(schema=sub_schema):
-                        sub_field = sub_schema["name"]
-                        for item in items:
-                            if sub_field in item:
-                                item.pop(sub_field)
+        for field, sub_fields in plan.exclude_sub_fields:
+            for item in listify(row.get(field, [])):
+                for sub_field in sub_fields:
+                    item.pop(sub_field, None)
 
     def do_join_values(self, rows: Union[List[dict], dict]) -> List[dict]:
         """Join values.
@@ -526,8 +872,8 @@ class Base:
         Args:
             row: row being processed
         """
-        joiner = str(self.get_arg_value("field_join_value"))
-        trim_len = coerce_int(self.get_arg_value("field_join_trim"))
+        joiner = self.plan.join_value
+        trim_len = self.plan.join_trim
         trim_str = FIELD_TRIM_STR
 
         for field in row:
@@ -551,7 +897,10 @@ class Base:
         if not self.field_replacements:
             return rows
 
-        rows = [{self._field_replace(key=k): v for k, v in row.items()} for row in rows]
+        keys = self.plan.replace_keys
+        for key in [k for row in rows for k in row if k not in keys]:
+            keys[key] = self._field_replace(key=key)
+        rows = [{keys[k]: v for k, v in row.items()} for row in rows]
         return rows
 
     def _field_replace(self, key: str) -> str:
@@ -593,7 +942,11 @@ class Base:
         rows = listify(rows)
         if not self.get_arg_value("field_compress"):
             return rows
-        rows = [{self._field_compress(key=k): v for k, v in row.items()} for row in rows]
+
+        keys = self.plan.compress_keys
+        for key in [k for row in rows for k in row if k not in keys]:
+            keys[key] = self._field_compress(key=key)
+        rows = [{keys[k]: v for k, v in row.items()} for row in rows]
         return rows
 
     def _field_compress(self, key: str) -> str:
@@ -637,14 +990,7 @@ class Base:
         Args:
             row: row being processed
         """
-        null_value = self.get_arg_value("field_null_value")
-        complex_null_value = self.get_arg_value("field_null_value_complex")
-
-        for schema in self.final_schemas:
-            title = schema["column_title"]
-            name = schema["name_qual"]
-            is_complex = schema["is_complex"]
-            default = complex_null_value if is_complex else null_value
+        for name, title, default in self.plan.title_fields:
             row[title] = row.pop(name, default)
 
     def do_flatten_fields(self, rows: Union[List[dict], dict]) -> List[dict]:
@@ -657,10 +1003,20 @@ class Base:
         if not self.get_arg_value("field_flatten"):
             return rows
 
+        null_value = self.plan.null_value
         for row in rows:
-            for schema in self.schemas_selected:
-                if self.schema_to_explode != schema and not schema.get("is_details", False):
-                    self._do_flatten_fields(row=row, schema=schema)
+            for field, sub_fields in self.plan.flatten_fields:
+                # remove the complex field, i.e. specific_data.data.network_interfaces
+                # force it into a list of items
+                items = listify(row.pop(field, []))
+
+                for sub_field, sub_short in sub_fields:
+                    # for each complex item, remove the sub-field, force it into a list,
+                    # and append it to the sub-fields fully qualified name at the root row level
+                    values = row[sub_field] = []
+                    for item in items:
+                        value = item.pop(sub_short, null_value)
+                        values += value if isinstance(value, list) else [value]
 
         return rows
 
@@ -800,52 +1156,18 @@ class Base:
 
     def do_tagging(self):
         """Add or remove tags to assets."""
-        self.do_tag_add()
-        self.do_tag_remove()
+        try:
+            self.do_tag_add()
+        finally:
+            self.do_tag_remove()
 
     def do_tag_add(self):
         """Add tags to assets."""
-        tags = listify(self.get_arg_value("tags_add"))
-        expirable_tags = self.get_arg_value("expirable_tags")
-        rows = self.TAG_ROWS_ADD
-        invert_selection = self.get_arg_value("tags_add_invert_selection")
-        count_tags = len(tags)
-        count_supplied = len(rows)
-        msgs = [
-            f"   Tags supplied ({count_tags}): {tags}",
-            f"   Asset IDs supplied ({count_supplied})",
-            f"   Invert selection: {invert_selection}",
-        ]
-        if tags:
-            self.echo(["Performing API call to add tags to assets", *msgs])
-            count_modified = self.APIOBJ.labels.add(
-                rows=rows, labels=tags, invert_selection=invert_selection, expirable_tags=expirable_tags,
-            )
-            self.echo(msg=[f"API added tags to {count_modified} assets", *msgs])
+        self.finish_tags(method="add")
 
     def do_tag_remove(self):
         """Remove tags from assets."""
-        tags = listify(self.get_arg_value("tags_remove"))
-        rows = self.TAG_ROWS_REMOVE
-        invert_selection = self.get_arg_value("tags_remove_invert_selection")
-        count_tags = len(tags)
-        count_supplied = len(rows)
-        msgs = [
-            f"   Asset IDs supplied ({count_supplied})",
-            f"   Tags supplied ({count_tags}): {tags}",
-            f"   Invert selection: {invert_selection}",
-        ]
-        if tags:
-            self.echo(["Performing API call to remove tags from assets", *msgs])
-            count_modified = self.APIOBJ.labels.remove(
-                rows=rows, labels=tags, invert_selection=invert_selection
-            )
-            msgs = [
-                f"API finished removing tags from assets",
-                f"   Asset IDs modified: " f"{count_modified}",
-                *msgs,
-            ]
-            self.echo(msg=msgs)
+        self.finish_tags(method="remove")
 
     def process_tags_to_add(self, rows: Union[List[dict], dict]) -> List[dict]:
         """Add assets to tracker for adding tags.
@@ -858,11 +1180,7 @@ class Base:
         if not tags:
             return rows
 
-        for row in rows:
-            tag_row = {"internal_axon_id": row["internal_axon_id"]}
-
-            if tag_row not in self.TAG_ROWS_ADD:
-                self.TAG_ROWS_ADD.append(tag_row)
+        self.track_tags(rows=rows, method="add")
         return rows
 
     def process_tags_to_remove(self, rows: Union[List[dict], dict]) -> List[dict]:
@@ -876,13 +1194,141 @@ class Base:
         if not tags:
             return rows
 
+        self.track_tags(rows=rows, method="remove")
+        return rows
+
+    def track_tags(self, rows: List[dict], method: str):
+        """Track the IDs of assets that have not been seen yet and send full chunks of them.
+
+        Args:
+            rows: rows to track
+            method: 'add' or 'remove'
+        """
+        tag_rows, tag_ids = self.get_tag_trackers(method=method)
         for row in rows:
-            tag_row = {"internal_axon_id": row["internal_axon_id"]}
+            axon_id = row["internal_axon_id"]
+            if axon_id not in tag_ids:
+                tag_ids.add(axon_id)
+                tag_rows.append({"internal_axon_id": axon_id})
+        self.flush_tags(method=method)
 
-            if tag_row not in self.TAG_ROWS_REMOVE:
-                self.TAG_ROWS_REMOVE.append(tag_row)
+    def get_tag_trackers(self, method: str) -> Tuple[List[dict], t.Set[str]]:
+        """Get the rows of assets waiting to be sent and the IDs of all assets seen.
 
-        return rows
+        Args:
+            method: 'add' or 'remove'
+        """
+        if method == "add":
+            return self.TAG_ROWS_ADD, self.TAG_IDS_ADD
+        return self.TAG_ROWS_REMOVE, self.TAG_IDS_REMOVE
+
+    def get_tag_worker(self, method: str) -> "LabelsWorker":
+        """Get or create the worker that sends chunks of asset IDs to add or remove tags.
+
+        Args:
+            method: 'add' or 'remove'
+        """
+        from ..assets.labels import LabelsWorker
+
+        if method not in self.TAG_WORKERS:
+            self.TAG_WORKERS[method] = LabelsWorker(
+                labels=self.APIOBJ.labels,
+                tags=listify(self.get_arg_value(f"tags_{method}")),
+                remove=method == "remove",
+                expirable_tags=self.get_arg_value("expirable_tags"),
+                background=bool(self.get_arg_value("tags_background")),
+                progress=lambda msg: self.echo(msg=msg),
+            )
+        return self.TAG_WORKERS[method]
+
+    def flush_tags(self, method: str, final: bool = False):
+        """Send chunks of tracked asset IDs to the worker for adding or removing tags.
+
+        Notes:
+            Inverted selections and a tags_chunk_size of 0 send every asset ID in one API
+            call when final is True, since the API tags the assets NOT supplied for an
+            inverted selection.
+
+        Args:
+            method: 'add' or 'remove'
+            final: send the remaining asset IDs, even if there are less than tags_chunk_size
+        """
+        tag_rows, _ = self.get_tag_trackers(method=method)
+        invert_selection = bool(self.get_arg_value(f"tags_{method}_invert_selection"))
+        chunk_size = coerce_int(self.get_arg_value("tags_chunk_size") or 0, min_value=0)
+
+        if invert_selection or not chunk_size:
+            if final:
+                ids = [x["internal_axon_id"] for x in tag_rows]
+                tag_rows.clear()
+                self.get_tag_worker(method=method).submit(ids=ids, include=not invert_selection)
+            return
+
+        while len(tag_rows) >= chunk_size or (final and tag_rows):
+            ids = [x["internal_axon_id"] for x in tag_rows[:chunk_size]]
+            del tag_rows[:chunk_size]
+            self.get_tag_worker(method=method).submit(ids=ids)
+
+    def close_tags(self):
+        """Stop the workers for adding or removing tags without sending the queued asset IDs.
+
+        Notes:
+            Used when a fetch does not finish, so that no worker thread outlives the fetch.
+        """
+        for method in list(self.TAG_WORKERS or {}):
+            self.TAG_WORKERS.pop(method).close()
+
+    def finish_tags(self, method: str):
+        """Send the remaining asset IDs, wait for the worker, and echo a reconciliation summary.
+
+        Args:
+            method: 'add' or 'remove'
+
+        Raises:
+            :exc:`ApiError`: if any API calls to add or remove tags failed
+        """
+        tags = listify(self.get_arg_value(f"tags_{method}"))
+        if not tags:
+            return
+
+        _, tag_ids = self.get_tag_trackers(method=method)
+        invert_selection = self.get_arg_value(f"tags_{method}_invert_selection")
+        self.flush_tags(method=method, final=True)
+
+        worker = self.TAG_WORKERS.pop(method, None)
+        summary = worker.join() if worker else {}
+        summary.setdefault("modified", 0)
+        summary["ids_supplied"] = len(tag_ids)
+        self.TAG_SUMMARY[method] = summary
+
+        msgs = [
+            f"   Tags supplied ({len(tags)}): {tags}",
+            f"   Asset IDs supplied ({len(tag_ids)})",
+            f"   Invert selection: {invert_selection}",
+        ]
+        if summary.get("chunks"):
+            msgs += [
+                f"   API calls: {summary['chunks']} in {summary['seconds']:.2f} seconds",
+                f"   Asset IDs sent: {summary['ids_sent']}",
+            ]
+        if not invert_selection and summary.get("ids_sent", 0) > summary["modified"]:
+            unchanged = summary["ids_sent"] - summary["modified"]
+            msgs.append(f"   Asset IDs not modified by API: {unchanged}")
+
+        verb = "removed tags from" if method == "remove" else "added tags to"
+        self.echo(msg=[f"API {verb} {summary['modified']} assets", *msgs])
+
+        if worker and worker.errors:
+            errors = [f"   {x}" for x in worker.errors]
+            self.echo(
+                msg=[
+                    f"API failed to {method} tags for {summary['ids_failed']} asset IDs in "
+                    f"{summary['chunks_failed']} API calls",
+                    *msgs,
+                    *errors,
+                ],
+                error=ApiError,
+            )
 
     def add_report_software_whitelist(self, rows: Union[List[dict], dict]) -> List[dict]:
         """Process report: Software whitelist.
@@ -1000,14 +1446,23 @@ class Base:
         Args:
             schema: field schema
         """
-        for excluded_schema in self.excluded_schemas:
-            for key in self.FIND_KEYS:
-                schema_key = schema.get(key, None)
-                excluded_key = excluded_schema.get(key, None)
-                if (schema_key and excluded_schema) and (schema_key == excluded_key):
-                    return True
+        excluded_keys = self.excluded_keys
+        for key in self.FIND_KEYS:
+            schema_key = schema.get(key, None)
+            if schema_key and schema_key in excluded_keys[key]:
+                return True
         return False
 
+    @property
+    def excluded_keys(self) -> t.Dict[str, t.Set[str]]:
+        """Map of FIND_KEYS to the values of that key for all schemas that should be excluded."""
+        if not hasattr(self, "_excluded_keys"):
+            self._excluded_keys = {
+                key: {x[key] for x in self.excluded_schemas if x.get(key, None)}
+                for key in self.FIND_KEYS
+            }
+        return self._excluded_keys
+
     @property
     def excluded_schemas(self) -> List[dict]:
         """List of all schemas that should be excluded."""
@@ -1189,18 +1644,18 @@ class Base:
         if not explode:
             return self._schema_to_explode
 
-        valids = []
-
+        lookup = {}
         for schema in self.schemas_selected:
             for key in self.FIND_KEYS:
                 name = schema.get(key)
                 if name:
-                    valids.append(name)
-                    if name == explode:
-                        self._schema_to_explode = schema
-                        return self._schema_to_explode
+                    lookup.setdefault(name, schema)
 
-        valids = sorted(list(set(valids)))
+        if explode in lookup:
+            self._schema_to_explode = lookup[explode]
+            return self._schema_to_explode
+
+        valids = sorted(lookup)
         self.echo(msg=f"Explode field {explode!r} not found, valid fields:{valids}", error=ApiError)
 
     @property
@@ -1257,6 +1712,14 @@ class Base:
     CB_NAME: str = "base"
     """name for this callback"""
 
+    EXPORT_COMPRESS: bool = True
+    """export_compress is supported by this export"""
+
+    EXPORT_RESUME: bool = True
+    """checkpoint and resume_from are supported by this export"""
+
+    _resume_warned: bool = False
+
     FIND_KEYS: List[str] = ["name", "name_qual", "column_title"]
     """field schema keys to use when finding a fields schema"""
 
@@ -1284,9 +1747,24 @@ class Base:
     TAG_ROWS_REMOVE: List[dict] = None
     """tracker of assets to remove tags from in :meth:`do_tagging`."""
 
+    TAG_IDS_ADD: t.Set[str] = None
+    """tracker of every asset ID seen by :meth:`process_tags_to_add`."""
+
+    TAG_IDS_REMOVE: t.Set[str] = None
+    """tracker of every asset ID seen by :meth:`process_tags_to_remove`."""
+
+    TAG_WORKERS: t.Dict[str, "LabelsWorker"] = None
+    """workers sending chunks of asset IDs to add or remove tags for, by 'add' or 'remove'."""
+
+    TAG_SUMMARY: t.Dict[str, dict] = None
+    """reconciliation summary of :meth:`do_tag_add` and :meth:`do_tag_remove`."""
+
     CUSTOM_CB_EXC: List[dict] = None
     """tracker of custom callbacks that have been executed by :meth:`do_custom_cbs`"""
 
+    PROFILER: Optional[Profiler] = None
+    """tracker of time taken by each stage of fetching and processing rows if profile=True"""
+
 
 # noinspection PyAttributeOutsideInit
 class ExportMixins(Base):
@@ -1310,6 +1788,9 @@ class ExportMixins(Base):
             "export_schema": False,
             "export_fd": None,
             "export_fd_close": True,
+            "export_compress": None,
+            "export_compress_level": None,
+            "export_compress_thread": True,
         }
 
     def open_fd(self) -> IO:
@@ -1338,12 +1819,20 @@ class ExportMixins(Base):
 
     def open_fd_path(self) -> IO:
         """Open a file descriptor for a path."""
+        if self.resume.get("export_position") is not None:
+            return self.open_fd_resume()
+
         export_fd_close = self.arg_export_fd_close
         export_backup = self.arg_export_backup
         export_overwrite = self.arg_export_overwrite
 
         self._file_path: pathlib.Path = self.export_full_path
         self._file_path_backup: Optional[pathlib.Path] = None
+        self._file_compress: Optional[str] = self.check_export_compress()
+        if self._file_compress:
+            suffix = COMPRESS_SUFFIXES[self._file_compress]
+            if not self._file_path.name.endswith(suffix):
+                self._file_path = self._file_path.with_name(f"{self._file_path.name}{suffix}")
         self._fd_close: bool = export_fd_close
 
         check_path_is_not_dir(path=self._file_path)
@@ -1372,12 +1861,46 @@ class ExportMixins(Base):
             self._file_path.touch(mode=0o600)
             self.echo(msg=f"Created new file {str(self._file_path)!r}", debug=True)
 
-        self._fd_info: str = f"file {str(self._file_path)!r} ({self._file_mode})"
+        compressed = f", {self._file_compress} compressed" if self._file_compress else ""
+        self._fd_info: str = f"file {str(self._file_path)!r} ({self._file_mode}{compressed})"
         self.echo(msg=f"Exporting to {self._fd_info}")
 
+        if self._file_compress:
+            return self.open_fd_compressed()
+
         self._fd: IO = self._file_path.open(mode="w", encoding="utf-8")
         return self._fd
 
+    def open_fd_compressed(self) -> IO:
+        """Open a text file descriptor that compresses the data written to the export file."""
+        level = self.get_arg_value("export_compress_level")
+        stream = open_compressed(path=self._file_path, method=self._file_compress, level=level)
+        if self.get_arg_value("export_compress_thread"):
+            stream = ThreadedWriter(stream=stream)
+        stream = io.BufferedWriter(stream, buffer_size=EXPORT_COMPRESS_BUFFER)
+        self._fd: IO = io.TextIOWrapper(stream, encoding="utf-8")
+        return self._fd
+
+    def check_export_compress(self) -> Optional[str]:
+        """Check that export_compress is a valid compression method for this export."""
+        compress = self.get_arg_value("export_compress")
+        if not compress:
+            return None
+
+        if not self.EXPORT_COMPRESS:
+            msg = f"export_compress is not supported by the {self.CB_NAME!r} export"
+            self.echo(msg=msg, error=ApiError, level="error")
+
+        if self.STORE.get("checkpoint"):
+            msg = "export_compress is not supported with checkpoint"
+            self.echo(msg=msg, error=ApiError, level="error")
+
+        if compress not in COMPRESS_SUFFIXES:
+            valids = list(COMPRESS_SUFFIXES)
+            msg = f"Invalid export_compress {compress!r}, must be one of {valids}"
+            self.echo(msg=msg, error=ApiError, level="error")
+        return compress
+
     def open_fd_stdout(self) -> IO:
         """Open a file descriptor to STDOUT."""
         self._fd_close: bool = False
@@ -1436,6 +1959,60 @@ class ExportMixins(Base):
         """Pass."""
         return self.get_arg_value("export_fd_close")
 
+    def get_checkpoint(self) -> dict:
+        """Get the state of this callbacks object to save in a checkpoint after each page.
+
+        Notes:
+            The export file is flushed and synced to disk so that the position saved in the
+            checkpoint only includes data that has been written.
+        """
+        ret = super(ExportMixins, self).get_checkpoint()
+        ret["export_file"] = None
+        ret["export_position"] = None
+
+        fd = getattr(self, "_fd", None)
+        if fd is None or fd.closed:
+            return ret
+
+        fd.flush()
+        file_path = getattr(self, "_file_path", None)
+        if file_path is not None and fd is not sys.stdout:
+            os.fsync(fd.fileno())
+            ret["export_file"] = str(file_path)
+            ret["export_position"] = fd.tell()
+        return ret
+
+    def open_fd_resume(self) -> IO:
+        """Open the export file of the fetch being resumed and truncate it to the checkpoint.
+
+        Notes:
+            Any data written after the last checkpoint was saved is removed.
+        """
+        position = self.resume["export_position"]
+        self._file_path: pathlib.Path = self.export_full_path
+        self._file_path_backup: Optional[pathlib.Path] = None
+        self._file_compress: Optional[str] = None
+        self._fd_close: bool = self.arg_export_fd_close
+
+        if not self._file_path.is_file():
+            msg = f"Unable to resume, export file {str(self._file_path)!r} does not exist"
+            self.echo(msg=msg, error=ApiError, level="error")
+
+        size = self._file_path.stat().st_size
+        if size < position:
+            msg = (
+                f"Unable to resume, export file {str(self._file_path)!r} is {size} bytes and "
+                f"the checkpoint is at byte {position}"
+            )
+            self.echo(msg=msg, error=ApiError, level="error")
+
+        os.truncate(self._file_path, position)
+        self._file_mode: str = f"Resumed existing file at byte {position} of {size}"
+        self._fd_info: str = f"file {str(self._file_path)!r} ({self._file_mode})"
+        self.echo(msg=f"Exporting to {self._fd_info}")
+        self._fd: IO = self._file_path.open(mode="a", encoding="utf-8")
+        return self._fd
+
 
 ARG_DESCRIPTIONS: dict = {
     "field_excludes": "Fields to exclude from output",
@@ -1455,9 +2032,12 @@ ARG_DESCRIPTIONS: dict = {
     "tags_add_invert_selection": "Invert selection for tags to add",
     "tags_remove": "Tags to remove from assets",
     "tags_remove_invert_selection": "Invert selection for tags to remove",
+    "tags_chunk_size": "Add or remove tags for every N assets while fetching (0 = once when done)",
+    "tags_background": "Add or remove tags in a background thread while fetching",
     "report_adapters_missing": "Add Missing Adapters calculation",
     "report_software_whitelist": "Missing Software to calculate",
     "page_progress": "Echo page progress every N assets",
+    "page_batch": "Process and write a page of assets at a time",
     "do_echo": "Echo messages to console",
     "custom_cbs": "Custom callbacks to perform on assets",
     "json_flat": "For JSON Export: Use JSONL format",
@@ -1465,6 +2045,8 @@ ARG_DESCRIPTIONS: dict = {
     "csv_key_extras": "For CSV Export: What to do with extra CSV columns",
     "csv_dialect": "For CSV Export: CSV Dialect to use",
     "csv_quoting": "For CSV Export: CSV quoting style",
+    "spool_dir": "For JSON to CSV Export: Directory to write the temporary JSON file to",
+    "spool_compress": "For JSON to CSV Export: Compress the temporary JSON file (gzip or zstd)",
     "csv_field_flatten": "For CSV/XLSX Export: Enable flattening of complex fields",
     "csv_field_join": "For CSV/XLSX Export: Enable joining of list fields",
     "csv_field_null": "For CSV/XLSX Export: Enable null values for missing fields",
@@ -1475,12 +2057,26 @@ ARG_DESCRIPTIONS: dict = {
     "export_fd": "Export to a file descriptor",
     "export_fd_close": "Close the file descriptor when done",
     "export_backup": "If export_file exists, rename it with the datetime",
+    "export_compress": "Compress export_file (gzip, bz2, xz, zstd)",
+    "export_compress_level": "Compression level to use for export_compress",
+    "export_compress_thread": "Compress export_file in a background thread",
     "table_format": "For Table export: Table format to use",
     "table_max_rows": "For Table export: Maximum rows to output",
     "table_api_fields": "For Table export: Include API fields in output",
+    "table_window": "For Table export: Write a table every N rows (0 = one table when done)",
+    "arrow_batch_rows": "For Parquet/Arrow export: Rows to write per record batch",
+    "arrow_compression": "For Parquet/Arrow export: Compression codec to use",
+    "sqlite_table": "For SQLite export: Table to write assets to (default: devices or users)",
+    "sqlite_indexes": "For SQLite export: Columns to index after writing assets",
+    "sqlite_append": "For SQLite export: Replace assets of the same history date in export_file",
     "xlsx_column_length": "For XLSX export: Length to use for every column",
     "xlsx_cell_format": "For XLSX Export: Formatting to apply to every cell",
+    "xlsx_column_formats": "For XLSX Export: Formatting to apply to columns by field type or name",
+    "xlsx_max_rows": "For XLSX Export: Rows per worksheet before rolling over to a new one",
+    "xlsx_cell_max_len": "For XLSX Export: Maximum length of cell values (None = no limit)",
     "debug_timing": "Enable logging of time taken for each callback",
+    "profile": "Track time taken by each callback and request stage",
+    "profile_export": "File to export profile results to as JSON",
     "explode_entities": "Split rows into one row for each asset entity",
     "include_dates": "Include history date and current date as a columns in the output",
 }
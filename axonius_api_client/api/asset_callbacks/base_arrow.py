@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""Arrow IPC export callbacks."""
+from typing import Any
+
+from .base_parquet import Parquet
+
+
+class Arrow(Parquet):
+    """Callbacks for formatting asset data and exporting it in Arrow IPC file format.
+
+    Examples:
+        Create a ``client`` using :obj:`axonius_api_client.connect.Connect` and assume
+        ``apiobj`` is either ``client.devices`` or ``client.users``
+
+        >>> apiobj = client.devices  # or client.users
+
+        * :meth:`args_map` for callback generic arguments to format assets.
+        * :meth:`args_map_custom` for callback specific arguments to format and export data.
+
+    Notes:
+        Requires the ``pyarrow`` package. Takes the same arguments as
+        :obj:`axonius_api_client.api.asset_callbacks.base_parquet.Parquet`, with
+        ``arrow_compression`` being one of None, 'lz4', or 'zstd'.
+
+    """
+
+    def get_writer(self, schema: Any) -> Any:
+        """Get a writer for the export file.
+
+        Args:
+            schema: arrow schema of the columns
+        """
+        compression = self.get_arg_value("arrow_compression")
+        options = self._pa.ipc.IpcWriteOptions(compression=compression)
+        return self._pa.ipc.new_file(sink=str(self._file_path), schema=schema, options=options)
+
+    CB_NAME: str = "arrow"
+    """name for this callback"""
+
+    FILE_EXT: str = ".arrow"
+    """extension to add to export_file"""
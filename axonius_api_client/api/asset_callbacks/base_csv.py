@@ -140,11 +140,13 @@ class Csv(ExportMixins):
 
         quote = getattr(csv, f"QUOTE_{quote.upper()}")
 
-        try:
-            self._fd.write(codecs.BOM_UTF8.decode("utf-8"))
-        except Exception:  # pragma: no cover
-            # only happens on windows sometimes
-            self.LOG.error("Unable to write UTF8 BOM!")
+        resume = bool(self.resume)
+        if not resume:
+            try:
+                self._fd.write(codecs.BOM_UTF8.decode("utf-8"))
+            except Exception:  # pragma: no cover
+                # only happens on windows sometimes
+                self.LOG.error("Unable to write UTF8 BOM!")
 
         self._stream = csv.DictWriter(
             self._fd,
@@ -155,8 +157,10 @@ class Csv(ExportMixins):
             dialect=dialect,
             extrasaction=extras,
         )
-        self._stream.writerow(dict(zip(self.final_columns, self.final_columns)))
-        self.do_export_schema()
+        if not resume:
+            # the columns and schema rows were written by the fetch that is being resumed
+            self._stream.writerow(dict(zip(self.final_columns, self.final_columns)))
+            self.do_export_schema()
 
     def stop(self, **kwargs):
         """Stop this callbacks object."""
@@ -175,6 +179,11 @@ class Csv(ExportMixins):
             rows: rows to process
         """
         rows = listify(rows)
+        fieldnames = set(self._stream.fieldnames)
+        if all(x in fieldnames for row in rows for x in row):
+            self._stream.writerows(rows)
+            return
+
         for row in rows:
             self._stream.fieldnames += [x for x in row if x not in self._stream.fieldnames]
             self._stream.writerow(row)
@@ -195,6 +204,21 @@ class Csv(ExportMixins):
         del rows, row
         return row_return
 
+    def process_page(self, rows: List[dict]) -> List[dict]:
+        """Process the callbacks for a page of rows and write them at once.
+
+        Args:
+            rows: rows to process
+        """
+        self.do_start()
+
+        rows = self.do_pre_page(rows=rows)
+        row_return = [{"internal_axon_id": row["internal_axon_id"]} for row in rows]
+        rows = self.do_row(rows=rows)
+        self.write_rows(rows=rows)
+        del rows
+        return row_return
+
     def do_export_schema(self):
         """Add schema rows to the output."""
         export_schema = self.get_arg_value("export_schema")
@@ -1,7 +1,5 @@
 # -*- coding: utf-8 -*-
 """JSON export callbacks."""
-import json
-import textwrap
 from typing import List, Union
 
 from ...tools import listify
@@ -74,10 +72,11 @@ class Json(ExportMixins):
         super(Json, self).start(**kwargs)
         flat = self.get_arg_value("json_flat")
 
-        self._first_row = True
+        self._first_row = self.resume.get("json_first_row", True)
         self.open_fd()
-        begin = "" if flat else "["
-        self._fd.write(begin)
+        if not self.resume:
+            begin = "" if flat else "["
+            self._fd.write(begin)
 
     def stop(self, **kwargs):
         """Stop this callbacks object."""
@@ -89,6 +88,12 @@ class Json(ExportMixins):
         self._fd.write(end)
         self.close_fd()
 
+    def get_checkpoint(self) -> dict:
+        """Get the state of this callbacks object to save in a checkpoint after each page."""
+        ret = super(Json, self).get_checkpoint()
+        ret["json_first_row"] = self._first_row
+        return ret
+
     def process_row(self, row: Union[List[dict], dict]) -> List[dict]:
         """Process the callbacks for current row.
 
@@ -103,6 +108,19 @@ class Json(ExportMixins):
         del rows, row
         return row_return
 
+    def process_page(self, rows: List[dict]) -> List[dict]:
+        """Process the callbacks for a page of rows and write them at once.
+
+        Args:
+            rows: rows to process
+        """
+        rows = self.do_pre_page(rows=rows)
+        row_return = [{"internal_axon_id": row["internal_axon_id"]} for row in rows]
+        rows = self.do_row(rows=rows)
+        self.write_rows(rows=rows)
+        del rows
+        return row_return
+
     def write_rows(self, rows: Union[List[dict], dict]):
         """Write rows to the file descriptor.
 
@@ -110,24 +128,25 @@ class Json(ExportMixins):
             rows: rows to process
         """
         rows = listify(rows)
-        flat = self.get_arg_value("json_flat")
-
-        indent = None if flat else 2
-        prefix = " " * indent if indent else ""
+        if not rows:
+            return
 
-        for row in rows:
-            if self._first_row:
-                pre = "" if flat else "\n"
-            else:
-                pre = "\n" if flat else ",\n"
-
-            self._first_row = False
-            self._fd.write(pre)
-
-            value = json.dumps(row, indent=indent)
-            value = textwrap.indent(value, prefix=prefix) if indent else value
-            self._fd.write(value)
-            del value, row
+        flat = self.get_arg_value("json_flat")
+        codec = self.json_codec
+
+        if flat:
+            pre = "" if self._first_row else "\n"
+            value = "\n".join(codec.dumps(obj=row) for row in rows)
+        else:
+            # serialize the whole page as a list indented by the codec and strip the list
+            # brackets, which indents each row by 2 spaces inside of the list in the output
+            pre = "\n" if self._first_row else ",\n"
+            value = codec.dumps(obj=rows, indent=2)[2:-2]
+
+        self._first_row = False
+        # write every row as one str so each page is a single write
+        self._fd.write(f"{pre}{value}")
+        del value, rows
 
     def do_export_schema(self):
         """Add schema rows to the output."""
@@ -1,12 +1,21 @@
 # -*- coding: utf-8 -*-
 """JSON to CSV export callbacks."""
-import json
+import gzip
+import io
+import itertools
 import tempfile
-from typing import List, Union
+from typing import IO, List, Optional, Union
 
-from ...tools import listify
+from ...exceptions import ApiError
+from ...tools import get_path, listify, profile_stage
 from .base_csv import Csv
 
+SPOOL_COMPRESS: List[Optional[str]] = [None, "gzip", "zstd"]
+"""Valid compression methods for the temporary JSON file."""
+
+SPOOL_BATCH: int = 1000
+"""Number of rows to read from the temporary JSON file and write to CSV at a time."""
+
 
 class JsonToCsv(Csv):
     """Callbacks for formatting asset data and exporting it in CSV format using a temp JSON file.
@@ -89,6 +98,16 @@ class JsonToCsv(Csv):
             ...     export="json_to_csv", export_file="test.csv", csv_quoting='all'
             ... )
 
+            Write the temporary JSON file to a fast local scratch disk and compress it with
+            zstd (requires the ``zstandard`` package). Must be one of None, 'gzip', or 'zstd'.
+
+            >>> assets = apiobj.get(
+            ...     export="json_to_csv",
+            ...     export_file="test.csv",
+            ...     spool_dir="/scratch",
+            ...     spool_compress="zstd",
+            ... )
+
         See Also:
             * :meth:`args_map` for callback generic arguments to format assets.
 
@@ -114,6 +133,8 @@ class JsonToCsv(Csv):
                 "csv_key_extras": "ignore",
                 "csv_dialect": "excel",
                 "csv_quoting": "nonnumeric",
+                "spool_dir": None,
+                "spool_compress": None,
             }
         )
         return args
@@ -122,29 +143,108 @@ class JsonToCsv(Csv):
         """Start this callbacks object."""
         super(Csv, self).start(**kwargs)
         self.open_fd()
-        self._temp_file = tempfile.NamedTemporaryFile(mode="w+", encoding="utf-8")
+        self._spool_columns: dict = {}
+        self._temp_file = self.create_spool()
+        self._spool: IO = self.open_spool(mode="w")
         self.echo(msg=f"Writing JSON to temporary file {self._temp_file.name!r}")
 
     def stop(self, **kwargs):
         """Stop this callbacks object."""
-        self.STATE["rows_processed_total"] = 0
+        self.close_spool()
+
+        # add columns found in rows that were not in the schemas to the CSV header
+        columns = self.final_columns
+        extras = [x for x in self._spool_columns if x not in columns]
+        self._final_columns = columns + extras
         self.do_start(**kwargs)
 
         self.echo(msg="Re-reading temporary file and converting to CSV")
-        self._temp_file.file.seek(0)
-
-        for line in self._temp_file.file.readlines():
-            row = json.loads(line.strip())
-            rows = listify(row)
-            rows = self.do_pre_row(rows=rows)
-            rows = self.do_row(rows=rows)
-            self.write_rows(rows=rows)
-            del rows, row, line
+        count = 0
+        with profile_stage(profiler=self.PROFILER, name="callback.read_spool"):
+            self._temp_file.seek(0)
+            self._spool = self.open_spool(mode="r")
+            loads = self.json_codec.loads
+            while True:
+                lines = list(itertools.islice(self._spool, SPOOL_BATCH))
+                if not lines:
+                    break
+                self.write_rows(rows=[loads(line) for line in lines])
+                count += len(lines)
+                del lines
+            self.close_spool()
+        self.echo(msg=f"Converted {count} rows from temporary file to CSV")
 
         self.echo(msg=f"Closing and deleting temporary file {self._temp_file.name!r}")
-        self._temp_file.file.close()
+        self._temp_file.close()
         super(JsonToCsv, self).stop(**kwargs)
 
+    def create_spool(self) -> IO:
+        """Create the temporary JSON file in spool_dir."""
+        compress = self.get_arg_value("spool_compress")
+        if compress not in SPOOL_COMPRESS:
+            self.echo(
+                msg=f"Invalid spool_compress {compress!r}, must be one of {SPOOL_COMPRESS}",
+                error=ApiError,
+            )
+
+        spool_dir = self.get_arg_value("spool_dir")
+        if spool_dir:
+            spool_dir = get_path(obj=spool_dir)
+            spool_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+
+        suffix = f".jsonl.{compress}" if compress else ".jsonl"
+        return tempfile.NamedTemporaryFile(mode="w+b", suffix=suffix, dir=spool_dir)
+
+    def open_spool(self, mode: str) -> IO:
+        """Open a text stream over the temporary JSON file, using spool_compress if supplied.
+
+        Args:
+            mode: 'r' or 'w'
+        """
+        compress = self.get_arg_value("spool_compress")
+        fh = self._temp_file.file
+
+        if compress == "gzip":
+            # favor speed over size, the file only lives until the export is done
+            stream = gzip.GzipFile(fileobj=fh, mode=f"{mode}b", compresslevel=1)
+        elif compress == "zstd":
+            try:
+                import zstandard
+            except ImportError:  # pragma: no cover
+                self.echo(
+                    msg="spool_compress='zstd' requires the 'zstandard' package", error=ApiError
+                )
+
+            if mode == "w":
+                stream = zstandard.ZstdCompressor().stream_writer(fh, closefd=False)
+            else:
+                stream = zstandard.ZstdDecompressor().stream_reader(fh, closefd=False)
+                stream = io.BufferedReader(stream)
+        else:
+            stream = fh
+
+        return io.TextIOWrapper(stream, encoding="utf-8")
+
+    def close_spool(self):
+        """Close the text stream over the temporary JSON file without closing the file."""
+        self._spool.flush()
+        stream = self._spool.detach()
+        if stream is not self._temp_file.file:
+            # flushes any compressed data that is still buffered, leaves the file open
+            stream.close()
+        self._temp_file.file.flush()
+
+    def write_spool(self, rows: List[dict]):
+        """Write rows to the temporary JSON file and track the columns seen.
+
+        Args:
+            rows: rows to write
+        """
+        for row in rows:
+            self._spool_columns.update(dict.fromkeys(row))
+        dumps = self.json_codec.dumps
+        self._spool.write("".join(f"{dumps(obj=row)}\n" for row in rows))
+
     def process_row(self, row: Union[List[dict], dict]) -> List[dict]:
         """Process the callbacks for current row.
 
@@ -155,12 +255,28 @@ class JsonToCsv(Csv):
 
         row_return = [{"internal_axon_id": row["internal_axon_id"]} for row in rows]
         rows = self.do_pre_row(rows=rows)
-        for row in rows:
-            value = json.dumps(row)
-            self._temp_file.file.write(f"{value}\n")
-            del row, value
+        rows = self.do_row(rows=rows)
+        self.write_spool(rows=rows)
+        del rows, row
+
+        return row_return
+
+    def process_page(self, rows: List[dict]) -> List[dict]:
+        """Write a page of rows to the temporary file at once.
+
+        Args:
+            rows: rows to process
+        """
+        rows = self.do_pre_page(rows=rows)
+        row_return = [{"internal_axon_id": row["internal_axon_id"]} for row in rows]
+        rows = self.do_row(rows=rows)
+        self.write_spool(rows=rows)
+        del rows
 
         return row_return
 
     CB_NAME: str = "json_to_csv"
     """name for this callback"""
+
+    EXPORT_RESUME: bool = False
+    """checkpoint and resume_from are supported by this export"""
@@ -0,0 +1,355 @@
+# -*- coding: utf-8 -*-
+"""Parquet export callbacks."""
+import datetime
+import email.utils
+import json
+from typing import Any, Callable, List, Optional, Union
+
+from ...constants.api import ARROW_BATCH_ROWS, FIELD_JOINER
+from ...exceptions import ApiError
+from ...tools import dt_parse, listify
+from .base import ExportMixins
+
+
+class Parquet(ExportMixins):
+    """Callbacks for formatting asset data and exporting it in Parquet format.
+
+    Examples:
+        Create a ``client`` using :obj:`axonius_api_client.connect.Connect` and assume
+        ``apiobj`` is either ``client.devices`` or ``client.users``
+
+        >>> apiobj = client.devices  # or client.users
+
+        * :meth:`args_map` for callback generic arguments to format assets.
+        * :meth:`args_map_custom` for callback specific arguments to format and export data.
+
+    Notes:
+        Requires the ``pyarrow`` package.
+
+    """
+
+    @classmethod
+    def args_map_custom(cls) -> dict:
+        """Get the custom argument names and their defaults for this callbacks object.
+
+        Examples:
+            Export the output to a file in the default path
+            :attr:`axonius_api_client.setup_env.DEFAULT_PATH`.
+
+            >>> assets = apiobj.get(export="parquet", export_file="test.parquet")
+
+            Export the output to an absolute path file (ignoring ``export_path``) and overwrite
+            the file if it exists.
+
+            >>> assets = apiobj.get(
+            ...     export="parquet",
+            ...     export_file="/tmp/output.parquet",
+            ...     export_overwrite=True,
+            ... )
+
+            Write a row group for every 50,000 assets and compress them with zstd.
+
+            >>> assets = apiobj.get(
+            ...     export="parquet",
+            ...     export_file="test.parquet",
+            ...     arrow_batch_rows=50000,
+            ...     arrow_compression="zstd",
+            ... )
+
+        See Also:
+            * :meth:`args_map` for callback generic arguments to format assets.
+
+        Notes:
+            If ``export_file`` does not end with ``.parquet``, it will be appended to the
+            filename.
+
+            Columns are typed using the schemas of the selected fields. Complex fields are
+            written as lists of structs and fields of adapters are written as lists, since
+            the REST API returns a value for each adapter connection.
+
+            This callbacks object defaults the following arguments to False in order to keep
+            the types of the fields: ``field_null``, ``field_flatten``, ``field_join``, and
+            ``field_titles``
+
+        """
+        args = {}
+        args.update(cls.args_map_export())
+        args.update(
+            {
+                "field_titles": False,
+                "field_flatten": False,
+                "field_join": False,
+                "field_null": False,
+                "arrow_batch_rows": ARROW_BATCH_ROWS,
+                "arrow_compression": None,
+            }
+        )
+        return args
+
+    def _init(self, **kwargs):
+        """Import pyarrow."""
+        try:
+            import pyarrow
+        except ImportError:  # pragma: no cover
+            self.echo(
+                msg=f"The {self.CB_NAME!r} export requires the 'pyarrow' package", error=ApiError
+            )
+
+        self._pa = pyarrow
+
+    def start(self, **kwargs):
+        """Start this callbacks object."""
+        super(Parquet, self).start(**kwargs)
+        export_file = self.get_arg_value("export_file")
+        if not export_file:
+            self.echo(
+                msg="Must supply export_file for this export method", error=ApiError, level="error"
+            )
+
+        if not str(export_file).endswith(self.FILE_EXT):
+            self.set_arg_value("export_file", f"{export_file}{self.FILE_EXT}")
+        self.open_fd_path()
+        self._fd.close()
+
+        self._rows = []
+        self._arrow_schema = None
+        self._arrow_converters = []
+        self._writer = None
+
+    def stop(self, **kwargs):
+        """Stop this callbacks object."""
+        super(Parquet, self).stop(**kwargs)
+        self.write_batch()
+        if self._writer is None:
+            self.open_writer()
+        self._writer.close()
+        self.echo(msg=f"Finished exporting to {self._fd_info}")
+
+    def open_writer(self):
+        """Build the schema of the columns and open the writer for the export file."""
+        pa = self._pa
+        fields = []
+        self._arrow_converters = []
+        for column, schema in self.arrow_columns:
+            arrow_type = self.get_arrow_type(schema=schema)
+            fields.append(pa.field(column, arrow_type))
+            self._arrow_converters.append((column, get_converter(pa=pa, arrow_type=arrow_type)))
+
+        self._arrow_schema = pa.schema(fields)
+        self._writer = self.get_writer(schema=self._arrow_schema)
+
+    def get_writer(self, schema: Any) -> Any:
+        """Get a writer for the export file.
+
+        Args:
+            schema: arrow schema of the columns
+        """
+        import pyarrow.parquet
+
+        compression = self.get_arg_value("arrow_compression") or "snappy"
+        return pyarrow.parquet.ParquetWriter(
+            where=str(self._file_path), schema=schema, compression=compression
+        )
+
+    @property
+    def arrow_columns(self) -> List[tuple]:
+        """Get the column names and field schemas of the output, including unknown columns."""
+        columns = list(zip(self.final_columns, self.final_schemas))
+        names = set(self.final_columns)
+        for row in self._rows:
+            for key in row:
+                if key not in names:
+                    # keys of rows that do not have a schema are written as strings
+                    columns.append((key, {"name_qual": key, "type": "string"}))
+                    names.add(key)
+        return columns
+
+    def get_arrow_type(self, schema: dict, sub: bool = False) -> Any:
+        """Get the arrow type for a field schema.
+
+        Args:
+            schema: field schema
+            sub: schema is a sub field of a complex field
+        """
+        pa = self._pa
+        if schema.get("is_complex"):
+            subs = schema.get("sub_fields") or []
+            fields = [pa.field(x["name"], self.get_arrow_type(schema=x, sub=True)) for x in subs]
+            return pa.list_(pa.struct(fields))
+
+        if schema.get("type") == "array":
+            items = schema.get("items") or {}
+            item_type = get_scalar_type(pa=pa, ftype=items.get("type"), fformat=items.get("format"))
+            return pa.list_(item_type)
+
+        arrow_type = get_scalar_type(pa=pa, ftype=schema.get("type"), fformat=schema.get("format"))
+        is_api = schema.get("name_qual") in self.APIOBJ.FIELDS_API
+        if sub or is_api or schema.get("adapter_name") is None:
+            return arrow_type
+        return pa.list_(arrow_type)
+
+    def write_batch(self):
+        """Write the buffered rows as a record batch."""
+        if not self._rows:
+            return
+
+        if self._writer is None:
+            self.open_writer()
+
+        data = {k: [v(x.get(k)) for x in self._rows] for k, v in self._arrow_converters}
+        batch = self._pa.RecordBatch.from_pydict(data, schema=self._arrow_schema)
+        self._writer.write_batch(batch)
+        self._rows = []
+
+    def add_rows(self, rows: List[dict]):
+        """Buffer rows and write them as a record batch if there are arrow_batch_rows.
+
+        Args:
+            rows: rows to add
+        """
+        self._rows += rows
+        if len(self._rows) >= (self.get_arg_value("arrow_batch_rows") or ARROW_BATCH_ROWS):
+            self.write_batch()
+
+    def process_row(self, row: Union[List[dict], dict]) -> List[dict]:
+        """Process the callbacks for current row.
+
+        Args:
+            row: row to process
+        """
+        rows = listify(row)
+        rows = self.do_pre_row(rows=rows)
+
+        row_return = [{"internal_axon_id": row["internal_axon_id"]} for row in rows]
+        rows = self.do_row(rows=rows)
+        self.add_rows(rows=rows)
+        return row_return
+
+    def process_page(self, rows: List[dict]) -> List[dict]:
+        """Process the callbacks for a page of rows at once.
+
+        Args:
+            rows: rows to process
+        """
+        rows = self.do_pre_page(rows=rows)
+        row_return = [{"internal_axon_id": row["internal_axon_id"]} for row in rows]
+        rows = self.do_row(rows=rows)
+        self.add_rows(rows=rows)
+        return row_return
+
+    CB_NAME: str = "parquet"
+    """name for this callback"""
+
+    EXPORT_COMPRESS: bool = False
+    """export_compress is supported by this export"""
+
+    EXPORT_RESUME: bool = False
+    """checkpoint and resume_from are supported by this export"""
+
+    FILE_EXT: str = ".parquet"
+    """extension to add to export_file"""
+
+
+def get_scalar_type(pa: Any, ftype: Optional[str], fformat: Optional[str] = None) -> Any:
+    """Get the arrow type for a field schema type and format.
+
+    Args:
+        pa: pyarrow module
+        ftype: type of field schema
+        fformat: format of field schema
+    """
+    if fformat == "date-time":
+        return pa.timestamp("us", tz="UTC")
+    if ftype == "bool":
+        return pa.bool_()
+    if ftype == "integer":
+        return pa.int64()
+    if ftype == "number":
+        return pa.float64()
+    return pa.string()
+
+
+def get_converter(pa: Any, arrow_type: Any) -> Callable[[Any], Any]:
+    """Get a function that converts a value from the REST API into a value of an arrow type.
+
+    Notes:
+        Values that can not be converted are returned as None.
+
+    Args:
+        pa: pyarrow module
+        arrow_type: arrow type to convert values to
+    """
+    if pa.types.is_list(arrow_type):
+        convert_item = get_converter(pa=pa, arrow_type=arrow_type.value_type)
+
+        def convert(value):
+            if value is None:
+                return None
+            values = value if isinstance(value, (list, tuple)) else [value]
+            return [convert_item(x) for x in values]
+
+        return convert
+
+    if pa.types.is_struct(arrow_type):
+        fields = [arrow_type.field(idx) for idx in range(arrow_type.num_fields)]
+        converters = [(x.name, get_converter(pa=pa, arrow_type=x.type)) for x in fields]
+
+        def convert(value):
+            if not isinstance(value, dict):
+                return None
+            return {k: v(value.get(k)) for k, v in converters}
+
+        return convert
+
+    if pa.types.is_timestamp(arrow_type):
+        cast = to_datetime
+    elif pa.types.is_boolean(arrow_type):
+        cast = bool
+    elif pa.types.is_integer(arrow_type):
+        cast = int
+    elif pa.types.is_floating(arrow_type):
+        cast = float
+    else:
+        cast = to_str
+
+    def convert(value):
+        if isinstance(value, (list, tuple)):
+            # scalar fields with more than one value, i.e. from fields of more than one adapter
+            value = [x for x in value if x is not None]
+            if len(value) > 1 and cast is to_str:
+                value = FIELD_JOINER.join(to_str(x) for x in value)
+            else:
+                value = value[0] if value else None
+
+        if value is None:
+            return None
+        try:
+            return cast(value)
+        except Exception:
+            return None
+
+    return convert
+
+
+def to_str(value: Any) -> str:
+    """Convert a value into a str, serializing it as JSON if it is not a str.
+
+    Args:
+        value: value to convert
+    """
+    return value if isinstance(value, str) else json.dumps(value)
+
+
+def to_datetime(value: Any) -> datetime.datetime:
+    """Convert a value into a datetime.
+
+    Args:
+        value: value to convert
+    """
+    if isinstance(value, str):
+        try:
+            # fast path for the RFC 2822 format that the REST API uses for dates
+            return email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            pass
+    return dt_parse(obj=value)
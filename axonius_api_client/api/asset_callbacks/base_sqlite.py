@@ -0,0 +1,421 @@
+# -*- coding: utf-8 -*-
+"""SQLite export callbacks."""
+import datetime
+import sqlite3
+from typing import Any, Callable, List, Optional, Tuple, Union
+
+from ...constants.api import PAGE_SIZE, SQLITE_INT_MAX, SQLITE_INT_MIN, SQLITE_PARTITION
+from ...exceptions import ApiError
+from ...tools import dt_now, json_dump, listify
+from .base import ExportMixins
+
+
+class Sqlite(ExportMixins):
+    """Callbacks for formatting asset data and exporting it to a SQLite database.
+
+    Examples:
+        Create a ``client`` using :obj:`axonius_api_client.connect.Connect` and assume
+        ``apiobj`` is either ``client.devices`` or ``client.users``
+
+        >>> apiobj = client.devices  # or client.users
+
+        * :meth:`args_map` for callback generic arguments to format assets.
+        * :meth:`args_map_custom` for callback specific arguments to format and export data.
+
+    """
+
+    @classmethod
+    def args_map_custom(cls) -> dict:
+        """Get the custom argument names and their defaults for this callbacks object.
+
+        Examples:
+            Export the output to a file in the default path
+            :attr:`axonius_api_client.setup_env.DEFAULT_PATH`.
+
+            >>> assets = apiobj.get(export="sqlite", export_file="assets.sqlite")
+
+            Add the assets to a database from a previous run, replacing the assets of the
+            same history date, and index the hostname column.
+
+            >>> assets = apiobj.get(
+            ...     export="sqlite",
+            ...     export_file="assets.sqlite",
+            ...     sqlite_append=True,
+            ...     sqlite_indexes=["internal_axon_id", "specific_data.data.hostname"],
+            ... )
+
+            Join devices with the IPs of their network interfaces.
+
+            >>> import sqlite3
+            >>> conn = sqlite3.connect("assets.sqlite")
+            >>> conn.execute(
+            ...     'SELECT d."specific_data.data.hostname", n."ips" FROM "devices" d '
+            ...     'JOIN "devices__specific_data.data.network_interfaces" n '
+            ...     'USING ("internal_axon_id", "history_date")'
+            ... ).fetchall()
+
+        See Also:
+            * :meth:`args_map` for callback generic arguments to format assets.
+
+        Notes:
+            If ``export_file`` does not end with ``.sqlite``, it will be appended to the
+            filename.
+
+            The assets are written to the table ``sqlite_table`` (default is ``devices`` or
+            ``users``). Complex fields are written to child tables named
+            ``{sqlite_table}__{field}`` with one row for each value of the complex field,
+            keyed by ``internal_axon_id`` and ``idx``.
+
+            Every table has a ``history_date`` column, which is the history date of the
+            fetch or the current date. If ``sqlite_append`` is True and ``export_file``
+            exists, the rows with the same ``history_date`` are replaced and all other rows
+            are kept.
+
+            Columns are typed using the schemas of the selected fields. Fields with more than
+            one value, like fields of more than one adapter, are written as JSON arrays.
+
+            The indexes in ``sqlite_indexes`` are created after all assets are written.
+
+            This callbacks object defaults the following arguments to False in order to keep
+            the types of the fields: ``field_null``, ``field_flatten``, ``field_join``, and
+            ``field_titles``
+
+        """
+        args = {}
+        args.update(cls.args_map_export())
+        args.update(
+            {
+                "field_titles": False,
+                "field_flatten": False,
+                "field_join": False,
+                "field_null": False,
+                "sqlite_table": None,
+                "sqlite_indexes": ["internal_axon_id"],
+                "sqlite_append": False,
+            }
+        )
+        return args
+
+    def start(self, **kwargs):
+        """Start this callbacks object."""
+        super(Sqlite, self).start(**kwargs)
+        export_file = self.get_arg_value("export_file")
+        if not export_file:
+            self.echo(
+                msg="Must supply export_file for this export method", error=ApiError, level="error"
+            )
+
+        if not str(export_file).endswith(self.FILE_EXT):
+            self.set_arg_value("export_file", f"{export_file}{self.FILE_EXT}")
+
+        append = self.get_arg_value("sqlite_append")
+        if append and self.export_full_path.is_file():
+            self._file_path = self.export_full_path
+            self._fd_info = f"file {str(self._file_path)!r} (Appended to existing file)"
+            self.echo(msg=f"Exporting to {self._fd_info}")
+        else:
+            self.open_fd_path()
+            self._fd.close()
+
+        self._rows = []
+        self._partition = self.get_partition()
+        self._conn = sqlite3.connect(str(self._file_path), isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self.create_tables()
+        if append:
+            self.delete_partition()
+
+    def stop(self, **kwargs):
+        """Stop this callbacks object."""
+        super(Sqlite, self).stop(**kwargs)
+        self.write_rows(rows=self._rows)
+        self._rows = []
+        self.create_indexes()
+        self._conn.close()
+        self.echo(msg=f"Finished exporting to {self._fd_info}")
+
+    def get_partition(self) -> str:
+        """Get the value of the history_date column for this fetch."""
+        history_date = self.STORE.get("history_date_parsed")
+        if isinstance(history_date, datetime.datetime):
+            return history_date.date().isoformat()
+        if history_date:
+            return str(history_date)
+        return dt_now().date().isoformat()
+
+    @property
+    def sqlite_table(self) -> str:
+        """Get the name of the table to write assets to."""
+        return self.get_arg_value("sqlite_table") or self.APIOBJ.__class__.__name__.lower()
+
+    def create_tables(self):
+        """Create the tables for the columns of the output, adding columns that are missing."""
+        table = self.sqlite_table
+        self._columns = []
+        self._children = []
+
+        columns = [(SQLITE_PARTITION, "TEXT")]
+        for column, schema in zip(self.final_columns, self.final_schemas):
+            if column == SQLITE_PARTITION:
+                continue
+
+            if schema.get("is_complex"):
+                self.create_child_table(column=column, schema=schema)
+                continue
+
+            columns.append((column, get_sql_type(schema=schema)))
+            self._columns.append((column, get_converter(schema=schema)))
+
+        self.create_table(table=table, columns=columns)
+
+    def create_child_table(self, column: str, schema: dict):
+        """Create the child table for a complex field.
+
+        Args:
+            column: column name of the complex field
+            schema: schema of the complex field
+        """
+        table = f"{self.sqlite_table}__{column}"
+        columns = [("internal_axon_id", "TEXT"), (SQLITE_PARTITION, "TEXT"), ("idx", "INTEGER")]
+        converters = []
+        for sub_schema in self.get_sub_schemas(schema=schema):
+            name = sub_schema["name"]
+            columns.append((name, get_sql_type(schema=sub_schema)))
+            converters.append((name, get_converter(schema=sub_schema)))
+
+        self.create_table(table=table, columns=columns)
+        self._children.append((column, table, converters))
+
+    def create_table(self, table: str, columns: List[Tuple[str, str]]):
+        """Create a table if it does not exist and add any columns that it is missing.
+
+        Args:
+            table: name of table
+            columns: names and types of columns
+        """
+        defs = ", ".join(f"{quote(name)} {sql_type}" for name, sql_type in columns)
+        self._conn.execute(f"CREATE TABLE IF NOT EXISTS {quote(table)} ({defs})")
+
+        existing = {x[1] for x in self._conn.execute(f"PRAGMA table_info({quote(table)})")}
+        for name, sql_type in columns:
+            if name not in existing:
+                self._conn.execute(
+                    f"ALTER TABLE {quote(table)} ADD COLUMN {quote(name)} {sql_type}"
+                )
+
+    def delete_partition(self):
+        """Delete the rows of every table that have the history_date of this fetch."""
+        tables = [self.sqlite_table] + [x[1] for x in self._children]
+        self._conn.execute("BEGIN")
+        for table in tables:
+            sql = f"DELETE FROM {quote(table)} WHERE {quote(SQLITE_PARTITION)} = ?"
+            count = self._conn.execute(sql, (self._partition,)).rowcount
+            if count:
+                self.echo(msg=f"Deleted {count} rows from {table!r} for {self._partition!r}")
+        self._conn.execute("COMMIT")
+
+    def create_indexes(self):
+        """Create the indexes of sqlite_indexes, history_date, and the child tables."""
+        table = self.sqlite_table
+        indexes = [(table, SQLITE_PARTITION)]
+        indexes += [(table, x) for x in listify(self.get_arg_value("sqlite_indexes"))]
+        indexes += [(x[1], "internal_axon_id") for x in self._children]
+
+        names = {x[0] for x in self._columns}
+        for index_table, column in indexes:
+            if index_table == table and column not in names and column != SQLITE_PARTITION:
+                self.echo(msg=f"Unable to index unknown column {column!r}", warning=True)
+                continue
+            name = quote(f"ix_{index_table}_{column}")
+            self._conn.execute(
+                f"CREATE INDEX IF NOT EXISTS {name} ON {quote(index_table)} ({quote(column)})"
+            )
+        self.echo(msg=f"Created {len(indexes)} indexes")
+
+    def add_unknown_columns(self, rows: List[dict]):
+        """Add columns for keys of rows that do not have a schema as TEXT columns.
+
+        Args:
+            rows: rows to check for unknown keys
+        """
+        names = {x[0] for x in self._columns}
+        names.update(x[0] for x in self._children)
+        names.add(SQLITE_PARTITION)
+        for row in rows:
+            for key in row:
+                if key not in names:
+                    self.create_table(table=self.sqlite_table, columns=[(key, "TEXT")])
+                    self._columns.append((key, get_converter(schema={})))
+                    names.add(key)
+
+    def write_rows(self, rows: List[dict]):
+        """Write rows to the tables in a single transaction.
+
+        Args:
+            rows: rows to write
+        """
+        if not rows:
+            return
+
+        self.add_unknown_columns(rows=rows)
+        partition = self._partition
+        columns = self._columns
+        table = self.sqlite_table
+        names = ", ".join(quote(x[0]) for x in [(SQLITE_PARTITION, None)] + columns)
+        marks = ", ".join("?" * (len(columns) + 1))
+        values = [(partition, *[v(row.get(k)) for k, v in columns]) for row in rows]
+
+        self._conn.execute("BEGIN")
+        try:
+            self._conn.executemany(f"INSERT INTO {quote(table)} ({names}) VALUES ({marks})", values)
+            for column, child_table, converters in self._children:
+                self.write_child_rows(
+                    rows=rows, column=column, table=child_table, converters=converters
+                )
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+    def write_child_rows(
+        self, rows: List[dict], column: str, table: str, converters: List[Tuple[str, Callable]]
+    ):
+        """Write the values of a complex field of rows to its child table.
+
+        Args:
+            rows: rows to write
+            column: column name of the complex field
+            table: name of child table
+            converters: names and converters of the sub fields
+        """
+        partition = self._partition
+        names = ["internal_axon_id", SQLITE_PARTITION, "idx"] + [x[0] for x in converters]
+        marks = ", ".join("?" * len(names))
+        names = ", ".join(quote(x) for x in names)
+
+        values = []
+        for row in rows:
+            axon_id = row.get("internal_axon_id")
+            items = [x for x in listify(row.get(column)) if isinstance(x, dict)]
+            for idx, item in enumerate(items):
+                values.append((axon_id, partition, idx, *[v(item.get(k)) for k, v in converters]))
+
+        if values:
+            self._conn.executemany(f"INSERT INTO {quote(table)} ({names}) VALUES ({marks})", values)
+
+    def process_row(self, row: Union[List[dict], dict]) -> List[dict]:
+        """Process the callbacks for current row and write them in batches of PAGE_SIZE rows.
+
+        Args:
+            row: row to process
+        """
+        rows = listify(row)
+        rows = self.do_pre_row(rows=rows)
+
+        row_return = [{"internal_axon_id": row["internal_axon_id"]} for row in rows]
+        self._rows += self.do_row(rows=rows)
+        if len(self._rows) >= PAGE_SIZE:
+            self.write_rows(rows=self._rows)
+            self._rows = []
+        return row_return
+
+    def process_page(self, rows: List[dict]) -> List[dict]:
+        """Process the callbacks for a page of rows and write them in a single transaction.
+
+        Args:
+            rows: rows to process
+        """
+        rows = self.do_pre_page(rows=rows)
+        row_return = [{"internal_axon_id": row["internal_axon_id"]} for row in rows]
+        rows = self.do_row(rows=rows)
+        self.write_rows(rows=rows)
+        return row_return
+
+    CB_NAME: str = "sqlite"
+    """name for this callback"""
+
+    EXPORT_COMPRESS: bool = False
+    """export_compress is supported by this export"""
+
+    EXPORT_RESUME: bool = False
+    """checkpoint and resume_from are supported by this export"""
+
+    FILE_EXT: str = ".sqlite"
+    """extension to add to export_file"""
+
+
+def quote(name: str) -> str:
+    """Quote a SQLite identifier.
+
+    Args:
+        name: identifier to quote
+    """
+    return '"{}"'.format(name.replace('"', '""'))
+
+
+def get_sql_type(schema: dict) -> str:
+    """Get the SQLite column type for a field schema.
+
+    Args:
+        schema: field schema
+    """
+    ftype = schema.get("type")
+    if ftype == "array" or schema.get("format") == "date-time":
+        return "TEXT"
+    if ftype in ["bool", "integer"]:
+        return "INTEGER"
+    if ftype == "number":
+        return "REAL"
+    return "TEXT"
+
+
+def get_converter(schema: dict) -> Callable[[Any], Any]:
+    """Get a function that converts a value from the REST API into a SQLite value.
+
+    Notes:
+        Array fields are always written as JSON arrays. Scalar fields with one value are
+        written as that value, and with more than one value as a JSON array.
+
+    Args:
+        schema: field schema
+    """
+    if schema.get("type") == "array":
+        return to_json
+
+    def convert(value):
+        if isinstance(value, (list, tuple)):
+            # scalar fields with more than one value, i.e. from fields of more than one adapter
+            value = [x for x in value if x is not None]
+            if len(value) > 1:
+                return to_json(value)
+            value = value[0] if value else None
+        return to_scalar(value)
+
+    return convert
+
+
+def to_json(value: Any) -> Optional[str]:
+    """Convert a value into a JSON str.
+
+    Args:
+        value: value to convert
+    """
+    if value is None:
+        return None
+    return json_dump(obj=value, indent=None)
+
+
+def to_scalar(value: Any) -> Any:
+    """Convert a value into a value that SQLite supports.
+
+    Args:
+        value: value to convert
+    """
+    if isinstance(value, int) and not SQLITE_INT_MIN <= value <= SQLITE_INT_MAX:
+        return str(value)
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    if isinstance(value, datetime.datetime):
+        return value.isoformat()
+    return json_dump(obj=value, indent=None)
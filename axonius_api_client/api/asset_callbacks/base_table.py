@@ -1,10 +1,8 @@
 # -*- coding: utf-8 -*-
 """Table export callbacks."""
-from typing import List, Union
+from typing import Any, List, Union
 
-import tabulate
-
-from ...constants.api import TABLE_FORMAT, TABLE_MAX_ROWS
+from ...constants.api import TABLE_FORMAT, TABLE_MAX_ROWS, TABLE_WINDOW
 from ...exceptions import ApiError, StopFetch
 from ...tools import listify
 from .base import ExportMixins
@@ -76,6 +74,16 @@ class Table(ExportMixins):
             ...     table_api_fields=True,
             ... )
 
+            Stream the output as a table for every 100 rows instead of one table when the fetch
+            is done. Column widths are calculated from the first 100 rows and the column titles,
+            longer values in later rows are wrapped.
+
+            >>> assets = apiobj.get(
+            ...     export="table",
+            ...     table_max_rows=0,
+            ...     table_window=100,
+            ... )
+
         See Also:
             * :meth:`args_map` for callback generic arguments to format assets.
 
@@ -102,6 +110,7 @@ class Table(ExportMixins):
                 "table_format": TABLE_FORMAT,
                 "table_max_rows": TABLE_MAX_ROWS,
                 "table_api_fields": False,
+                "table_window": TABLE_WINDOW,
             }
         )
         return args
@@ -124,11 +133,21 @@ class Table(ExportMixins):
         """Start this callbacks object."""
         super(Table, self).start(**kwargs)
         self._rows = []
+        self._table_widths = {}
+        self._table_windows = 0
         self.open_fd()
 
     def stop(self, **kwargs):
         """Stop this callbacks object."""
         super(Table, self).stop(**kwargs)
+        if self.get_arg_value("table_window"):
+            if self._rows or not self._table_windows:
+                self.write_window()
+            self.close_fd()
+            return
+
+        import tabulate
+
         tablefmt = self.get_arg_value("table_format") or TABLE_FORMAT
         rows = getattr(self, "_rows", [])
 
@@ -143,6 +162,44 @@ class Table(ExportMixins):
         self._fd.write("\n")
         self.close_fd()
 
+    def add_rows(self, rows: List[dict]):
+        """Add rows to the current window and write it if it is full.
+
+        Args:
+            rows: rows to add
+        """
+        self._rows += rows
+        window = self.get_arg_value("table_window")
+        if window and len(self._rows) >= window:
+            self.write_window()
+
+    def write_window(self):
+        """Write the rows of the current window as a table with fixed column widths."""
+        import tabulate
+
+        widths = self._table_widths
+        for row in self._rows:
+            for key in row:
+                if key not in widths:
+                    # column widths are calculated from the first window a column is seen in
+                    values = [get_width(x.get(key)) for x in self._rows]
+                    widths[key] = max([len(key)] + values)
+
+        tablefmt = self.get_arg_value("table_format") or TABLE_FORMAT
+        table = tabulate.tabulate(
+            tabular_data=[[row.get(k) for k in widths] for row in self._rows],
+            tablefmt=tablefmt,
+            showindex=False,
+            headers=[k.ljust(v) for k, v in widths.items()],
+            maxcolwidths=list(widths.values()) or None,
+        )
+
+        self._fd.write(table)
+        self._fd.write("\n")
+        self._fd.flush()
+        self._table_windows += 1
+        self._rows = []
+
     def process_row(self, row: Union[List[dict], dict]) -> List[dict]:
         """Process the callbacks for current row.
 
@@ -154,7 +211,38 @@ class Table(ExportMixins):
         self.check_stop()
         rows = self.do_row(rows=rows)
         # TBD textwrap key/values
-        self._rows += rows
+        self.add_rows(rows=rows)
+        return rows
+
+    def process_page(self, rows: List[dict]) -> List[dict]:
+        """Process the callbacks for a page of rows at once.
+
+        Notes:
+            Keeps the same rows that :meth:`process_row` would have kept before
+            :meth:`check_stop` stopped the fetch, and marks the fetch as stopped in
+            :attr:`STATE` so that the rows of this page are still returned.
+
+        Args:
+            rows: rows to process
+        """
+        rows = listify(rows)
+        self.check_stop()
+
+        max_rows = self.get_arg_value("table_max_rows")
+        rows_processed = self.STATE.get("rows_processed_total", 0) or 0
+        stop = bool(max_rows) and rows_processed + len(rows) >= max_rows
+        if stop:
+            rows = rows[: max(max_rows - rows_processed - 1, 0)]
+
+        rows = self.do_pre_page(rows=rows)
+        rows = self.do_row(rows=rows) if rows else rows
+        self.add_rows(rows=rows)
+
+        if stop:
+            reason = f"table_max_rows of {max_rows}"
+            self.STATE["stop_fetch"] = True
+            self.STATE["stop_msg"] = reason
+            self.APIOBJ.LOG.info(f"Issuing stop of fetch due to {reason}")
         return rows
 
     def check_stop(self):
@@ -178,6 +266,8 @@ class Table(ExportMixins):
         Raises:
             :exc:`axonius_api_client.exceptions.ApiError`: if fmt is not a valid choice
         """
+        import tabulate
+
         if fmt not in tabulate.tabulate_formats:
             fmts = ", ".join(tabulate.tabulate_formats)
             msg = f"{fmt!r} is not a valid table format, must be one of {fmts}"
@@ -186,3 +276,17 @@ class Table(ExportMixins):
 
     CB_NAME: str = "table"
     """name for this callback"""
+
+    EXPORT_RESUME: bool = False
+    """checkpoint and resume_from are supported by this export"""
+
+
+def get_width(value: Any) -> int:
+    """Get the width of the longest line of a value as it will be shown in a table.
+
+    Args:
+        value: value to get the width of
+    """
+    if value is None:
+        return 0
+    return max([len(x) for x in str(value).splitlines()] or [0])
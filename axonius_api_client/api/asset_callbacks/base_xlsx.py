@@ -1,10 +1,8 @@
 # -*- coding: utf-8 -*-
 """Excel export callbacks class."""
-from typing import List
+from typing import List, Optional, Union
 
-import xlsxwriter
-
-from ...constants.api import FIELD_TRIM_LEN
+from ...constants.api import FIELD_TRIM_LEN, XLSX_MAX_ROWS, XLSX_TYPE_FORMATS
 from ...exceptions import ApiError
 from ...tools import listify
 from .base import ExportMixins
@@ -71,6 +69,34 @@ class Xlsx(ExportMixins):
             ...     xlsx_cell_format=fmt,
             ... )
 
+            Format columns using the types of their fields, such as integer fields with a
+            number format. See :data:`axonius_api_client.constants.api.XLSX_TYPE_FORMATS`
+            for the default formats.
+
+            >>> assets = apiobj.get(
+            ...     export="xlsx",
+            ...     export_file="test.xlsx",
+            ...     xlsx_column_formats=True,
+            ... )
+
+            Supply formats for columns by field type or by column name, which are merged
+            with ``xlsx_cell_format``.
+
+            >>> fmts = {"integer": {"num_format": "#,##0"}, "Asset Unique ID": {"bold": True}}
+            >>> assets = apiobj.get(
+            ...     export="xlsx",
+            ...     export_file="test.xlsx",
+            ...     xlsx_column_formats=fmts,
+            ... )
+
+            Limit the length of the values in each cell.
+
+            >>> assets = apiobj.get(
+            ...     export="xlsx",
+            ...     export_file="test.xlsx",
+            ...     xlsx_cell_max_len=1000,
+            ... )
+
         See Also:
             * :meth:`args_map` for callback generic arguments to format assets.
 
@@ -85,6 +111,10 @@ class Xlsx(ExportMixins):
             :meth:`axonius_api_client.api.assets.users.Users.get` or
             :meth:`axonius_api_client.api.assets.devices.Devices.get`
 
+            When a worksheet reaches ``xlsx_max_rows`` rows (default is the Excel limit of
+            :data:`axonius_api_client.constants.api.XLSX_MAX_ROWS`), a new worksheet is added
+            with the same headers, i.e. ``Devices``, ``Devices_2``, ``Devices_3``.
+
         """
         args = {}
         args.update(cls.args_map_export())
@@ -97,6 +127,9 @@ class Xlsx(ExportMixins):
                 "field_null": True,
                 "xlsx_column_length": 50,
                 "xlsx_cell_format": {"text_wrap": True},
+                "xlsx_column_formats": None,
+                "xlsx_max_rows": XLSX_MAX_ROWS,
+                "xlsx_cell_max_len": None,
             }
         )
         return args
@@ -116,7 +149,6 @@ class Xlsx(ExportMixins):
         """Start this callbacks object."""
         export_file = self.get_arg_value("export_file")
         cell_format = self.get_arg_value("xlsx_cell_format")
-        column_length = self.get_arg_value("xlsx_column_length")
 
         if export_file:
             if not str(export_file).endswith(".xlsx"):
@@ -128,16 +160,61 @@ class Xlsx(ExportMixins):
                 msg="Must supply export_file for this export method", error=ApiError, level="error"
             )
 
+        import xlsxwriter
+
         self._workbook = xlsxwriter.Workbook(str(self._file_path), {"constant_memory": True})
         self._cell_format = self._workbook.add_format(cell_format)
+        self._column_formats = self.get_column_formats()
+        self._columns = list(self.final_columns)
+        max_rows = self.get_arg_value("xlsx_max_rows") or XLSX_MAX_ROWS
+        self._max_rows = max(min(max_rows, XLSX_MAX_ROWS), 2)
+        self._cell_max_len = self.get_arg_value("xlsx_cell_max_len") or None
+        self._worksheets = []
+        self.add_worksheet()
+
+    def add_worksheet(self):
+        """Add a worksheet and write the headers to it."""
+        column_length = self.get_arg_value("xlsx_column_length")
+        name = f"{self.APIOBJ.__class__.__name__}"
+        if self._worksheets:
+            name = f"{name}_{len(self._worksheets) + 1}"
+
+        self._worksheet = self._workbook.add_worksheet(name)
+        self._worksheets.append(self._worksheet)
+        self._worksheet.write_row(0, 0, self._columns, self._cell_format)
+        for idx, column_format in enumerate(self._column_formats):
+            self._worksheet.set_column(idx, idx, column_length, column_format)
+        self._rowtracker = 1
 
-        worksheet = f"{self.APIOBJ.__class__.__name__}"
-        self._worksheet = self._workbook.add_worksheet(worksheet)
+    def get_column_formats(self) -> list:
+        """Get the format for each column, merged from xlsx_cell_format and xlsx_column_formats.
 
-        for idx, column_name in enumerate(self.final_columns):
-            self._worksheet.write(0, idx, column_name, self._cell_format)
-            self._worksheet.set_column(idx, idx, column_length)
-        self._rowtracker = 1
+        Notes:
+            If xlsx_column_formats is True, :data:`XLSX_TYPE_FORMATS` is used. Formats for
+            a column name take precedence over formats for a field type.
+        """
+        column_formats = self.get_arg_value("xlsx_column_formats")
+        if column_formats is True:
+            column_formats = XLSX_TYPE_FORMATS
+        column_formats = column_formats or {}
+        cell_format = self.get_arg_value("xlsx_cell_format") or {}
+
+        formats = []
+        cache = {}
+        for column_name, schema in zip(self.final_columns, self.final_schemas):
+            column_format = column_formats.get(column_name)
+            if column_format is None:
+                column_format = column_formats.get(get_field_type(schema=schema))
+
+            if not column_format:
+                formats.append(self._cell_format)
+                continue
+
+            key = repr(sorted(column_format.items()))
+            if key not in cache:
+                cache[key] = self._workbook.add_format({**cell_format, **column_format})
+            formats.append(cache[key])
+        return formats
 
     def stop(self, **kwargs):
         """Stop this callbacks object."""
@@ -155,19 +232,68 @@ class Xlsx(ExportMixins):
 
         row_return = [{"internal_axon_id": row["internal_axon_id"]} for row in rows]
         rows = self.do_row(rows=rows)
+        self.write_rows(rows=rows)
+        del rows
 
-        for row in listify(rows):
-            for idx, column_name in enumerate(self.final_columns):
-                self._worksheet.write(
-                    self._rowtracker, idx, row.get(column_name), self._cell_format
-                )
+        return row_return
 
-            self._rowtracker += 1
-            del row
+    def process_page(self, rows: List[dict]) -> List[dict]:
+        """Process the callbacks for a page of rows and write them at once.
 
+        Args:
+            rows: rows to process
+        """
+        rows = self.do_pre_page(rows=rows)
+        row_return = [{"internal_axon_id": row["internal_axon_id"]} for row in rows]
+        rows = self.do_row(rows=rows)
+        self.write_rows(rows=rows)
         del rows
 
         return row_return
 
+    def write_rows(self, rows: Union[List[dict], dict]):
+        """Write rows to the worksheet, one call per row.
+
+        Notes:
+            Cells without a value are not written and cells with a value are written
+            without a format, so the format of their column is used.
+
+        Args:
+            rows: rows to write
+        """
+        columns = self._columns
+        max_rows = self._max_rows
+        max_len = self._cell_max_len
+        for row in listify(rows):
+            if self._rowtracker >= max_rows:
+                self.add_worksheet()
+
+            values = [row.get(column_name) for column_name in columns]
+            if max_len:
+                values = [
+                    x[:max_len] if isinstance(x, str) and len(x) > max_len else x for x in values
+                ]
+            self._worksheet.write_row(self._rowtracker, 0, values)
+            self._rowtracker += 1
+            del row, values
+
     CB_NAME: str = "xlsx"
     """name for this callback"""
+
+    EXPORT_COMPRESS: bool = False
+    """export_compress is supported by this export"""
+
+    EXPORT_RESUME: bool = False
+    """checkpoint and resume_from are supported by this export"""
+
+
+def get_field_type(schema: dict) -> Optional[str]:
+    """Get the type of a field schema, using the type of the items for array fields.
+
+    Args:
+        schema: field schema
+    """
+    field_type = schema.get("type")
+    if field_type == "array":
+        return (schema.get("items") or {}).get("type")
+    return field_type
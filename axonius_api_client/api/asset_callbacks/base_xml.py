@@ -5,6 +5,9 @@ from typing import List, Union
 from ...tools import listify
 from .base import ExportMixins
 
+XML_ROOT: str = "assets"
+"""Name of the root element of the XML document."""
+
 
 class Xml(ExportMixins):
     """Callbacks for formatting asset data and exporting it in XML format.
@@ -93,18 +96,41 @@ class Xml(ExportMixins):
     def start(self, **kwargs):
         """Start this callbacks object."""
         super(Xml, self).start(**kwargs)
-        self._rows = []
+        self._rows_written = self.resume.get("xml_rows_written", 0)
         self.open_fd()
+        if not self.resume:
+            self._fd.write(f'<?xml version="1.0" encoding="utf-8"?>\n<{XML_ROOT}>')
 
     def stop(self, **kwargs):
         """Stop this callbacks object."""
         super(Xml, self).stop(**kwargs)
-        rows = getattr(self, "_rows", [])
+        self._fd.write(f"\n</{XML_ROOT}>" if self._rows_written else f"</{XML_ROOT}>")
+        self.close_fd()
+
+    def get_checkpoint(self) -> dict:
+        """Get the state of this callbacks object to save in a checkpoint after each page."""
+        ret = super(Xml, self).get_checkpoint()
+        ret["xml_rows_written"] = self._rows_written
+        return ret
+
+    def write_rows(self, rows: List[dict]):
+        """Write rows to the file descriptor as elements of the root element.
+
+        Notes:
+            The rows are serialized as a document by themselves and the root element tags are
+            stripped off, which produces the same output as serializing all rows at once.
+
+        Args:
+            rows: rows to write
+        """
+        if not rows:
+            return
 
         asset_type = self.APIOBJ.__class__.__name__.lower()
-        xml_obj = {"assets": {asset_type: rows}}
-        self._xmltodict.unparse(xml_obj, output=self._fd, pretty=True)
-        self.close_fd()
+        xml_obj = {XML_ROOT: {asset_type: rows}}
+        value = self._xmltodict.unparse(xml_obj, full_document=False, pretty=True)
+        self._fd.write(value[len(f"<{XML_ROOT}>") : -len(f"\n</{XML_ROOT}>")])
+        self._rows_written += len(rows)
 
     def process_row(self, row: Union[List[dict], dict]) -> List[dict]:
         """Process the callbacks for current row.
@@ -115,7 +141,18 @@ class Xml(ExportMixins):
         rows = listify(row)
         rows = self.do_pre_row(rows=rows)
         rows = self.do_row(rows=rows)
-        self._rows += rows
+        self.write_rows(rows=rows)
+        return rows
+
+    def process_page(self, rows: List[dict]) -> List[dict]:
+        """Process the callbacks for a page of rows at once.
+
+        Args:
+            rows: rows to process
+        """
+        rows = self.do_pre_page(rows=rows)
+        rows = self.do_row(rows=rows)
+        self.write_rows(rows=rows)
         return rows
 
     CB_NAME: str = "xml"
@@ -1,9 +1,12 @@
 # -*- coding: utf-8 -*-
 """APIs for working with assets, saved queries, fields, and tags."""
 from .asset_mixin import AssetMixin
+from .checkpoint import FetchCheckpoint
 from .devices import Devices
+from .field_index import FieldIndex
 from .fields import Fields
-from .labels import Labels
+from .fields_cache import FieldsCache
+from .labels import Labels, LabelsWorker
 from .runner import Runner
 from .saved_query import SavedQuery
 from .users import Users
@@ -15,7 +18,11 @@ __all__ = (
     "AssetMixin",
     "SavedQuery",
     "Fields",
+    "FieldIndex",
+    "FieldsCache",
     "Labels",
+    "LabelsWorker",
+    "FetchCheckpoint",
     "Vulnerabilities",
     "Runner",
 )
@@ -1,19 +1,38 @@
 # -*- coding: utf-8 -*-
 """API model mixin for device and user assets."""
+import collections
+import concurrent.futures
+import copy
 import datetime
 import pathlib
+import queue
+import threading
 import time
 import types
 import typing as t
 import uuid
 
-import cachetools
+from cachetools.keys import hashkey
 
-from ...constants.api import DEFAULT_CALLBACKS_CLS, MAX_PAGE_SIZE, PAGE_SIZE
+from ...caching import cached
+from ...constants.api import DEFAULT_CALLBACKS_CLS, MAX_PAGE_SIZE, PAGE_SIZE, WARMUP_ITEMS
 from ...constants.fields import AXID
 from ...exceptions import ApiError, NotFoundError, ResponseNotOk, StopFetch
 from ...parsers.grabber import Grabber
-from ...tools import PathLike, dt_now, dt_now_file, get_subcls, json_dump, listify
+from ...tools import (
+    PathLike,
+    Profiler,
+    dt_now,
+    dt_now_file,
+    dt_sec_ago,
+    get_path,
+    get_subcls,
+    json_dump,
+    listify,
+    parse_int_min_max,
+    profile_stage,
+    use_profiler,
+)
 from ..api_endpoints import ApiEndpoint, ApiEndpoints
 from ..asset_callbacks.tools import Base as BaseCallbacks
 from ..asset_callbacks.tools import get_callbacks_cls
@@ -28,11 +47,10 @@ from ..json_api.assets import (
 )
 from ..mixins import ModelMixins
 from ..wizards import Wizard, WizardCsv, WizardText
+from .checkpoint import FetchCheckpoint
 from .runner import ENFORCEMENT, Runner
 
 GEN_TYPE = t.Union[t.Generator[dict, None, None], t.List[dict]]
-HISTORY_DATES_OBJ_CACHE = cachetools.TTLCache(maxsize=1, ttl=300)
-HISTORY_DATES_CACHE = cachetools.TTLCache(maxsize=1, ttl=300)
 
 
 # noinspection PyAttributeOutsideInit,PyShadowingBuiltins
@@ -1112,6 +1130,10 @@ class AssetMixin(ModelMixins):
         export_templates: t.Optional[dict] = None,
         http_args: t.Optional[dict] = None,
         return_plain_data: t.Optional[bool] = None,
+        workers: t.Optional[int] = None,
+        prefetch: t.Optional[int] = None,
+        checkpoint: t.Optional[PathLike] = None,
+        resume_from: t.Optional[PathLike] = None,
         **kwargs,
     ) -> t.Generator[dict, None, None]:
         """Get assets from a query.
@@ -1190,8 +1212,46 @@ class AssetMixin(ModelMixins):
             http_args: http args to pass to :meth:`axonius_api_client.http.Http.__call__` for each
                 page fetched
             request_obj: request object to use for this query
+            workers: if greater than 1, fetch pages using N threads by splitting the
+                rows in ``initial_count`` into offset ranges (disables ``use_cursor``), rows are
+                still passed to the callbacks in order
+            prefetch: if greater than 0, fetch up to N pages ahead of the page being processed
+                using a background thread (if ``workers`` is also supplied, this is the number of
+                pages that can be in flight across all workers)
+            checkpoint: file to save the state of the fetch to after each page is processed
+                (only for the default, ``csv``, ``json`` and ``xml`` exports)
+            resume_from: checkpoint file to resume a fetch from, the query, fields, history date,
+                sort, and export file of the checkpoint are used and the export file is
+                truncated to the last page saved in the checkpoint and appended to (the
+                checkpoint will be updated as the fetch continues)
             **kwargs: passed thru to the asset callback defined in ``export``
         """
+        resume: t.Optional[FetchCheckpoint] = None
+        if resume_from:
+            resume = FetchCheckpoint.load(path=resume_from, asset_type=self.ASSET_TYPE)
+            self.LOG.info(f"Resuming fetch from {resume}")
+            checkpoint = checkpoint or resume_from
+            export = resume.get("export")
+            query = resume.get("query")
+            wiz_parsed = {}
+            fields_parsed = resume.get("fields_parsed")
+            sort_field_parsed = resume.get("sort_field_parsed")
+            sort_field = None
+            history_date_parsed = resume.get("history_date_parsed")
+            history_date = history_days_ago = None
+            include_details = resume.get("include_details", include_details)
+            initial_count = resume.get("initial_count")
+            page_size = resume.get("page_size") or page_size
+            row_start = resume.get("rows_offset") or 0
+            page_start = 0
+            max_rows = resume.get_remaining(key="max_rows")
+            max_pages = resume.get_remaining(key="max_pages")
+            if resume.get("export_file"):
+                kwargs["export_file"] = resume.get("export_file")
+
+        workers: int = parse_int_min_max(value=workers, default=0, min_value=0)
+        prefetch: int = parse_int_min_max(value=prefetch, default=0, min_value=0)
+        use_cursor = False if workers > 1 else use_cursor
         request_obj: AssetRequest = self.build_get_request(
             request_obj=request_obj,
             search=search,
@@ -1302,6 +1362,10 @@ class AssetMixin(ModelMixins):
             "initial_count": initial_count,
             "export_templates": export_templates,
             "request_obj": request_obj,
+            "workers": workers,
+            "prefetch": prefetch,
+            "checkpoint": str(checkpoint) if checkpoint else None,
+            "resume": resume.data if resume else None,
         }
         state: dict = AssetsPage.create_state(
             max_pages=max_pages,
@@ -1311,42 +1375,165 @@ class AssetMixin(ModelMixins):
             page_start=page_start,
             row_start=row_start,
             initial_count=initial_count,
+            workers=workers,
+            prefetch=prefetch,
         )
         callbacks_cls: t.Type[BaseCallbacks] = get_callbacks_cls(export=export)
         callbacks: BaseCallbacks = callbacks_cls(
             apiobj=self, getargs=kwargs, state=state, store=store
         )
         self.LAST_CALLBACKS: BaseCallbacks = callbacks
+        if checkpoint and not callbacks.EXPORT_RESUME:
+            raise ApiError(f"checkpoint is not supported by the {callbacks.CB_NAME!r} export")
+
+        checkpoint_obj: t.Optional[FetchCheckpoint] = None
+        if checkpoint:
+            checkpoint_obj = resume or FetchCheckpoint(path=checkpoint)
+            if resume and get_path(obj=checkpoint) != resume.path:
+                checkpoint_obj = FetchCheckpoint(path=checkpoint, data=dict(resume.data))
+            checkpoint_obj.data.setdefault("max_rows", max_rows)
+            checkpoint_obj.data.setdefault("max_pages", max_pages)
+
         callbacks.start()
+        page_batch: bool = callbacks.page_batch
         self.LOG.info(f"STARTING FETCH store={json_dump(store)}")
         self.LOG.debug(f"STARTING FETCH state={json_dump(state)}")
 
-        while not state["stop_fetch"]:
-            request_obj.filter = store["query"]
-            request_obj.fields = {self.ASSET_TYPE: store["fields_parsed"]}
-            request_obj.include_details = store["include_details"]
-            request_obj.set_offset(state["rows_offset"])
-            request_obj.set_limit(state["page_size"])
-
-            try:
-                start_dt: datetime.datetime = dt_now()
-                page: AssetsPage = self._get(request_obj=request_obj, http_args=http_args)
+        if workers > 1:
+            pages = self._get_pages_workers(
+                request_obj=request_obj,
+                state=state,
+                store=store,
+                http_args=http_args,
+                profiler=callbacks.PROFILER,
+            )
+        elif prefetch:
+            pages = self._get_pages_prefetch(
+                request_obj=request_obj,
+                state=state,
+                store=store,
+                http_args=http_args,
+                profiler=callbacks.PROFILER,
+            )
+        else:
+            pages = self._get_pages(
+                request_obj=request_obj,
+                state=state,
+                store=store,
+                http_args=http_args,
+                profiler=callbacks.PROFILER,
+            )
 
-                if request_obj.use_cursor:
-                    request_obj.cursor_id = page.cursor
-                state: dict = page.process_page(state=state, start_dt=start_dt, apiobj=self)
-                for row in page.assets:
-                    state: dict = page.start_row(state=state, apiobj=self, row=row)
-                    yield from listify(obj=callbacks.process_row(row=row))
-                    state: dict = page.process_row(state=state, apiobj=self, row=row)
+        try:
+            for page, start_dt, worker, fetch_seconds in pages:
+                state: dict = page.process_page(
+                    state=state,
+                    start_dt=start_dt,
+                    apiobj=self,
+                    worker=worker,
+                    fetch_seconds=fetch_seconds,
+                )
+                if page_batch:
+                    yield from self._process_page_batch(page=page, state=state, callbacks=callbacks)
+                else:
+                    for row in page.assets:
+                        state: dict = page.start_row(state=state, apiobj=self, row=row)
+                        with profile_stage(profiler=callbacks.PROFILER, name="process_row"):
+                            rows: t.List[dict] = listify(obj=callbacks.process_row(row=row))
+                        yield from rows
+                        state: dict = page.process_row(state=state, apiobj=self, row=row)
+                if checkpoint_obj:
+                    self._save_checkpoint(
+                        checkpoint=checkpoint_obj, state=state, store=store, callbacks=callbacks
+                    )
                 state: dict = page.process_loop(state=state, apiobj=self)
                 time.sleep(state["page_sleep"])
-            except StopFetch as exc:
-                self.LOG.debug(f"Received {type(exc)}: {exc.reason}")
-                break
+        except StopFetch as exc:
+            self.LOG.debug(f"Received {type(exc)}: {exc.reason}")
+        except BaseException:
+            callbacks.close_tags()
+            raise
+        finally:
+            pages.close()
         self.LOG.info(f"FINISHED FETCH store={json_dump(store)}")
         self.LOG.debug(f"FINISHED FETCH state={json_dump(state)}")
         callbacks.stop()
+        if checkpoint_obj:
+            self._save_checkpoint(
+                checkpoint=checkpoint_obj,
+                state=state,
+                store=store,
+                callbacks=callbacks,
+                complete=True,
+            )
+
+    def _save_checkpoint(
+        self,
+        checkpoint: FetchCheckpoint,
+        state: dict,
+        store: dict,
+        callbacks: BaseCallbacks,
+        complete: bool = False,
+    ):
+        """Save the state of a fetch after a page has been processed for :meth:`get_generator`.
+
+        Notes:
+            The cursor ID is saved for reference only, a resumed fetch starts a new cursor at
+            rows_offset since the cursor of the REST API has already moved past rows_offset
+            once the next page has been fetched.
+
+        Args:
+            checkpoint: checkpoint to save the state to
+            state: paging state from :meth:`AssetsPage.create_state`
+            store: store from :meth:`get_generator`
+            callbacks: callbacks object processing the rows
+            complete: the fetch finished
+        """
+        request_obj: AssetRequest = store["request_obj"]
+        if not complete:
+            checkpoint.data["pages_processed_total"] = checkpoint.pages_before + state["page_loop"]
+        checkpoint.save(
+            asset_type=self.ASSET_TYPE,
+            export=store["export"],
+            query=store["query"],
+            fields_parsed=store["fields_parsed"],
+            sort_field_parsed=store["sort_field_parsed"],
+            history_date_parsed=store["history_date_parsed"],
+            include_details=store["include_details"],
+            page_size=store["page_size"],
+            initial_count=state["rows_initial_count"],
+            rows_offset=state["rows_offset"],
+            rows_processed_total=checkpoint.rows_before + state["rows_processed_total"],
+            cursor_id=request_obj.cursor_id,
+            complete=complete,
+            **callbacks.get_checkpoint(),
+        )
+
+    def _process_page_batch(
+        self, page: AssetsPage, state: dict, callbacks: BaseCallbacks
+    ) -> t.Generator[dict, None, None]:
+        """Process all of the rows of a page at once using the callbacks.
+
+        Args:
+            page: page of assets to process
+            state: state tracker of the get method
+            callbacks: callbacks object to process the rows with
+        """
+        rows: t.List[dict] = page.assets
+        max_rows: int = state["max_rows"]
+        if max_rows:
+            rows = rows[: max(max_rows - state["rows_processed_total"], 0)]
+        if not rows:
+            return
+
+        page.start_row(state=state, apiobj=self, row=rows[0])
+        with profile_stage(profiler=callbacks.PROFILER, name="process_page"):
+            processed: t.List[dict] = listify(obj=callbacks.process_page(rows=rows))
+        yield from processed
+
+        if state["stop_fetch"]:
+            raise StopFetch(reason=state["stop_msg"], state=state)
+        page.process_row(state=state, apiobj=self, row=rows[-1])
 
     def get_by_saved_query(
         self,
@@ -1695,12 +1882,72 @@ class AssetMixin(ModelMixins):
 
         return self.get(**kwargs)
 
-    @cachetools.cached(cache=HISTORY_DATES_OBJ_CACHE)
+    def fetch_metadata(self, what: str) -> t.Any:
+        """Fetch metadata used by this asset type without using or updating any caches.
+
+        Args:
+            what: metadata to fetch, one of :data:`WARMUP_ITEMS` except 'feature_flags'
+
+        Notes:
+            Safe to call from many threads at once, used by
+            :meth:`axonius_api_client.connect.Connect.warmup` with :meth:`cache_metadata`.
+        """
+        if what == "fields":
+            return self.fields._get_parsed()
+        if what == "adapters":
+            return self.adapters._get_basic()
+        if what == "saved_queries":
+            return self.saved_query.get(as_dataclass=True)
+        if what == "labels":
+            return self.labels.get()
+        if what == "history_dates":
+            return self._history_dates()
+        if what == "instances":
+            return self.instances._get()
+        valid = [x for x in WARMUP_ITEMS if x != "feature_flags"]
+        raise ApiError(f"Invalid metadata {what!r}, valid: {valid}")
+
+    def cache_metadata(self, what: str, value: t.Any):
+        """Store metadata from :meth:`fetch_metadata` in the caches used by this asset type.
+
+        Args:
+            what: metadata that was fetched
+            value: metadata returned by :meth:`fetch_metadata`
+        """
+        caches = self.http.CACHES
+        parsers = [x.PARSER for x in [self.wizard, self.wizard_text, self.wizard_csv]]
+        if what == "fields":
+            self.fields.set_cache(data=value)
+        elif what == "adapters":
+            caches.set(name="adapters.get_basic_cached", key=hashkey(self.adapters), value=value)
+            for parser in parsers:
+                parser.set_cache(method="get_adapters", value=list(value.adapters.values()))
+        elif what == "saved_queries":
+            key = hashkey(self.saved_query, as_dataclass=True)
+            caches.set(name="saved_query.get_cached", key=key, value=value)
+            for parser in parsers:
+                parser.set_cache(method="get_sqs", value=value)
+        elif what == "labels":
+            for parser in parsers:
+                parser.set_cache(method="get_asset_tags", value=value)
+        elif what == "history_dates":
+            key = hashkey(self)
+            caches.set(name="assets.history_dates", key=key, value=value.value[self.ASSET_TYPE])
+            obj = value.parsed[self.ASSET_TYPE]
+            caches.set(name="assets.history_dates_obj", key=key, value=obj)
+        elif what == "instances":
+            for parser in parsers:
+                parser.set_cache(method="get_instances", value=value)
+        else:
+            valid = [x for x in WARMUP_ITEMS if x != "feature_flags"]
+            raise ApiError(f"Invalid metadata {what!r}, valid: {valid}")
+
+    @cached(name="assets.history_dates_obj", maxsize=16, ttl=300)
     def history_dates_obj(self) -> AssetTypeHistoryDates:
         """Pass."""
         return self._history_dates().parsed[self.ASSET_TYPE]
 
-    @cachetools.cached(cache=HISTORY_DATES_CACHE)
+    @cached(name="assets.history_dates", maxsize=16, ttl=300)
     def history_dates(self) -> dict:
         """Get all known historical dates."""
         return self._history_dates().value[self.ASSET_TYPE]
@@ -1880,6 +2127,237 @@ class AssetMixin(ModelMixins):
         )
         return response
 
+    def _get_pages(
+        self,
+        request_obj: AssetRequest,
+        state: dict,
+        store: dict,
+        http_args: dict,
+        profiler: t.Optional[Profiler] = None,
+    ) -> t.Generator[t.Tuple[AssetsPage, datetime.datetime, None, None], None, None]:
+        """Fetch pages of assets one at a time for :meth:`get_generator`.
+
+        Args:
+            request_obj: request object to use
+            state: paging state from :meth:`AssetsPage.create_state`
+            store: store from :meth:`get_generator`
+            http_args: arguments to pass to :meth:`requests.Session.request`
+            profiler: profiler to time the requests of this fetch with
+        """
+        while not state["stop_fetch"]:
+            request_obj.filter = store["query"]
+            request_obj.fields = {self.ASSET_TYPE: store["fields_parsed"]}
+            request_obj.include_details = store["include_details"]
+            request_obj.set_offset(state["rows_offset"])
+            request_obj.set_limit(state["page_size"])
+
+            start_dt: datetime.datetime = dt_now()
+            with use_profiler(profiler):
+                page: AssetsPage = self._get(request_obj=request_obj, http_args=http_args)
+
+            if request_obj.use_cursor:
+                request_obj.cursor_id = page.cursor
+            yield page, start_dt, None, None
+
+    @staticmethod
+    def get_page_offsets(state: dict) -> t.List[int]:
+        """Get the offsets of each page to fetch based on the paging state.
+
+        Args:
+            state: paging state from :meth:`AssetsPage.create_state`
+        """
+        row_start: int = state["rows_offset"]
+        row_stop: int = state["rows_initial_count"] or 0
+        if state["max_rows"]:
+            row_stop = min(row_stop, row_start + state["max_rows"])
+
+        offsets: t.List[int] = list(range(row_start, row_stop, state["page_size"]))
+        if state["max_pages"]:
+            offsets = offsets[: state["max_pages"]]
+        return offsets
+
+    def _get_pages_workers(
+        self,
+        request_obj: AssetRequest,
+        state: dict,
+        store: dict,
+        http_args: dict,
+        profiler: t.Optional[Profiler] = None,
+    ) -> t.Generator[t.Tuple[AssetsPage, datetime.datetime, str, float], None, None]:
+        """Fetch pages of assets using a pool of threads for :meth:`get_generator`.
+
+        Notes:
+            Each page is fetched using a copy of ``request_obj`` with its own offset, at most
+            ``state["prefetch"]`` pages (or 2 pages per worker if not set) are fetched ahead of
+            the page being processed, and pages are yielded in offset order.
+
+            Offsets start as :meth:`get_page_offsets` of the initial count, or the first
+            offset if that is empty. If a full page reports a total count past the last
+            offset (or has no total count and is the last page), offsets are added until a
+            page is short or empty, so rows added during the fetch are not dropped.
+
+        Args:
+            request_obj: request object to use as a template for each page
+            state: paging state from :meth:`AssetsPage.create_state`
+            store: store from :meth:`get_generator`
+            http_args: arguments to pass to :meth:`requests.Session.request`
+            profiler: profiler to time the requests of this fetch with
+        """
+        workers: int = state["workers"]
+        window: int = max(state["prefetch"] or workers * 2, workers)
+        page_size: int = state["page_size"]
+        offsets: t.Deque[int] = collections.deque(
+            self.get_page_offsets(state=state) or [state["rows_offset"]]
+        )
+        row_stop: int = state["rows_offset"] + state["max_rows"] if state["max_rows"] else 0
+        tail: dict = {"offset": offsets[-1] + page_size, "pages": len(offsets), "warned": False}
+
+        request_obj.filter = store["query"]
+        request_obj.fields = {self.ASSET_TYPE: store["fields_parsed"]}
+        request_obj.include_details = store["include_details"]
+        request_obj.use_cursor = False
+        request_obj.cursor_id = None
+
+        def fetch(offset: int) -> t.Tuple[AssetsPage, datetime.datetime, str, float]:
+            page_request_obj: AssetRequest = copy.deepcopy(request_obj)
+            page_request_obj.set_offset(offset)
+            page_request_obj.set_limit(state["page_size"])
+            start_dt: datetime.datetime = dt_now()
+            with use_profiler(profiler):
+                page: AssetsPage = self._get(request_obj=page_request_obj, http_args=http_args)
+            worker: str = threading.current_thread().name
+            return page, start_dt, worker, dt_sec_ago(obj=start_dt, exact=True)
+
+        def add_offsets(page: AssetsPage):
+            if page.asset_count_page < page_size:
+                return
+
+            total: t.Optional[int] = page.asset_count_total
+            if not isinstance(total, int):
+                if offsets or futures:
+                    return
+                total = tail["offset"] + 1
+
+            while tail["offset"] < total:
+                if row_stop and tail["offset"] >= row_stop:
+                    break
+                if state["max_pages"] and tail["pages"] >= state["max_pages"]:
+                    break
+                if not tail["warned"]:
+                    tail["warned"] = True
+                    self.LOG.warning(
+                        f"Row total count grew from initial {state['rows_initial_count']} to"
+                        f" {total}, fetching pages past offset {tail['offset']}"
+                    )
+                offsets.append(tail["offset"])
+                tail["offset"] += page_size
+                tail["pages"] += 1
+
+        self.LOG.info(f"Fetching {self.ASSET_TYPE} pages using {workers} workers")
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix=f"{self.ASSET_TYPE}_worker"
+        )
+        futures: t.Deque[concurrent.futures.Future] = collections.deque()
+        try:
+            while offsets and len(futures) < window:
+                futures.append(executor.submit(fetch, offsets.popleft()))
+
+            while futures and not state["stop_fetch"]:
+                result = futures.popleft().result()
+                state["prefetch_queue_depth"] = len([x for x in futures if x.done()])
+                add_offsets(page=result[0])
+                while offsets and len(futures) < window:
+                    futures.append(executor.submit(fetch, offsets.popleft()))
+                yield result
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def _get_pages_prefetch(
+        self,
+        request_obj: AssetRequest,
+        state: dict,
+        store: dict,
+        http_args: dict,
+        profiler: t.Optional[Profiler] = None,
+    ) -> t.Generator[t.Tuple[AssetsPage, datetime.datetime, None, float], None, None]:
+        """Fetch pages of assets in a background thread for :meth:`get_generator`.
+
+        Notes:
+            Pages are fetched one after the other (using cursors if ``request_obj.use_cursor``)
+            into a queue that holds at most ``state["prefetch"]`` pages, so the next pages
+            are fetched while the callbacks process the current page.
+
+        Args:
+            request_obj: request object to use
+            state: paging state from :meth:`AssetsPage.create_state`
+            store: store from :meth:`get_generator`
+            http_args: arguments to pass to :meth:`requests.Session.request`
+            profiler: profiler to time the requests of this fetch with
+        """
+        pages: queue.Queue = queue.Queue(maxsize=state["prefetch"])
+        stop: threading.Event = threading.Event()
+        done: object = object()
+
+        def put(item: t.Any) -> bool:
+            while not stop.is_set():
+                try:
+                    pages.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def fetch():
+            offset: int = state["rows_offset"]
+            rows: int = 0
+            count: int = 0
+            try:
+                while not stop.is_set():
+                    request_obj.filter = store["query"]
+                    request_obj.fields = {self.ASSET_TYPE: store["fields_parsed"]}
+                    request_obj.include_details = store["include_details"]
+                    request_obj.set_offset(offset)
+                    request_obj.set_limit(state["page_size"])
+
+                    start_dt: datetime.datetime = dt_now()
+                    with use_profiler(profiler):
+                        page: AssetsPage = self._get(request_obj=request_obj, http_args=http_args)
+                    if request_obj.use_cursor:
+                        request_obj.cursor_id = page.cursor
+                    if not put((page, start_dt, None, dt_sec_ago(obj=start_dt, exact=True))):
+                        break
+
+                    offset += page.asset_count_page
+                    rows += page.asset_count_page
+                    count += 1
+                    if (
+                        not page.assets
+                        or (state["max_rows"] and rows >= state["max_rows"])
+                        or (state["max_pages"] and count >= state["max_pages"])
+                    ):
+                        break
+            except Exception as exc:
+                put(exc)
+            finally:
+                put(done)
+
+        self.LOG.info(f"Prefetching up to {state['prefetch']} {self.ASSET_TYPE} pages")
+        thread = threading.Thread(target=fetch, name=f"{self.ASSET_TYPE}_prefetch", daemon=True)
+        thread.start()
+        try:
+            while True:
+                item: t.Any = pages.get()
+                state["prefetch_queue_depth"] = pages.qsize()
+                if item is done:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            stop.set()
+
     def _count(
         self,
         request_obj: t.Optional[CountRequest] = None,
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""Checkpoints for resuming asset fetches."""
+import os
+import pathlib
+import typing as t
+
+from ...exceptions import ApiError
+from ...tools import PathLike, dt_now, get_path, json_dump, json_load
+
+
+class FetchCheckpoint:
+    """Persist the state of an asset fetch after each page so that it can be resumed.
+
+    Examples:
+        Save a checkpoint after each page is written to the export file
+
+        >>> assets = apiobj.get(export="csv", export_file="devices.csv", checkpoint="devices.ckpt")
+
+        If the fetch dies, continue it from the last page that was written
+
+        >>> assets = apiobj.get(export="csv", resume_from="devices.ckpt")
+
+    Notes:
+        The checkpoint is written to a temporary file which is synced to disk and renamed over
+        the checkpoint, so the checkpoint is never partially written.
+    """
+
+    VERSION: int = 1
+    """version of the format of checkpoint files"""
+
+    def __init__(self, path: PathLike, data: t.Optional[dict] = None):
+        """Persist the state of an asset fetch after each page so that it can be resumed.
+
+        Args:
+            path: path to the checkpoint file
+            data: previously saved state of the fetch
+        """
+        self.path: pathlib.Path = get_path(obj=path)
+        self.data: dict = data or {}
+        self.rows_before: int = self.data.get("rows_processed_total") or 0
+        self.pages_before: int = self.data.get("pages_processed_total") or 0
+
+    @classmethod
+    def load(cls, path: PathLike, asset_type: str) -> "FetchCheckpoint":
+        """Load a checkpoint to resume a fetch from.
+
+        Args:
+            path: path to the checkpoint file
+            asset_type: asset type of the fetch being resumed
+
+        Raises:
+            :exc:`ApiError`: if the checkpoint does not exist, is invalid, is for another asset
+                type, or the fetch it was saved for already finished
+        """
+        obj = get_path(obj=path)
+        if not obj.is_file():
+            raise ApiError(f"Checkpoint file {str(obj)!r} does not exist")
+
+        try:
+            data = json_load(obj=obj.read_text(encoding="utf-8"), load_file=False)
+        except Exception as exc:
+            raise ApiError(f"Checkpoint file {str(obj)!r} is not valid JSON: {exc}") from exc
+
+        if not isinstance(data, dict) or data.get("version") != cls.VERSION:
+            raise ApiError(f"Checkpoint file {str(obj)!r} is not a version {cls.VERSION} file")
+
+        if data.get("asset_type") != asset_type:
+            raise ApiError(
+                f"Checkpoint file {str(obj)!r} is for asset type {data.get('asset_type')!r}, "
+                f"not {asset_type!r}"
+            )
+
+        if data.get("complete"):
+            raise ApiError(f"Checkpoint file {str(obj)!r} is for a fetch that already finished")
+        return cls(path=obj, data=data)
+
+    def save(self, **kwargs):
+        """Update the state of the fetch and write it to the checkpoint file.
+
+        Args:
+            **kwargs: state to update
+        """
+        self.data.update(kwargs)
+        self.data["version"] = self.VERSION
+        self.data["updated"] = dt_now().isoformat()
+
+        self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        tmp = self.path.with_name(f"{self.path.name}.tmp")
+        with tmp.open(mode="w", encoding="utf-8") as fh:
+            fh.write(json_dump(obj=self.data, indent=2))
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp, self.path)
+
+    def get(self, key: str, default: t.Any = None) -> t.Any:
+        """Get a value from the state of the fetch.
+
+        Args:
+            key: key to get
+            default: value to return if key is not set
+        """
+        return self.data.get(key, default)
+
+    def get_remaining(self, key: str) -> int:
+        """Get the remaining rows or pages of max_rows or max_pages of the fetch being resumed.
+
+        Args:
+            key: 'max_rows' or 'max_pages'
+        """
+        value = self.data.get(key) or 0
+        before = self.rows_before if key == "max_rows" else self.pages_before
+        return max(value - before, 1) if value else 0
+
+    def __repr__(self) -> str:
+        """Pass."""
+        items = [
+            f"path={str(self.path)!r}",
+            f"rows_offset={self.data.get('rows_offset')}",
+            f"complete={self.data.get('complete')}",
+        ]
+        return f"{self.__class__.__name__}({', '.join(items)})"
+
+    def __str__(self) -> str:
+        """Pass."""
+        return self.__repr__()
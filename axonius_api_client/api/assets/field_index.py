@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+"""Indexes of parsed field schemas for fast lookups."""
+import bisect
+import re
+import typing as t
+
+from ...constants.fields import ALL_NAME, GET_SCHEMA_KEYS, GET_SCHEMAS_KEYS
+
+LITERAL_PREFIX: t.Pattern = re.compile(r"\^([\w :/-]*)")
+"""regex to find a regex that only matches a literal prefix"""
+
+
+class AdapterFieldIndex:
+    """Index of the field schemas of a single adapter.
+
+    Notes:
+        Values are lower cased the same way the linear searches they replace compared them,
+        and the first schema in the order of the API wins when more than one schema has
+        a key equal to the same value.
+    """
+
+    def __init__(self, schemas: t.List[dict]):
+        """Index of the field schemas of a single adapter.
+
+        Args:
+            schemas: field schemas of the adapter from :func:`parse_fields`
+        """
+        self.schemas: t.List[dict] = schemas
+
+        self.eq: t.Dict[str, dict] = {}
+        self.eq_selectable: t.Dict[str, dict] = {}
+        self.selectable: t.List[dict] = []
+        self.roots: t.List[dict] = []
+        self.fuzzy: t.List[dict] = []
+        self.fuzzy_roots: t.List[dict] = []
+        self.complex: t.List[dict] = []
+        self.sub_fields: t.Dict[str, t.List[dict]] = {}
+        self.prefixes: t.List[t.Tuple[str, int]] = []
+
+        for idx, schema in enumerate(schemas):
+            selectable = schema.get("selectable", True)
+            for key in GET_SCHEMA_KEYS:
+                value = schema[key].lower()
+                self.eq.setdefault(value, schema)
+                if selectable:
+                    self.eq_selectable.setdefault(value, schema)
+
+            if schema.get("selectable"):
+                self.selectable.append(schema)
+                if schema.get("is_root"):
+                    self.roots.append(schema)
+                self.prefixes += [(schema[x].lower(), idx) for x in GET_SCHEMAS_KEYS]
+
+            is_details = schema["name"].endswith("_details")
+            if selectable and not is_details and schema["name"] != ALL_NAME:
+                self.fuzzy.append(schema)
+                if schema["is_root"]:
+                    self.fuzzy_roots.append(schema)
+
+            if schema["is_complex"] and not schema["is_all"] and not schema["is_details"]:
+                self.complex.append(schema)
+
+            if schema.get("sub_fields"):
+                self.sub_fields[schema["name_qual"]] = schema["sub_fields"]
+
+        self.prefixes.sort()
+
+    def get(self, value: str, selectable_only: bool = True) -> t.Optional[dict]:
+        """Get the schema with a name, base name, qualified name, or title equal to a value.
+
+        Args:
+            value: value to look up
+            selectable_only: only return schemas of selectable fields
+        """
+        lookup = self.eq_selectable if selectable_only else self.eq
+        return lookup.get(value.lower().strip())
+
+    def find(self, value: str) -> t.List[dict]:
+        """Get the schemas of selectable fields that regex match a value.
+
+        Args:
+            value: regex to match against name, base name, qualified name, or title
+
+        Notes:
+            Regexes that only match a literal prefix, i.e. '^host', are looked up in the
+            sorted prefix index instead of being matched against every schema.
+        """
+        value = value.lower().strip()
+        literal = LITERAL_PREFIX.fullmatch(value)
+        if literal and literal.group(1):
+            return self.find_prefix(prefix=literal.group(1))
+
+        search = re.compile(value, re.I)
+        return [x for x in self.selectable if any(search.search(x[k]) for k in GET_SCHEMAS_KEYS)]
+
+    def find_prefix(self, prefix: str) -> t.List[dict]:
+        """Get the schemas of selectable fields with a key that starts with a prefix.
+
+        Args:
+            prefix: lower cased prefix
+        """
+        start = bisect.bisect_left(self.prefixes, (prefix,))
+        found = set()
+        for value, idx in self.prefixes[start:]:
+            if not value.startswith(prefix):
+                break
+            found.add(idx)
+        return [self.schemas[x] for x in sorted(found)]
+
+    def __repr__(self) -> str:
+        """Pass."""
+        return f"{self.__class__.__name__}(schemas={len(self.schemas)})"
+
+    def __str__(self) -> str:
+        """Pass."""
+        return self.__repr__()
+
+
+class FieldIndex:
+    """Index of the field schemas of all adapters returned by :meth:`Fields.get`.
+
+    Examples:
+        Create a ``client`` using :obj:`axonius_api_client.connect.Connect` and assume
+        ``apiobj`` is either ``client.devices`` or ``client.users``
+
+        >>> index = apiobj.fields.get_index()
+        >>> index.get(adapter="agg", value="Host Name")["name_qual"]
+        'specific_data.data.hostname'
+        >>> [x["name_qual"] for x in index.find(adapter="agg", value="^hostname")]
+        ['specific_data.data.hostname', 'specific_data.data.hostname_preferred']
+    """
+
+    def __init__(self, fields: dict):
+        """Index of the field schemas of all adapters returned by :meth:`Fields.get`.
+
+        Args:
+            fields: field schemas of all adapters from :func:`parse_fields`
+        """
+        self.fields: dict = fields
+        self.adapters: t.Dict[str, AdapterFieldIndex] = {
+            k: AdapterFieldIndex(schemas=v) for k, v in fields.items()
+        }
+        self.ids: t.Set[int] = {id(y) for x in fields.values() for y in x}
+
+    def get(self, adapter: str, value: str, selectable_only: bool = True) -> t.Optional[dict]:
+        """Get the schema of an adapter with a key equal to a value.
+
+        Args:
+            adapter: name of adapter
+            value: value to look up
+            selectable_only: only return schemas of selectable fields
+        """
+        return self.adapters[adapter].get(value=value, selectable_only=selectable_only)
+
+    def find(self, adapter: str, value: str) -> t.List[dict]:
+        """Get the schemas of selectable fields of an adapter that regex match a value.
+
+        Args:
+            adapter: name of adapter
+            value: regex to match against name, base name, qualified name, or title
+        """
+        return self.adapters[adapter].find(value=value)
+
+    def get_sub_schemas(self, adapter: str, name_qual: str) -> t.List[dict]:
+        """Get the schemas of the sub-fields of a complex field.
+
+        Args:
+            adapter: name of adapter
+            name_qual: fully qualified name of complex field
+        """
+        return self.adapters[adapter].sub_fields.get(name_qual, [])
+
+    def __contains__(self, schema: dict) -> bool:
+        """Check if a schema is from :attr:`fields`."""
+        return id(schema) in self.ids
+
+    def __repr__(self) -> str:
+        """Pass."""
+        return f"{self.__class__.__name__}(adapters={len(self.adapters)})"
+
+    def __str__(self) -> str:
+        """Pass."""
+        return self.__repr__()
@@ -1,11 +1,13 @@
 # -*- coding: utf-8 -*-
 """API for working with fields for assets."""
+import hashlib
 import re
 import typing as t
 from typing import List, Optional, Tuple, Union
 
-from cachetools import TTLCache, cached
+from cachetools.keys import hashkey
 
+from ...caching import cached
 from ...constants.fields import (
     AGG_ADAPTER_ALTS,
     AGG_ADAPTER_NAME,
@@ -20,6 +22,8 @@ from ...tools import listify, split_str, strip_right
 from .. import json_api
 from ..api_endpoints import ApiEndpoints
 from ..mixins import ChildMixins
+from .field_index import FieldIndex
+from .fields_cache import FieldsCache
 
 
 def fuzzyfinder(value: str, collection: t.Iterable, accessor: t.Callable = lambda x: x):
@@ -65,7 +69,7 @@ class Fields(ChildMixins):
         * User assets :obj:`axonius_api_client.api.assets.users.Users`
     """
 
-    @cached(cache=TTLCache(maxsize=1024, ttl=300))
+    @cached(name="fields.get", ttl=300)
     def get(self) -> dict:
         """Get the schema of all adapters and their fields.
 
@@ -87,8 +91,59 @@ class Fields(ChildMixins):
             ...     title = schema['title']
             ...     print(f"title {title!r}, qualified name {name!r}, base name {name!r}")
 
+        Notes:
+            The parsed schemas are kept in memory for 5 minutes and on disk in :attr:`cache`
+            so that other processes and later runs do not have to fetch and parse them again.
+
+        """
+        return self._get_parsed()
+
+    def _get_parsed(self) -> dict:
+        """Load the parsed schemas from :attr:`cache` or fetch and parse them.
+
+        Notes:
+            This does not use or update the in memory cache of :meth:`get`.
+        """
+        key, stamp = self._get_cache_ids()
+        if key:
+            data = self.cache.load(key=key, stamp=stamp)
+            if data is not None:
+                self.LOG.debug(f"Loaded field schemas from {self.cache}")
+                return data
+
+        data = parse_fields(raw=self._get().document_meta)
+        if key:
+            self.cache.save(key=key, stamp=stamp, data=data)
+        return data
+
+    def get_index(self) -> FieldIndex:
+        """Get the index of the schemas returned by :meth:`get` for fast lookups.
+
+        Notes:
+            The index is rebuilt only when :meth:`get` returns new schemas.
+        """
+        fields = self.get()
+        if getattr(self, "_index", None) is None or self._index.fields is not fields:
+            self._index: FieldIndex = FieldIndex(fields=fields)
+        return self._index
+
+    def set_cache(self, data: dict):
+        """Store parsed schemas to return from :meth:`get` until they expire.
+
+        Args:
+            data: parsed schemas from :meth:`_get_parsed`
         """
-        return parse_fields(raw=self._get().document_meta)
+        self.http.CACHES.set(name="fields.get", key=hashkey(self), value=data)
+
+    def invalidate_cache(self) -> int:
+        """Remove the schemas of this asset type from the in memory and on disk caches.
+
+        Returns:
+            number of on disk cache entries removed
+        """
+        self.http.CACHES.pop(name="fields.get", key=hashkey(self))
+        key, _ = self._get_cache_ids()
+        return self.cache.invalidate(key=key) if key else 0
 
     def validate(
         self,
@@ -213,9 +268,9 @@ class Fields(ChildMixins):
         adapter = self.get_adapter_name(value=adapter)
         schemas = fields[adapter]
         if fields_custom and adapter in fields_custom:
-            schemas += fields_custom[adapter]
+            schemas = [*schemas, *fields_custom[adapter]]
         schema = self.get_field_schema(
-            value=afield, schemas=schemas, selectable_only=selectable_only
+            value=afield, schemas=schemas, selectable_only=selectable_only, adapter=adapter
         )
         return schema[key] if key else schema
 
@@ -273,25 +328,24 @@ class Fields(ChildMixins):
             key: key of schema to return
         """
         splits = self.split_searches(value=value)
-        fields = self.get()
+        index = self.get_index()
 
-        matches = []
+        matches = {}
 
         for adapter_re, fields_re in splits:
             adapters = self.get_adapter_names(value=adapter_re)
 
             for adapter in adapters:
                 for field_re in fields_re:
-                    found_schemas = self.get_field_schemas(value=field_re, schemas=fields[adapter])
+                    found_schemas = index.find(adapter=adapter, value=field_re)
                     found_schemas = [
                         x for x in found_schemas if x["name_base"] not in ["all", "raw_data"]
                     ]
                     if root_only:
                         found_schemas = [x for x in found_schemas if x["is_root"]]
 
-                    names = [x[key] for x in found_schemas]
-                    matches += [x for x in names if x not in matches]
-        return matches
+                    matches.update({x[key]: None for x in found_schemas})
+        return list(matches)
 
     def get_field_names_eq(
         self,
@@ -328,8 +382,9 @@ class Fields(ChildMixins):
         """
         splits = self.split_searches(value=value)
         fields = self.get()
+        index = self.get_index()
 
-        matches = []
+        matches = {}
 
         for adapter_name, names in splits:
             adapter = self.get_adapter_name(value=adapter_name)
@@ -340,13 +395,18 @@ class Fields(ChildMixins):
                     schemas=schemas,
                     fields_error=fields_error,
                     selectable_only=selectable_only,
+                    adapter=adapter,
                 )
 
-                match = schema[key] if key else schema
-                if match not in matches:
-                    matches.append(match)
+                if key:
+                    matches.setdefault(schema[key], schema[key])
+                elif schema in index:
+                    matches.setdefault(id(schema), schema)
+                else:
+                    # custom schemas are created for each lookup, dedupe them by name
+                    matches.setdefault(("custom", schema["name"]), schema)
 
-        return matches
+        return list(matches.values())
 
     def get_field_names_fuzzy(self, value: str, key: str = "name_qual") -> List[str]:
         """Get field names using that equal a value.
@@ -368,18 +428,18 @@ class Fields(ChildMixins):
 
         """
         splits = self.split_searches(value=value)
-        fields = self.get()
+        index = self.get_index()
 
-        matches = []
+        matches = {}
 
         for adapter_name, names in splits:
             adapter = self.get_adapter_name(value=adapter_name)
             for name in names:
-                schemas = fields[adapter]
+                schemas = index.adapters[adapter].fuzzy_roots
                 amatches = self.fuzzy_filter(search=name, schemas=schemas, key=key, root_only=True)
-                matches += [x for x in amatches if x not in matches]
+                matches.update({x: None for x in amatches})
 
-        return matches
+        return list(matches)
 
     def get_field_schemas_root(self, adapter: str) -> List[dict]:
         """Get schemas of all root fields for a given adapter.
@@ -397,12 +457,8 @@ class Fields(ChildMixins):
             since 'ips' is a sub-field of 'specific_data.data.network_interfaces'
 
         """
-        fields = self.get()
         adapter = self.get_adapter_name(value=adapter)
-        schemas = fields[adapter]
-
-        matches = [x for x in schemas if x.get("selectable") and x.get("is_root")]
-        return matches
+        return list(self.get_index().adapters[adapter].roots)
 
     def get_field_names_root(self, adapter: str, key: str = "name_qual") -> List[str]:
         """Get names of all root fields for a given adapter.
@@ -443,19 +499,20 @@ class Fields(ChildMixins):
             not_select = not schema.get("selectable", True)
             is_root = root_only and not schema["is_root"]
 
-            if any([schema in matches, is_details, is_all, not_select, is_root]):
+            if any([id(schema) in matched, is_details, is_all, not_select, is_root]):
                 return True
 
             return False
 
         matches = []
+        matched = set()
+        value = search.strip().lower()
 
         # try to do string matches first
         for schema in schemas:
-            if not do_skip(schema) and any(
-                [search.strip().lower() in x for x in [schema[x] for x in fuzzy_keys]]
-            ):
+            if not do_skip(schema) and any(value in schema[x] for x in fuzzy_keys):
                 matches.append(schema)
+                matched.add(id(schema))
 
         # if no string matches, try to find matches with fuzzyfinder
         if not matches:
@@ -464,6 +521,7 @@ class Fields(ChildMixins):
                     fuzzyfinder(search, [schema[x] for x in fuzzy_keys])
                 ):
                     matches.append(schema)
+                    matched.add(id(schema))
 
         return [x[key] for x in matches] if key else matches
 
@@ -535,9 +593,8 @@ class Fields(ChildMixins):
             if not schema.get("selectable"):
                 continue
 
-            for key in keys:
-                if search.search(schema[key]) and schema not in matches:
-                    matches.append(schema)
+            if any(search.search(schema[key]) for key in keys):
+                matches.append(schema)
         return matches
 
     def get_field_schema(
@@ -547,6 +604,7 @@ class Fields(ChildMixins):
         keys: List[str] = GET_SCHEMA_KEYS,
         fields_error: bool = True,
         selectable_only: bool = True,
+        adapter: Optional[str] = None,
         **kwargs,
     ) -> dict:
         """Find a field name that equals a value.
@@ -555,6 +613,10 @@ class Fields(ChildMixins):
             value: name of field
             schemas: list of field schemas to search through
             keys: list of keys to check if value equals
+            fields_error: raise an error if no field found, otherwise return a custom schema
+            selectable_only: only search through schemas of selectable fields
+            adapter: name of adapter schemas are from, used to look up value in the index
+                from :meth:`get_index` before searching through schemas
             **kwargs: passed to :meth:`fuzzy_filter` to print fuzzy matches in error
                 if no matches found
 
@@ -562,13 +624,22 @@ class Fields(ChildMixins):
             :exc:`NotFoundError`: when no field name equals supplied value
         """
         search = value.lower().strip()
+        searches = schemas
+
+        if adapter and keys == GET_SCHEMA_KEYS:
+            index = self.get_index()
+            schema = index.get(adapter=adapter, value=search, selectable_only=selectable_only)
+            if schema:
+                return schema
+            # only schemas not from the index, i.e. custom schemas, are left to search
+            searches = [x for x in schemas if x not in index]
 
         if selectable_only:
-            schemas = [x for x in schemas if x.get("selectable", True)]
+            searches = [x for x in searches if x.get("selectable", True)]
 
-        for schema in schemas:
+        for schema in searches:
             for key in keys:
-                if search.lower().strip() == schema[key].lower():
+                if search == schema[key].lower():
                     return schema
 
         if not fields_error:
@@ -576,6 +647,9 @@ class Fields(ChildMixins):
             schema = schema_custom(name=search)
             return schema
 
+        if selectable_only:
+            schemas = [x for x in schemas if x.get("selectable", True)]
+
         kwargs["search"] = value
         kwargs["schemas"] = schemas
         kwargs["key"] = ""
@@ -655,6 +729,50 @@ class Fields(ChildMixins):
         len_max = max([len(x[len_key]) for x in schemas]) if schemas else 0
         return [tmpl.format(len_max=len_max, **x) for x in schemas]
 
+    def _init(self, parent: ChildMixins):
+        """Post init method for subclasses to use for extra setup.
+
+        Args:
+            parent: parent API model of this child
+        """
+        self.cache: FieldsCache = FieldsCache()
+
+    def _get_cache_ids(self) -> Tuple[Optional[str], Optional[str]]:
+        """Get the key and stamp of the on disk cache entry for this asset type.
+
+        Notes:
+            The user is identified by a hash of the API key, which decides the role and
+            permissions of the fields returned, so no API call is needed for the key. The
+            stamp only needs the about page, fetched once per session by
+            :meth:`_get_cache_meta`.
+
+        Returns:
+            key and stamp, or None and None if the cache is disabled or the instance
+            metadata could not be fetched
+        """
+        if not self.cache.enabled:
+            return None, None
+
+        try:
+            meta = self._get_cache_meta()
+        except Exception as exc:  # noqa: BLE001
+            self.LOG.debug(f"Not using {self.cache}, unable to get instance metadata: {exc}")
+            return None, None
+
+        api_key = self.http.session.headers.get("api-key") or ""
+        user = {"api_key": hashlib.sha256(str(api_key).encode()).hexdigest()}
+        key = self.cache.get_key(url=self.http.url, asset_type=self.parent.ASSET_TYPE, user=user)
+        return key, self.cache.get_stamp(meta=meta)
+
+    @cached(name="fields.cache_meta", ttl=0, key=lambda self: hashkey(self.http.url))
+    def _get_cache_meta(self) -> dict:
+        """Get the about page of the instance to stamp on disk cache entries with.
+
+        Notes:
+            Cached for the life of the http object and shared by all asset types.
+        """
+        return ApiEndpoints.system_settings.meta_about.perform_request(http=self.http)
+
     def _get(self) -> json_api.generic.Metadata:
         """Private API method to get the schema of all fields."""
         api_endpoint = ApiEndpoints.assets.fields
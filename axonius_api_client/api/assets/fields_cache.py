@@ -0,0 +1,259 @@
+# -*- coding: utf-8 -*-
+"""Persistent on-disk cache of parsed field schemas."""
+import hashlib
+import json
+import logging
+import marshal
+import os
+import pathlib
+import sys
+import tempfile
+import time
+import typing as t
+import zlib
+
+from ... import DEFAULT_PATH
+from ...constants.fields import FIELDS_CACHE_DIR
+from ...logs import get_obj_log
+from ...setup_env import get_env_fields_cache, get_env_fields_cache_path, get_env_fields_cache_ttl
+from ...tools import PathLike, coerce_bool, get_path
+from ...version import __version__
+
+
+class FieldsCache:
+    """Persistent on-disk cache of parsed field schemas shared across processes and runs.
+
+    Examples:
+        Create a ``client`` using :obj:`axonius_api_client.connect.Connect` and assume
+        ``apiobj`` is either ``client.devices`` or ``client.users``
+
+        The cache is used by :meth:`axonius_api_client.api.assets.fields.Fields.get`
+
+        >>> apiobj.fields.cache
+        FieldsCache(path='/home/user/axonius_api_client_cache/fields', enabled=True, ttl=86400)
+
+        Remove the cached field schemas of this asset type
+
+        >>> apiobj.fields.invalidate_cache()
+
+        Remove all cached field schemas
+
+        >>> apiobj.fields.cache.invalidate()
+
+    Notes:
+        The cache is disabled unless enabled is True or AX_FIELDS_CACHE is set to yes.
+
+        Entries are keyed by the URL of the instance, the asset type, and the API key of the
+        current user. Each entry stores a stamp of the about page of the instance, the version
+        of this package, and the version of python. An entry is stale if the stamp does not
+        match or it is older than ttl seconds, so adapters or permissions that change without
+        an upgrade of the instance are picked up after ttl seconds or by invalidating the
+        cache.
+
+        Entries are serialized with :mod:`marshal` and compressed with :mod:`zlib`. They are
+        written to a temporary file which is renamed over the entry, so readers in other
+        processes never see a partially written entry. marshal is not safe to load from
+        files other users can write, so entries are only read from a directory and files
+        owned by the current user that no other user can write to.
+
+        Defaults for enabled, path, and ttl are taken from the OS env vars
+        AX_FIELDS_CACHE, AX_FIELDS_CACHE_PATH, and AX_FIELDS_CACHE_TTL.
+    """
+
+    VERSION: int = 1
+    """version of the format of cache entries"""
+
+    SUFFIX: str = ".fields"
+    """suffix of cache entry files"""
+
+    def __init__(
+        self,
+        path: t.Optional[PathLike] = None,
+        ttl: t.Optional[int] = None,
+        enabled: t.Optional[bool] = None,
+    ):
+        """Persistent on-disk cache of parsed field schemas shared across processes and runs.
+
+        Args:
+            path: directory to store cache entries in, if not supplied will use
+                AX_FIELDS_CACHE_PATH or :meth:`get_default_path`
+            ttl: seconds entries are fresh for, 0 for no limit, if not supplied will use
+                AX_FIELDS_CACHE_TTL
+            enabled: use the cache, if not supplied will use AX_FIELDS_CACHE
+        """
+        self.LOG: logging.Logger = get_obj_log(obj=self)
+        path = path or get_env_fields_cache_path() or self.get_default_path()
+        self.path: pathlib.Path = get_path(obj=path)
+        self.ttl: int = get_env_fields_cache_ttl() if ttl is None else int(ttl)
+        self.enabled: bool = get_env_fields_cache() if enabled is None else coerce_bool(enabled)
+
+    @staticmethod
+    def get_default_path() -> pathlib.Path:
+        """Get :attr:`FIELDS_CACHE_DIR` under :attr:`DEFAULT_PATH`."""
+        return pathlib.Path(DEFAULT_PATH) / FIELDS_CACHE_DIR
+
+    @staticmethod
+    def is_private(path: pathlib.Path) -> bool:
+        """Check that a path is owned by the current user and no other user can write to it.
+
+        Args:
+            path: path to check
+
+        Notes:
+            Always True on platforms without POSIX ownership, i.e. Windows.
+        """
+        if not hasattr(os, "getuid"):
+            return True
+        stat = path.stat()
+        return stat.st_uid == os.getuid() and not stat.st_mode & 0o022
+
+    @staticmethod
+    def get_key(url: str, asset_type: str, user: dict) -> str:
+        """Get the key of a cache entry.
+
+        Args:
+            url: URL of the instance
+            asset_type: asset type of the field schemas
+            user: role and permissions of the current user
+        """
+        data = {"url": url, "asset_type": asset_type, "user": user}
+        return hashlib.sha256(json.dumps(data, sort_keys=True, default=str).encode()).hexdigest()
+
+    @staticmethod
+    def get_stamp(meta: t.Any) -> str:
+        """Get the stamp used to check if a cache entry is stale.
+
+        Args:
+            meta: metadata of the instance
+        """
+        data = {
+            "meta": meta,
+            "client": __version__,
+            "python": list(sys.version_info[:2]),
+        }
+        return hashlib.sha256(json.dumps(data, sort_keys=True, default=str).encode()).hexdigest()
+
+    def get_file(self, key: str) -> pathlib.Path:
+        """Get the path to a cache entry.
+
+        Args:
+            key: key of the cache entry
+        """
+        return self.path / f"{key}{self.SUFFIX}"
+
+    def load(self, key: str, stamp: str) -> t.Any:
+        """Load a cache entry.
+
+        Args:
+            key: key of the cache entry
+            stamp: stamp the cache entry must have been saved with
+
+        Returns:
+            the cached data, or None if the entry does not exist, is stale, or is invalid
+        """
+        if not self.enabled:
+            return None
+
+        path = self.get_file(key=key)
+        try:
+            if not (self.is_private(path=self.path) and self.is_private(path=path)):
+                self.LOG.warning(
+                    f"Not reading field schema cache entry {str(path)!r}, it or its directory"
+                    " is not owned by the current user or can be written to by other users"
+                )
+                return None
+            header, payload = marshal.loads(path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except Exception as exc:  # noqa: BLE001
+            self.LOG.debug(f"Unable to read field schema cache entry {str(path)!r}: {exc}")
+            return None
+
+        if header.get("version") != self.VERSION or header.get("stamp") != stamp:
+            self.LOG.debug(f"Field schema cache entry {str(path)!r} is stale")
+            return None
+
+        age = time.time() - header.get("created", 0)
+        if self.ttl and age > self.ttl:
+            self.LOG.debug(f"Field schema cache entry {str(path)!r} expired {age:.0f}s old")
+            return None
+
+        try:
+            return marshal.loads(zlib.decompress(payload))
+        except Exception as exc:  # noqa: BLE001
+            self.LOG.debug(f"Unable to load field schema cache entry {str(path)!r}: {exc}")
+            return None
+
+    def save(self, key: str, stamp: str, data: t.Any) -> bool:
+        """Save a cache entry.
+
+        Args:
+            key: key of the cache entry
+            stamp: stamp to check against when loading the cache entry
+            data: data to cache
+
+        Returns:
+            True if the cache entry was written
+        """
+        if not self.enabled:
+            return False
+
+        path = self.get_file(key=key)
+        tmp = None
+        try:
+            payload = zlib.compress(marshal.dumps(data))
+            header = {"version": self.VERSION, "stamp": stamp, "created": time.time()}
+            self.path.mkdir(mode=0o700, parents=True, exist_ok=True)
+            if not self.is_private(path=self.path):
+                self.LOG.warning(
+                    f"Not writing field schema cache entry {str(path)!r}, its directory is not"
+                    " owned by the current user or can be written to by other users"
+                )
+                return False
+            fd, tmp = tempfile.mkstemp(dir=str(self.path), prefix=f".{key}.", suffix=".tmp")
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(marshal.dumps((header, payload)))
+                fh.flush()
+                os.fsync(fh.fileno())
+            os.replace(tmp, path)
+        except Exception as exc:  # noqa: BLE001
+            self.LOG.warning(f"Unable to write field schema cache entry {str(path)!r}: {exc}")
+            if tmp and os.path.exists(tmp):
+                os.unlink(tmp)
+            return False
+
+        self.LOG.debug(f"Wrote field schema cache entry {str(path)!r}")
+        return True
+
+    def invalidate(self, key: t.Optional[str] = None) -> int:
+        """Remove cache entries.
+
+        Args:
+            key: key of the cache entry to remove, if not supplied remove all entries
+
+        Returns:
+            number of cache entries removed
+        """
+        paths = [self.get_file(key=key)] if key else self.path.glob(f"*{self.SUFFIX}")
+        removed = 0
+        for path in paths:
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                continue
+            removed += 1
+        self.LOG.debug(f"Removed {removed} field schema cache entries from {str(self.path)!r}")
+        return removed
+
+    def __repr__(self) -> str:
+        """Pass."""
+        items = [
+            f"path={str(self.path)!r}",
+            f"enabled={self.enabled}",
+            f"ttl={self.ttl}",
+        ]
+        return f"{self.__class__.__name__}({', '.join(items)})"
+
+    def __str__(self) -> str:
+        """Pass."""
+        return self.__repr__()
@@ -1,8 +1,12 @@
 # -*- coding: utf-8 -*-
 """API for working with tags for assets."""
+import queue
+import threading
+import time
 from datetime import datetime, timedelta
-from typing import List, Optional, Union
+from typing import Callable, List, Optional, Union
 
+from ...constants.api import TAGS_QUEUE_SIZE
 from ...tools import listify
 from .. import json_api
 from ..api_endpoints import ApiEndpoints
@@ -151,9 +155,11 @@ class Labels(ChildMixins):
         request_obj = api_endpoint.load_request(
             entities=entities, labels=listify(labels), expirable_tags=expirable_tags,
         )
-        return api_endpoint.perform_request(
+        response = api_endpoint.perform_request(
             http=self.auth.http, request_obj=request_obj, asset_type=self.asset_type
         )
+        self.http.CACHES.invalidate("wizard.get_asset_tags*")
+        return response
 
     def remove(self, rows: List[dict], labels: List[str], invert_selection: bool = False) -> int:
         """Remove tags from assets.
@@ -196,9 +202,11 @@ class Labels(ChildMixins):
 
         entities = {"ids": listify(ids), "include": include}
         request_obj = api_endpoint.load_request(entities=entities, labels=listify(labels))
-        return api_endpoint.perform_request(
+        response = api_endpoint.perform_request(
             http=self.auth.http, request_obj=request_obj, asset_type=self.asset_type
         )
+        self.http.CACHES.invalidate("wizard.get_asset_tags*")
+        return response
 
     @staticmethod
     def _get_ids(rows: Union[List[dict], str]) -> List[str]:
@@ -224,3 +232,165 @@ class Labels(ChildMixins):
         """Direct API method to get all known expirable labels/tags."""
         api_endpoint = ApiEndpoints.assets.tags_get_expirable_names
         return api_endpoint.perform_request(http=self.auth.http, asset_type=self.asset_type)
+
+
+class LabelsWorker:
+    """Add or remove tags for chunks of assets, optionally in a background thread.
+
+    Examples:
+        Add tags to assets while they are being fetched, one API call per chunk of IDs
+
+        >>> worker = LabelsWorker(labels=client.devices.labels, tags=["tag1"])
+        >>> for page in pages:
+        ...     worker.submit(ids=[x["internal_axon_id"] for x in page])
+        >>> worker.join()
+        {'chunks': 3, 'ids_sent': 25, 'modified': 25, 'chunks_failed': 0, 'ids_failed': 0, ...}
+
+    Notes:
+        Chunks are sent in the order they are submitted. Errors do not stop the worker, they
+        are tracked in :attr:`errors` and counted in :attr:`metrics` so that the caller
+        can reconcile the IDs that were not tagged.
+    """
+
+    def __init__(
+        self,
+        labels: Labels,
+        tags: List[str],
+        remove: bool = False,
+        expirable_tags: Optional[dict] = None,
+        background: bool = False,
+        progress: Optional[Callable[[str], None]] = None,
+    ):
+        """Add or remove tags for chunks of assets, optionally in a background thread.
+
+        Args:
+            labels: labels object of the asset type to tag
+            tags: tags to add or remove
+            remove: remove tags instead of adding them
+            expirable_tags: dict with tag name and expiration date, only used when adding
+            background: send chunks from a background thread instead of in :meth:`submit`
+            progress: callable to report progress messages to
+        """
+        self.labels: Labels = labels
+        self.tags: List[str] = listify(tags)
+        self.remove: bool = remove
+        self.expirable_tags: List[dict] = (
+            [] if remove else labels._set_expirable_tags(expirations=expirable_tags)
+        )
+        self.background: bool = background
+        self.progress: Optional[Callable[[str], None]] = progress
+        self.errors: List[Exception] = []
+        self.metrics: dict = {
+            "chunks": 0,
+            "ids_sent": 0,
+            "modified": 0,
+            "chunks_failed": 0,
+            "ids_failed": 0,
+            "seconds": 0.0,
+        }
+        self._queue: queue.Queue = queue.Queue(maxsize=TAGS_QUEUE_SIZE)
+        self._thread: Optional[threading.Thread] = None
+
+    def submit(self, ids: List[str], include: bool = True):
+        """Send a chunk of asset IDs to the API, blocking if the queue is full.
+
+        Args:
+            ids: internal_axon_id of assets to add or remove tags for
+            include: True=tag assets that ARE supplied in ids;
+                False=tag assets that ARE NOT supplied in ids
+        """
+        if not self.background:
+            self.send(ids=ids, include=include)
+            return
+
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name=f"labels_{self.verb}_{self.labels.asset_type}", daemon=True
+            )
+            self._thread.start()
+        self._queue.put((ids, include))
+
+    def send(self, ids: List[str], include: bool = True):
+        """Perform the API call to add or remove tags for a chunk of asset IDs.
+
+        Args:
+            ids: internal_axon_id of assets to add or remove tags for
+            include: True=tag assets that ARE supplied in ids;
+                False=tag assets that ARE NOT supplied in ids
+        """
+        start = time.monotonic()
+        chunk = self.metrics["chunks"] + self.metrics["chunks_failed"] + 1
+        try:
+            if self.remove:
+                response = self.labels._remove(labels=self.tags, ids=ids, include=include)
+            else:
+                response = self.labels._add(
+                    labels=self.tags, ids=ids, include=include, expirable_tags=self.expirable_tags
+                )
+        except Exception as exc:
+            self.errors.append(exc)
+            self.metrics["chunks_failed"] += 1
+            self.metrics["ids_failed"] += len(ids)
+            self.echo(f"API failed tag {self.verb} for chunk #{chunk} of {len(ids)} IDs: {exc}")
+            return
+        finally:
+            self.metrics["seconds"] += time.monotonic() - start
+
+        self.metrics["chunks"] += 1
+        self.metrics["ids_sent"] += len(ids)
+        self.metrics["modified"] += response.value
+        self.echo(
+            f"API finished tag {self.verb} for chunk #{chunk} of {len(ids)} IDs, "
+            f"{response.value} assets modified, {self.metrics['modified']} total"
+        )
+
+    def join(self) -> dict:
+        """Wait for all submitted chunks to be sent and get the metrics."""
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+        return dict(self.metrics)
+
+    def close(self) -> dict:
+        """Stop the background thread without sending the queued chunks and get the metrics."""
+        if self._thread is not None:
+            discarded = 0
+            while True:
+                try:
+                    ids, _ = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                discarded += len(ids)
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+            if discarded:
+                self.echo(f"Discarded tag {self.verb} for {discarded} queued IDs")
+        return dict(self.metrics)
+
+    def echo(self, msg: str):
+        """Report a progress message.
+
+        Args:
+            msg: message to report
+        """
+        if callable(self.progress):
+            self.progress(msg)
+
+    @property
+    def verb(self) -> str:
+        """Get the verb for the tag operation of this worker."""
+        return "remove" if self.remove else "add"
+
+    def _run(self):
+        """Send chunks of asset IDs from the queue until the stop marker is found."""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            self.send(*item)
+
+    def __repr__(self) -> str:
+        """Pass."""
+        return f"{self.__class__.__name__}(verb={self.verb!r}, tags={self.tags!r})"
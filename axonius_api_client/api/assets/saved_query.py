@@ -5,8 +5,7 @@ import typing as t
 import warnings
 import pathlib
 
-from cachetools import TTLCache, cached
-
+from ...caching import cached
 from ...constants.api import AS_DATACLASS
 from ...constants.ctypes import PatternLikeListy
 from ...exceptions import (
@@ -27,10 +26,13 @@ from ..json_api.paging_state import LOG_LEVEL_API, PAGE_SIZE, PagingState
 from ..mixins import ChildMixins
 
 MULTI = t.Union[str, dict, models.SavedQuery]
-CACHE_TAGS = TTLCache(maxsize=1024, ttl=60)
-CACHE_RUN_BY = TTLCache(maxsize=1024, ttl=60)
-CACHE_RUN_FROM = TTLCache(maxsize=1024, ttl=60)
-CACHE_GET = TTLCache(maxsize=1024, ttl=60)
+CACHES_MUTATED: t.List[str] = [
+    "saved_query.get_cached",
+    "saved_query.get_tags",
+    "wizard.get_sqs",
+    "folders.*",
+]
+"""Caches holding saved queries, invalidated when a saved query is added, updated, or deleted."""
 CONTENT = t.Union[str, bytes]
 STR_PATH = t.Union[str, pathlib.Path]
 
@@ -627,17 +629,17 @@ class SavedQuery(ChildMixins):
             tags += [x for x in sq.tags if x not in tags]
         return tags
 
-    @cached(cache=CACHE_TAGS)
+    @cached(name="saved_query.get_tags")
     def get_tags(self) -> t.List[str]:
         """Get all tags for saved queries."""
         return self._get_tags().value
 
-    @cached(cache=CACHE_RUN_BY)
+    @cached(name="saved_query.get_query_history_run_by")
     def get_query_history_run_by(self) -> t.List[str]:
         """Get the valid values for the run_by attribute for getting query history."""
         return self._get_query_history_run_by().value
 
-    @cached(cache=CACHE_RUN_FROM)
+    @cached(name="saved_query.get_query_history_run_from")
     def get_query_history_run_from(self) -> t.List[str]:
         """Get the valid values for the run_from attribute for getting query history."""
         return self._get_query_history_run_from().value
@@ -804,7 +806,7 @@ class SavedQuery(ChildMixins):
 
         return list(gen)
 
-    @cached(cache=CACHE_GET)
+    @cached(name="saved_query.get_cached")
     def get_cached(self, **kwargs) -> t.List[t.Union[dict, models.SavedQuery]]:
         """Get all saved queries.
 
@@ -1265,6 +1267,7 @@ class SavedQuery(ChildMixins):
         response = api_endpoint.perform_request(
             http=self.auth.http, http_args=http_args
         )
+        self.http.CACHES.invalidate(*CACHES_MUTATED)
         return response
 
     def saved_query_export(self, ids: t.List[str], folder_id: str = "", **kwargs) -> t.List[dict]:
@@ -1336,7 +1339,7 @@ class SavedQuery(ChildMixins):
             request_obj=request_obj,
             uuid=uuid,
         )
-        self.get_cached.cache_clear()
+        self.http.CACHES.invalidate(*CACHES_MUTATED)
         return response
 
     # noinspection PyUnresolvedReferences
@@ -1354,7 +1357,7 @@ class SavedQuery(ChildMixins):
         response = api_endpoint.perform_request(
             http=self.auth.http, request_obj=request_obj, asset_type=self.parent.ASSET_TYPE
         )
-        self.get_cached.cache_clear()
+        self.http.CACHES.invalidate(*CACHES_MUTATED)
         return response
 
     def _delete(self, uuid: str) -> Metadata:
@@ -1371,7 +1374,7 @@ class SavedQuery(ChildMixins):
         response = api_endpoint.perform_request(
             http=self.auth.http, request_obj=request_obj, uuid=uuid
         )
-        self.get_cached.cache_clear()
+        self.http.CACHES.invalidate(*CACHES_MUTATED)
         return response
 
     def _get_model(self, request_obj: models.SavedQueryGet) -> t.List[models.SavedQuery]:
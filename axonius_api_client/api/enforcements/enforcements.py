@@ -3,8 +3,7 @@
 import typing as t
 import warnings
 
-from cachetools import TTLCache, cached
-
+from ...caching import cached
 from ...constants.api import MAX_PAGE_SIZE
 from ...exceptions import AlreadyExists, ApiError, ApiWarning, NotAllowedError, NotFoundError
 from ...parsers.tables import tablize
@@ -35,7 +34,6 @@ MULTI_SET = t.Union[
     str, dict, EnforcementBasicModel, EnforcementFullModel, UpdateEnforcementResponseModel
 ]
 MULTI_ACTION_TYPE = t.Union[str, dict, ActionType]
-CACHE_GET = TTLCache(maxsize=1024, ttl=60)
 
 
 class Enforcements(ModelMixins):
@@ -136,7 +134,7 @@ class Enforcements(ModelMixins):
             )
         )
 
-    @cached(cache=CACHE_GET)
+    @cached(name="enforcements.get_sets_cached")
     def get_sets_cached(
         self, **kwargs
     ) -> t.List[t.Union[EnforcementBasicModel, EnforcementFullModel]]:
@@ -850,7 +848,7 @@ Easiest way to learn the correct configuration for an action:
         api_endpoint = ApiEndpoints.enforcements.delete_set
         request_obj = api_endpoint.load_request(value={"ids": [uuid], "include": True})
         response = api_endpoint.perform_request(http=self.auth.http, request_obj=request_obj)
-        self.get_sets_cached.cache_clear()
+        self.http.CACHES.invalidate("enforcements.get_sets_cached", "folders.*")
         return response
 
     def _copy(self, uuid: str, name: str, clone_triggers: bool) -> EnforcementFullModel:
@@ -869,7 +867,7 @@ Easiest way to learn the correct configuration for an action:
             id=uuid, uuid=uuid, name=name, clone_triggers=clone_triggers
         )
         response = api_endpoint.perform_request(http=self.auth.http, request_obj=request_obj)
-        self.get_sets_cached.cache_clear()
+        self.http.CACHES.invalidate("enforcements.get_sets_cached", "folders.*")
         return response
 
     def _update_description(self, uuid: str, description: str) -> None:
@@ -885,7 +883,7 @@ Easiest way to learn the correct configuration for an action:
         response = api_endpoint.perform_request(
             http=self.auth.http, request_obj=request_obj, uuid=uuid
         )
-        self.get_sets_cached.cache_clear()
+        self.http.CACHES.invalidate("enforcements.get_sets_cached", "folders.*")
         return response
 
     def _update(
@@ -919,7 +917,7 @@ Easiest way to learn the correct configuration for an action:
         response = api_endpoint.perform_request(
             http=self.auth.http, request_obj=request_obj, uuid=uuid
         )
-        self.get_sets_cached.cache_clear()
+        self.http.CACHES.invalidate("enforcements.get_sets_cached", "folders.*")
         return response
 
     def _create_from_model(self, request_obj: CreateEnforcementModel) -> EnforcementFullModel:
@@ -928,7 +926,7 @@ Easiest way to learn the correct configuration for an action:
         response: EnforcementFullModel = api_endpoint.perform_request(
             http=self.auth.http, request_obj=request_obj
         )
-        self.get_sets_cached.cache_clear()
+        self.http.CACHES.invalidate("enforcements.get_sets_cached", "folders.*")
         return response
 
     def _create(
@@ -970,7 +968,7 @@ Easiest way to learn the correct configuration for an action:
             folder_id=folder_id,
         )
         response = api_endpoint.perform_request(http=self.auth.http, request_obj=request_obj)
-        self.get_sets_cached.cache_clear()
+        self.http.CACHES.invalidate("enforcements.get_sets_cached", "folders.*")
         return response
 
     # noinspection PyShadowingBuiltins
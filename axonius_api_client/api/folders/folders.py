@@ -3,8 +3,7 @@
 import abc
 import typing as t
 
-from cachetools import TTLCache, cached
-
+from ...caching import cached
 from ..api_endpoints import ApiEndpoint, ApiEndpointGroup, ApiEndpoints
 from ..json_api.folders.base import (
     BaseModel,
@@ -45,7 +44,7 @@ class FoldersMixins(ModelMixins, abc.ABC):
         root: FoldersModel = self._get()
         return root
 
-    @cached(cache=TTLCache(maxsize=1024, ttl=60))
+    @cached(name="folders.get_cached")
     def get_cached(self) -> t.Union[FoldersModel, FolderModel]:
         """Get the root for this folders object type using a cache with a TTL of 60."""
         return self.get()
@@ -97,7 +96,7 @@ class FoldersMixins(ModelMixins, abc.ABC):
         root: FoldersModel = self.get()
         return root.find(folder=folder, create=create, refresh=False, echo=echo)
 
-    @cached(cache=TTLCache(maxsize=1024, ttl=60))
+    @cached(name="folders.find_cached")
     def find_cached(self, *args, **kwargs) -> t.Union[FoldersModel, FolderModel]:
         """Find a folder for this folders object type using a cache with a TTL of 60."""
         return self.find(*args, **kwargs)
@@ -421,6 +420,7 @@ class FoldersMixins(ModelMixins, abc.ABC):
         response: RenameFolderResponseModel = endpoint.perform_request(
             http=self.auth.http, request_obj=request_obj, id=id
         )
+        self.http.CACHES.invalidate("folders.*")
         return response
 
     def _move(self, id: str, parent_id: str) -> MoveFolderResponseModel:
@@ -440,6 +440,7 @@ class FoldersMixins(ModelMixins, abc.ABC):
             request_obj=request_obj,
             id=id,
         )
+        self.http.CACHES.invalidate("folders.*")
         return response
 
     def _create(self, name: str, parent_id: str) -> CreateFolderResponseModel:
@@ -459,6 +460,7 @@ class FoldersMixins(ModelMixins, abc.ABC):
         response: CreateFolderResponseModel = endpoint.perform_request(
             http=self.auth.http, request_obj=request_obj
         )
+        self.http.CACHES.invalidate("folders.*")
         return response
 
     def _delete(self, id: str) -> DeleteFolderResponseModel:
@@ -472,6 +474,7 @@ class FoldersMixins(ModelMixins, abc.ABC):
         """
         endpoint: ApiEndpoint = self.api_endpoint_group.delete
         response: DeleteFolderResponseModel = endpoint.perform_request(http=self.auth.http, id=id)
+        self.http.CACHES.invalidate("folders.*")
         return response
 
 
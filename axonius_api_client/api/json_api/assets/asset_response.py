@@ -176,8 +176,12 @@ class AssetsPage(BaseModel):
         page_start: int = 0,
         row_start: int = 0,
         initial_count: int = 0,
+        workers: int = 0,
+        prefetch: int = 0,
     ) -> dict:
         """Pass."""
+        workers = parse_int_min_max(value=workers, default=0, min_value=0)
+        prefetch = parse_int_min_max(value=prefetch, default=0, min_value=0)
         max_rows = parse_int_min_max(value=max_rows, default=0, min_value=0)
         max_pages = parse_int_min_max(value=max_pages, default=0, min_value=0)
         page_start = parse_int_min_max(value=page_start, default=0, min_value=0)
@@ -205,6 +209,10 @@ class AssetsPage(BaseModel):
             "page_start": page_start,
             "pages_to_fetch_left": 0,
             "pages_to_fetch_total": 0,
+            "prefetch": prefetch,
+            "prefetch_queue_depth": 0,
+            "process_seconds_this_page": 0,
+            "process_seconds_total": 0,
             "rows_fetched_this_page": 0,
             "rows_fetched_total": 0,
             "rows_initial_count": initial_count,
@@ -214,14 +222,26 @@ class AssetsPage(BaseModel):
             "rows_to_fetch_total": 0,
             "stop_fetch": False,
             "stop_msg": None,
+            "workers": workers,
+            "workers_progress": {},
         }
         return state
 
-    def process_page(self, state: dict, start_dt: datetime.datetime, apiobj) -> dict:
+    def process_page(
+        self,
+        state: dict,
+        start_dt: datetime.datetime,
+        apiobj,
+        worker: t.Optional[str] = None,
+        fetch_seconds: t.Optional[float] = None,
+    ) -> dict:
         """Pass."""
         apiobj.LOG.debug(f"FETCHED PAGE: {self}")
+        self.process_start_dt = dt_now()
 
-        this_page_took = dt_sec_ago(obj=start_dt, exact=True)
+        this_page_took = (
+            dt_sec_ago(obj=start_dt, exact=True) if fetch_seconds is None else fetch_seconds
+        )
         init_count = state["rows_initial_count"]
         this_count = self.asset_count_left
         prev_count = state["rows_to_fetch_total"]
@@ -246,6 +266,14 @@ class AssetsPage(BaseModel):
         state["page_cursor"] = self.cursor
         state["page_number"] = self.page_number
 
+        if worker:
+            progress = state.setdefault("workers_progress", {}).setdefault(
+                worker, {"pages": 0, "rows": 0, "fetch_seconds": 0}
+            )
+            progress["pages"] += 1
+            progress["rows"] += self.asset_count_page
+            progress["fetch_seconds"] += this_page_took
+
         if not self.assets:
             state = self.process_stop(state=state, reason="no more rows returned", apiobj=apiobj)
 
@@ -273,7 +301,10 @@ class AssetsPage(BaseModel):
                 state=state, reason="'page_number' greater than 'max_pages'", apiobj=apiobj
             )
         state["page_loop"] += 1
-        process_page_took = dt_sec_ago(obj=self.page_start_dt, exact=True)
+        process_start_dt = getattr(self, "process_start_dt", self.page_start_dt)
+        process_page_took = dt_sec_ago(obj=process_start_dt, exact=True)
+        state["process_seconds_this_page"] = process_page_took
+        state["process_seconds_total"] += process_page_took
         apiobj.LOG.debug(f"Processing page took {process_page_took} seconds")
         return state
 
@@ -66,7 +66,7 @@ class Folder(base.Folder):
     def _clear_objects_cache(self):
         """Clear any object specific cache being used."""
         super()._clear_objects_cache()
-        self.client.enforcements.get_sets_cached.cache_clear()
+        self.client.CACHES.invalidate("enforcements.get_sets_cached")
 
     def _get_objects(
         self,
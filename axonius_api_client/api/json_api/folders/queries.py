@@ -90,7 +90,7 @@ class Folder(base.Folder):
     def _clear_objects_cache(self):
         """Clear any object specific cache being used."""
         super()._clear_objects_cache()
-        self.client.devices.saved_query.get_cached.cache_clear()
+        self.client.CACHES.invalidate("saved_query.get_cached")
 
     def _get_objects(
         self, full_objects: bool = base.FolderDefaults.full_objects
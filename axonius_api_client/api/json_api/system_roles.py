@@ -7,8 +7,8 @@ import typing as t
 
 import marshmallow
 import marshmallow_jsonapi
-from cachetools import TTLCache, cached
 
+from ...caching import cached
 from .base import BaseModel, BaseSchemaJson
 from .custom_fields import SchemaBool, SchemaDatetime, get_field_dc_mm
 from .data_scopes import DataScope
@@ -66,7 +66,7 @@ def parse_cat_actions(raw: dict) -> dict:
     return {"categories": cats, "actions": cat_actions, "lengths": lengths}
 
 
-@cached(cache=TTLCache(maxsize=1024, ttl=300))
+@cached(name="system_roles.cat_actions", ttl=300)
 def cat_actions(http) -> dict:
     """Get permission categories and their actions."""
     from .. import ApiEndpoints
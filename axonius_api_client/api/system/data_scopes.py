@@ -2,8 +2,7 @@
 """API for working with data scopes."""
 import typing as t
 
-import cachetools
-
+from ...caching import cached
 from ...exceptions import ApiError, NotFoundError
 from ...parsers.tables import tablize
 from ...tools import listify
@@ -16,7 +15,6 @@ SELECT = t.Union[str, MODEL]
 MODEL_SQ = json_api.saved_queries.SavedQuery
 SELECT_SQ = t.Union[str, MODEL_SQ]
 SELECT_SQS = t.Union[SELECT_SQ, t.List[SELECT_SQ]]
-CACHE_GET: cachetools.TTLCache = cachetools.TTLCache(maxsize=1024, ttl=60)
 
 
 class DataScopes(ModelMixins):
@@ -67,7 +65,7 @@ class DataScopes(ModelMixins):
         err = f"No data scope found with name of {name!r} or UUID of {uuid!r}"
         raise NotFoundError(tablize(value=[x.to_tablize() for x in items], err=err))
 
-    @cachetools.cached(cache=CACHE_GET)
+    @cached(name="data_scopes.get_cached")
     def get_cached(self, safe: bool = False) -> t.List[MODEL]:
         """Get Axonius system users using a cache mechanism."""
         if not self.is_feature_enabled:
@@ -311,7 +309,9 @@ class DataScopes(ModelMixins):
     def _delete(self, uuid: str) -> json_api.generic.Metadata:
         """Direct API method to delete a data scope by UUID."""
         api_endpoint = ApiEndpoints.data_scopes.delete
-        return api_endpoint.perform_request(http=self.auth.http, uuid=uuid)
+        response = api_endpoint.perform_request(http=self.auth.http, uuid=uuid)
+        self.http.CACHES.invalidate("data_scopes.get_cached")
+        return response
 
     def _create(
         self,
@@ -328,7 +328,9 @@ class DataScopes(ModelMixins):
             users_queries=users_queries,
             description=description,
         )
-        return api_endpoint.perform_request(http=self.auth.http, request_obj=request_obj)
+        response = api_endpoint.perform_request(http=self.auth.http, request_obj=request_obj)
+        self.http.CACHES.invalidate("data_scopes.get_cached")
+        return response
 
     def _update(
         self,
@@ -347,7 +349,11 @@ class DataScopes(ModelMixins):
             users_queries=users_queries,
             description=description,
         )
-        return api_endpoint.perform_request(http=self.auth.http, request_obj=request_obj, uuid=uuid)
+        response = api_endpoint.perform_request(
+            http=self.auth.http, request_obj=request_obj, uuid=uuid
+        )
+        self.http.CACHES.invalidate("data_scopes.get_cached")
+        return response
 
     def _update_from_model(self, value: MODEL) -> json_api.generic.Metadata:
         """Update a data scope from a model object."""
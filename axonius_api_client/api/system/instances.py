@@ -5,9 +5,9 @@ import math
 import pathlib
 from typing import List, Optional, Union
 
-import cachetools
 import requests
 
+from ...caching import cached
 from ...exceptions import FeatureNotEnabledError, NotFoundError
 from ...parsers.tables import tablize
 from ...tools import is_url, path_read
@@ -15,7 +15,6 @@ from .. import json_api
 from ..api_endpoints import ApiEndpoints
 from ..mixins import ModelMixins
 
-FEATURE_FLAGS_CACHE = cachetools.TTLCache(maxsize=1, ttl=10)
 TUNNEL_MODEL = json_api.instances.Tunnel
 
 
@@ -508,7 +507,7 @@ class Instances(ModelMixins):
         return [x.value for x in self._get_api_versions()]
 
     @property
-    @cachetools.cached(cache=FEATURE_FLAGS_CACHE)
+    @cached(name="instances.feature_flags", maxsize=1, ttl=10)
     def feature_flags(self) -> json_api.system_settings.FeatureFlags:
         """Get the feature flags for the core."""
         return self._feature_flags()
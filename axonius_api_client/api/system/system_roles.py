@@ -3,8 +3,7 @@
 import copy
 import typing as t
 
-import cachetools
-
+from ...caching import cached
 from ...exceptions import ApiError, NotFoundError, ResponseNotOk
 from ...parsers.tables import tablize_roles
 from ...tools import coerce_str_to_csv
@@ -12,7 +11,6 @@ from .. import json_api
 from ..api_endpoints import ApiEndpoints
 from ..mixins import ModelMixins
 
-CACHE_GET: cachetools.TTLCache = cachetools.TTLCache(maxsize=1024, ttl=60)
 MODEL = json_api.system_roles.SystemRole
 
 
@@ -58,7 +56,7 @@ class SystemRoles(ModelMixins):
         for row in rows:
             yield row.to_dict_old()
 
-    @cachetools.cached(cache=CACHE_GET)
+    @cached(name="system_roles.get_cached")
     def get_cached(self) -> t.List[MODEL]:
         """Get Axonius system roles using a caching mechanism."""
         return self._get()
@@ -395,7 +393,9 @@ class SystemRoles(ModelMixins):
         request_obj = api_endpoint.load_request(
             name=name, permissions=permissions, data_scope_restriction=data_scope_restriction
         )
-        return api_endpoint.perform_request(http=self.auth.http, request_obj=request_obj)
+        response = api_endpoint.perform_request(http=self.auth.http, request_obj=request_obj)
+        self.http.CACHES.invalidate("system_roles.get_cached")
+        return response
 
     def _update(
         self,
@@ -419,7 +419,11 @@ class SystemRoles(ModelMixins):
             permissions=permissions,
             data_scope_restriction=data_scope_restriction,
         )
-        return api_endpoint.perform_request(http=self.auth.http, request_obj=request_obj, uuid=uuid)
+        response = api_endpoint.perform_request(
+            http=self.auth.http, request_obj=request_obj, uuid=uuid
+        )
+        self.http.CACHES.invalidate("system_roles.get_cached")
+        return response
 
     def _delete(self, uuid: str) -> MODEL:
         """Direct API method to delete a role.
@@ -429,7 +433,9 @@ class SystemRoles(ModelMixins):
         """
         api_endpoint = ApiEndpoints.system_roles.delete
         request_obj = api_endpoint.load_request(uuid=uuid)
-        return api_endpoint.perform_request(http=self.auth.http, request_obj=request_obj)
+        response = api_endpoint.perform_request(http=self.auth.http, request_obj=request_obj)
+        self.http.CACHES.invalidate("system_roles.get_cached")
+        return response
 
     def _get_labels(self) -> dict:  # pragma: no cover
         """Direct API method to get role labels."""
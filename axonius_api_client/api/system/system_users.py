@@ -2,8 +2,7 @@
 """API for working with system users."""
 import typing as t
 
-import cachetools
-
+from ...caching import cached
 from ...constants.api import MAX_PAGE_SIZE
 from ...exceptions import ApiError, NotFoundError
 from ...parsers.tables import tablize_users
@@ -12,7 +11,6 @@ from .. import json_api
 from ..api_endpoints import ApiEndpoints
 from ..mixins import ModelMixins
 
-CACHE_GET: cachetools.TTLCache = cachetools.TTLCache(maxsize=1024, ttl=60)
 MODEL = json_api.system_users.SystemUser
 
 
@@ -62,7 +60,7 @@ class SystemUsers(ModelMixins):
         err = f"No user found with name of {name!r} or UUID of {uuid!r}"
         raise NotFoundError(tablize_users(users=[x.to_dict_old() for x in items], err=err))
 
-    @cachetools.cached(cache=CACHE_GET)
+    @cached(name="system_users.get_cached")
     def get_cached(self) -> t.List[MODEL]:
         """Get Axonius system users using a cache mechanism."""
         offset = 0
@@ -443,7 +441,9 @@ class SystemUsers(ModelMixins):
             role_id=role_id,
             auto_generated_password=auto_generated_password,
         )
-        return api_endpoint.perform_request(http=self.auth.http, request_obj=request_obj)
+        response = api_endpoint.perform_request(http=self.auth.http, request_obj=request_obj)
+        self.http.CACHES.invalidate("system_users.get_cached")
+        return response
 
     def _delete(self, uuid: str) -> MODEL:
         """Direct API method to delete a user.
@@ -453,7 +453,9 @@ class SystemUsers(ModelMixins):
         """
         api_endpoint = ApiEndpoints.system_users.delete
         request_obj = api_endpoint.load_request(uuid=uuid)
-        return api_endpoint.perform_request(http=self.auth.http, request_obj=request_obj)
+        response = api_endpoint.perform_request(http=self.auth.http, request_obj=request_obj)
+        self.http.CACHES.invalidate("system_users.get_cached")
+        return response
 
     def _update(
         self,
@@ -490,7 +492,9 @@ class SystemUsers(ModelMixins):
             pic_name=pic_name,
             ignore_role_assignment_rules=ignore_role_assignment_rules,
         )
-        return api_endpoint.perform_request(http=self.auth.http, request_obj=request_obj)
+        response = api_endpoint.perform_request(http=self.auth.http, request_obj=request_obj)
+        self.http.CACHES.invalidate("system_users.get_cached")
+        return response
 
     def _tokens_generate(self, uuid: str, user_name: str) -> str:
         """Direct API method to generate a password reset link for a user.
@@ -535,12 +535,7 @@ class Wizard:
         if not field[Fields.IS_COMPLEX]:
             aname = field[Fields.ANAME]
             fname = field[Fields.NAME]
-            afields = self.APIOBJ.fields.get()[aname]
-            schemas = [
-                x
-                for x in afields
-                if x[Fields.IS_COMPLEX] and not x[Fields.IS_ALL] and not x[Fields.IS_DETAILS]
-            ]
+            schemas = self.APIOBJ.fields.get_index().adapters[aname].complex
             msg = [
                 f"Invalid COMPLEX-FIELD {fname!r} for adapter {aname!r}, valids:",
                 *self.APIOBJ.fields._prettify_schemas(schemas=schemas),
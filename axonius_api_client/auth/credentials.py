@@ -4,8 +4,10 @@ import typing as t
 
 from ..http import Http
 from .model import AuthModel
-from ..api.json_api.account import LoginRequest, LoginResponse
-from ..api.api_endpoints import ApiEndpoint, ApiEndpoints
+
+if t.TYPE_CHECKING:
+    from ..api.api_endpoint import ApiEndpoint
+    from ..api.json_api.account import LoginRequest, LoginResponse
 
 
 class AuthCredentials(AuthModel):
@@ -25,6 +27,8 @@ class AuthCredentials(AuthModel):
             username: Axonius Username
             password: Axonius Password
         """
+        from ..api.json_api.account import LoginRequest
+
         creds: LoginRequest = LoginRequest(user_name=username, password=password, eula_agreed=True)
         kwargs["creds"] = creds
         super().__init__(http=http, **kwargs)
@@ -32,7 +36,7 @@ class AuthCredentials(AuthModel):
     def login(self):
         """Login to API."""
         if not self.is_logged_in:
-            self.LOGIN_RESPONSE: t.ClassVar[LoginResponse] = self._login(request_obj=self._creds)
+            self.LOGIN_RESPONSE: t.ClassVar["LoginResponse"] = self._login(request_obj=self._creds)
             # now that we logged in with username & password
             # get the API keys and use for the rest of the session
             api_keys: dict = self._get_api_keys(http_args=self.LOGIN_RESPONSE.http_args)
@@ -56,7 +60,7 @@ class AuthCredentials(AuthModel):
         """Credential fields used by this auth model."""
         return [f"username={self._creds.user_name!r}", "password"]
 
-    def _login(self, request_obj: LoginRequest) -> LoginResponse:
+    def _login(self, request_obj: "LoginRequest") -> "LoginResponse":
         """Direct API method to issue a login request using credentials.
 
         Args:
@@ -65,6 +69,10 @@ class AuthCredentials(AuthModel):
         Returns:
             LoginResponse: Response object received
         """
-        endpoint: ApiEndpoint = ApiEndpoints.account.login
-        response: LoginResponse = endpoint.perform_request(http=self.http, request_obj=request_obj)
+        from ..api.api_endpoints import ApiEndpoints
+
+        endpoint: "ApiEndpoint" = ApiEndpoints.account.login
+        response: "LoginResponse" = endpoint.perform_request(
+            http=self.http, request_obj=request_obj
+        )
         return response
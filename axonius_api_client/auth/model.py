@@ -4,14 +4,15 @@ import abc
 import logging
 import typing as t
 
-from ..api.api_endpoint import ApiEndpoint
-from ..api.api_endpoints import ApiEndpoints
-from ..api.json_api.account import CurrentUser
 from ..constants.logs import LOG_LEVEL_AUTH
 from ..exceptions import NotLoggedIn
 from ..http import Http
 from ..logs import get_obj_log
 
+if t.TYPE_CHECKING:
+    from ..api.api_endpoint import ApiEndpoint
+    from ..api.json_api.account import CurrentUser
+
 
 class AuthModel(abc.ABC):
     """Abstract base class for all Authentication methods."""
@@ -53,6 +54,8 @@ class AuthModel(abc.ABC):
 
     def validate(self) -> bool:
         """Validate credentials."""
+        from ..api.api_endpoints import ApiEndpoints
+
         self.VALIDATE_RESPONSE: t.ClassVar[t.Any] = ApiEndpoints.account.validate.perform_request(
             http=self.http
         )
@@ -68,7 +71,7 @@ class AuthModel(abc.ABC):
         """Get the API key and secret for the current user."""
         return self._get_api_keys()
 
-    def get_current_user(self) -> CurrentUser:
+    def get_current_user(self) -> "CurrentUser":
         """Get the current user."""
         return self._get_current_user()
 
@@ -106,14 +109,18 @@ class AuthModel(abc.ABC):
         """Show object info."""
         return self.__str__()
 
-    def _get_current_user(self) -> CurrentUser:
+    def _get_current_user(self) -> "CurrentUser":
         """Direct API method to get the current user."""
-        endpoint: ApiEndpoint = ApiEndpoints.account.get_current_user
-        response: CurrentUser = endpoint.perform_request(http=self.http)
+        from ..api.api_endpoints import ApiEndpoints
+
+        endpoint: "ApiEndpoint" = ApiEndpoints.account.get_current_user
+        response: "CurrentUser" = endpoint.perform_request(http=self.http)
         return response
 
     def _get_api_keys(self, http_args: t.Optional[dict] = None) -> dict:
         """Direct API method to get the API keys for the current user."""
-        endpoint: ApiEndpoint = ApiEndpoints.account.get_api_keys
+        from ..api.api_endpoints import ApiEndpoints
+
+        endpoint: "ApiEndpoint" = ApiEndpoints.account.get_api_keys
         response: dict = endpoint.perform_request(http=self.http, http_args=http_args)
         return response
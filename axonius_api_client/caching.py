@@ -0,0 +1,341 @@
+# -*- coding: utf-8 -*-
+"""Caches of API responses that can be sized, measured, and invalidated together."""
+import fnmatch
+import functools
+import logging
+import threading
+import typing as t
+
+import cachetools
+from cachetools.keys import hashkey
+
+from .exceptions import ApiError
+from .logs import get_obj_log
+
+POLICIES: t.Dict[str, dict] = {}
+"""Default maxsize and ttl of every cache by name, registered by :func:`cached`."""
+
+POLICY_KEYS: t.List[str] = ["maxsize", "ttl"]
+"""Valid keys of a cache policy."""
+
+
+class StatsCacheMixin:
+    """Mixin to count hits, misses, evictions, expirations, and invalidations of a cache."""
+
+    def __init__(self, *args, **kwargs):
+        """Mixin to count hits, misses, evictions, expirations, and invalidations of a cache."""
+        super().__init__(*args, **kwargs)
+        self.lock: threading.RLock = threading.RLock()
+        self.reset_metrics()
+
+    def reset_metrics(self):
+        """Reset the cache metrics."""
+        with self.lock:
+            self._metrics: t.Dict[str, int] = {
+                "hits": 0,
+                "misses": 0,
+                "evictions": 0,
+                "expirations": 0,
+                "invalidations": 0,
+            }
+
+    @property
+    def metrics(self) -> dict:
+        """Get the cache metrics and the current size and policy of the cache."""
+        with self.lock:
+            metrics = dict(self._metrics)
+            metrics["currsize"] = len(self)
+            metrics["maxsize"] = self.maxsize
+            metrics["ttl"] = getattr(self, "ttl", 0)
+        return metrics
+
+    def popitem(self) -> t.Tuple[t.Any, t.Any]:
+        """Remove the next item to evict to make room for a new item."""
+        item = super().popitem()
+        self._metrics["evictions"] += 1
+        return item
+
+    def invalidate(self) -> int:
+        """Remove all items from the cache.
+
+        Returns:
+            number of items removed
+        """
+        with self.lock:
+            count = len(self)
+            evictions = self._metrics["evictions"]
+            self.clear()
+            self._metrics["evictions"] = evictions
+            self._metrics["invalidations"] += count
+        return count
+
+
+class StatsLRUCache(StatsCacheMixin, cachetools.LRUCache):
+    """Least recently used cache with metrics."""
+
+
+class StatsTTLCache(StatsCacheMixin, cachetools.TTLCache):
+    """Least recently used cache with a time to live for each item and metrics."""
+
+    def expire(self, *args, **kwargs) -> t.Any:
+        """Remove expired items from the cache.
+
+        Notes:
+            Requires cachetools 5 or later, where expire returns the expired items.
+        """
+        expired = super().expire(*args, **kwargs)
+        self._metrics["expirations"] += len(expired or [])
+        return expired
+
+
+class CacheManager:
+    """Caches used by the API models of a :obj:`axonius_api_client.connect.Connect` object.
+
+    Examples:
+        Create a ``client`` using :obj:`axonius_api_client.connect.Connect`
+
+        Get the hits, misses, evictions, expirations, and invalidations of every cache used
+
+        >>> client.CACHES.metrics["saved_query.get_cached"]
+        {'hits': 3, 'misses': 1, 'evictions': 0, 'expirations': 0, 'invalidations': 0,
+         'currsize': 1, 'maxsize': 1024, 'ttl': 60}
+
+        Keep field schemas for 10 minutes and stop caching adapters
+
+        >>> client.CACHES.configure(name="fields.get", ttl=600)
+        >>> client.CACHES.configure(name="adapters.*", maxsize=0)
+
+        Remove everything cached for saved queries, or everything cached
+
+        >>> client.CACHES.invalidate("saved_query.*")
+        >>> client.CACHES.invalidate()
+
+    Notes:
+        Each :obj:`axonius_api_client.http.Http` object has its own manager unless one is
+        supplied. Values are keyed on the API model they were fetched with, so Connect
+        objects that share a manager share its policies, metrics, and invalidation, but
+        never each other's cached values. Methods that change objects invalidate the
+        caches that hold those objects.
+
+        maxsize of 0 disables a cache and ttl of 0 keeps items until they are evicted.
+    """
+
+    def __init__(self, policies: t.Optional[t.Dict[str, dict]] = None, enabled: bool = True):
+        """Caches used by the API models of a Connect object.
+
+        Args:
+            policies: maxsize and/or ttl by name or fnmatch pattern of cache names, to
+                override the defaults in :data:`POLICIES`
+            enabled: use the caches, if False every cached method calls the API
+        """
+        self.LOG: logging.Logger = get_obj_log(obj=self)
+        self.enabled: bool = enabled
+        self.policies: t.Dict[str, dict] = {}
+        self.caches: t.Dict[str, StatsCacheMixin] = {}
+        self.lock: threading.RLock = threading.RLock()
+        for name, policy in (policies or {}).items():
+            self.configure(name=name, **policy)
+
+    def get_policy(self, name: str) -> dict:
+        """Get the maxsize and ttl of a cache.
+
+        Args:
+            name: name of cache
+        """
+        policy = dict(POLICIES.get(name) or {"maxsize": 1024, "ttl": 60})
+        for pattern, override in self.policies.items():
+            if fnmatch.fnmatchcase(name, pattern):
+                policy.update(override)
+        return policy
+
+    def configure(self, name: str, **kwargs) -> t.List[str]:
+        """Override the maxsize and/or ttl of caches.
+
+        Args:
+            name: name or fnmatch pattern of cache names
+            **kwargs: maxsize and/or ttl to use
+
+        Returns:
+            names of the caches that were created before and are now removed, they will be
+            created again using the new policy when next used
+        """
+        invalid = [x for x in kwargs if x not in POLICY_KEYS]
+        if invalid:
+            raise ApiError(f"Invalid cache policy keys {invalid}, valid: {POLICY_KEYS}")
+
+        for key, value in kwargs.items():
+            if not isinstance(value, (int, float)) or isinstance(value, bool) or value < 0:
+                raise ApiError(f"Cache policy {key!r} must be a number >= 0, not {value!r}")
+
+        with self.lock:
+            self.policies.setdefault(name, {}).update(kwargs)
+            removed = [x for x in self.caches if fnmatch.fnmatchcase(x, name)]
+            for cache_name in removed:
+                del self.caches[cache_name]
+        self.LOG.debug(f"Configured caches {name!r} with {kwargs}, removed {removed}")
+        return removed
+
+    def get_cache(self, name: str) -> StatsCacheMixin:
+        """Get a cache, creating it if it does not exist.
+
+        Args:
+            name: name of cache
+        """
+        with self.lock:
+            cache = self.caches.get(name)
+            if cache is None:
+                policy = self.get_policy(name=name)
+                if policy["ttl"]:
+                    cache = StatsTTLCache(maxsize=policy["maxsize"], ttl=policy["ttl"])
+                else:
+                    cache = StatsLRUCache(maxsize=policy["maxsize"])
+                self.caches[name] = cache
+        return cache
+
+    def set(self, name: str, key: t.Any, value: t.Any):
+        """Store a value in a cache.
+
+        Args:
+            name: name of cache
+            key: key of value, i.e. ``hashkey(self, **kwargs)`` for the cached method
+            value: value to store
+        """
+        cache = self.get_cache(name=name)
+        with cache.lock:
+            try:
+                cache[key] = value
+            except ValueError:
+                pass
+
+    def pop(self, name: str, key: t.Any) -> bool:
+        """Remove a value from a cache.
+
+        Args:
+            name: name of cache
+            key: key of value, i.e. ``hashkey(self, **kwargs)`` for the cached method
+
+        Returns:
+            True if the value was in the cache
+        """
+        cache = self.get_cache(name=name)
+        with cache.lock:
+            try:
+                del cache[key]
+            except KeyError:
+                return False
+            cache._metrics["invalidations"] += 1
+        return True
+
+    def invalidate(self, *names: str) -> int:
+        """Remove all items from caches.
+
+        Args:
+            *names: names or fnmatch patterns of cache names, all caches if none supplied
+
+        Returns:
+            number of items removed
+        """
+        with self.lock:
+            caches = [
+                v
+                for k, v in self.caches.items()
+                if not names or any(fnmatch.fnmatchcase(k, x) for x in names)
+            ]
+        count = sum(x.invalidate() for x in caches)
+        self.LOG.debug(f"Removed {count} items from caches {list(names) or 'all'}")
+        return count
+
+    @property
+    def metrics(self) -> t.Dict[str, dict]:
+        """Get the metrics of every cache that has been used by name of cache."""
+        with self.lock:
+            caches = dict(self.caches)
+        return {k: caches[k].metrics for k in sorted(caches)}
+
+    def reset_metrics(self):
+        """Reset the metrics of every cache."""
+        with self.lock:
+            caches = list(self.caches.values())
+        for cache in caches:
+            cache.reset_metrics()
+
+    def __repr__(self) -> str:
+        """Pass."""
+        items = [
+            f"enabled={self.enabled}",
+            f"caches={len(self.caches)}",
+            f"policies={self.policies}",
+        ]
+        return f"{self.__class__.__name__}({', '.join(items)})"
+
+    def __str__(self) -> str:
+        """Pass."""
+        return self.__repr__()
+
+
+DEFAULT_MANAGER: CacheManager = CacheManager()
+"""Cache manager used by objects that are not tied to a :obj:`axonius_api_client.http.Http`."""
+
+
+def get_manager(obj: t.Any) -> CacheManager:
+    """Get the cache manager of an object.
+
+    Args:
+        obj: Http object, API model, or object with an ``apiobj`` API model
+
+    Returns:
+        the manager of the Http object used by obj, or :data:`DEFAULT_MANAGER`
+    """
+    http = getattr(getattr(obj, "apiobj", None), "http", None) or getattr(obj, "http", None)
+    for value in [obj, http]:
+        manager = getattr(value, "CACHES", None)
+        if isinstance(manager, CacheManager):
+            return manager
+    return DEFAULT_MANAGER
+
+
+def cached(
+    name: str, maxsize: int = 1024, ttl: t.Union[int, float] = 60, key: t.Callable = hashkey
+) -> t.Callable:
+    """Decorator to cache the return values of a function in a cache of a :obj:`CacheManager`.
+
+    Args:
+        name: name of cache, registered in :data:`POLICIES`
+        maxsize: default max number of items in the cache
+        ttl: default seconds items live in the cache, 0 to keep items until evicted
+        key: function to get the key of a value from the arguments of the function
+
+    Notes:
+        The manager is found from the first argument of the function using
+        :func:`get_manager`, i.e. ``self`` for methods of API models. The default key
+        includes that argument, so each API model object has its own values in the cache.
+    """
+    POLICIES[name] = {"maxsize": maxsize, "ttl": ttl}
+
+    def decorator(func: t.Callable) -> t.Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            obj = args[0] if args else next(iter(kwargs.values()), None)
+            manager = get_manager(obj=obj)
+            if not manager.enabled:
+                return func(*args, **kwargs)
+
+            cache = manager.get_cache(name=name)
+            value_key = key(*args, **kwargs)
+            with cache.lock:
+                try:
+                    value = cache[value_key]
+                except KeyError:
+                    cache._metrics["misses"] += 1
+                else:
+                    cache._metrics["hits"] += 1
+                    return value
+
+            value = func(*args, **kwargs)
+            manager.set(name=name, key=value_key, value=value)
+            return value
+
+        wrapper.cache_name = name
+        return wrapper
+
+    return decorator
@@ -18,19 +18,7 @@ from ..constants.logs import (
 from ..logs import LOG
 from ..setup_env import DEFAULT_ENV_FILE
 from ..tools import json_dump
-from . import (
-    context,
-    grp_account,
-    grp_adapters,
-    grp_assets,
-    grp_certs,
-    grp_enforcements,
-    grp_folders,
-    grp_openapi,
-    grp_spaces,
-    grp_system,
-    grp_tools,
-)
+from . import context
 
 AX_ENV = os.environ.get("AX_ENV", "")
 
@@ -558,7 +546,10 @@ CF = cf_constants.CLIENT_DESC
     "-rb",
     "retry_backoff",
     default=connect.Http.RETRY_BACKOFF,
-    help="Seconds to wait between retry attempts. This value is multiplied by the retry attempt.",
+    help=(
+        "Seconds to wait before the first retry attempt. This value is doubled for every retry "
+        "attempt after that, with random jitter."
+    ),
     type=click.INT,
     show_default=True,
 )
@@ -590,20 +581,21 @@ def cli(click_ctx, ctx, quiet, **kwargs):
     ctx._connect_args.update(kwargs)
 
 
-GROUPS: t.List[click.Group] = [
-    grp_adapters.adapters,
-    grp_assets.devices,
-    grp_assets.users,
-    grp_assets.vulnerabilities,
-    grp_system.system,
-    grp_tools.tools,
-    grp_openapi.openapi,
-    grp_certs.certs,
-    grp_enforcements.enforcements,
-    grp_spaces.spaces,
-    grp_folders.folders,
-    grp_account.account,
-]
+GROUPS: t.Dict[str, str] = {
+    "adapters": f"{__name__}.grp_adapters:adapters",
+    "devices": f"{__name__}.grp_assets:devices",
+    "users": f"{__name__}.grp_assets:users",
+    "vulnerabilities": f"{__name__}.grp_assets:vulnerabilities",
+    "system": f"{__name__}.grp_system:system",
+    "tools": f"{__name__}.grp_tools:tools",
+    "openapi": f"{__name__}.grp_openapi:openapi",
+    "certs": f"{__name__}.grp_certs:certs",
+    "enforcements": f"{__name__}.grp_enforcements:enforcements",
+    "spaces": f"{__name__}.grp_spaces:spaces",
+    "folders": f"{__name__}.grp_folders:folders",
+    "account": f"{__name__}.grp_account:account",
+}
+"""groups of commands that are not imported until they are used."""
 
-for grp in GROUPS:
-    cli.add_command(grp)
+for name, import_path in GROUPS.items():
+    cli.add_lazy_command(name=name, import_path=import_path)
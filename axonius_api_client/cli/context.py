@@ -2,6 +2,7 @@
 """Command line interface for Axonius API Client."""
 import importlib
 import pathlib
+import re
 import typing as t
 import warnings
 
@@ -24,6 +25,8 @@ from ..tools import (
 )
 
 CONTEXT_SETTINGS: dict = {"auto_envvar_prefix": "AX"}
+CMD_NAME_RE: t.Pattern = re.compile(r'@click\.command\(\s*name="([^"]+)"')
+"""regex to find the name of the command defined in a cmd_*.py module without importing it"""
 SSL_WARN_CLS: t.Type[Warning] = urllib3.exceptions.InsecureRequestWarning
 SSL_WARN_MSG: str = """Unverified HTTPS request!
 
@@ -39,10 +42,20 @@ To silence this message:
 
 
 def load_cmds(path: PathLike, package: str, group: click.Group):
-    """Load the commands for a given path."""
+    """Load the commands for a given path.
+
+    Notes:
+        If group is an :obj:`AliasedGroup` and the name of the command can be found in the
+        module, the module is not imported until the command is used.
+    """
     path = pathlib.Path(path)
 
     for item in path.parent.glob("cmd_*.py"):
+        name = CMD_NAME_RE.search(item.read_text(encoding="utf-8"))
+        if name and isinstance(group, AliasedGroup):
+            group.add_lazy_command(name=name.group(1), import_path=f"{package}.{item.stem}:cmd")
+            continue
+
         module = importlib.import_module(f".{item.stem}", package=package)
         module_cmd = getattr(module, "cmd", None)
         if callable(module_cmd):
@@ -159,8 +172,30 @@ class SplitEquals(DictParam):
 class AliasedGroup(click.Group):
     """Pass."""
 
+    def __init__(self, *args, **kwargs):
+        """Pass."""
+        super().__init__(*args, **kwargs)
+        self.lazy_commands: t.Dict[str, str] = {}
+
+    def add_lazy_command(self, name: str, import_path: str):
+        """Add a command that is not imported until it is used.
+
+        Args:
+            name: name of the command
+            import_path: 'package.module:attr' of the command
+        """
+        self.lazy_commands[name] = import_path
+
+    def list_commands(self, ctx) -> t.List[str]:
+        """Pass."""
+        return sorted({*self.commands, *self.lazy_commands})
+
     def get_command(self, ctx, cmd_name):
         """Pass."""
+        if cmd_name in self.lazy_commands and cmd_name not in self.commands:
+            module, attr = self.lazy_commands[cmd_name].split(":", 1)
+            self.add_command(getattr(importlib.import_module(module), attr), name=cmd_name)
+
         rv = click.Group.get_command(self, ctx, cmd_name)
 
         if rv is not None:
@@ -541,6 +541,36 @@ GET_EXPORT = [
         is_flag=True,
         hidden=False,
     ),
+    click.option(
+        "--checkpoint",
+        "checkpoint",
+        default=None,
+        help="File to save the state of the fetch to after each page (csv, json, xml only)",
+        show_envvar=True,
+        show_default=True,
+        metavar="PATH",
+        hidden=False,
+    ),
+    click.option(
+        "--resume-from",
+        "resume_from",
+        default=None,
+        help="Checkpoint file to resume a fetch from, appending to its export file",
+        show_envvar=True,
+        show_default=True,
+        metavar="PATH",
+        hidden=False,
+    ),
+    click.option(
+        "--tag-chunk-size",
+        "tags_chunk_size",
+        help="Add or remove tags for every N assets while fetching (0 = once when done)",
+        default=asset_callbacks.Base.args_map()["tags_chunk_size"],
+        show_envvar=True,
+        show_default=True,
+        type=click.INT,
+        hidden=False,
+    ),
     click.option(
         "--include-details/--no-include-details",
         "-id/-nid",
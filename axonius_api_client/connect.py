@@ -1,15 +1,21 @@
 """Easy all-in-one connection handler."""
+import concurrent.futures
+import functools
 import logging
 import logging.handlers
 import platform
 import re
+import time
 import types
 import typing as t
 
 import requests
+from cachetools.keys import hashkey
 
 from . import api, logs, tools, version
 from .auth import AuthApiKey, AuthCredentials, AuthModel, AuthNull
+from .caching import CacheManager
+from .constants.api import WARMUP_ASSETS, WARMUP_ITEMS, WARMUP_SHARED, WARMUP_WORKERS
 from .constants.ctypes import PathLike
 from .constants.logs import (
     LOG_FILE_MAX_FILES,
@@ -26,7 +32,7 @@ from .constants.logs import (
     LOG_LEVEL_PACKAGE,
 )
 from .exceptions import ConnectError, InvalidCredentials
-from .http import Http, T_Cookies, T_Headers
+from .http import Http, RateLimiter, RetryPolicy, T_Cookies, T_Headers
 from .projects import cert_human
 from .projects.cf_token import constants as cf_constants
 from .setup_env import get_env_ax
@@ -142,7 +148,10 @@ class Connect:
     CREDENTIALS: bool = False
     """Flag to indicate if key & secret are actually username & password."""
 
-    API_CACHE: t.Dict[t.Type[api.ModelMixins], api.ModelMixins] = None
+    CACHES: CacheManager = None
+    """Caches used by the API models, shared with :attr:`HTTP`."""
+
+    API_CACHE: t.Dict[t.Type["api.ModelMixins"], "api.ModelMixins"] = None
     """Cache for API Models."""
 
     API_ATTRS: t.List[str] = [
@@ -188,6 +197,9 @@ class Connect:
     ABOUT_CACHE: t.Optional[dict] = None
     """Cached data from the /about endpoint."""
 
+    WARMUP_ERRORS: t.Optional[t.Dict[str, Exception]] = None
+    """Errors of the fetches that failed in the last :meth:`warmup`, by name of fetch."""
+
     HTTP_MAX: str = """log_request_body = True
 log_response_body = True
 log_level_http = "debug"
@@ -266,6 +278,18 @@ log_body_lines = 10000
         auth_null: t.Optional[AuthModel] = None,
         max_retries: t.Optional[int] = Http.MAX_RETRIES,
         retry_backoff: t.Optional[int] = Http.RETRY_BACKOFF,
+        pool_connections: int = Http.POOL_CONNECTIONS,
+        pool_maxsize: int = Http.POOL_MAXSIZE,
+        pool_block: bool = Http.POOL_BLOCK,
+        tcp_keepalive: bool = Http.TCP_KEEPALIVE,
+        tcp_keepalive_idle: int = Http.TCP_KEEPALIVE_IDLE,
+        tcp_keepalive_interval: int = Http.TCP_KEEPALIVE_INTERVAL,
+        tcp_keepalive_count: int = Http.TCP_KEEPALIVE_COUNT,
+        tls_session_reuse: bool = Http.TLS_SESSION_REUSE,
+        retry_policy: t.Optional[RetryPolicy] = None,
+        rate_limiter: t.Optional[RateLimiter] = None,
+        json_codec: t.Optional[t.Union[str, tools.JsonCodec]] = None,
+        caches: t.Optional[t.Union[CacheManager, t.Dict[str, dict]]] = None,
         **kwargs: t.Dict[str, t.Any],
     ) -> None:
         """Easy all-in-one connection handler.
@@ -335,7 +359,26 @@ log_body_lines = 10000
             auth: auth model to use for this connection
             auth_null: null auth model to use for this connection
             max_retries: number of times to retry a failed connection
-            retry_backoff: number of seconds to wait between retries, will be multiplied against the current retry attempt
+            retry_backoff: number of seconds to wait before the first retry, will be doubled for
+                every retry after that
+            pool_connections: number of connection pools to cache
+            pool_maxsize: max number of connections to keep open in each connection pool
+            pool_block: block when no free connections are available in a connection pool
+            tcp_keepalive: enable TCP keepalive on new connections
+            tcp_keepalive_idle: seconds a connection must be idle before keepalive probes are sent
+            tcp_keepalive_interval: seconds between keepalive probes
+            tcp_keepalive_count: number of failed keepalive probes before a connection is dropped
+            tls_session_reuse: resume TLS sessions for new connections in the same pool
+            retry_policy: policy to decide if and when to retry requests, if not supplied
+                one will be created using max_retries and retry_backoff, if supplied
+                max_retries and retry_backoff are ignored and taken from the policy
+            rate_limiter: rate limiter to throttle every request through, share one
+                across Connect objects to throttle them as a group
+            json_codec: JSON codec object or name of JSON codec to use, if not supplied
+                will be taken from the OS env var AX_JSON_CODEC
+            caches: cache manager to use, share one across Connect objects to share cache
+                policies, metrics, and invalidation (not cached values), or dict of maxsize
+                and/or ttl by cache name to create one with
             **kwargs: unused
         """
         self._url: str = url
@@ -414,6 +457,18 @@ log_body_lines = 10000
             "cf_echo_verbose": cf_echo_verbose,
             "max_retries": max_retries,
             "retry_backoff": retry_backoff,
+            "pool_connections": pool_connections,
+            "pool_maxsize": pool_maxsize,
+            "pool_block": pool_block,
+            "tcp_keepalive": tcp_keepalive,
+            "tcp_keepalive_idle": tcp_keepalive_idle,
+            "tcp_keepalive_interval": tcp_keepalive_interval,
+            "tcp_keepalive_count": tcp_keepalive_count,
+            "tls_session_reuse": tls_session_reuse,
+            "retry_policy": retry_policy,
+            "rate_limiter": rate_limiter,
+            "json_codec": json_codec,
+            "caches": caches,
         }
 
         self.set_wraperror(wraperror)
@@ -424,6 +479,7 @@ log_body_lines = 10000
         self.control_log_file(enable=log_file, rotate=log_file_rotate)
         self.control_log_console(enable=log_console)
         self.HTTP = self.http = self._init_http(http=http)
+        self.CACHES: CacheManager = self.HTTP.CACHES
         self.AUTH = self.auth = self._init_auth(auth=auth, log_level=log_level_auth)
         self.AUTH_NULL: AuthModel = self._init_auth_null(
             auth_null=auth_null,
@@ -462,109 +518,205 @@ log_body_lines = 10000
             self.STARTED = True
             self.LOG.info(str(self))
 
+    def warmup(
+        self,
+        assets: t.Optional[t.List[str]] = None,
+        what: t.Optional[t.List[str]] = None,
+        workers: int = WARMUP_WORKERS,
+    ) -> t.Dict[str, float]:
+        """Fetch metadata at the same time and store it in the caches used by the API models.
+
+        Examples:
+            Fetch everything that the first query of a script would otherwise fetch one by one
+
+            >>> client.warmup()
+            {'devices.fields': 0.412, 'users.fields': 0.398, 'adapters': 0.201, ...}
+
+            Fetch only the fields and saved queries of devices
+
+            >>> client.warmup(assets=["devices"], what=["fields", "saved_queries"])
+
+        Args:
+            assets: asset types to fetch metadata for, defaults to :data:`WARMUP_ASSETS`
+            what: metadata to fetch, defaults to all of :data:`WARMUP_ITEMS`
+            workers: number of requests to send at the same time
+
+        Returns:
+            seconds each successful fetch took, by name of fetch
+
+        Notes:
+            adapters, history_dates, and instances are the same for all asset types, so they
+            are fetched once and stored in the caches of every asset type.
+
+            A fetch that fails is logged as a warning and its error is stored by name of fetch
+            in :attr:`WARMUP_ERRORS`; the fetches that succeeded are still cached.
+
+            The metadata is stored in the caches after all fetches have finished, from this
+            thread, so the caches are never written to by more than one thread at a time.
+        """
+        assets: t.List[str] = tools.listify(assets) or WARMUP_ASSETS
+        what: t.List[str] = tools.listify(what) or WARMUP_ITEMS
+        workers: int = tools.coerce_int(obj=workers, min_value=1, errmsg="Invalid workers")
+
+        asset_types = [x.ASSET_TYPE for x in [api.Devices, api.Users, api.Vulnerabilities]]
+        invalid = [x for x in assets if x not in asset_types]
+        if invalid:
+            raise ConnectError(f"Invalid asset types {invalid}, valid: {asset_types}")
+
+        invalid = [x for x in what if x not in WARMUP_ITEMS]
+        if invalid:
+            raise ConnectError(f"Invalid metadata {invalid}, valid: {WARMUP_ITEMS}")
+
+        self.start()
+        apiobjs: t.List["api.AssetMixin"] = [getattr(self, x) for x in assets]
+        tasks: t.Dict[str, t.Callable] = {}
+        for item in what:
+            if item == "feature_flags":
+                tasks[item] = self.instances._feature_flags
+            elif item in WARMUP_SHARED:
+                tasks[item] = functools.partial(apiobjs[0].fetch_metadata, what=item)
+            else:
+                for apiobj in apiobjs:
+                    name = f"{apiobj.ASSET_TYPE}.{item}"
+                    tasks[name] = functools.partial(apiobj.fetch_metadata, what=item)
+
+        def timed(task: t.Callable) -> t.Tuple[t.Any, float]:
+            start: float = time.monotonic()
+            return task(), time.monotonic() - start
+
+        self.LOG.info(f"Fetching {list(tasks)} using {workers} workers")
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="warmup"
+        ) as executor:
+            futures = {k: executor.submit(timed, v) for k, v in tasks.items()}
+
+        values: t.Dict[str, t.Tuple[t.Any, float]] = {}
+        self.WARMUP_ERRORS: t.Dict[str, Exception] = {}
+        for name, future in futures.items():
+            try:
+                values[name] = future.result()
+            except Exception as exc:
+                self.WARMUP_ERRORS[name] = exc
+                self.LOG.warning(f"Failed to fetch {name!r} during warmup: {exc}")
+
+        ret: t.Dict[str, float] = {}
+        for name, (value, seconds) in values.items():
+            ret[name] = round(seconds, 3)
+            if name == "feature_flags":
+                key = hashkey(self.instances)
+                self.CACHES.set(name="instances.feature_flags", key=key, value=value)
+            elif name in WARMUP_SHARED:
+                for apiobj in apiobjs:
+                    apiobj.cache_metadata(what=name, value=value)
+            else:
+                asset_type, item = name.split(".", 1)
+                getattr(self, asset_type).cache_metadata(what=item, value=value)
+        self.LOG.info(f"Fetched metadata in seconds: {ret}")
+        return ret
+
     # --> MODELS
     @property
-    def activity_logs(self) -> api.ActivityLogs:
+    def activity_logs(self) -> "api.ActivityLogs":
         """Work with activity logs."""
         return self._get_model(model=api.ActivityLogs)
 
     @property
-    def adapters(self) -> api.Adapters:
+    def adapters(self) -> "api.Adapters":
         """Work with adapters and adapter connections."""
         return self._get_model(model=api.Adapters)
 
     @property
-    def dashboard(self) -> api.Dashboard:
+    def dashboard(self) -> "api.Dashboard":
         """Work with discovery cycles."""
         return self._get_model(model=api.Dashboard)
 
     @property
-    def dashboard_spaces(self) -> api.DashboardSpaces:
+    def dashboard_spaces(self) -> "api.DashboardSpaces":
         """Work with dashboard spaces."""
         return self._get_model(model=api.DashboardSpaces)
 
     @property
-    def data_scopes(self) -> api.DataScopes:
+    def data_scopes(self) -> "api.DataScopes":
         """Work with data scopes."""
         return self._get_model(model=api.DataScopes)
 
     @property
-    def devices(self) -> api.Devices:
+    def devices(self) -> "api.Devices":
         """Work with device assets."""
         return self._get_model(model=api.Devices)
 
     @property
-    def enforcements(self) -> api.Enforcements:
+    def enforcements(self) -> "api.Enforcements":
         """Work with Enforcement Center."""
         return self._get_model(model=api.Enforcements)
 
     @property
-    def folders(self) -> api.Folders:
+    def folders(self) -> "api.Folders":
         """Work with folders for enforcements and queries."""
         return self._get_model(model=api.Folders)
 
     @property
-    def instances(self) -> api.Instances:
+    def instances(self) -> "api.Instances":
         """Work with instances."""
         return self._get_model(model=api.Instances)
 
     @property
-    def openapi(self) -> api.OpenAPISpec:
+    def openapi(self) -> "api.OpenAPISpec":
         """Work with the OpenAPI specification file."""
         return self._get_model(model=api.OpenAPISpec)
 
     @property
-    def meta(self) -> api.Meta:
+    def meta(self) -> "api.Meta":
         """Work with instance metadata."""
         return self._get_model(model=api.Meta)
 
     @property
-    def remote_support(self) -> api.RemoteSupport:
+    def remote_support(self) -> "api.RemoteSupport":
         """Work with configuring remote support."""
         return self._get_model(model=api.RemoteSupport)
 
     @property
-    def settings_global(self) -> api.SettingsGlobal:
+    def settings_global(self) -> "api.SettingsGlobal":
         """Work with core system settings."""
         return self._get_model(model=api.SettingsGlobal)
 
     @property
-    def settings_gui(self) -> api.SettingsGui:
+    def settings_gui(self) -> "api.SettingsGui":
         """Work with gui system settings."""
         return self._get_model(model=api.SettingsGui)
 
     @property
-    def settings_ip(self) -> api.SettingsIdentityProviders:
+    def settings_ip(self) -> "api.SettingsIdentityProviders":
         """Work with identity providers settings."""
         return self._get_model(model=api.SettingsIdentityProviders)
 
     @property
-    def settings_lifecycle(self) -> api.SettingsLifecycle:
+    def settings_lifecycle(self) -> "api.SettingsLifecycle":
         """Work with lifecycle system settings."""
         return self._get_model(model=api.SettingsLifecycle)
 
     @property
-    def signup(self) -> api.Signup:
+    def signup(self) -> "api.Signup":
         """Perform initial signup, password reset, and other unauthenticated endpoints."""
         return self._get_model(model=api.Signup, start=False, auth=self.AUTH_NULL)
 
     @property
-    def system_users(self) -> api.SystemUsers:
+    def system_users(self) -> "api.SystemUsers":
         """Work with system users."""
         return self._get_model(model=api.SystemUsers)
 
     @property
-    def system_roles(self) -> api.SystemRoles:
+    def system_roles(self) -> "api.SystemRoles":
         """Work with system roles."""
         return self._get_model(model=api.SystemRoles)
 
     @property
-    def users(self) -> api.Users:
+    def users(self) -> "api.Users":
         """Work with user assets."""
         return self._get_model(model=api.Users)
 
     @property
-    def vulnerabilities(self) -> api.Vulnerabilities:
+    def vulnerabilities(self) -> "api.Vulnerabilities":
         """Work with vulnerability assets."""
         return self._get_model(model=api.Vulnerabilities)
 
@@ -690,7 +842,7 @@ log_body_lines = 10000
         return self.AUTH.get_api_keys()
 
     @property
-    def current_user(self) -> t.Optional[api.json_api.account.CurrentUser]:
+    def current_user(self) -> t.Optional["api.json_api.account.CurrentUser"]:
         """Get the current user (returns 404 for service accounts)."""
         try:
             return self.AUTH.get_current_user()
@@ -861,7 +1013,7 @@ log_body_lines = 10000
 
     def _get_model(
         self,
-        model: t.Type[api.ModelMixins],
+        model: t.Type["api.ModelMixins"],
         start: bool = True,
         auth: t.Optional[AuthModel] = None,
     ) -> t.Any:
@@ -0,0 +1,634 @@
+"""Send requests with a non-blocking HTTP transport so asyncio code can await the REST API."""
+import asyncio
+import logging
+import ssl
+import time
+import typing as t
+
+import requests
+
+from .api.api_endpoint import ApiEndpoint
+from .api.api_endpoints import ApiEndpoints
+from .api.assets import AssetMixin
+from .api.json_api import saved_queries as sq_models
+from .api.json_api.adapters import AdaptersList
+from .api.json_api.assets import AssetRequest, AssetsPage, Count, CountRequest
+from .connect import Connect
+from .constants.api import MAX_PAGE_SIZE, PAGE_SIZE
+from .exceptions import ApiError
+from .http import Http
+from .logs import get_obj_log
+from .parsers.fields import parse_fields
+from .tools import coerce_int, get_profiler, join_url, parse_int_min_max, profile_stage
+
+
+def get_httpx() -> t.Any:
+    """Import httpx, the optional package used to send requests without blocking.
+
+    Raises:
+        :exc:`ApiError`: if httpx is not installed
+    """
+    try:
+        import httpx
+    except ImportError as exc:  # pragma: no cover
+        raise ApiError(
+            "AsyncConnect requires the 'httpx' package, install it with: "
+            "pip install axonius_api_client[async]"
+        ) from exc
+    return httpx
+
+
+class AsyncHttp:
+    """Send requests built by an :obj:`Http` object using an :obj:`httpx.AsyncClient`.
+
+    Notes:
+        Requests are built by the :attr:`Http.session` of :attr:`http`, so the URL, auth
+        headers, cookies, and body are exactly what :meth:`Http.__call__` would send, and
+        responses are converted to :obj:`requests.Response` so that
+        :meth:`ApiEndpoint.handle_response` loads and checks them the same way. Retries use
+        :attr:`Http.RETRY_POLICY`, sleeping with :func:`asyncio.sleep`.
+
+        :attr:`Http.RATE_LIMITER` blocks while waiting for a token, so it is not used. The
+        number of requests in flight is limited by max_connections instead.
+    """
+
+    MAX_CONNECTIONS: int = 32
+    """Default number of requests that can be in flight at the same time."""
+
+    EXCEPTIONS: t.Dict[str, t.Type[requests.RequestException]] = {
+        "ConnectTimeout": requests.exceptions.ConnectTimeout,
+        "ConnectError": requests.exceptions.ConnectionError,
+        "ProxyError": requests.exceptions.ProxyError,
+        "ReadTimeout": requests.exceptions.ReadTimeout,
+        "TimeoutException": requests.exceptions.Timeout,
+        "RemoteProtocolError": requests.exceptions.ChunkedEncodingError,
+        "TransportError": requests.exceptions.RequestException,
+    }
+    """requests exceptions to raise for httpx exceptions, checked by httpx class name."""
+
+    def __init__(self, http: Http, max_connections: t.Optional[int] = None):
+        """Send requests built by an :obj:`Http` object using an :obj:`httpx.AsyncClient`.
+
+        Args:
+            http: HTTP object to build requests and load responses with
+            max_connections: number of requests that can be in flight at the same time
+        """
+        httpx = get_httpx()
+        self.http: Http = http
+        self.max_connections: int = coerce_int(
+            obj=max_connections or self.MAX_CONNECTIONS,
+            min_value=1,
+            errmsg="Invalid max_connections",
+        )
+        proxies: dict = http.session.proxies or {}
+        self.client: t.Any = httpx.AsyncClient(
+            verify=self.get_ssl_context(),
+            proxy=proxies.get("https") or proxies.get("http") or None,
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+            ),
+        )
+        self.LOG: logging.Logger = get_obj_log(obj=self, level=http.LOG.level)
+
+    def get_ssl_context(self) -> t.Union[ssl.SSLContext, bool]:
+        """Get the SSL context to verify certificates and offer a client cert with.
+
+        Notes:
+            Built from the verify and cert settings of :attr:`Http.session`.
+        """
+        verify = self.http.session.verify
+        cert = self.http.session.cert
+        if verify is False and not cert:
+            return False
+
+        context = ssl.create_default_context(cafile=verify if isinstance(verify, str) else None)
+        if verify is False:
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+        if isinstance(cert, tuple):
+            context.load_cert_chain(*cert)
+        elif cert:
+            context.load_cert_chain(cert)
+        return context
+
+    async def __call__(
+        self,
+        path: t.Optional[str] = None,
+        route: t.Optional[str] = None,
+        method: str = "get",
+        data: t.Optional[str] = None,
+        params: t.Optional[dict] = None,
+        headers: t.Optional[dict] = None,
+        cookies: t.Optional[dict] = None,
+        json: t.Optional[dict] = None,
+        files: tuple = None,
+        idempotent: t.Optional[bool] = None,
+        **kwargs,
+    ) -> requests.Response:
+        """Create, prepare, and then send a request without blocking the event loop.
+
+        Args:
+            path: path to append to :attr:`Http.url`
+            route: route to append to :attr:`Http.url`
+            method: HTTP method to use
+            data: body to send
+            params: parameters to url encode
+            headers: headers to send
+            cookies: cookies to send
+            json: obj to encode as json
+            files: files to send
+            idempotent: request is safe to retry after it may have been processed, if None
+                :attr:`Http.RETRY_POLICY` will decide based on method
+            **kwargs: overrides for object attributes
+
+                * connect_timeout: seconds to wait for connection to open for this request
+                * response_timeout: seconds to wait for response for this request
+
+        Returns:
+            :obj:`requests.Response`
+        """
+        http: Http = self.http
+        this_headers = {}
+        this_headers.update(headers or {})
+        this_headers.setdefault("User-Agent", http.user_agent)
+
+        request = requests.Request(
+            url=join_url(http.url, path, route),
+            method=method,
+            data=data,
+            headers=this_headers,
+            cookies=cookies or {},
+            params=params,
+            json=json,
+            files=files or [],
+        )
+        prepped_request = http.session.prepare_request(request=request)
+        if "Content-Type" not in prepped_request.headers:
+            prepped_request.headers["Content-Type"] = "application/vnd.api+json"
+
+        if http.SAVE_LAST:
+            http.LAST_REQUEST = prepped_request
+
+        timeout = self.get_timeout(
+            connect=kwargs.get("connect_timeout", http.CONNECT_TIMEOUT),
+            response=kwargs.get("response_timeout", http.RESPONSE_TIMEOUT),
+        )
+
+        policy = http.RETRY_POLICY
+        idempotent = policy.is_idempotent(method=method, idempotent=idempotent)
+        started = policy.start()
+
+        response = None
+        attempt = 0
+        while True:
+            attempt += 1
+            self.LOG.debug(f"Attempt {attempt} of {policy.max_retries}.")
+            try:
+                response = await self.send(request=prepped_request, timeout=timeout)
+            except Exception as exc:
+                self.LOG.error(f"Connect Error: {exc}")
+                backoff, msg = policy.get_retry(
+                    attempt=attempt, started=started, idempotent=idempotent, exc=exc
+                )
+                if backoff is None:
+                    self.LOG.error(msg)
+                    raise exc
+            else:
+                backoff, msg = policy.get_retry(
+                    attempt=attempt, started=started, idempotent=idempotent, response=response
+                )
+                if backoff is None:
+                    break
+                self.LOG.warning(f"Response Error: {response}")
+
+            self.LOG.warning(msg)
+            await asyncio.sleep(backoff)
+
+        if http.SAVE_LAST:
+            http.LAST_RESPONSE = response
+
+        if http.SAVE_HISTORY:
+            http.HISTORY.append(response)
+
+        http._do_log_response(response=response)
+        return response
+
+    def get_timeout(
+        self,
+        connect: t.Optional[t.Union[int, float]] = None,
+        response: t.Optional[t.Union[int, float]] = None,
+    ) -> t.Any:
+        """Get the timeouts of a request.
+
+        Args:
+            connect: seconds to wait for connection to open
+            response: seconds to wait for response
+        """
+        return get_httpx().Timeout(connect=connect, read=response, write=response, pool=None)
+
+    async def send(self, request: requests.PreparedRequest, timeout: t.Any) -> requests.Response:
+        """Send a prepared request using :attr:`client`.
+
+        Args:
+            request: prepared request to send
+            timeout: timeouts from :meth:`get_timeout`
+
+        Raises:
+            :exc:`requests.RequestException`: the requests version of errors raised by httpx,
+                so retries and callers handle them the same as for :obj:`Http`
+        """
+        httpx = get_httpx()
+        started = time.monotonic()
+        try:
+            with profile_stage(profiler=get_profiler(), name="http.send"):
+                response = await self.client.request(
+                    method=request.method,
+                    url=request.url,
+                    headers=dict(request.headers),
+                    content=request.body,
+                    timeout=timeout,
+                )
+        except httpx.TransportError as exc:
+            raise self.get_exception(exc=exc, request=request) from exc
+
+        self.LOG.debug(f"Received {response} in {time.monotonic() - started:.2f} seconds")
+        return self.get_response(response=response, request=request)
+
+    def get_exception(
+        self, exc: Exception, request: requests.PreparedRequest
+    ) -> requests.RequestException:
+        """Get the requests exception to raise for an httpx exception.
+
+        Args:
+            exc: exception raised by httpx
+            request: prepared request that was being sent
+        """
+        for cls in type(exc).__mro__:
+            if cls.__name__ in self.EXCEPTIONS:
+                return self.EXCEPTIONS[cls.__name__](str(exc), request=request)
+        return requests.exceptions.RequestException(str(exc), request=request)
+
+    @staticmethod
+    def get_response(response: t.Any, request: requests.PreparedRequest) -> requests.Response:
+        """Convert an :obj:`httpx.Response` to a :obj:`requests.Response`.
+
+        Args:
+            response: response received by httpx
+            request: prepared request that was sent
+        """
+        ret = requests.Response()
+        ret.status_code = response.status_code
+        ret.reason = response.reason_phrase
+        ret.headers = requests.structures.CaseInsensitiveDict(response.headers)
+        ret.encoding = response.encoding
+        ret.url = str(response.url)
+        ret.elapsed = response.elapsed
+        ret.request = request
+        ret._content = response.content
+        requests.cookies.cookiejar_from_dict(dict(response.cookies), cookiejar=ret.cookies)
+        return ret
+
+    async def close(self):
+        """Close the connections of :attr:`client`."""
+        await self.client.aclose()
+
+    def __str__(self) -> str:
+        """Pass."""
+        return (
+            f"{self.__class__.__name__}(http={self.http}, max_connections={self.max_connections})"
+        )
+
+    def __repr__(self) -> str:
+        """Pass."""
+        return self.__str__()
+
+
+class AsyncConnect:
+    """Await the REST API from asyncio code without a thread per request.
+
+    Examples:
+        >>> import asyncio
+        >>> import axonius_api_client as axonapi
+        >>>
+        >>> async def main():
+        ...     client_args: dict = axonapi.get_env_connect()
+        ...     async with axonapi.AsyncConnect(**client_args) as client:
+        ...         devices, users = await asyncio.gather(
+        ...             client.count(asset_type="devices"),
+        ...             client.count(asset_type="users"),
+        ...         )
+        ...         async for row in client.get_assets(asset_type="devices", max_rows=10):
+        ...             print(row["internal_axon_id"])
+        >>>
+        >>> asyncio.run(main())
+
+        Any endpoint in :obj:`ApiEndpoints` can be awaited using :meth:`perform_request`
+
+        >>> about = await client.perform_request(ApiEndpoints.system_settings.meta_about)
+
+    Notes:
+        Requires the optional ``httpx`` package. Requests are sent by :obj:`AsyncHttp`,
+        which shares the settings, auth, retry policy, and logging of the :obj:`Http` of
+        :attr:`connect`. Requests are built and responses are loaded using the same
+        :obj:`ApiEndpoint` definitions and models as :obj:`Connect`.
+
+        :meth:`start` logs in using the blocking :meth:`Connect.start` once, in the default
+        executor of the event loop.
+    """
+
+    def __init__(
+        self,
+        connect: t.Optional[Connect] = None,
+        max_connections: t.Optional[int] = None,
+        **kwargs,
+    ):
+        """Await the REST API from asyncio code without a thread per request.
+
+        Args:
+            connect: client to use, will be created using kwargs if not supplied
+            max_connections: number of requests that can be in flight at the same time
+            **kwargs: passed to :obj:`Connect` if connect is not supplied
+        """
+        self.connect: Connect = connect if isinstance(connect, Connect) else Connect(**kwargs)
+        """Client that owns the HTTP and auth objects."""
+
+        self.http: AsyncHttp = AsyncHttp(http=self.connect.http, max_connections=max_connections)
+        """Non-blocking transport used to send requests."""
+
+        self.FIELDS: t.Dict[str, dict] = {}
+        """Parsed field schemas by asset type, fetched by :meth:`get_fields`."""
+
+        self.LOG: logging.Logger = get_obj_log(obj=self, level=self.connect.LOG.level)
+
+    async def start(self):
+        """Connect to and authenticate with Axonius."""
+        if not self.connect.STARTED:
+            loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self.connect.start)
+
+    async def close(self):
+        """Close the connections used by :attr:`http`."""
+        await self.http.close()
+
+    async def __aenter__(self) -> "AsyncConnect":
+        """Pass."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, exc_tb):
+        """Pass."""
+        await self.close()
+
+    async def perform_request(
+        self, api_endpoint: ApiEndpoint, request_obj: t.Any = None, raw: bool = False, **kwargs
+    ) -> t.Any:
+        """Perform a request to an API endpoint.
+
+        Args:
+            api_endpoint: endpoint to send request to
+            request_obj: request object to send
+            raw: return the :obj:`requests.Response` instead of loading it
+            **kwargs: passed to :meth:`ApiEndpoint.get_http_args` and
+                :meth:`ApiEndpoint.handle_response`
+        """
+        response: requests.Response = await self.http(
+            **api_endpoint.get_http_args(request_obj=request_obj, **kwargs)
+        )
+        kwargs["response"] = response
+        if raw:
+            return response
+        return api_endpoint.handle_response(http=self.connect.http, **kwargs)
+
+    def get_apiobj(self, asset_type: str) -> AssetMixin:
+        """Get the API model for an asset type.
+
+        Args:
+            asset_type: asset type to get API model for
+        """
+        asset_types: t.List[str] = AssetMixin.asset_types()
+        if asset_type not in asset_types:
+            raise ApiError(f"Invalid asset_type {asset_type!r}, valid: {asset_types}")
+        return getattr(self.connect, asset_type)
+
+    async def get_fields(self, asset_type: str = "devices", refresh: bool = False) -> dict:
+        """Get the schema of all adapters and their fields for an asset type.
+
+        Notes:
+            The parsed schemas are kept in :attr:`FIELDS` and stored in the in memory cache
+            of :meth:`axonius_api_client.api.assets.fields.Fields.get` every time this is
+            called, so that validating fields never fetches them with the blocking client.
+
+        Args:
+            asset_type: asset type to get fields for
+            refresh: fetch the schemas even if they were fetched before
+        """
+        apiobj: AssetMixin = self.get_apiobj(asset_type=asset_type)
+        if refresh or asset_type not in self.FIELDS:
+            response = await self.perform_request(
+                api_endpoint=ApiEndpoints.assets.fields, asset_type=asset_type
+            )
+            self.FIELDS[asset_type] = parse_fields(raw=response.document_meta)
+        apiobj.fields.set_cache(data=self.FIELDS[asset_type])
+        return self.FIELDS[asset_type]
+
+    async def count(
+        self,
+        asset_type: str = "devices",
+        query: t.Optional[str] = None,
+        history_date_parsed: t.Optional[str] = None,
+        request_obj: t.Optional[CountRequest] = None,
+        http_args: t.Optional[dict] = None,
+        sleep: t.Optional[t.Union[int, float]] = 0.5,
+        **kwargs,
+    ) -> int:
+        """Get the count of assets from a query.
+
+        Args:
+            asset_type: asset type to get count for
+            query: only return the count of assets that match the query
+            history_date_parsed: previously parsed history date
+            request_obj: request object to use instead of building one
+            http_args: args to pass to http request
+            sleep: time to sleep between requests
+            **kwargs: passed to :meth:`AssetMixin.build_count_request`
+        """
+        request_obj: CountRequest = AssetMixin.build_count_request(
+            request_obj=request_obj, filter=query, history=history_date_parsed, **kwargs
+        )
+        count: t.Optional[int] = None
+        while not isinstance(count, int):
+            response: Count = await self.perform_request(
+                api_endpoint=ApiEndpoints.assets.count,
+                request_obj=request_obj,
+                asset_type=asset_type,
+                http_args=http_args,
+            )
+            count: t.Optional[int] = response.value
+            if isinstance(count, int):
+                break
+            request_obj.use_cache_entry = True
+            if isinstance(sleep, (int, float)):
+                await asyncio.sleep(sleep)
+        return count
+
+    async def get_pages(
+        self,
+        asset_type: str = "devices",
+        query: t.Optional[str] = None,
+        fields: t.Optional[t.Union[t.List[str], str]] = None,
+        fields_default: bool = True,
+        fields_parsed: t.Optional[t.List[str]] = None,
+        max_rows: t.Optional[int] = None,
+        max_pages: t.Optional[int] = None,
+        row_start: int = 0,
+        page_size: int = MAX_PAGE_SIZE,
+        use_cursor: bool = True,
+        request_obj: t.Optional[AssetRequest] = None,
+        http_args: t.Optional[dict] = None,
+        **kwargs,
+    ) -> t.AsyncGenerator[AssetsPage, None]:
+        """Get pages of assets from a query.
+
+        Args:
+            asset_type: asset type to get assets for
+            query: if supplied, only get the assets that match the query
+            fields: fields to return for each asset (will be validated)
+            fields_default: include the default fields
+            fields_parsed: previously parsed fields
+            max_rows: only return N rows
+            max_pages: only return N pages
+            row_start: start at row N
+            page_size: fetch N rows per page
+            use_cursor: use cursor based pagination
+            request_obj: request object to use for this query
+            http_args: args to pass to http request
+            **kwargs: passed to :meth:`AssetMixin.build_get_request`
+        """
+        apiobj: AssetMixin = self.get_apiobj(asset_type=asset_type)
+        if not isinstance(fields_parsed, (list, tuple)):
+            await self.get_fields(asset_type=asset_type)
+            fields_parsed = apiobj.fields.validate(fields=fields, fields_default=fields_default)
+
+        max_rows: int = parse_int_min_max(value=max_rows, default=0, min_value=0)
+        max_pages: int = parse_int_min_max(value=max_pages, default=0, min_value=0)
+        page_size: int = parse_int_min_max(
+            value=page_size, default=PAGE_SIZE, min_value=1, max_value=MAX_PAGE_SIZE
+        )
+        page_size = max_rows if max_rows and max_rows < page_size else page_size
+
+        request_obj: AssetRequest = AssetMixin.build_get_request(
+            request_obj=request_obj, filter=query, use_cursor=use_cursor, **kwargs
+        )
+        request_obj.get_metadata = True
+        request_obj.use_cursor = use_cursor
+        request_obj.fields = {asset_type: fields_parsed}
+
+        offset: int = parse_int_min_max(value=row_start, default=0, min_value=0)
+        rows: int = 0
+        pages: int = 0
+        while True:
+            request_obj.set_offset(offset)
+            request_obj.set_limit(page_size)
+            page: AssetsPage = await self.perform_request(
+                api_endpoint=ApiEndpoints.assets.get,
+                request_obj=request_obj,
+                asset_type=asset_type,
+                http_args=http_args,
+            )
+            if request_obj.use_cursor:
+                request_obj.cursor_id = page.cursor
+            self.LOG.debug(f"FETCHED PAGE: {page}")
+            if not page.assets:
+                break
+
+            yield page
+
+            offset += page.asset_count_page
+            rows += page.asset_count_page
+            pages += 1
+            if (max_rows and rows >= max_rows) or (max_pages and pages >= max_pages):
+                break
+
+    async def get_assets(
+        self, max_rows: t.Optional[int] = None, **kwargs
+    ) -> t.AsyncGenerator[dict, None]:
+        """Get assets from a query.
+
+        Args:
+            max_rows: only return N rows
+            **kwargs: passed to :meth:`get_pages`
+        """
+        max_rows: int = parse_int_min_max(value=max_rows, default=0, min_value=0)
+        rows: int = 0
+        async for page in self.get_pages(max_rows=max_rows, **kwargs):
+            for row in page.assets:
+                yield row
+                rows += 1
+                if max_rows and rows >= max_rows:
+                    return
+
+    async def get_saved_queries(
+        self,
+        asset_type: str = "devices",
+        query: t.Optional[str] = None,
+        page_size: int = PAGE_SIZE,
+        as_dataclass: bool = True,
+        request_obj: t.Optional[sq_models.SavedQueryGet] = None,
+        **kwargs,
+    ) -> t.AsyncGenerator[t.Union[dict, sq_models.SavedQuery], None]:
+        """Get saved queries.
+
+        Args:
+            asset_type: asset type to get saved queries for
+            query: query to filter saved queries
+            page_size: fetch N saved queries per page
+            as_dataclass: yield saved query dataclass instead of dict
+            request_obj: request object to use
+            **kwargs: passed to :obj:`SavedQueryGet` if request_obj not supplied
+        """
+        apiobj: AssetMixin = self.get_apiobj(asset_type=asset_type)
+        if not isinstance(request_obj, sq_models.SavedQueryGet):
+            query: t.Optional[str] = apiobj.saved_query.build_filter_query(query=query)
+            request_obj = sq_models.SavedQueryGet(filter=query, **kwargs)
+
+        offset: int = 0
+        while True:
+            request_obj.page.offset = offset
+            request_obj.page.limit = page_size
+            rows: t.List[sq_models.SavedQuery] = await self.perform_request(
+                api_endpoint=ApiEndpoints.saved_queries.get, request_obj=request_obj
+            )
+            for row in rows:
+                yield row if as_dataclass else row.to_dict()
+
+            offset += len(rows)
+            if len(rows) < page_size:
+                break
+
+    async def get_adapters(self, get_clients: bool = False) -> t.List[dict]:
+        """Get all adapters on all nodes.
+
+        Args:
+            get_clients: Include the connections and schemas in the response
+        """
+        api_endpoint: ApiEndpoint = ApiEndpoints.adapters.get
+        request_obj = api_endpoint.load_request(get_clients=get_clients)
+        adapters = await self.perform_request(api_endpoint=api_endpoint, request_obj=request_obj)
+        return [
+            adapter_node.to_dict_old()
+            for adapter in adapters
+            for adapter_node in adapter.adapter_nodes
+        ]
+
+    async def get_adapters_basic(self) -> AdaptersList:
+        """Get the basic metadata for all adapters."""
+        return await self.perform_request(api_endpoint=ApiEndpoints.adapters.get_basic)
+
+    def __str__(self) -> str:
+        """Pass."""
+        return f"{self.__class__.__name__}(connect={self.connect.url!r}, http={self.http})"
+
+    def __repr__(self) -> str:
+        """Pass."""
+        return self.__str__()
@@ -26,6 +26,41 @@ TABLE_FORMAT: str = "fancy_grid"
 TABLE_MAX_ROWS: int = 5
 """Default row limit for tablize export"""
 
+EXPORT_COMPRESS_BUFFER: int = 1024 * 1024
+"""Bytes to buffer before handing data to the compressor for compressed exports"""
+
+ARROW_BATCH_ROWS: int = 10000
+"""Default rows per record batch (row group) for parquet and arrow exports"""
+
+TABLE_WINDOW: int = 0
+"""Default rows per window for tablize export, 0 renders one table when done"""
+
+XLSX_MAX_ROWS: int = 1048576
+"""Max rows per worksheet allowed by Excel, including the header row"""
+
+XLSX_TYPE_FORMATS: dict = {
+    "integer": {"num_format": "0"},
+    "number": {"num_format": "0.00"},
+    "bool": {"align": "center"},
+}
+"""Default formats by field type for xlsx export when xlsx_column_formats is True"""
+
+SQLITE_PARTITION: str = "history_date"
+"""Column of every table in sqlite export with the history date (or current date) of a fetch"""
+
+SQLITE_INT_MAX: int = 2**63 - 1
+"""Largest integer SQLite can store, larger integers are written as str by sqlite export"""
+
+SQLITE_INT_MIN: int = -(2**63)
+"""Smallest integer SQLite can store, smaller integers are written as str by sqlite export"""
+
+TAGS_CHUNK_SIZE: int = 0
+"""Default asset IDs to send per API call when adding or removing tags while fetching assets,
+0 sends every asset ID in one API call when the fetch is done"""
+
+TAGS_QUEUE_SIZE: int = 4
+"""Max chunks of asset IDs to queue for the background tagging worker before blocking"""
+
 MAX_PAGE_SIZE: int = 2000
 """maximum page size that REST API allows"""
 
@@ -44,6 +79,30 @@ TIMEOUT_CONNECT: int = 5
 TIMEOUT_RESPONSE: int = 900
 """seconds to wait for response from API."""
 
+POOL_CONNECTIONS: int = 10
+"""number of connection pools to cache in the HTTP transport adapter."""
+
+POOL_MAXSIZE: int = 10
+"""max number of connections to keep open in each connection pool."""
+
+POOL_BLOCK: bool = False
+"""block when no free connections are available in a connection pool."""
+
+TCP_KEEPALIVE: bool = False
+"""enable TCP keepalive on new connections to API."""
+
+TCP_KEEPALIVE_IDLE: int = 60
+"""seconds a connection must be idle before TCP keepalive probes are sent."""
+
+TCP_KEEPALIVE_INTERVAL: int = 15
+"""seconds between TCP keepalive probes."""
+
+TCP_KEEPALIVE_COUNT: int = 4
+"""number of failed TCP keepalive probes before a connection is dropped."""
+
+TLS_SESSION_REUSE: bool = False
+"""resume TLS sessions for new connections to API in the same pool."""
+
 DEFAULT_CALLBACKS_CLS: str = "base"
 """Default callback object to use"""
 
@@ -56,6 +115,26 @@ COUNT_POLLING_SLEEP: int = 1
 AS_DATACLASS: bool = False
 """Global default for returning objects as dataclass instead of dict."""
 
+WARMUP_ASSETS: List[str] = ["devices", "users"]
+"""default asset types to fetch metadata for in Connect.warmup"""
+
+WARMUP_ITEMS: List[str] = [
+    "fields",
+    "adapters",
+    "saved_queries",
+    "labels",
+    "history_dates",
+    "instances",
+    "feature_flags",
+]
+"""metadata that can be fetched by Connect.warmup"""
+
+WARMUP_SHARED: List[str] = ["adapters", "history_dates", "instances"]
+"""metadata fetched once by Connect.warmup and shared by all asset types"""
+
+WARMUP_WORKERS: int = 8
+"""default number of requests Connect.warmup sends at the same time"""
+
 BARRIER: str = "-" * 15
 ASSET_TMPL: str = "{k}: {v}"
 # ALL_ID: str = "all"
@@ -8,7 +8,6 @@ import warnings
 
 from ..data import BaseData, BaseEnum
 from ..exceptions import NotFoundError, UnknownFieldSchema
-from ..tools import is_str
 
 AGG_ADAPTER_NAME: str = "agg"
 """Short name to use for aggregated adapter"""
@@ -49,7 +48,7 @@ class AXID:
     @staticmethod
     def is_axid(value: t.Any) -> bool:
         """Pass."""
-        return is_str(value) and value.isalnum() and len(value) == AXID.length
+        return isinstance(value, str) and value.isalnum() and len(value) == AXID.length
 
 
 ALL_NAME: str = "all"
@@ -88,6 +87,9 @@ FUZZY_SCHEMAS_KEYS: t.List[str] = [
 PRETTY_SCHEMA_TMPL: str = "{adapter_name}:{name_base:{len_max}} -> {column_title}"
 """template to use when pretty printing schemas."""
 
+FIELDS_CACHE_DIR: str = "axonius_api_client_cache/fields"
+"""directory under DEFAULT_PATH to store the persistent field schema cache in."""
+
 FIELDS_DETAILS: t.List[str] = [
     "meta_data.client_used",
     "unique_adapter_names_details",
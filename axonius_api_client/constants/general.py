@@ -62,6 +62,12 @@ IS_MAC: bool = sys.platform == "darwin"
 TRIM_MSG: str = "\nTrimmed {value_len} {trim_type} down to {trim}"
 FILE_DATE_FMT: str = "%Y-%m-%dT%H-%M-%S"
 
+COMPRESS_SUFFIXES: t.Dict[str, str] = {"gzip": ".gz", "bz2": ".bz2", "xz": ".xz", "zstd": ".zst"}
+"""Compression methods for files and the suffix to add to the file name for each."""
+
+COMPRESS_LEVELS: t.Dict[str, int] = {"gzip": 6, "bz2": 9, "xz": 6, "zstd": 3}
+"""Default compression level for each compression method."""
+
 
 SECHO_ARGS: t.List[str] = [
     "fg",
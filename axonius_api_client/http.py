@@ -1,19 +1,39 @@
 """HTTP client."""
+import datetime
+import email.utils
 import logging
 import pathlib
+import random
+import socket
+import ssl
+import threading
+import time
 import typing as t
 import warnings
-import time
 
 import OpenSSL  # noqa: TCH002
 import requests
+import requests.adapters
 import requests.cookies
 import requests.structures
 import urllib3
+import urllib3.connection
 import urllib3.exceptions
+import urllib3.util.ssl_
 
 from . import version
-from .constants.api import TIMEOUT_CONNECT, TIMEOUT_RESPONSE
+from .constants.api import (
+    POOL_BLOCK,
+    POOL_CONNECTIONS,
+    POOL_MAXSIZE,
+    TCP_KEEPALIVE,
+    TCP_KEEPALIVE_COUNT,
+    TCP_KEEPALIVE_IDLE,
+    TCP_KEEPALIVE_INTERVAL,
+    TIMEOUT_CONNECT,
+    TIMEOUT_RESPONSE,
+    TLS_SESSION_REUSE,
+)
 from .constants.ctypes import PathLike, PatternLikeListy
 from .constants.logs import (
     LOG_LEVEL_HTTP,
@@ -21,6 +41,7 @@ from .constants.logs import (
     REQUEST_ATTR_MAP,
     RESPONSE_ATTR_MAP,
 )
+from .caching import CacheManager
 from .exceptions import HttpError
 from .logs import get_obj_log, set_log_level
 from .projects import cert_human
@@ -30,13 +51,18 @@ from .projects.cf_token.tools import get_env_url, is_url
 from .projects.url_parser import UrlParser
 from .setup_env import get_env_user_agent
 from .tools import (
+    JsonCodec,
     coerce_bool,
+    coerce_int,
     coerce_int_float,
     coerce_str,
     join_url,
     json_log,
     listify,
+    get_json_codec,
+    get_profiler,
     path_read,
+    profile_stage,
     tilde_re,
 )
 
@@ -69,6 +95,698 @@ def is_cookies(value: t.Any) -> bool:
     return isinstance(value, (dict, requests.cookies.RequestsCookieJar))
 
 
+def get_keepalive_options(
+    idle: t.Optional[int] = TCP_KEEPALIVE_IDLE,
+    interval: t.Optional[int] = TCP_KEEPALIVE_INTERVAL,
+    count: t.Optional[int] = TCP_KEEPALIVE_COUNT,
+) -> t.List[t.Tuple[int, int, int]]:
+    """Get the socket options to enable TCP keepalive on new connections.
+
+    Notes:
+        The idle, interval, and count options are only set on platforms that support them.
+
+    Args:
+        idle: seconds a connection must be idle before keepalive probes are sent
+        interval: seconds between keepalive probes
+        count: number of failed keepalive probes before the connection is dropped
+    """
+    options = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+    tcp_options = {"TCP_KEEPIDLE": idle, "TCP_KEEPINTVL": interval, "TCP_KEEPCNT": count}
+    if not hasattr(socket, "TCP_KEEPIDLE") and hasattr(socket, "TCP_KEEPALIVE"):
+        # macOS names the idle option TCP_KEEPALIVE
+        tcp_options["TCP_KEEPALIVE"] = tcp_options.pop("TCP_KEEPIDLE")
+
+    for name, value in tcp_options.items():
+        if isinstance(value, int) and value > 0 and hasattr(socket, name):
+            options.append((socket.IPPROTO_TCP, getattr(socket, name), value))
+    return options
+
+
+class TlsSessionSocket(ssl.SSLSocket):
+    """SSL socket that hands its TLS session back to its context when closed.
+
+    Notes:
+        TLS 1.3 servers send session tickets after the handshake, so the session is only
+        resumable once some data has been read, which is guaranteed by the time it is closed.
+    """
+
+    def _real_close(self):
+        """Store the TLS session in the context before closing."""
+        context = self.context
+        if isinstance(context, TlsSessionContext):
+            context.store_session(sock=self)
+        super()._real_close()
+
+
+class TlsSessionContext(ssl.SSLContext):
+    """SSL context that resumes the last TLS session to a host for new connections.
+
+    Notes:
+        :obj:`urllib3` wraps every new connection using the SSL context in the pool, so
+        using one of these for a pool lets new connections skip the full handshake.
+
+        :obj:`urllib3` also sets the verify mode and loads the CA and client certificates
+        of the pool into the context for every new connection. :obj:`HttpPoolManager`
+        creates one context for each pool, so those writes always come from the same pool
+        settings and never change the context used by the connections of another pool.
+    """
+
+    sslsocket_class = TlsSessionSocket
+
+    @classmethod
+    def create(
+        cls, on_handshake: t.Optional[t.Callable[[bool], None]] = None
+    ) -> "TlsSessionContext":
+        """Create a context with the defaults of :func:`urllib3.util.ssl_.create_urllib3_context`.
+
+        Args:
+            on_handshake: called with True if a TLS session was resumed or False if a new
+                one was negotiated, every time a connection finishes its handshake
+
+        Notes:
+            ``OP_NO_TICKET`` is not set, as session tickets are needed to resume TLS 1.3
+            sessions.
+        """
+        context = cls(ssl.PROTOCOL_TLS_CLIENT)
+        context.set_ciphers(urllib3.util.ssl_.DEFAULT_CIPHERS)
+        context.options |= ssl.OP_NO_SSLv2 | ssl.OP_NO_SSLv3 | ssl.OP_NO_COMPRESSION
+        if getattr(context, "post_handshake_auth", None) is not None:
+            context.post_handshake_auth = True
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_REQUIRED
+        context.load_default_certs()
+        context.tls_sessions = {}
+        context.tls_sessions_lock = threading.Lock()
+        context.on_handshake = on_handshake
+        return context
+
+    def store_session(self, sock: ssl.SSLSocket):
+        """Store the TLS session of sock for its server_hostname."""
+        try:
+            session = sock.session
+        except Exception:  # pragma: no cover
+            return
+        if session is not None:
+            with self.tls_sessions_lock:
+                self.tls_sessions[sock.server_hostname] = session
+
+    def wrap_socket(self, sock, *args, server_hostname=None, session=None, **kwargs):
+        """Wrap a socket using the last TLS session for server_hostname."""
+        with self.tls_sessions_lock:
+            session = session or self.tls_sessions.get(server_hostname)
+
+        try:
+            wrapped = super().wrap_socket(
+                sock, *args, server_hostname=server_hostname, session=session, **kwargs
+            )
+        except ssl.SSLError:
+            with self.tls_sessions_lock:
+                self.tls_sessions.pop(server_hostname, None)
+            raise
+
+        if callable(self.on_handshake):
+            self.on_handshake(wrapped.session_reused)
+        self.store_session(sock=wrapped)
+        return wrapped
+
+
+class HttpPoolManager(urllib3.PoolManager):
+    """Pool manager that reports every new socket connection to a callback."""
+
+    def __init__(
+        self,
+        *args,
+        on_connect: t.Optional[t.Callable[[], None]] = None,
+        ssl_context_factory: t.Optional[t.Callable[[], ssl.SSLContext]] = None,
+        **kwargs,
+    ):
+        """Pool manager that reports every new socket connection to a callback.
+
+        Args:
+            *args: passed to :obj:`urllib3.PoolManager`
+            on_connect: called every time a pool opens a new socket connection
+            ssl_context_factory: called to create the SSL context of every new HTTPS pool
+            **kwargs: passed to :obj:`urllib3.PoolManager`
+        """
+        self.on_connect = on_connect
+        self.ssl_context_factory = ssl_context_factory
+        super().__init__(*args, **kwargs)
+
+    def _new_pool(self, scheme, host, port, request_context=None):
+        """Create a pool whose connections call :attr:`on_connect` when they connect."""
+        if scheme == "https" and callable(self.ssl_context_factory):
+            request_context = dict(request_context or self.connection_pool_kw)
+            request_context["ssl_context"] = self.ssl_context_factory()
+        pool = super()._new_pool(scheme, host, port, request_context=request_context)
+        on_connect = self.on_connect
+        if callable(on_connect):
+            base = pool.ConnectionCls
+
+            class CountedConnection(base):
+                def _new_conn(self):
+                    conn = super()._new_conn()
+                    on_connect()
+                    return conn
+
+            CountedConnection.__name__ = base.__name__
+            pool.ConnectionCls = CountedConnection
+        return pool
+
+
+class HttpAdapter(requests.adapters.HTTPAdapter):
+    """Transport adapter with socket options, TLS session reuse, and connection counters."""
+
+    socket_options: t.Optional[t.List[t.Tuple[int, int, int]]] = None
+    """Socket options to set on new connections."""
+
+    tls_session_reuse: bool = False
+    """Give each HTTPS pool a :obj:`TlsSessionContext` to resume TLS sessions with."""
+
+    def __init__(
+        self,
+        socket_options: t.Optional[t.List[t.Tuple[int, int, int]]] = None,
+        tls_session_reuse: bool = False,
+        **kwargs,
+    ):
+        """Transport adapter with socket options, TLS session reuse, and connection counters.
+
+        Args:
+            socket_options: socket options to set on new connections, will be added to
+                :attr:`urllib3.connection.HTTPConnection.default_socket_options`
+            tls_session_reuse: give each HTTPS pool a :obj:`TlsSessionContext` to resume
+                TLS sessions with
+            **kwargs: passed to :obj:`requests.adapters.HTTPAdapter`
+        """
+        self.socket_options = socket_options
+        self.tls_session_reuse = tls_session_reuse
+        self.stats_lock = threading.Lock()
+        self.requests_sent = 0
+        self.connections_opened = 0
+        self.tls_sessions_new = 0
+        self.tls_sessions_reused = 0
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        """Initialize a :obj:`HttpPoolManager` with our socket options and SSL contexts."""
+        if self.socket_options:
+            pool_kwargs["socket_options"] = [
+                *urllib3.connection.HTTPConnection.default_socket_options,
+                *self.socket_options,
+            ]
+        if self.tls_session_reuse:
+            pool_kwargs["ssl_context_factory"] = self._new_ssl_context
+
+        self._pool_connections = connections
+        self._pool_maxsize = maxsize
+        self._pool_block = block
+        self.poolmanager = HttpPoolManager(
+            num_pools=connections,
+            maxsize=maxsize,
+            block=block,
+            on_connect=self._on_connect,
+            **pool_kwargs,
+        )
+
+    def _new_ssl_context(self) -> TlsSessionContext:
+        return TlsSessionContext.create(on_handshake=self._on_handshake)
+
+    def _on_connect(self):
+        with self.stats_lock:
+            self.connections_opened += 1
+
+    def _on_handshake(self, reused: bool):
+        with self.stats_lock:
+            if reused:
+                self.tls_sessions_reused += 1
+            else:
+                self.tls_sessions_new += 1
+
+    def send(self, request, *args, **kwargs):
+        """Count the request and send it."""
+        with self.stats_lock:
+            self.requests_sent += 1
+        return super().send(request, *args, **kwargs)
+
+    @property
+    def pool_stats(self) -> t.Dict[str, int]:
+        """Get the number of connections opened and reused by this adapter."""
+        with self.stats_lock:
+            requests_sent = self.requests_sent
+            opened = self.connections_opened
+            tls_sessions = {
+                "tls_sessions_new": self.tls_sessions_new,
+                "tls_sessions_reused": self.tls_sessions_reused,
+            }
+        stats = {
+            "pools": len(self.poolmanager.pools),
+            "requests": requests_sent,
+            "connections_opened": opened,
+            "connections_reused": max(requests_sent - opened, 0),
+        }
+        if self.tls_session_reuse:
+            stats.update(tls_sessions)
+        return stats
+
+
+class RetryPolicy:
+    """Decide if and how long to wait before retrying a request sent by :obj:`Http`.
+
+    Notes:
+        Backoff is exponential with full jitter, i.e. a random number of seconds between 0
+        and ``min(backoff_max, backoff * 2 ** (attempt - 1))``, so many clients retrying
+        at once spread out instead of hitting the server in lockstep.
+    """
+
+    STATUS_CODES: t.Tuple[int, ...] = (429, 502, 503, 504)
+    """Response status codes that will be retried."""
+
+    STATUS_CODES_UNPROCESSED: t.Tuple[int, ...] = (429, 503)
+    """Response status codes that mean the request was not processed, retried for any method."""
+
+    METHODS_IDEMPOTENT: t.Tuple[str, ...] = ("DELETE", "GET", "HEAD", "OPTIONS", "PUT", "TRACE")
+    """HTTP methods that are safe to retry after the request may have been processed."""
+
+    BACKOFF_MAX: float = 120
+    """Max number of seconds to wait between retries."""
+
+    RETRY_AFTER_MAX: float = 300
+    """Max number of seconds to honor from a Retry-After response header."""
+
+    TOTAL_TIME: t.Optional[float] = None
+    """Max number of seconds to spend on all attempts for a request, None for no limit."""
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff: float = 5,
+        backoff_max: float = BACKOFF_MAX,
+        total_time: t.Optional[float] = TOTAL_TIME,
+        status_codes: t.Iterable[int] = STATUS_CODES,
+        status_codes_unprocessed: t.Iterable[int] = STATUS_CODES_UNPROCESSED,
+        methods_idempotent: t.Iterable[str] = METHODS_IDEMPOTENT,
+        retry_after: bool = True,
+        retry_after_max: float = RETRY_AFTER_MAX,
+        jitter: bool = True,
+    ):
+        """Decide if and how long to wait before retrying a request sent by :obj:`Http`.
+
+        Args:
+            max_retries: max number of attempts to make for a request
+            backoff: number of seconds to wait before the first retry, doubled for every
+                retry after that
+            backoff_max: max number of seconds to wait between retries
+            total_time: max number of seconds to spend on all attempts for a request
+            status_codes: response status codes that will be retried
+            status_codes_unprocessed: response status codes that will be retried for any method
+            methods_idempotent: HTTP methods that are safe to retry
+            retry_after: honor the Retry-After header of responses with a retryable status code
+            retry_after_max: max number of seconds to honor from a Retry-After header
+            jitter: wait a random number of seconds up to the backoff instead of the backoff
+        """
+        self.max_retries: int = max(coerce_int(max_retries), 1)
+        self.backoff: float = max(coerce_int_float(backoff or 0), 0)
+        self.backoff_max: float = coerce_int_float(backoff_max)
+        self.total_time: t.Optional[float] = (
+            None if total_time is None else coerce_int_float(total_time)
+        )
+        self.status_codes: t.Set[int] = {coerce_int(x) for x in status_codes}
+        self.status_codes_unprocessed: t.Set[int] = {
+            coerce_int(x) for x in status_codes_unprocessed
+        }
+        self.methods_idempotent: t.Set[str] = {str(x).upper() for x in methods_idempotent}
+        self.retry_after: bool = coerce_bool(retry_after)
+        self.retry_after_max: float = coerce_int_float(retry_after_max)
+        self.jitter: bool = coerce_bool(jitter)
+        self.lock: threading.Lock = threading.Lock()
+        self.reset_metrics()
+
+    def __str__(self) -> str:
+        """Pass."""
+        items = [
+            f"max_retries={self.max_retries}",
+            f"backoff={self.backoff}",
+            f"backoff_max={self.backoff_max}",
+            f"total_time={self.total_time}",
+            f"status_codes={sorted(self.status_codes)}",
+        ]
+        return f"{self.__class__.__name__}({', '.join(items)})"
+
+    def __repr__(self) -> str:
+        """Pass."""
+        return self.__str__()
+
+    def reset_metrics(self):
+        """Reset the retry metrics."""
+        with self.lock:
+            self._metrics: dict = {
+                "requests": 0,
+                "attempts": 0,
+                "retries": 0,
+                "retries_by_reason": {},
+                "backoff_seconds": 0.0,
+                "gave_up": 0,
+                "budget_exhausted": 0,
+            }
+
+    @property
+    def metrics(self) -> dict:
+        """Get the number of requests, attempts, retries and seconds spent backing off."""
+        with self.lock:
+            metrics = dict(self._metrics)
+            metrics["retries_by_reason"] = dict(metrics["retries_by_reason"])
+        return metrics
+
+    def is_idempotent(self, method: str, idempotent: t.Optional[bool] = None) -> bool:
+        """Check if a request is safe to retry after it may have been processed.
+
+        Args:
+            method: HTTP method of request
+            idempotent: override the check by method
+        """
+        if isinstance(idempotent, bool):
+            return idempotent
+        return str(method).upper() in self.methods_idempotent
+
+    def get_backoff(self, attempt: int, response: t.Optional[requests.Response] = None) -> float:
+        """Get the number of seconds to wait before the next attempt.
+
+        Args:
+            attempt: number of the attempt that just failed, starting at 1
+            response: response received for the attempt that just failed
+        """
+        retry_after = self.get_retry_after(response=response)
+        if retry_after is not None:
+            return retry_after
+
+        cap = min(self.backoff_max, self.backoff * (2 ** max(attempt - 1, 0)))
+        return random.uniform(0, cap) if self.jitter else cap
+
+    def get_retry_after(self, response: t.Optional[requests.Response] = None) -> t.Optional[float]:
+        """Get the number of seconds from the Retry-After header of a response.
+
+        Args:
+            response: response to get the Retry-After header from
+        """
+        if not self.retry_after or response is None:
+            return None
+
+        value = str(response.headers.get("Retry-After") or "").strip()
+        if not value:
+            return None
+
+        try:
+            seconds = float(value)
+        except ValueError:
+            try:
+                then = email.utils.parsedate_to_datetime(value)
+            except (TypeError, ValueError):
+                return None
+            if then.tzinfo is None:
+                then = then.replace(tzinfo=datetime.timezone.utc)
+            seconds = (then - datetime.datetime.now(datetime.timezone.utc)).total_seconds()
+        return min(max(seconds, 0.0), self.retry_after_max)
+
+    def get_reason(
+        self,
+        idempotent: bool,
+        response: t.Optional[requests.Response] = None,
+        exc: t.Optional[Exception] = None,
+    ) -> t.Optional[str]:
+        """Get the reason to retry a failed attempt, or None if it should not be retried.
+
+        Notes:
+            Connection errors mean the request was never received, so they are retried for
+            any method. Other errors, such as read timeouts, are only retried if idempotent.
+
+        Args:
+            idempotent: request is safe to retry after it may have been processed
+            response: response received for the attempt
+            exc: exception raised by the attempt
+        """
+        if exc is not None:
+            is_connect = isinstance(exc, requests.exceptions.ConnectionError) and not isinstance(
+                exc, requests.exceptions.ChunkedEncodingError
+            )
+            if is_connect or idempotent:
+                return exc.__class__.__name__
+            return None
+
+        if response is not None:
+            status = response.status_code
+            if status in self.status_codes and (
+                idempotent or status in self.status_codes_unprocessed
+            ):
+                return str(status)
+        return None
+
+    def start(self) -> float:
+        """Record the start of a request and get the time it started."""
+        with self.lock:
+            self._metrics["requests"] += 1
+        return time.monotonic()
+
+    def get_retry(
+        self,
+        attempt: int,
+        started: float,
+        idempotent: bool,
+        response: t.Optional[requests.Response] = None,
+        exc: t.Optional[Exception] = None,
+    ) -> t.Tuple[t.Optional[float], str]:
+        """Get the number of seconds to wait before retrying an attempt.
+
+        Args:
+            attempt: number of the attempt that just finished, starting at 1
+            started: value returned from :meth:`start` for this request
+            idempotent: request is safe to retry after it may have been processed
+            response: response received for the attempt
+            exc: exception raised by the attempt
+
+        Returns:
+            tuple of seconds to wait or None if the attempt should not be retried, and a
+            message explaining why
+        """
+        reason = self.get_reason(idempotent=idempotent, response=response, exc=exc)
+
+        with self.lock:
+            self._metrics["attempts"] += 1
+
+            if reason is None:
+                return None, "Not retryable"
+
+            if attempt >= self.max_retries:
+                self._metrics["gave_up"] += 1
+                return None, f"Max attempts ({self.max_retries}) reached ({reason})"
+
+            backoff = self.get_backoff(attempt=attempt, response=response)
+            if self.total_time is not None:
+                elapsed = time.monotonic() - started
+                if elapsed + backoff > self.total_time:
+                    self._metrics["gave_up"] += 1
+                    self._metrics["budget_exhausted"] += 1
+                    return None, (
+                        f"Retry time budget of {self.total_time} seconds exhausted "
+                        f"after {elapsed:.2f} seconds ({reason})"
+                    )
+
+            by_reason = self._metrics["retries_by_reason"]
+            by_reason[reason] = by_reason.get(reason, 0) + 1
+            self._metrics["retries"] += 1
+            self._metrics["backoff_seconds"] += backoff
+        return backoff, f"Retrying after {backoff:.2f} seconds ({reason})"
+
+
+class RateLimiter:
+    """Token bucket rate limiter that adapts its rate to how the server is coping.
+
+    Notes:
+        With adaptive=True the rate follows AIMD (additive increase, multiplicative
+        decrease): every quick successful response raises the rate a little, while 429/5xx
+        responses, connection errors, and responses slower than latency_target cut it.
+        One instance is thread safe and can be shared by many :obj:`Http` objects to
+        throttle them as a group.
+    """
+
+    RATE: float = 10.0
+    """Requests per second to start at."""
+
+    RATE_MIN: float = 0.5
+    """Lowest requests per second to decrease to."""
+
+    RATE_MAX: float = 100.0
+    """Highest requests per second to increase to."""
+
+    BURST: int = 5
+    """Max number of requests that can be sent at once after being idle."""
+
+    INCREASE: float = 1.0
+    """Requests per second to add for every second of successful responses."""
+
+    DECREASE: float = 0.5
+    """Multiply the rate by this when the server is struggling."""
+
+    COOLDOWN: float = 1.0
+    """Min seconds between rate decreases, so a burst of failures only counts once."""
+
+    LATENCY_TARGET: t.Optional[float] = None
+    """Responses slower than this many seconds decrease the rate, None to ignore latency."""
+
+    def __init__(
+        self,
+        rate: float = RATE,
+        rate_min: float = RATE_MIN,
+        rate_max: float = RATE_MAX,
+        burst: int = BURST,
+        adaptive: bool = True,
+        increase: float = INCREASE,
+        decrease: float = DECREASE,
+        cooldown: float = COOLDOWN,
+        latency_target: t.Optional[float] = LATENCY_TARGET,
+        max_concurrent: t.Optional[int] = None,
+    ):
+        """Token bucket rate limiter that adapts its rate to how the server is coping.
+
+        Args:
+            rate: requests per second to start at
+            rate_min: lowest requests per second to decrease to
+            rate_max: highest requests per second to increase to
+            burst: max number of requests that can be sent at once after being idle
+            adaptive: adjust the rate based on responses, otherwise keep rate fixed
+            increase: requests per second to add for every second of successful responses
+            decrease: multiply the rate by this when the server is struggling
+            cooldown: min seconds between rate decreases
+            latency_target: responses slower than this many seconds decrease the rate
+            max_concurrent: max number of requests in flight at once, None for no limit
+        """
+        self.rate_min: float = max(coerce_int_float(rate_min, as_float=True), 0.01)
+        self.rate_max: float = max(coerce_int_float(rate_max, as_float=True), self.rate_min)
+        self.rate: float = min(
+            max(coerce_int_float(rate, as_float=True), self.rate_min), self.rate_max
+        )
+        self.burst: int = coerce_int(burst, min_value=1)
+        self.adaptive: bool = coerce_bool(adaptive)
+        self.increase: float = max(coerce_int_float(increase, as_float=True), 0.0)
+        self.decrease: float = min(max(coerce_int_float(decrease, as_float=True), 0.01), 1.0)
+        self.cooldown: float = max(coerce_int_float(cooldown, as_float=True), 0.0)
+        self.latency_target: t.Optional[float] = (
+            None if latency_target is None else coerce_int_float(latency_target, as_float=True)
+        )
+        self.max_concurrent: t.Optional[int] = (
+            None if max_concurrent is None else coerce_int(max_concurrent, min_value=1)
+        )
+        self.semaphore: t.Optional[threading.BoundedSemaphore] = (
+            None if self.max_concurrent is None else threading.BoundedSemaphore(self.max_concurrent)
+        )
+        self.lock: threading.Lock = threading.Lock()
+        self.tokens: float = float(self.burst)
+        self.refilled: float = time.monotonic()
+        self.decreased: float = 0.0
+        self.reset_metrics()
+
+    def __str__(self) -> str:
+        """Pass."""
+        items = [
+            f"rate={self.rate:.2f}",
+            f"rate_min={self.rate_min}",
+            f"rate_max={self.rate_max}",
+            f"burst={self.burst}",
+            f"adaptive={self.adaptive}",
+            f"max_concurrent={self.max_concurrent}",
+        ]
+        return f"{self.__class__.__name__}({', '.join(items)})"
+
+    def __repr__(self) -> str:
+        """Pass."""
+        return self.__str__()
+
+    def reset_metrics(self):
+        """Reset the rate limiter metrics."""
+        with self.lock:
+            self._metrics: dict = {
+                "requests": 0,
+                "waits": 0,
+                "wait_seconds": 0.0,
+                "increases": 0,
+                "decreases": 0,
+            }
+
+    @property
+    def metrics(self) -> dict:
+        """Get the current rate, number of requests, and seconds spent waiting for a token."""
+        with self.lock:
+            metrics = dict(self._metrics)
+            metrics["rate"] = self.rate
+        return metrics
+
+    def _refill(self, now: float):
+        self.tokens = min(float(self.burst), self.tokens + (now - self.refilled) * self.rate)
+        self.refilled = now
+
+    def acquire(self) -> float:
+        """Block until a request can be sent.
+
+        Returns:
+            seconds spent waiting
+        """
+        started = time.monotonic()
+        if self.semaphore is not None:
+            self.semaphore.acquire()
+
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self._refill(now=now)
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    waited = now - started
+                    self._metrics["requests"] += 1
+                    if waited > 0.001:
+                        self._metrics["waits"] += 1
+                        self._metrics["wait_seconds"] += waited
+                    return waited
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+    def release(
+        self,
+        latency: float,
+        response: t.Optional[requests.Response] = None,
+        exc: t.Optional[Exception] = None,
+    ):
+        """Report the outcome of a request sent after :meth:`acquire`.
+
+        Args:
+            latency: seconds it took to get the response
+            response: response received
+            exc: exception raised while sending
+        """
+        if self.semaphore is not None:
+            self.semaphore.release()
+
+        if not self.adaptive:
+            return
+
+        status = getattr(response, "status_code", None)
+        struggling = (
+            exc is not None
+            or (isinstance(status, int) and (status == 429 or status >= 500))
+            or (self.latency_target is not None and latency > self.latency_target)
+        )
+
+        with self.lock:
+            now = time.monotonic()
+            self._refill(now=now)
+            if struggling:
+                if now - self.decreased >= self.cooldown:
+                    self.rate = max(self.rate_min, self.rate * self.decrease)
+                    self.tokens = min(self.tokens, 0.0)
+                    self.decreased = now
+                    self._metrics["decreases"] += 1
+            elif self.rate < self.rate_max:
+                self.rate = min(self.rate_max, self.rate + self.increase / self.rate)
+                self._metrics["increases"] += 1
+
+
 class Http:
     """HTTP client that wraps around :obj:`requests.Session`."""
 
@@ -176,7 +894,46 @@ class Http:
     """Number of times to retry a request if it fails."""
 
     RETRY_BACKOFF: t.Optional[int] = 5
-    """Number of seconds to wait between retries, will be multiplied against the current retry attempt."""
+    """Number of seconds to wait before the first retry, will be doubled for every retry after that."""
+
+    POOL_CONNECTIONS: int = POOL_CONNECTIONS
+    """Number of connection pools to cache."""
+
+    POOL_MAXSIZE: int = POOL_MAXSIZE
+    """Max number of connections to keep open in each pool."""
+
+    POOL_BLOCK: bool = POOL_BLOCK
+    """Block when no free connections are available in a pool instead of opening a new one."""
+
+    TCP_KEEPALIVE: bool = TCP_KEEPALIVE
+    """Enable TCP keepalive on new connections."""
+
+    TCP_KEEPALIVE_IDLE: int = TCP_KEEPALIVE_IDLE
+    """Seconds a connection must be idle before TCP keepalive probes are sent."""
+
+    TCP_KEEPALIVE_INTERVAL: int = TCP_KEEPALIVE_INTERVAL
+    """Seconds between TCP keepalive probes."""
+
+    TCP_KEEPALIVE_COUNT: int = TCP_KEEPALIVE_COUNT
+    """Number of failed TCP keepalive probes before a connection is dropped."""
+
+    TLS_SESSION_REUSE: bool = TLS_SESSION_REUSE
+    """Resume TLS sessions for new connections, using one SSL context for each pool."""
+
+    ADAPTER: t.Optional[HttpAdapter] = None
+    """Transport adapter mounted on :attr:`session`."""
+
+    RETRY_POLICY: t.Optional[RetryPolicy] = None
+    """Policy to decide if and when to retry requests."""
+
+    RATE_LIMITER: t.Optional[RateLimiter] = None
+    """Rate limiter to throttle every request through."""
+
+    JSON_CODEC: t.Optional[JsonCodec] = None
+    """JSON codec to deserialize responses and serialize exports with."""
+
+    CACHES: t.Optional[CacheManager] = None
+    """Caches used by the API models that send requests with this object."""
 
     def __init__(  # noqa: PLR0913
         self,
@@ -220,6 +977,18 @@ class Http:
         cf_timeout_login: t.Optional[int] = cf_constants.TIMEOUT_LOGIN,
         max_retries: t.Optional[int] = MAX_RETRIES,
         retry_backoff: t.Optional[int] = RETRY_BACKOFF,
+        pool_connections: int = POOL_CONNECTIONS,
+        pool_maxsize: int = POOL_MAXSIZE,
+        pool_block: bool = POOL_BLOCK,
+        tcp_keepalive: bool = TCP_KEEPALIVE,
+        tcp_keepalive_idle: int = TCP_KEEPALIVE_IDLE,
+        tcp_keepalive_interval: int = TCP_KEEPALIVE_INTERVAL,
+        tcp_keepalive_count: int = TCP_KEEPALIVE_COUNT,
+        tls_session_reuse: bool = TLS_SESSION_REUSE,
+        retry_policy: t.Optional[RetryPolicy] = None,
+        rate_limiter: t.Optional[RateLimiter] = None,
+        json_codec: t.Optional[t.Union[str, JsonCodec]] = None,
+        caches: t.Optional[t.Union[CacheManager, t.Dict[str, dict]]] = None,
         **kwargs,
     ) -> None:
         """HTTP client that wraps around :obj:`requests.Session`.
@@ -273,7 +1042,26 @@ class Http:
             cf_echo: echo commands and results to stdout
             cf_echo_verbose: echo checks to stdout
             max_retries: number of times to retry a failed connection
-            retry_backoff: number of seconds to wait between retries, will be multiplied against the current retry attempt
+            retry_backoff: number of seconds to wait before the first retry, will be doubled for
+                every retry after that
+            pool_connections: number of connection pools to cache
+            pool_maxsize: max number of connections to keep open in each pool
+            pool_block: block when no free connections are available in a pool
+            tcp_keepalive: enable TCP keepalive on new connections
+            tcp_keepalive_idle: seconds a connection must be idle before keepalive probes are sent
+            tcp_keepalive_interval: seconds between keepalive probes
+            tcp_keepalive_count: number of failed keepalive probes before a connection is dropped
+            tls_session_reuse: resume TLS sessions for new connections in the same pool
+            retry_policy: policy to decide if and when to retry requests, if not supplied
+                one will be created using max_retries and retry_backoff, if supplied
+                max_retries and retry_backoff are ignored and taken from the policy
+            rate_limiter: rate limiter to throttle every request through, share one
+                across Http objects to throttle them as a group
+            json_codec: JSON codec object or name of JSON codec to use, if not supplied
+                will be taken from the OS env var AX_JSON_CODEC, see
+                :func:`axonius_api_client.tools.get_json_codec`
+            caches: cache manager to use, or dict of cache policies to create one with,
+                see :obj:`axonius_api_client.caching.CacheManager`
             **kwargs: no longer used, will throw a deprecation warning
 
         Raises:
@@ -352,13 +1140,30 @@ class Http:
         self.SAVE_HISTORY: bool = coerce_bool(save_history)
         self.SAVE_LAST: bool = coerce_bool(save_last)
 
-        self.MAX_RETRIES: t.Optional[int] = coerce_int_float(
-            max_retries,
-            error=False,
+        self.POOL_CONNECTIONS: int = coerce_int(pool_connections, min_value=1)
+        self.POOL_MAXSIZE: int = coerce_int(pool_maxsize, min_value=1)
+        self.POOL_BLOCK: bool = coerce_bool(pool_block)
+        self.TCP_KEEPALIVE: bool = coerce_bool(tcp_keepalive)
+        self.TCP_KEEPALIVE_IDLE: int = coerce_int(tcp_keepalive_idle, min_value=1)
+        self.TCP_KEEPALIVE_INTERVAL: int = coerce_int(tcp_keepalive_interval, min_value=1)
+        self.TCP_KEEPALIVE_COUNT: int = coerce_int(tcp_keepalive_count, min_value=1)
+        self.TLS_SESSION_REUSE: bool = coerce_bool(tls_session_reuse)
+        self.RETRY_POLICY: RetryPolicy = (
+            retry_policy
+            if isinstance(retry_policy, RetryPolicy)
+            else RetryPolicy(
+                max_retries=coerce_int_float(max_retries, error=False) or 1,
+                backoff=coerce_int_float(retry_backoff, error=False),
+            )
         )
-        self.RETRY_BACKOFF: t.Optional[int] = coerce_int_float(
-            retry_backoff,
-            error=False,
+        self.MAX_RETRIES: int = self.RETRY_POLICY.max_retries
+        self.RETRY_BACKOFF: float = self.RETRY_POLICY.backoff
+        self.RATE_LIMITER: t.Optional[RateLimiter] = (
+            rate_limiter if isinstance(rate_limiter, RateLimiter) else None
+        )
+        self.JSON_CODEC: JsonCodec = get_json_codec(codec=json_codec)
+        self.CACHES: CacheManager = (
+            caches if isinstance(caches, CacheManager) else CacheManager(policies=caches)
         )
 
         self.set_urllib_warnings()
@@ -507,6 +1312,60 @@ class Http:
         self.set_session_proxies()
         self.set_session_verify()
         self.set_session_cert()
+        self.set_session_adapter()
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        """Send a prepared request using :attr:`session`, throttled by :attr:`RATE_LIMITER`.
+
+        Args:
+            request: prepared request to send
+            **kwargs: passed to :meth:`requests.Session.send`
+        """
+        limiter = self.RATE_LIMITER
+        if not isinstance(limiter, RateLimiter):
+            with profile_stage(profiler=get_profiler(), name="http.send"):
+                return self.session.send(request=request, **kwargs)
+
+        waited = limiter.acquire()
+        if waited > 0.001:
+            self.LOG.debug(f"Waited {waited:.2f} seconds for {limiter}")
+
+        response = None
+        exc = None
+        started = time.monotonic()
+        try:
+            with profile_stage(profiler=get_profiler(), name="http.send"):
+                response = self.session.send(request=request, **kwargs)
+            return response
+        except Exception as send_exc:
+            exc = send_exc
+            raise
+        finally:
+            limiter.release(latency=time.monotonic() - started, response=response, exc=exc)
+
+    def set_session_adapter(self):
+        """Mount a :obj:`HttpAdapter` on :attr:`session` using the pool settings."""
+        socket_options = None
+        if self.TCP_KEEPALIVE:
+            socket_options = get_keepalive_options(
+                idle=self.TCP_KEEPALIVE_IDLE,
+                interval=self.TCP_KEEPALIVE_INTERVAL,
+                count=self.TCP_KEEPALIVE_COUNT,
+            )
+        self.ADAPTER = HttpAdapter(
+            pool_connections=self.POOL_CONNECTIONS,
+            pool_maxsize=self.POOL_MAXSIZE,
+            pool_block=self.POOL_BLOCK,
+            socket_options=socket_options,
+            tls_session_reuse=self.TLS_SESSION_REUSE,
+        )
+        self.session.mount("https://", self.ADAPTER)
+        self.session.mount("http://", self.ADAPTER)
+
+    @property
+    def pool_stats(self) -> t.Dict[str, int]:
+        """Get the number of connections opened and reused by :attr:`session`."""
+        return self.ADAPTER.pool_stats if isinstance(self.ADAPTER, HttpAdapter) else {}
 
     def set_session_headers(self):
         """Configure :attr:`session` headers with :attr:`HTTP_HEADERS`."""
@@ -592,6 +1451,7 @@ class Http:
         cookies: t.Optional[dict] = None,
         json: t.Optional[dict] = None,
         files: tuple = None,
+        idempotent: t.Optional[bool] = None,
         **kwargs,
     ):
         """Create, prepare, and then send a request using :attr:`session`.
@@ -606,6 +1466,8 @@ class Http:
             cookies: cookies to send
             json: obj to encode as json
             files: files to send
+            idempotent: request is safe to retry after it may have been processed, if None
+                :attr:`RETRY_POLICY` will decide based on method
             **kwargs: overrides for object attributes
 
                 * connect_timeout: seconds to wait for connection to open for this request
@@ -672,29 +1534,36 @@ class Http:
         )
         log_if_headers(f"Request arguments after environment merge: {send_args}")
 
-        if self.MAX_RETRIES < 1:
-            self.MAX_RETRIES = 1
+        policy = self.RETRY_POLICY
+        idempotent = policy.is_idempotent(method=method, idempotent=idempotent)
+        started = policy.start()
 
         response = None
-        for attempt in range(self.MAX_RETRIES):
-            attempt_count = attempt + 1
-            attempt_backoff = attempt_count * self.RETRY_BACKOFF
+        attempt = 0
+        while True:
+            attempt += 1
+            self.LOG.debug(f"Attempt {attempt} of {policy.max_retries}.")
             try:
-                self.LOG.debug(f"Attempt {attempt_count} of {self.MAX_RETRIES}.")
-                response = self.session.send(
-                    request=prepped_request,
-                    timeout=timeout,
-                    **send_args,
-                )
-                break
+                response = self.send(request=prepped_request, timeout=timeout, **send_args)
             except Exception as exc:
                 self.LOG.error(f"Connect Error: {exc}")
-                if attempt == self.MAX_RETRIES - 1:
-                    self.LOG.error(f"Max attempts ({self.MAX_RETRIES}) reached.")
+                backoff, msg = policy.get_retry(
+                    attempt=attempt, started=started, idempotent=idempotent, exc=exc
+                )
+                if backoff is None:
+                    self.LOG.error(msg)
                     raise exc
-                self.LOG.warning(f"Retrying after {attempt_backoff} seconds...")
-                time.sleep(attempt_backoff)
-                continue
+            else:
+                backoff, msg = policy.get_retry(
+                    attempt=attempt, started=started, idempotent=idempotent, response=response
+                )
+                if backoff is None:
+                    break
+                self.LOG.warning(f"Response Error: {response}")
+                response.close()
+
+            self.LOG.warning(msg)
+            time.sleep(backoff)
 
         if self.SAVE_LAST:
             self.LAST_RESPONSE = response
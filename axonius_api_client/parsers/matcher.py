@@ -3,8 +3,7 @@
 
 import typing as t
 
-import cachetools
-
+from ..caching import cached
 from ..constants.api import RE_PREFIX
 from ..constants.ctypes import PatternLike, PatternLikeListy
 from ..constants.general import HIDDEN, SPLITTER
@@ -107,7 +106,7 @@ class Matcher:
             return cls(values=values.values, **cls_args)
         return cls(values=values, **cls_args)
 
-    @cachetools.cached(cachetools.LRUCache(maxsize=CACHE_SIZE))
+    @cached(name="matcher.contains", maxsize=CACHE_SIZE, ttl=0)
     def contains(self, value: str, patterns: bool = True) -> bool:
         """Check if value that contains strings or matches patterns.
 
@@ -125,7 +124,7 @@ class Matcher:
                 return True
         return self.search(value) if patterns else False
 
-    @cachetools.cached(cachetools.LRUCache(maxsize=CACHE_SIZE))
+    @cached(name="matcher.equals", maxsize=CACHE_SIZE, ttl=0)
     def equals(self, value: str, patterns: bool = True) -> bool:
         """Check if value that equals strings or matches patterns.
 
@@ -143,7 +142,7 @@ class Matcher:
                 return True
         return self.search(value) if patterns else False
 
-    @cachetools.cached(cachetools.LRUCache(maxsize=CACHE_SIZE))
+    @cached(name="matcher.search", maxsize=CACHE_SIZE, ttl=0)
     def search(self, value: str) -> bool:
         """Check if value that matches patterns.
 
@@ -4,8 +4,6 @@ import copy
 import textwrap
 from typing import List, Optional, Union
 
-import tabulate
-
 from ..constants.api import TABLE_FORMAT
 from ..constants.tables import KEY_MAP_ADAPTER, KEY_MAP_SCHEMA
 from ..tools import json_dump, listify
@@ -26,6 +24,8 @@ def tablize(
         fmt: table format to use
         footer: include err at bottom too
     """
+    import tabulate
+
     table = tabulate.tabulate(value, tablefmt=fmt, headers="keys")
     use_footer = ""
 
@@ -3,8 +3,9 @@
 import re
 from typing import Any, Callable, List, Optional, Tuple, Union
 
-from cachetools import TTLCache, cached
+from cachetools.keys import hashkey
 
+from ..caching import cached, get_manager
 from ..exceptions import WizardError
 from ..tools import (
     check_empty,
@@ -22,12 +23,15 @@ from .tables import tablize
 
 CACHE_MAXSIZE: int = 4096
 CACHE_TTL: int = 30
-CACHE_ADAPTERS: TTLCache = TTLCache(maxsize=CACHE_MAXSIZE, ttl=CACHE_TTL)
-CACHE_SQS: TTLCache = TTLCache(maxsize=CACHE_MAXSIZE, ttl=CACHE_TTL)
-CACHE_INSTANCES: TTLCache = TTLCache(maxsize=CACHE_MAXSIZE, ttl=CACHE_TTL)
-CACHE_CNX_LABELS: TTLCache = TTLCache(maxsize=CACHE_MAXSIZE, ttl=CACHE_TTL)
-CACHE_ASSET_LABELS: TTLCache = TTLCache(maxsize=CACHE_MAXSIZE, ttl=CACHE_TTL)
-CACHE_ASSET_LABELS_EXPIRABLE: TTLCache = TTLCache(maxsize=CACHE_MAXSIZE, ttl=CACHE_TTL)
+CACHES: List[str] = [
+    "get_adapters",
+    "get_cnx_labels",
+    "get_instances",
+    "get_sqs",
+    "get_asset_tags",
+    "get_asset_tags_expirable",
+]
+"""names of the cached methods of WizardParser, cached as 'wizard.<name>'."""
 
 
 class WizardParser:
@@ -525,32 +529,43 @@ class WizardParser:
         """Pass."""
         return self.apiobj.data_scopes.get(value=value).uuid
 
-    @cached(cache=CACHE_ADAPTERS)
+    def set_cache(self, method: str, value: Any):
+        """Store a value to return from a cached method of this parser until it expires.
+
+        Args:
+            method: name of cached method in :attr:`CACHES`
+            value: value to store
+        """
+        if method not in CACHES:
+            raise WizardError(f"Invalid cached method {method!r}, valid: {CACHES}")
+        get_manager(obj=self).set(name=f"wizard.{method}", key=hashkey(self), value=value)
+
+    @cached(name="wizard.get_adapters", maxsize=CACHE_MAXSIZE, ttl=CACHE_TTL)
     def get_adapters(self) -> List[dict]:
         """Get all known adapters."""
         return list(self.apiobj.adapters._get_basic().adapters.values())
 
-    @cached(cache=CACHE_CNX_LABELS)
+    @cached(name="wizard.get_cnx_labels", maxsize=CACHE_MAXSIZE, ttl=CACHE_TTL)
     def get_cnx_labels(self) -> List[dict]:
         """Get all known adapter connection labels."""
         return self.apiobj.adapters._get_labels().labels
 
-    @cached(cache=CACHE_INSTANCES)
+    @cached(name="wizard.get_instances", maxsize=CACHE_MAXSIZE, ttl=CACHE_TTL)
     def get_instances(self) -> List[object]:
         """Get all known instances/nodes."""
         return self.apiobj.instances._get()
 
-    @cached(cache=CACHE_SQS)
+    @cached(name="wizard.get_sqs", maxsize=CACHE_MAXSIZE, ttl=CACHE_TTL)
     def get_sqs(self) -> List[object]:
         """Get all Saved Query objects for this asset type."""
         return self.apiobj.saved_query.get(as_dataclass=True)
 
-    @cached(cache=CACHE_ASSET_LABELS)
+    @cached(name="wizard.get_asset_tags", maxsize=CACHE_MAXSIZE, ttl=CACHE_TTL)
     def get_asset_tags(self) -> List[str]:
         """Get all known tags (labels) of this asset type."""
         return self.apiobj.labels.get()
 
-    @cached(cache=CACHE_ASSET_LABELS_EXPIRABLE)
+    @cached(name="wizard.get_asset_tags_expirable", maxsize=CACHE_MAXSIZE, ttl=CACHE_TTL)
     def get_asset_tags_expirable(self) -> List[str]:
         """Get all known expirable tags (labels) of this asset type."""
         return self.apiobj.labels.get_expirable_names()
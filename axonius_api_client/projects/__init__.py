@@ -1,5 +1,20 @@
+# -*- coding: utf-8 -*-
 """Projects that are their own python modules."""
-
-from . import cert_human, cf_token, url_parser
+import importlib
+import typing as t
 
 __all__ = ("cert_human", "cf_token", "url_parser")
+
+
+def __getattr__(name: str) -> t.Any:
+    """Import projects on first access (PEP 562)."""
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = importlib.import_module(f".{name}", __name__)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> t.List[str]:
+    """Get the attributes of this package, including the projects imported on first access."""
+    return sorted({*globals(), *__all__})
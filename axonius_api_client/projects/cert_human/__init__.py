@@ -1,9 +1,11 @@
 # -*- coding: utf-8 -*-
 """Tools for working with SSL certificate files."""
 
+import importlib
+import typing as t
+
 from . import (
     constants,
-    ct_logs,
     enums,
     exceptions,
     paths,
@@ -16,6 +18,16 @@ from . import (
 )
 from .stores import Cert, CertRequest, Store
 
+
+def __getattr__(name: str) -> t.Any:
+    """Import :mod:`ct_logs` and the large list of CT logs it loads on first access (PEP 562)."""
+    if name != "ct_logs":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = importlib.import_module(f".{name}", __name__)
+    globals()[name] = value
+    return value
+
+
 __all__ = (
     "Store",
     "Cert",
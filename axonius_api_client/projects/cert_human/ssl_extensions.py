@@ -8,7 +8,6 @@ from typing import Any, Generator, List, Optional, Tuple
 
 import asn1crypto.x509
 
-from .ct_logs import load_ct_logs
 from .enums import HashAlgorithms, SctVersions, SignatureAlgorithms
 from .utils import (
     b64_to_hex,
@@ -359,6 +358,8 @@ class SctParser:
     @property
     def log_operator(self) -> dict:
         """Pass."""
+        from .ct_logs import load_ct_logs
+
         lookup = self.log_key_id_base64
         data = load_ct_logs()
         operators: List[dict] = data["operators"]
@@ -92,6 +92,75 @@ KEY_USER_AGENT: str = f"{KEY_PRE}USER_AGENT"
 KEY_CREDENTIALS = f"{KEY_PRE}CREDENTIALS"
 DEFAULT_CREDENTIALS: str = "no"
 
+KEY_POOL_CONNECTIONS: str = f"{KEY_PRE}POOL_CONNECTIONS"
+"""OS env to get the number of connection pools to cache from"""
+
+KEY_POOL_MAXSIZE: str = f"{KEY_PRE}POOL_MAXSIZE"
+"""OS env to get the max number of connections to keep open in each pool from"""
+
+KEY_POOL_BLOCK: str = f"{KEY_PRE}POOL_BLOCK"
+"""OS env to get the block when no free connections are available bool from"""
+
+KEY_TCP_KEEPALIVE: str = f"{KEY_PRE}TCP_KEEPALIVE"
+"""OS env to get the enable TCP keepalive bool from"""
+
+KEY_TCP_KEEPALIVE_IDLE: str = f"{KEY_PRE}TCP_KEEPALIVE_IDLE"
+"""OS env to get the TCP keepalive idle seconds from"""
+
+KEY_TCP_KEEPALIVE_INTERVAL: str = f"{KEY_PRE}TCP_KEEPALIVE_INTERVAL"
+"""OS env to get the TCP keepalive interval seconds from"""
+
+KEY_TCP_KEEPALIVE_COUNT: str = f"{KEY_PRE}TCP_KEEPALIVE_COUNT"
+"""OS env to get the TCP keepalive probe count from"""
+
+KEY_TLS_SESSION_REUSE: str = f"{KEY_PRE}TLS_SESSION_REUSE"
+"""OS env to get the resume TLS sessions bool from"""
+
+KEY_JSON_CODEC: str = f"{KEY_PRE}JSON_CODEC"
+"""OS env to get the name of the JSON codec to use from"""
+
+KEY_FIELDS_CACHE: str = f"{KEY_PRE}FIELDS_CACHE"
+"""OS env to get the enable persistent field schema cache bool from"""
+
+KEY_FIELDS_CACHE_PATH: str = f"{KEY_PRE}FIELDS_CACHE_PATH"
+"""OS env to get the directory of the persistent field schema cache from"""
+
+KEY_FIELDS_CACHE_TTL: str = f"{KEY_PRE}FIELDS_CACHE_TTL"
+"""OS env to get the seconds entries of the persistent field schema cache are fresh for from"""
+
+DEFAULT_POOL_CONNECTIONS: str = "10"
+"""Default for :attr:`KEY_POOL_CONNECTIONS`"""
+
+DEFAULT_POOL_MAXSIZE: str = "10"
+"""Default for :attr:`KEY_POOL_MAXSIZE`"""
+
+DEFAULT_POOL_BLOCK: str = "no"
+"""Default for :attr:`KEY_POOL_BLOCK`"""
+
+DEFAULT_TCP_KEEPALIVE: str = "no"
+"""Default for :attr:`KEY_TCP_KEEPALIVE`"""
+
+DEFAULT_TCP_KEEPALIVE_IDLE: str = "60"
+"""Default for :attr:`KEY_TCP_KEEPALIVE_IDLE`"""
+
+DEFAULT_TCP_KEEPALIVE_INTERVAL: str = "15"
+"""Default for :attr:`KEY_TCP_KEEPALIVE_INTERVAL`"""
+
+DEFAULT_TCP_KEEPALIVE_COUNT: str = "4"
+"""Default for :attr:`KEY_TCP_KEEPALIVE_COUNT`"""
+
+DEFAULT_TLS_SESSION_REUSE: str = "no"
+"""Default for :attr:`KEY_TLS_SESSION_REUSE`"""
+
+DEFAULT_JSON_CODEC: str = "auto"
+"""Default for :attr:`KEY_JSON_CODEC`"""
+
+DEFAULT_FIELDS_CACHE: str = "no"
+"""Default for :attr:`KEY_FIELDS_CACHE`"""
+
+DEFAULT_FIELDS_CACHE_TTL: str = "86400"
+"""Default for :attr:`KEY_FIELDS_CACHE_TTL`"""
+
 DEFAULT_DEBUG: str = "no"
 """Default for :attr:`KEY_DEBUG`"""
 
@@ -197,6 +266,69 @@ CONNECT_SCHEMAS: dict = {
             "cloudflared binary in cf_path"
         ),
     },
+    "pool_connections": {
+        "env": KEY_POOL_CONNECTIONS,
+        "arg": "pool_connections",
+        "default": DEFAULT_POOL_CONNECTIONS,
+        "type": "integer",
+        "description": "Number of connection pools to cache",
+    },
+    "pool_maxsize": {
+        "env": KEY_POOL_MAXSIZE,
+        "arg": "pool_maxsize",
+        "default": DEFAULT_POOL_MAXSIZE,
+        "type": "integer",
+        "description": "Max number of connections to keep open in each connection pool",
+    },
+    "pool_block": {
+        "env": KEY_POOL_BLOCK,
+        "arg": "pool_block",
+        "default": DEFAULT_POOL_BLOCK,
+        "type": "boolean",
+        "description": "Block when no free connections are available in a connection pool",
+    },
+    "tcp_keepalive": {
+        "env": KEY_TCP_KEEPALIVE,
+        "arg": "tcp_keepalive",
+        "default": DEFAULT_TCP_KEEPALIVE,
+        "type": "boolean",
+        "description": "Enable TCP keepalive on new connections",
+    },
+    "tcp_keepalive_idle": {
+        "env": KEY_TCP_KEEPALIVE_IDLE,
+        "arg": "tcp_keepalive_idle",
+        "default": DEFAULT_TCP_KEEPALIVE_IDLE,
+        "type": "integer",
+        "description": "Seconds a connection must be idle before TCP keepalive probes are sent",
+    },
+    "tcp_keepalive_interval": {
+        "env": KEY_TCP_KEEPALIVE_INTERVAL,
+        "arg": "tcp_keepalive_interval",
+        "default": DEFAULT_TCP_KEEPALIVE_INTERVAL,
+        "type": "integer",
+        "description": "Seconds between TCP keepalive probes",
+    },
+    "tcp_keepalive_count": {
+        "env": KEY_TCP_KEEPALIVE_COUNT,
+        "arg": "tcp_keepalive_count",
+        "default": DEFAULT_TCP_KEEPALIVE_COUNT,
+        "type": "integer",
+        "description": "Number of failed TCP keepalive probes before a connection is dropped",
+    },
+    "tls_session_reuse": {
+        "env": KEY_TLS_SESSION_REUSE,
+        "arg": "tls_session_reuse",
+        "default": DEFAULT_TLS_SESSION_REUSE,
+        "type": "boolean",
+        "description": "Resume TLS sessions for new connections in the same pool",
+    },
+    "json_codec": {
+        "env": KEY_JSON_CODEC,
+        "arg": "json_codec",
+        "default": DEFAULT_JSON_CODEC,
+        "type": "string",
+        "description": "JSON codec to use: 'auto', 'json', or 'orjson'",
+    },
 }
 # TBD convert to click options (need to refactor cli/__init__.py to do this properly)
 
@@ -535,6 +667,25 @@ def get_env_bool(key: str, default: t.Any = None, description: t.Optional[str] =
     raise ValueError("\n".join(msg))
 
 
+def get_env_int(key: str, default: t.Any = None, description: t.Optional[str] = None) -> int:
+    """Get an OS env var and convert it to an integer.
+
+    Args:
+        key: OS env key
+        default: default to use if not found
+        description: description of env var for error message
+
+    Raises:
+        :exc:`ValueError`: OS env var value is not an integer
+    """
+    value = get_env_str(key=key, default=default, description=description)
+    try:
+        return int(value)
+    except (TypeError, ValueError) as err:
+        msg = f"Supplied value {value!r} for OS environment variable {key!r} must be an integer"
+        raise ValueError(msg) from err
+
+
 def get_env_extra_warn(
     ax_env: t.Optional[t.Union[str, bytes, pathlib.Path]] = None,
     **kwargs,
@@ -602,6 +753,62 @@ def get_env_user_agent(
     return get_env_str(key=KEY_USER_AGENT, default="", empty_ok=True)
 
 
+def get_env_json_codec(
+    ax_env: t.Optional[t.Union[str, bytes, pathlib.Path]] = None,
+    **kwargs: t.Any,
+) -> str:
+    """Get AX_JSON_CODEC from OS env vars.
+
+    Args:
+        ax_env: path to .env file to load, if not supplied will find a '.env'
+        **kwargs: passed to :func:`load_dotenv`
+    """
+    load_dotenv(ax_env=ax_env, **kwargs)
+    return get_env_str(key=KEY_JSON_CODEC, default=DEFAULT_JSON_CODEC, lower=True)
+
+
+def get_env_fields_cache(
+    ax_env: t.Optional[t.Union[str, bytes, pathlib.Path]] = None,
+    **kwargs: t.Any,
+) -> bool:
+    """Get AX_FIELDS_CACHE from OS env vars.
+
+    Args:
+        ax_env: path to .env file to load, if not supplied will find a '.env'
+        **kwargs: passed to :func:`load_dotenv`
+    """
+    load_dotenv(ax_env=ax_env, **kwargs)
+    return get_env_bool(key=KEY_FIELDS_CACHE, default=DEFAULT_FIELDS_CACHE)
+
+
+def get_env_fields_cache_path(
+    ax_env: t.Optional[t.Union[str, bytes, pathlib.Path]] = None,
+    **kwargs: t.Any,
+) -> t.Union[pathlib.Path, str]:
+    """Get AX_FIELDS_CACHE_PATH from OS env vars.
+
+    Args:
+        ax_env: path to .env file to load, if not supplied will find a '.env'
+        **kwargs: passed to :func:`load_dotenv`
+    """
+    load_dotenv(ax_env=ax_env, **kwargs)
+    return get_env_path(key=KEY_FIELDS_CACHE_PATH, default="", get_dir=False)
+
+
+def get_env_fields_cache_ttl(
+    ax_env: t.Optional[t.Union[str, bytes, pathlib.Path]] = None,
+    **kwargs: t.Any,
+) -> int:
+    """Get AX_FIELDS_CACHE_TTL from OS env vars.
+
+    Args:
+        ax_env: path to .env file to load, if not supplied will find a '.env'
+        **kwargs: passed to :func:`load_dotenv`
+    """
+    load_dotenv(ax_env=ax_env, **kwargs)
+    return get_env_int(key=KEY_FIELDS_CACHE_TTL, default=DEFAULT_FIELDS_CACHE_TTL)
+
+
 def load_schema(schema: dict, kwargs: t.Optional[dict] = None) -> t.Any:
     """Load a schema from an OS env var."""
     kwargs = {} if not isinstance(kwargs, dict) else kwargs
@@ -615,6 +822,9 @@ def load_schema(schema: dict, kwargs: t.Optional[dict] = None) -> t.Any:
     if schema_type == "boolean":
         return get_env_bool(key=env_key, default=default, description=description)
 
+    if schema_type == "integer":
+        return get_env_int(key=env_key, default=default, description=description)
+
     return get_env_str(
         key=env_key,
         default=default,
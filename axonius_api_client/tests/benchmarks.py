@@ -0,0 +1,353 @@
+# -*- coding: utf-8 -*-
+"""Offline benchmarks for the asset fetch path using :obj:`FakeApi`.
+
+Examples:
+    Benchmark every export format against 20,000 synthetic devices
+
+    $ python -m axonius_api_client.tests.benchmarks --rows 20000
+
+    Benchmark the csv and json exports with 3 workers and 10ms of latency per request
+
+    $ python -m axonius_api_client.tests.benchmarks -e csv -e json --workers 3 --latency 0.01
+
+    Benchmark the time it takes to import the package, the API client, and the CLI
+
+    $ python -m axonius_api_client.tests.benchmarks --imports
+
+Notes:
+    Each export format is run in its own spawned process so that the peak RSS reported for
+    a format is not inflated by the formats that ran before it.
+"""
+import argparse
+import concurrent.futures
+import importlib.util
+import json
+import multiprocessing
+import pathlib
+import subprocess
+import sys
+import tempfile
+import time
+import typing as t
+
+import click
+
+from .fake_api import FakeApi
+
+FLATTEN: t.List[str] = ["csv", "json_to_csv", "table", "xlsx"]
+"""Export formats that are run with complex fields flattened."""
+
+REQUIRES: t.Dict[str, str] = {"parquet": "pyarrow", "arrow": "pyarrow"}
+"""Export formats that require an optional package and the name of the package."""
+
+COLUMNS: t.List[t.Tuple[str, str]] = [
+    ("export", "{}"),
+    ("rows", "{}"),
+    ("rows_per_second", "{:.1f}"),
+    ("peak_rss_mb", "{:.1f}"),
+    ("connect_seconds", "{:.3f}"),
+    ("get_seconds", "{:.3f}"),
+    ("fetch_seconds", "{:.3f}"),
+    ("process_seconds", "{:.3f}"),
+    ("other_seconds", "{:.3f}"),
+]
+"""Columns of the report table and how to format them."""
+
+IMPORTS: t.Dict[str, str] = {
+    "package": "import axonius_api_client",
+    "connect": "from axonius_api_client import Connect",
+    "cli": "from axonius_api_client.cli import cli",
+    "cli_command": "from axonius_api_client.cli import cli; cli.get_command(None, 'devices')",
+}
+"""Statements timed by :func:`run_import` and the names to report them as."""
+
+IMPORT_COLUMNS: t.List[t.Tuple[str, str]] = [
+    ("import", "{}"),
+    ("seconds", "{:.3f}"),
+    ("modules", "{}"),
+    ("package_modules", "{}"),
+]
+"""Columns of the report table of :func:`run_import_benchmarks` and how to format them."""
+
+IMPORT_CODE: str = """
+import json, sys, time
+start = time.perf_counter()
+{code}
+seconds = time.perf_counter() - start
+package = [x for x in sys.modules if x.split(".")[0] == "axonius_api_client"]
+print(json.dumps([seconds, len(sys.modules), len(package)]))
+"""
+"""Code run in a new interpreter by :func:`run_import` to time a statement."""
+
+
+def get_peak_rss_mb() -> t.Optional[float]:
+    """Get the peak resident set size of this process in megabytes, if supported."""
+    try:
+        import resource
+    except ImportError:  # pragma: no cover
+        return None
+
+    peak: int = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and kilobytes everywhere else
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def get_export_names() -> t.List[str]:
+    """Get the names of all export formats that have their optional packages installed."""
+    from ..api.asset_callbacks import CB_MAP
+
+    return [x for x in CB_MAP if x not in REQUIRES or importlib.util.find_spec(REQUIRES[x])]
+
+
+def run_export(
+    url: str,
+    key: str,
+    secret: str,
+    export: str,
+    asset_type: str = "devices",
+    export_path: t.Optional[str] = None,
+    **kwargs,
+) -> dict:
+    """Fetch all assets of an asset type using an export format and time each stage.
+
+    Args:
+        url: URL of the server to fetch assets from
+        key: API key
+        secret: API secret
+        export: export format to use
+        asset_type: asset type to fetch
+        export_path: directory to write export files to
+        **kwargs: passed to :meth:`axonius_api_client.api.assets.asset_mixin.AssetMixin.get`
+    """
+    from ..connect import Connect
+
+    kwargs.setdefault("field_flatten", export in FLATTEN)
+    if export == "table":
+        # the table export stops fetching after TABLE_MAX_ROWS rows by default
+        kwargs.setdefault("table_max_rows", 0)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        start: float = time.monotonic()
+        client: Connect = Connect(
+            url=url,
+            key=key,
+            secret=secret,
+            certwarn=False,
+            cf_token=None,
+            cf_run=False,
+            cf_env=False,
+        )
+        client.start()
+        apiobj = getattr(client, asset_type)
+        connect_seconds: float = time.monotonic() - start
+
+        start: float = time.monotonic()
+        apiobj.get(
+            export=export,
+            export_file=f"benchmark.{export}",
+            export_path=export_path or tmpdir,
+            export_overwrite=True,
+            **kwargs,
+        )
+        get_seconds: float = time.monotonic() - start
+        state: dict = apiobj.LAST_CALLBACKS.STATE
+
+    rows: int = state.get("rows_processed_total", 0) or 0
+    fetch_seconds: float = state.get("fetch_seconds_total", 0) or 0
+    process_seconds: float = state.get("process_seconds_total", 0) or 0
+    return {
+        "export": export,
+        "rows": rows,
+        "rows_per_second": rows / get_seconds if get_seconds else 0,
+        "peak_rss_mb": get_peak_rss_mb(),
+        "connect_seconds": connect_seconds,
+        "get_seconds": get_seconds,
+        "fetch_seconds": fetch_seconds,
+        "process_seconds": process_seconds,
+        "other_seconds": max(get_seconds - fetch_seconds - process_seconds, 0),
+    }
+
+
+def run_benchmarks(
+    exports: t.Optional[t.List[str]] = None,
+    spawn: bool = True,
+    server: t.Optional[FakeApi] = None,
+    get_args: t.Optional[dict] = None,
+    **kwargs,
+) -> t.List[dict]:
+    """Run :func:`run_export` for each export format against a :obj:`FakeApi`.
+
+    Args:
+        exports: export formats to benchmark, all if not supplied
+        spawn: run each export format in a new process
+        server: server to use, will be created using kwargs if not supplied
+        get_args: passed to :func:`run_export`
+        **kwargs: passed to :obj:`FakeApi` if server is not supplied
+    """
+    exports: t.List[str] = exports or get_export_names()
+    get_args: dict = get_args or {}
+    own_server: bool = not isinstance(server, FakeApi)
+    server: FakeApi = FakeApi(**kwargs) if own_server else server
+    server.start()
+    args: dict = {"url": server.url, "key": server.KEY, "secret": server.SECRET, **get_args}
+
+    results: t.List[dict] = []
+    try:
+        for export in exports:
+            if spawn:
+                context = multiprocessing.get_context("spawn")
+                with concurrent.futures.ProcessPoolExecutor(
+                    max_workers=1, mp_context=context
+                ) as executor:
+                    result: dict = executor.submit(run_export, export=export, **args).result()
+            else:
+                result: dict = run_export(export=export, **args)
+            results.append(result)
+    finally:
+        if own_server:
+            server.stop()
+    return results
+
+
+def run_import(name: str, code: str, repeat: int = 3) -> dict:
+    """Time a statement that imports from this package in new interpreters.
+
+    Args:
+        name: name to report the statement as
+        code: statement to time
+        repeat: number of interpreters to time the statement in, the fastest is reported
+
+    Notes:
+        Each interpreter is new so that no modules are already imported, and the fastest run
+        is reported to reduce the noise from the OS.
+    """
+    runs: t.List[list] = []
+    for _ in range(max(repeat, 1)):
+        proc = subprocess.run(
+            [sys.executable, "-c", IMPORT_CODE.format(code=code)],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        runs.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+    seconds, modules, package_modules = min(runs)
+    return {
+        "import": name,
+        "seconds": seconds,
+        "modules": modules,
+        "package_modules": package_modules,
+    }
+
+
+def run_import_benchmarks(
+    imports: t.Optional[t.Dict[str, str]] = None, repeat: int = 3
+) -> t.List[dict]:
+    """Run :func:`run_import` for each statement.
+
+    Args:
+        imports: names and statements to time, :attr:`IMPORTS` if not supplied
+        repeat: passed to :func:`run_import`
+    """
+    imports: t.Dict[str, str] = imports or IMPORTS
+    return [run_import(name=k, code=v, repeat=repeat) for k, v in imports.items()]
+
+
+def format_results(
+    results: t.List[dict], columns: t.Optional[t.List[t.Tuple[str, str]]] = None
+) -> str:
+    """Format the results of :func:`run_benchmarks` as a table.
+
+    Args:
+        results: results to format
+        columns: columns to show and how to format them, :attr:`COLUMNS` if not supplied
+    """
+    columns: t.List[t.Tuple[str, str]] = columns or COLUMNS
+    rows: t.List[t.List[str]] = [[x for x, _ in columns]]
+    for result in results:
+        rows.append([fmt.format(result[k]) if result[k] is not None else "" for k, fmt in columns])
+    widths: t.List[int] = [max(len(row[idx]) for row in rows) for idx in range(len(columns))]
+    lines: t.List[str] = ["  ".join(v.rjust(w) for v, w in zip(row, widths)) for row in rows]
+    lines.insert(1, "  ".join("-" * w for w in widths))
+    return "\n".join(lines)
+
+
+def get_parser() -> argparse.ArgumentParser:
+    """Get the argument parser for :func:`main`."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "-e",
+        "--export",
+        dest="exports",
+        action="append",
+        choices=get_export_names(),
+        help="Export format to benchmark (multiple, default: all)",
+    )
+    parser.add_argument("--asset-type", default="devices", help="Asset type to fetch")
+    parser.add_argument("--rows", type=int, default=10000, help="Number of synthetic assets")
+    parser.add_argument("--extra-fields", type=int, default=0, help="Extra fields per asset")
+    parser.add_argument(
+        "--extra-field-size", type=int, default=16, help="Characters per extra field value"
+    )
+    parser.add_argument("--list-size", type=int, default=2, help="Items in list fields")
+    parser.add_argument("--latency", type=float, default=0, help="Seconds of latency/request")
+    parser.add_argument("--error-rate", type=float, default=0, help="Chance of an error/request")
+    parser.add_argument("--page-size", type=int, default=None, help="Rows per page")
+    parser.add_argument("--workers", type=int, default=None, help="Pages to fetch at once")
+    parser.add_argument("--prefetch", type=int, default=None, help="Pages to fetch ahead")
+    parser.add_argument(
+        "--no-spawn",
+        dest="spawn",
+        action="store_false",
+        help="Run every export in this process (peak RSS will be cumulative)",
+    )
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("--export-path", default=None, help="Keep export files in this directory")
+    parser.add_argument(
+        "--imports",
+        action="store_true",
+        help="Benchmark the time it takes to import the package instead of the exports",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Interpreters to time each import in")
+    return parser
+
+
+def main(args: t.Optional[t.List[str]] = None) -> t.List[dict]:
+    """Run the benchmarks from the command line.
+
+    Args:
+        args: command line arguments, sys.argv if not supplied
+    """
+    opts: argparse.Namespace = get_parser().parse_args(args)
+    if opts.imports:
+        results: t.List[dict] = run_import_benchmarks(repeat=opts.repeat)
+        click.secho(
+            json.dumps(results, indent=2)
+            if opts.json
+            else format_results(results, columns=IMPORT_COLUMNS)
+        )
+        return results
+
+    get_args: dict = {"asset_type": opts.asset_type}
+    for key in ["page_size", "workers", "prefetch", "export_path"]:
+        value: t.Any = getattr(opts, key)
+        if value is not None:
+            get_args[key] = value
+    if opts.export_path:
+        pathlib.Path(opts.export_path).mkdir(parents=True, exist_ok=True)
+
+    results: t.List[dict] = run_benchmarks(
+        exports=opts.exports,
+        spawn=opts.spawn,
+        get_args=get_args,
+        rows=opts.rows,
+        extra_fields=opts.extra_fields,
+        extra_field_size=opts.extra_field_size,
+        list_size=opts.list_size,
+        latency=opts.latency,
+        error_rate=opts.error_rate,
+    )
+    click.secho(json.dumps(results, indent=2) if opts.json else format_results(results))
+    return results
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
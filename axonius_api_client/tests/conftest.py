@@ -7,6 +7,7 @@ import pytest
 from axonius_api_client.tools import coerce_bool
 from axonius_api_client.http import Http
 
+from .fake_api import FakeApi
 from .meta import CSV_FILECONTENT_STR, CSV_FILENAME, USER_NAME
 from .utils import (
     check_apiobj_children,
@@ -127,6 +128,13 @@ def load_asset_api(obj):
     return obj
 
 
+@pytest.fixture(scope="module")
+def fake_api():
+    """Fake Axonius API server with generated assets, see :obj:`fake_api.FakeApi`."""
+    with FakeApi(rows=25) as server:
+        yield server
+
+
 @pytest.fixture(scope="session")
 def api_client(request):
     """Test utility."""
@@ -0,0 +1,853 @@
+# -*- coding: utf-8 -*-
+"""Local stand-in for the Axonius REST API, used for offline tests and benchmarks.
+
+Examples:
+    Serve 10,000 synthetic devices with 20ms of latency per request
+
+    >>> from axonius_api_client.tests.fake_api import FakeApi
+    >>> with FakeApi(rows=10000, latency=0.02) as server:
+    ...     client = server.get_connect()
+    ...     assets = client.devices.get()
+
+Notes:
+    Only the routes used by the asset fetch path are implemented: connect/validate,
+    asset pages (offset and cursor based), count, fields metadata, history dates,
+    saved queries, adapters, and labels. Unknown routes return a JSON:API 404.
+"""
+import datetime
+import hashlib
+import http.server
+import json
+import random
+import re
+import threading
+import time
+import typing as t
+import urllib.parse
+import uuid
+
+ADAPTERS: t.List[str] = [
+    "active_directory_adapter",
+    "aws_adapter",
+    "crowd_strike_adapter",
+    "tanium_adapter",
+    "vmware_esx_adapter",
+]
+"""Default adapters that synthetic assets are seen by."""
+
+ASSET_TYPES: t.List[str] = ["devices", "users", "vulnerabilities"]
+"""Asset types that can be fetched."""
+
+SCHEMAS: t.Dict[str, t.List[dict]] = {
+    "devices": [
+        {"name": "hostname", "title": "Host Name", "type": "string"},
+        {"name": "name", "title": "Asset Name", "type": "string"},
+        {"name": "last_seen", "title": "Last Seen", "type": "string", "format": "date-time"},
+        {
+            "name": "network_interfaces",
+            "title": "Network Interfaces",
+            "type": "array",
+            "items": {
+                "type": "array",
+                "items": [
+                    {"name": "mac", "title": "MAC", "type": "string"},
+                    {
+                        "name": "ips",
+                        "title": "IPs",
+                        "type": "array",
+                        "format": "ip",
+                        "items": {"type": "string", "format": "ip"},
+                    },
+                ],
+            },
+        },
+        {
+            "name": "network_interfaces.mac",
+            "title": "Network Interfaces: MAC",
+            "type": "array",
+            "items": {"type": "string"},
+        },
+        {
+            "name": "network_interfaces.ips",
+            "title": "Network Interfaces: IPs",
+            "type": "array",
+            "format": "ip",
+            "items": {"type": "string", "format": "ip"},
+        },
+        {"name": "os.type", "title": "OS: Type", "type": "string"},
+    ],
+    "users": [
+        {"name": "username", "title": "User Name", "type": "string"},
+        {"name": "domain", "title": "Domain", "type": "string"},
+        {"name": "mail", "title": "Mail", "type": "string"},
+        {"name": "is_admin", "title": "Is Admin", "type": "bool"},
+        {"name": "last_seen", "title": "Last Seen", "type": "string", "format": "date-time"},
+    ],
+    "vulnerabilities": [
+        {"name": "cve_id", "title": "CVE ID", "type": "string"},
+        {"name": "cve_severity", "title": "CVE Severity", "type": "string"},
+        {"name": "last_seen", "title": "Last Seen", "type": "string", "format": "date-time"},
+    ],
+}
+"""Aggregated field schemas for each asset type, names are relative to specific_data.data."""
+
+PREFIX: str = "specific_data.data"
+"""Prefix for aggregated field names."""
+
+LAST_SEEN: datetime.datetime = datetime.datetime(2023, 1, 1, tzinfo=datetime.timezone.utc)
+"""Last seen date of the first synthetic asset, each asset after is a minute later."""
+
+
+def get_axon_id(asset_type: str, index: int) -> str:
+    """Get a stable 32 character internal_axon_id for a synthetic asset."""
+    return hashlib.md5(f"{asset_type}:{index}".encode()).hexdigest()
+
+
+class FakeData:
+    """Synthetic asset documents, field schemas, saved queries, adapters, and labels."""
+
+    def __init__(
+        self,
+        rows: int = 1000,
+        adapters: t.Optional[t.List[str]] = None,
+        extra_fields: int = 0,
+        extra_field_size: int = 16,
+        list_size: int = 2,
+        seed: int = 0,
+    ):
+        """Synthetic asset documents, field schemas, saved queries, adapters, and labels.
+
+        Args:
+            rows: number of assets of each asset type
+            adapters: adapters that assets are seen by
+            extra_fields: number of extra string fields to add to every asset
+            extra_field_size: number of characters in each extra field value
+            list_size: number of items in list fields, i.e. network interfaces
+            seed: seed for random values, the same seed will always produce the same assets
+        """
+        self.rows: int = rows
+        self.adapters: t.List[str] = list(adapters or ADAPTERS)
+        self.extra_fields: int = extra_fields
+        self.extra_field_size: int = extra_field_size
+        self.list_size: int = list_size
+        self.seed: int = seed
+        self.lock: threading.Lock = threading.Lock()
+        self.labels: t.Dict[str, t.Dict[str, t.Set[str]]] = {x: {} for x in ASSET_TYPES}
+        self.saved_queries: t.Dict[str, dict] = {}
+        for asset_type in ASSET_TYPES:
+            self.add_saved_query(
+                asset_type=asset_type, name=f"All {asset_type}", query="", predefined=True
+            )
+
+    def get_schemas(self, asset_type: str) -> t.List[dict]:
+        """Get the aggregated field schemas for an asset type."""
+        schemas = [
+            {
+                "name": "adapters",
+                "title": "Adapters",
+                "type": "array",
+                "format": "discrete",
+                "items": {"type": "string", "format": "logo", "enum": []},
+            },
+            {"name": "internal_axon_id", "title": "Asset Unique ID", "type": "string"},
+            {
+                "name": "labels",
+                "title": "Tags",
+                "type": "array",
+                "items": {"type": "string", "format": "tag"},
+            },
+            {"name": "adapter_list_length", "title": "Distinct Adapter Count", "type": "integer"},
+        ]
+        for schema in SCHEMAS[asset_type] + self.get_extra_schemas():
+            schema = json.loads(json.dumps(schema))
+            schema["name"] = f"{PREFIX}.{schema['name']}"
+            schemas.append(schema)
+        return schemas
+
+    def get_extra_schemas(self) -> t.List[dict]:
+        """Get the field schemas for extra fields."""
+        return [
+            {"name": f"extra_{x}", "title": f"Extra {x}", "type": "string"}
+            for x in range(self.extra_fields)
+        ]
+
+    def get_fields(self, asset_type: str) -> dict:
+        """Get the fields metadata returned by api/{asset_type}/fields."""
+        generic = self.get_schemas(asset_type=asset_type)
+        specific = {}
+        for adapter in self.adapters:
+            fields = []
+            for schema in SCHEMAS[asset_type] + self.get_extra_schemas():
+                schema = json.loads(json.dumps(schema))
+                schema["name"] = f"adapters_data.{adapter}.{schema['name']}"
+                fields.append(schema)
+            specific[adapter] = fields
+        return {"generic": generic, "specific": specific}
+
+    def get_asset(self, asset_type: str, index: int) -> dict:
+        """Get the full document for a synthetic asset, keyed by fully qualified field names."""
+        rand = random.Random(f"{self.seed}:{asset_type}:{index}")
+        axon_id = get_axon_id(asset_type=asset_type, index=index)
+        adapters = sorted(rand.sample(self.adapters, k=rand.randint(1, len(self.adapters))))
+        last_seen = (LAST_SEEN + datetime.timedelta(minutes=index)).strftime(
+            "%a, %d %b %Y %H:%M:%S GMT"
+        )
+        with self.lock:
+            labels = sorted(self.labels[asset_type].get(axon_id, set()))
+
+        asset = {
+            "internal_axon_id": axon_id,
+            "adapters": adapters,
+            "adapter_list_length": len(adapters),
+            "labels": labels,
+            f"{PREFIX}.last_seen": last_seen,
+        }
+
+        if asset_type == "devices":
+            macs = [
+                ":".join(f"{rand.randint(0, 255):02x}" for _ in range(6))
+                for _ in range(self.list_size)
+            ]
+            ips = [f"10.{index % 256}.{x}.{rand.randint(1, 254)}" for x in range(self.list_size)]
+            asset.update(
+                {
+                    f"{PREFIX}.hostname": [f"host-{index}.example.com"],
+                    f"{PREFIX}.name": [f"host-{index}"],
+                    f"{PREFIX}.network_interfaces": [
+                        {"mac": mac, "ips": [ip]} for mac, ip in zip(macs, ips)
+                    ],
+                    f"{PREFIX}.network_interfaces.mac": macs,
+                    f"{PREFIX}.network_interfaces.ips": ips,
+                    f"{PREFIX}.os.type": [rand.choice(["Windows", "Linux", "OS X"])],
+                }
+            )
+        elif asset_type == "users":
+            asset.update(
+                {
+                    f"{PREFIX}.username": [f"user{index}"],
+                    f"{PREFIX}.domain": ["example.com"],
+                    f"{PREFIX}.mail": [f"user{index}@example.com"],
+                    f"{PREFIX}.is_admin": [index % 10 == 0],
+                }
+            )
+        else:
+            asset.update(
+                {
+                    f"{PREFIX}.cve_id": [f"CVE-2023-{index:05d}"],
+                    f"{PREFIX}.cve_severity": [rand.choice(["LOW", "MEDIUM", "HIGH"])],
+                }
+            )
+
+        for extra in range(self.extra_fields):
+            value = "".join(rand.choices("abcdefghijklmnopqrstuvwxyz", k=self.extra_field_size))
+            asset[f"{PREFIX}.extra_{extra}"] = [value]
+        return asset
+
+    def get_assets(
+        self, asset_type: str, offset: int, limit: int, fields: t.Optional[t.List[str]] = None
+    ) -> t.List[dict]:
+        """Get a page of synthetic assets, limited to fields if supplied."""
+        assets = []
+        for index in range(offset, min(offset + limit, self.rows)):
+            asset = self.get_asset(asset_type=asset_type, index=index)
+            if fields:
+                keep = set(fields) | {"internal_axon_id", "adapter_list_length"}
+                asset = {k: v for k, v in asset.items() if k in keep}
+            assets.append(asset)
+        return assets
+
+    def add_saved_query(
+        self, asset_type: str, name: str, query: str = "", predefined: bool = False, **kwargs
+    ) -> dict:
+        """Add a saved query."""
+        uuid = hashlib.md5(f"{asset_type}:{name}".encode()).hexdigest()[:24]
+        sq = {
+            "uuid": uuid,
+            "id": uuid,
+            "name": name,
+            "module": asset_type,
+            "predefined": predefined,
+            "private": False,
+            "tags": [],
+            "description": kwargs.get("description") or "",
+            "view": {
+                "query": {"filter": query, "expressions": [], "onlyExpressionsFilter": query},
+                "fields": kwargs.get("fields") or ["adapters", "internal_axon_id"],
+                "sort": {"desc": True, "field": ""},
+                "colFilters": {},
+                "colExcludedAdapters": {},
+                "pageSize": 20,
+            },
+            "updated_by": json.dumps({"user_name": "admin", "source": "internal"}),
+            "user_id": "0" * 24,
+            "last_updated": "2023-01-01T00:00:00+00:00",
+            "date_fetched": "2023-01-01T00:00:00+00:00",
+            "query_type": "saved",
+            "is_asset_scope_query_ready": False,
+            "is_referenced": False,
+            "used_in": [],
+        }
+        with self.lock:
+            self.saved_queries[uuid] = sq
+        return sq
+
+    def get_saved_queries(self, asset_type: t.Optional[str] = None) -> t.List[dict]:
+        """Get the saved queries for an asset type."""
+        with self.lock:
+            sqs = list(self.saved_queries.values())
+        return [x for x in sqs if asset_type is None or x["module"] == asset_type]
+
+    def get_adapters(self) -> t.List[dict]:
+        """Get the adapters returned by api/adapters."""
+        return [
+            {
+                "id": adapter,
+                "adapters_data": [
+                    {
+                        "node_id": "0" * 32,
+                        "node_name": "Primary",
+                        "plugin_name": adapter,
+                        "unique_plugin_name": f"{adapter}_0",
+                        "status": "success",
+                        "clients": [],
+                        "clients_count": {
+                            "total_count": 1,
+                            "error_count": 0,
+                            "success_count": 1,
+                            "inactive_count": 0,
+                            "warning_count": 0,
+                        },
+                        "supported_features": [],
+                        "is_master": True,
+                    }
+                ],
+            }
+            for adapter in self.adapters
+        ]
+
+    def get_adapters_list(self) -> t.List[dict]:
+        """Get the adapters returned by api/adapters/list."""
+        return [
+            {"name": adapter, "title": adapter.replace("_", " ").title(), "clients": [{}]}
+            for adapter in self.adapters
+        ]
+
+    @staticmethod
+    def get_instances() -> t.List[dict]:
+        """Get the instances returned by api/instances."""
+        return [
+            {
+                "hostname": "primary",
+                "node_id": "0" * 32,
+                "node_name": "Primary",
+                "node_user_password": "",
+                "status": "Activated",
+                "is_master": True,
+                "use_as_environment_name": False,
+                "ips": ["127.0.0.1"],
+                "tags": {},
+            }
+        ]
+
+    def modify_labels(
+        self, asset_type: str, ids: t.List[str], labels: t.List[str], add: bool
+    ) -> int:
+        """Add or remove labels from assets by internal_axon_id."""
+        with self.lock:
+            asset_labels = self.labels[asset_type]
+            for axon_id in ids:
+                current = asset_labels.setdefault(axon_id, set())
+                if add:
+                    current.update(labels)
+                else:
+                    current.difference_update(labels)
+        return len(ids)
+
+    def get_labels(self, asset_type: str) -> t.List[str]:
+        """Get all labels in use for an asset type."""
+        with self.lock:
+            return sorted(set().union(*self.labels[asset_type].values()))
+
+
+class FakeApiHandler(http.server.BaseHTTPRequestHandler):
+    """Handle requests to :obj:`FakeApi`."""
+
+    protocol_version: str = "HTTP/1.1"
+    server: "FakeApiHttpServer"
+
+    ROUTES: t.List[t.Tuple[str, str, str]] = [
+        ("GET", r"api/get_constants", "route_constants"),
+        ("GET", r"api/login", "route_current_user"),
+        ("GET", r"api/settings/meta/about", "route_about"),
+        ("GET", r"api/settings/metadata", "route_metadata"),
+        ("GET", r"api/dashboard/get_allowed_dates", "route_history_dates"),
+        ("GET", r"api/adapters", "route_adapters"),
+        ("GET", r"api/adapters/list", "route_adapters_list"),
+        ("GET", r"api/instances", "route_instances"),
+        ("GET", r"api/settings/plugins/gui/FeatureFlags", "route_feature_flags"),
+        ("GET", r"api/queries/saved", "route_saved_queries"),
+        ("GET", r"api/queries/saved/count", "route_saved_queries_count"),
+        ("POST", r"api/queries/(?P<asset_type>[a-z]+)", "route_saved_queries_create"),
+        ("GET", r"api/(?P<asset_type>[a-z]+)/fields", "route_fields"),
+        ("POST", r"api/(?P<asset_type>[a-z]+)/count", "route_count"),
+        ("GET", r"api/(?P<asset_type>[a-z]+)/labels", "route_labels_get"),
+        ("PUT", r"api/(?P<asset_type>[a-z]+)/labels", "route_labels_add"),
+        ("DELETE", r"api/(?P<asset_type>[a-z]+)/labels", "route_labels_remove"),
+        ("POST", r"api/(?P<asset_type>[a-z]+)", "route_assets"),
+    ]
+    """Method, path regex, and name of method to handle the route."""
+
+    def log_message(self, *args, **kwargs):
+        """Pass."""
+
+    def do_GET(self):
+        """Pass."""
+        self.handle_route(method="GET")
+
+    def do_POST(self):
+        """Pass."""
+        self.handle_route(method="POST")
+
+    def do_PUT(self):
+        """Pass."""
+        self.handle_route(method="PUT")
+
+    def do_DELETE(self):
+        """Pass."""
+        self.handle_route(method="DELETE")
+
+    def handle_route(self, method: str):
+        """Find the route for the request, inject latency and errors, and respond."""
+        server = self.server
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        path = self.path.split("?", 1)[0].strip("/")
+
+        keys = (self.headers.get("api-key"), self.headers.get("api-secret"))
+        if server.keys and keys != server.keys:
+            self.respond(status=401, body=self.errors(status=401, detail="Invalid credentials"))
+            return
+
+        server.count_request(path=path)
+        if server.latency:
+            time.sleep(server.get_latency())
+
+        error_status = server.get_error()
+        if error_status:
+            self.respond(
+                status=error_status,
+                body=self.errors(status=error_status, detail="Injected error"),
+                headers={"Retry-After": str(server.retry_after)},
+            )
+            return
+
+        for route_method, route_path, route_name in self.ROUTES:
+            match = re.fullmatch(route_path, path)
+            if route_method == method and match:
+                kwargs = match.groupdict()
+                if "asset_type" in kwargs and kwargs["asset_type"] not in ASSET_TYPES:
+                    continue
+                try:
+                    body = json.loads(raw) if raw else {}
+                except ValueError:
+                    body = {}
+                attrs = (body.get("data") or {}).get("attributes") or {}
+                status, data = getattr(self, route_name)(attrs=attrs, **kwargs)
+                self.respond(status=status, body=data)
+                return
+
+        self.respond(status=404, body=self.errors(status=404, detail=f"No route {method} {path}"))
+
+    def respond(self, status: int, body: t.Any, headers: t.Optional[dict] = None):
+        """Send a JSON response."""
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/vnd.api+json")
+        self.send_header("Content-Length", str(len(data)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    @staticmethod
+    def errors(status: int, detail: str) -> dict:
+        """Build a JSON:API error document."""
+        return {"errors": [{"status": str(status), "title": "Error", "detail": detail}]}
+
+    @staticmethod
+    def resource(type_: str, attributes: dict, id_: t.Optional[str] = None) -> dict:
+        """Build a JSON:API resource object."""
+        resource = {"type": type_, "attributes": attributes}
+        if id_ is not None:
+            resource["id"] = id_
+        return resource
+
+    @property
+    def data(self) -> FakeData:
+        """Pass."""
+        return self.server.data
+
+    def route_constants(self, **kwargs) -> t.Tuple[int, dict]:
+        """Pass."""
+        return 200, {"constants": {}}
+
+    def route_about(self, **kwargs) -> t.Tuple[int, dict]:
+        """Pass."""
+        attrs = {
+            "api_client_version": "4.0",
+            "Build Date": "2023-01-01",
+            "Customer Id": "0" * 32,
+            "Installed Version": "6.0.0",
+            "Contract Expiry Date": "",
+        }
+        return 200, {"data": self.resource(type_="about_schema", attributes=attrs)}
+
+    def route_metadata(self, **kwargs) -> t.Tuple[int, dict]:
+        """Pass."""
+        return 200, {"Installed Version": "6.0.0"}
+
+    def route_current_user(self, **kwargs) -> t.Tuple[int, dict]:
+        """Pass."""
+        attrs = {"user_name": "admin", "uuid": "0" * 24, "role_name": "Admin"}
+        return 200, {"data": self.resource(type_="current_user_schema", attributes=attrs)}
+
+    def route_history_dates(self, **kwargs) -> t.Tuple[int, dict]:
+        """Pass."""
+        dates = {"2023-01-01": "2023-01-01T00:00:00+00:00"}
+        attrs = {"value": {x: dates for x in ASSET_TYPES}}
+        return 200, {"data": self.resource(type_="dict_value_schema", attributes=attrs)}
+
+    def route_adapters(self, **kwargs) -> t.Tuple[int, dict]:
+        """Pass."""
+        data = [
+            self.resource(type_="adapters_schema", attributes=x, id_=x["id"])
+            for x in self.data.get_adapters()
+        ]
+        return 200, {"data": data, "meta": {"count": len(data)}}
+
+    def route_adapters_list(self, **kwargs) -> t.Tuple[int, dict]:
+        """Pass."""
+        return 200, {"data": None, "meta": {"adapter_list": self.data.get_adapters_list()}}
+
+    def route_instances(self, **kwargs) -> t.Tuple[int, dict]:
+        """Pass."""
+        data = [
+            self.resource(type_="instances_schema", attributes=x, id_=x["node_id"])
+            for x in self.data.get_instances()
+        ]
+        return 200, {"data": data}
+
+    def route_feature_flags(self, **kwargs) -> t.Tuple[int, dict]:
+        """Pass."""
+        attrs = {"config": {}, "config_name": "FeatureFlags", "pluginId": "gui"}
+        return 200, {"data": self.resource(type_="settings_schema", attributes=attrs)}
+
+    def get_query(self) -> t.Dict[str, str]:
+        """Get the query string parameters of the request."""
+        query = urllib.parse.urlsplit(self.path).query
+        return {k: v[-1] for k, v in urllib.parse.parse_qs(query).items()}
+
+    def route_saved_queries(self, **kwargs) -> t.Tuple[int, dict]:
+        """Pass."""
+        query = self.get_query()
+        offset = int(query.get("page[offset]") or 0)
+        limit = int(query.get("page[limit]") or 2000)
+        sqs = self.data.get_saved_queries()
+        match = re.search(r"module in \[\"([a-z]+)\"\]", query.get("filter") or "")
+        if match:
+            sqs = self.data.get_saved_queries(asset_type=match.group(1))
+        data = [
+            self.resource(type_="views_details_schema", attributes=x, id_=x["uuid"])
+            for x in sqs[offset : offset + limit]
+        ]
+        return 200, {"data": data, "meta": {"page": {"totalResources": len(sqs)}}}
+
+    def route_saved_queries_count(self, **kwargs) -> t.Tuple[int, dict]:
+        """Pass."""
+        count = len(self.data.get_saved_queries())
+        return 200, {"data": self.resource(type_="int_value_schema", attributes={"value": count})}
+
+    def route_saved_queries_create(self, attrs: dict, asset_type: str) -> t.Tuple[int, dict]:
+        """Pass."""
+        view = attrs.get("view") or {}
+        sq = self.data.add_saved_query(
+            asset_type=asset_type,
+            name=attrs.get("name") or "unnamed",
+            query=(view.get("query") or {}).get("filter") or "",
+            fields=view.get("fields"),
+            description=attrs.get("description"),
+        )
+        data = self.resource(type_="views_details_schema", attributes=sq, id_=sq["uuid"])
+        return 200, {"data": data}
+
+    def route_fields(self, asset_type: str, **kwargs) -> t.Tuple[int, dict]:
+        """Pass."""
+        return 200, {"data": None, "meta": self.data.get_fields(asset_type=asset_type)}
+
+    def route_count(self, asset_type: str, **kwargs) -> t.Tuple[int, dict]:
+        """Pass."""
+        attrs = {"value": self.data.rows}
+        return 200, {"data": self.resource(type_="int_value_schema", attributes=attrs)}
+
+    def route_labels_get(self, asset_type: str, **kwargs) -> t.Tuple[int, dict]:
+        """Pass."""
+        labels = self.data.get_labels(asset_type=asset_type)
+        return 200, {
+            "data": [
+                self.resource(type_="string_value_schema", attributes={"value": x}) for x in labels
+            ]
+        }
+
+    def _modify_labels(self, attrs: dict, asset_type: str, add: bool) -> t.Tuple[int, dict]:
+        entities = attrs.get("entities") or {}
+        ids = entities.get("ids") or []
+        count = self.data.modify_labels(
+            asset_type=asset_type, ids=ids, labels=attrs.get("labels") or [], add=add
+        )
+        return 200, {"data": self.resource(type_="int_value_schema", attributes={"value": count})}
+
+    def route_labels_add(self, attrs: dict, asset_type: str) -> t.Tuple[int, dict]:
+        """Pass."""
+        return self._modify_labels(attrs=attrs, asset_type=asset_type, add=True)
+
+    def route_labels_remove(self, attrs: dict, asset_type: str) -> t.Tuple[int, dict]:
+        """Pass."""
+        return self._modify_labels(attrs=attrs, asset_type=asset_type, add=False)
+
+    def route_assets(self, attrs: dict, asset_type: str) -> t.Tuple[int, dict]:
+        """Serve a page of assets using offset paging or cursors."""
+        page = attrs.get("page") or {}
+        limit = int(page.get("limit") or 2000)
+        offset = int(page.get("offset") or 0)
+        fields = (attrs.get("fields") or {}).get(asset_type)
+        meta = {}
+
+        if attrs.get("use_cursor"):
+            cursor_id = attrs.get("cursor_id")
+            if cursor_id:
+                offset = self.server.get_cursor(cursor_id=cursor_id)
+                if offset is None:
+                    return 400, self.errors(status=400, detail=f"Unknown cursor {cursor_id}")
+            else:
+                cursor_id = self.server.new_cursor()
+            self.server.set_cursor(cursor_id=cursor_id, offset=offset + limit)
+            meta["cursor"] = cursor_id
+
+        rows = self.data.rows
+        if attrs.get("get_metadata"):
+            meta["page"] = {
+                "number": (offset // limit) + 1 if limit else 1,
+                "size": limit,
+                "totalPages": -(-rows // limit) if limit else 1,
+                "totalResources": rows,
+            }
+
+        assets = self.data.get_assets(
+            asset_type=asset_type, offset=offset, limit=limit, fields=fields
+        )
+        data = [
+            self.resource(type_="assets_details_schema", attributes=x, id_=x["internal_axon_id"])
+            for x in assets
+        ]
+        return 200, {"data": data, "meta": meta}
+
+
+class FakeApiHttpServer(http.server.ThreadingHTTPServer):
+    """Threaded HTTP server holding the state for :obj:`FakeApiHandler`."""
+
+    daemon_threads: bool = True
+
+    def __init__(
+        self,
+        data: FakeData,
+        latency: float = 0,
+        latency_jitter: float = 0,
+        error_rate: float = 0,
+        error_status: int = 503,
+        error_every: int = 0,
+        retry_after: int = 0,
+        keys: t.Optional[t.Tuple[str, str]] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        """Threaded HTTP server holding the state for :obj:`FakeApiHandler`."""
+        super().__init__((host, port), FakeApiHandler)
+        self.data: FakeData = data
+        self.latency: float = latency
+        self.latency_jitter: float = latency_jitter
+        self.error_rate: float = error_rate
+        self.error_status: int = error_status
+        self.error_every: int = error_every
+        self.retry_after: int = retry_after
+        self.keys: t.Optional[t.Tuple[str, str]] = keys
+        self.lock: threading.Lock = threading.Lock()
+        self.cursors: t.Dict[str, int] = {}
+        self.requests: t.Dict[str, int] = {}
+        self.requests_total: int = 0
+        self.random: random.Random = random.Random(data.seed)
+
+    def count_request(self, path: str):
+        """Count a request to path."""
+        with self.lock:
+            self.requests_total += 1
+            self.requests[path] = self.requests.get(path, 0) + 1
+
+    def get_latency(self) -> float:
+        """Get the number of seconds to sleep before responding."""
+        with self.lock:
+            jitter = self.random.uniform(-self.latency_jitter, self.latency_jitter)
+        return max(self.latency + jitter, 0)
+
+    def get_error(self) -> t.Optional[int]:
+        """Get the status code of an error to inject, or None to respond normally."""
+        with self.lock:
+            if self.error_every and self.requests_total % self.error_every == 0:
+                return self.error_status
+            if self.error_rate and self.random.random() < self.error_rate:
+                return self.error_status
+        return None
+
+    def new_cursor(self) -> str:
+        """Create a new cursor ID."""
+        return uuid.uuid4().hex
+
+    def get_cursor(self, cursor_id: str) -> t.Optional[int]:
+        """Get the offset of the next page for a cursor."""
+        with self.lock:
+            return self.cursors.get(cursor_id)
+
+    def set_cursor(self, cursor_id: str, offset: int):
+        """Set the offset of the next page for a cursor."""
+        with self.lock:
+            self.cursors[cursor_id] = offset
+
+
+class FakeApi:
+    """Local stand-in for the Axonius REST API running in a background thread."""
+
+    KEY: str = "fake_key"
+    """API key accepted by the server."""
+
+    SECRET: str = "fake_secret"
+    """API secret accepted by the server."""
+
+    def __init__(
+        self,
+        rows: int = 1000,
+        adapters: t.Optional[t.List[str]] = None,
+        extra_fields: int = 0,
+        extra_field_size: int = 16,
+        list_size: int = 2,
+        seed: int = 0,
+        latency: float = 0,
+        latency_jitter: float = 0,
+        error_rate: float = 0,
+        error_status: int = 503,
+        error_every: int = 0,
+        retry_after: int = 0,
+        check_keys: bool = True,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        """Local stand-in for the Axonius REST API running in a background thread.
+
+        Args:
+            rows: number of assets of each asset type
+            adapters: adapters that assets are seen by
+            extra_fields: number of extra string fields to add to every asset
+            extra_field_size: number of characters in each extra field value
+            list_size: number of items in list fields
+            seed: seed for random values
+            latency: seconds to sleep before every response
+            latency_jitter: random seconds to add to or remove from latency
+            error_rate: chance from 0 to 1 of responding to a request with error_status
+            error_status: status code to respond with when injecting errors
+            error_every: respond to every Nth request with error_status
+            retry_after: value of the Retry-After header sent with injected errors
+            check_keys: respond with 401 unless :attr:`KEY` and :attr:`SECRET` are sent
+            host: address to listen on
+            port: port to listen on, 0 to pick a free port
+        """
+        self.data: FakeData = FakeData(
+            rows=rows,
+            adapters=adapters,
+            extra_fields=extra_fields,
+            extra_field_size=extra_field_size,
+            list_size=list_size,
+            seed=seed,
+        )
+        self.server: FakeApiHttpServer = FakeApiHttpServer(
+            data=self.data,
+            latency=latency,
+            latency_jitter=latency_jitter,
+            error_rate=error_rate,
+            error_status=error_status,
+            error_every=error_every,
+            retry_after=retry_after,
+            keys=(self.KEY, self.SECRET) if check_keys else None,
+            host=host,
+            port=port,
+        )
+        self.thread: t.Optional[threading.Thread] = None
+
+    def __str__(self) -> str:
+        """Pass."""
+        return f"{self.__class__.__name__}(url={self.url!r}, rows={self.data.rows})"
+
+    def __repr__(self) -> str:
+        """Pass."""
+        return self.__str__()
+
+    def __enter__(self) -> "FakeApi":
+        """Pass."""
+        return self.start()
+
+    def __exit__(self, *args, **kwargs):
+        """Pass."""
+        self.stop()
+
+    @property
+    def url(self) -> str:
+        """URL of the server."""
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def requests(self) -> t.Dict[str, int]:
+        """Number of requests received for each path."""
+        with self.server.lock:
+            return dict(self.server.requests)
+
+    def start(self) -> "FakeApi":
+        """Start serving in a background thread."""
+        if self.thread is None:
+            self.thread = threading.Thread(
+                target=self.server.serve_forever, name="fake_api", daemon=True
+            )
+            self.thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving and close the listening socket."""
+        if self.thread is not None:
+            self.server.shutdown()
+            self.thread.join()
+            self.thread = None
+        self.server.server_close()
+
+    def get_connect(self, **kwargs) -> t.Any:
+        """Get a :obj:`axonius_api_client.connect.Connect` for this server.
+
+        Args:
+            **kwargs: passed to :obj:`axonius_api_client.connect.Connect`
+        """
+        from ..connect import Connect
+
+        kwargs.setdefault("url", self.url)
+        kwargs.setdefault("key", self.KEY)
+        kwargs.setdefault("secret", self.SECRET)
+        kwargs.setdefault("certwarn", False)
+        kwargs.setdefault("cf_token", None)
+        kwargs.setdefault("cf_run", False)
+        kwargs.setdefault("cf_env", False)
+        return Connect(**kwargs)
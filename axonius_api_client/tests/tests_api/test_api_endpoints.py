@@ -23,7 +23,7 @@ from axonius_api_client.exceptions import (
     ResponseLoadObjectError,
     ResponseNotOk,
 )
-from axonius_api_client.http import Http
+from axonius_api_client.http import Http, RetryPolicy
 from axonius_api_client.tools import get_subcls
 
 from ..utils import get_auth, get_url
@@ -636,3 +636,14 @@ class TestApiEndpointGroups:
         for cls in get_schema_classes():
             err = f"{cls} not in use by any api endpoint"
             assert cls in cls_used, err
+
+    def test_read_only_idempotent(self):
+        policy = RetryPolicy()
+        read_only = ["export_spaces", "sq_export", "get_fetch_history"]
+        for group in ApiEndpoints.get_subgroups().values():
+            for name, endpoint in group.get_endpoints().items():
+                if endpoint.method.lower() == "get" or name in read_only:
+                    err = f"{name} {endpoint.path} not retried after a read timeout"
+                    assert policy.is_idempotent(endpoint.method, endpoint.idempotent), err
+        assert ApiEndpoints.assets.get.idempotent is True
+        assert ApiEndpoints.assets.count.idempotent is True
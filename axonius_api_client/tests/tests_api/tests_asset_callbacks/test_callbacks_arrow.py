@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+"""Test suite for assets."""
+import pytest
+
+
+class TestCallbacksArrowFakeApi:
+    @pytest.mark.parametrize("export", ["parquet", "arrow"])
+    def test_arrow_exports(self, fake_api, tmp_path, export):
+        pa = pytest.importorskip("pyarrow")
+        client = fake_api.get_connect()
+        path = tmp_path / "devices"
+        rows = client.devices.get(
+            export=export,
+            export_file=path,
+            fields=["network_interfaces"],
+            page_size=10,
+            arrow_batch_rows=10,
+        )
+        if export == "parquet":
+            import pyarrow.parquet
+
+            table = pyarrow.parquet.read_table(f"{path}.parquet")
+        else:
+            table = pa.ipc.open_file(f"{path}.arrow").read_all()
+
+        assert table.num_rows == len(rows) == 25
+        schema = table.schema
+        assert schema.field("internal_axon_id").type == pa.string()
+        assert schema.field("adapter_list_length").type == pa.int64()
+        assert pa.types.is_timestamp(schema.field("specific_data.data.last_seen").type.value_type)
+        interfaces = schema.field("specific_data.data.network_interfaces").type
+        assert pa.types.is_struct(interfaces.value_type)
+        row = table.slice(0, 1).to_pylist()[0]
+        assert row["specific_data.data.hostname"] == ["host-0.example.com"]
+        assert row["specific_data.data.network_interfaces"][0]["ips"]
@@ -4,6 +4,12 @@ import copy
 
 import pytest
 
+from axonius_api_client.api.asset_callbacks.base import Base
+from axonius_api_client.api.asset_callbacks.tools import CB_MAP
+from axonius_api_client.constants.general import COMPRESS_SUFFIXES
+from axonius_api_client.exceptions import ApiError
+from axonius_api_client.tools import open_compressed
+
 from ...utils import FLAKY
 from .test_callbacks import CallbacksFull
 
@@ -52,3 +58,111 @@ class TestCallbacksBase(CallbacksFull):
 
         assert rows_proc != rows_orig
         cbobj.stop()
+
+
+class TestCallbacksBaseFakeApi:
+    def test_row_plan(self, fake_api):
+        client = fake_api.get_connect()
+        rows = client.devices.get(
+            fields=["network_interfaces"],
+            field_flatten=True,
+            field_null=True,
+            field_excludes=["hostname"],
+            max_rows=2,
+        )
+        plan = client.devices.LAST_CALLBACKS.plan
+        assert [x.__name__ for x in plan.stages] == [
+            "do_excludes",
+            "do_add_null_values",
+            "do_flatten_fields",
+        ]
+        assert "specific_data.data.hostname" in plan.exclude_fields
+        assert plan.flatten_fields[0][0] == "specific_data.data.network_interfaces"
+        for row in rows:
+            assert "specific_data.data.hostname" not in row
+            assert "specific_data.data.network_interfaces" not in row
+            assert isinstance(row["specific_data.data.network_interfaces.mac"], list)
+
+        cbobj = client.devices.LAST_CALLBACKS
+        assert "specific_data.data.hostname" in cbobj.excluded_keys["name_qual"]
+        cbobj.set_arg_value("field_excludes", ["network_interfaces"])
+        assert "specific_data.data.hostname" not in cbobj.excluded_keys["name_qual"]
+        assert "specific_data.data.network_interfaces" in cbobj.excluded_keys["name_qual"]
+        assert cbobj.plan is not plan
+        assert "specific_data.data.network_interfaces" in cbobj.plan.exclude_fields
+
+    def test_page_batch_process_row_override(self, fake_api, monkeypatch):
+        class RowCounter(Base):
+            CB_NAME = "row_counter"
+            calls = 0
+
+            def process_row(self, row):
+                RowCounter.calls += 1
+                return super().process_row(row=row)
+
+        monkeypatch.setitem(CB_MAP, RowCounter.CB_NAME, RowCounter)
+        client = fake_api.get_connect()
+        rows = client.devices.get(export="row_counter", page_size=10, page_batch=True)
+        assert len(rows) == RowCounter.calls == 25
+        assert client.devices.LAST_CALLBACKS.page_batch is False
+
+    def test_page_batch_custom_cbs(self, fake_api):
+        sizes = []
+
+        def custom_cb(self, rows):
+            sizes.append(len(rows))
+            return rows
+
+        client = fake_api.get_connect()
+        assert client.devices.get(page_size=10, max_rows=12)
+        assert client.devices.LAST_CALLBACKS.page_batch is False
+        assert client.devices.get(page_size=10, page_batch=True, custom_cbs=[custom_cb])
+        assert client.devices.LAST_CALLBACKS.page_batch is False
+        assert sizes == [1] * 25
+        assert client.devices.get(page_size=10, max_rows=12, page_batch=True)
+        assert client.devices.LAST_CALLBACKS.page_batch is True
+
+    @pytest.mark.parametrize("export", ["csv", "json", "json_to_csv", "table", "xlsx", "xml"])
+    def test_page_batch(self, fake_api, tmp_path, export):
+        client = fake_api.get_connect()
+        outputs = []
+        for page_batch in [False, True]:
+            path = tmp_path / f"{page_batch}.{export}"
+            rows = client.devices.get(
+                export=export,
+                export_file=path,
+                page_size=10,
+                max_rows=22,
+                table_max_rows=15,
+                page_batch=page_batch,
+            )
+            data = path.read_bytes() if export != "xlsx" else None
+            outputs.append((rows, data))
+        assert outputs[0] == outputs[1]
+        assert len(outputs[0][0]) == (14 if export == "table" else 22)
+
+    @pytest.mark.parametrize("export", ["csv", "json", "xml"])
+    @pytest.mark.parametrize("method", ["gzip", "xz", "zstd"])
+    def test_export_compress(self, fake_api, tmp_path, export, method):
+        if method == "zstd":
+            pytest.importorskip("zstandard")
+        client = fake_api.get_connect()
+        path = tmp_path / f"devices.{export}"
+        client.devices.get(export=export, export_file=path, page_size=10)
+        client.devices.get(
+            export=export,
+            export_file=path,
+            page_size=10,
+            export_compress=method,
+            export_compress_level=1,
+        )
+        suffix = COMPRESS_SUFFIXES[method]
+        with open_compressed(path=f"{path}{suffix}", method=method, mode="rb") as fh:
+            assert fh.read() == path.read_bytes()
+
+    def test_export_compress_invalid(self, fake_api, tmp_path):
+        client = fake_api.get_connect()
+        with pytest.raises(ApiError, match="export_compress"):
+            client.devices.get(export="csv", export_file=tmp_path / "x", export_compress="rar")
+        with pytest.raises(ApiError, match="not supported"):
+            client.devices.get(export="xlsx", export_file=tmp_path / "x", export_compress="gzip")
@@ -85,3 +85,19 @@ class TestCallbacksJson(Exports):
         assert '"schemas": [' in output
         stop_val = output.splitlines()[-2:]
         assert "]" in stop_val
+
+
+class TestCallbacksJsonFakeApi:
+    @pytest.mark.parametrize("json_flat", [False, True])
+    def test_json_codec(self, fake_api, tmp_path, json_flat):
+        pytest.importorskip("orjson")
+        outputs = []
+        for codec in ["json", "orjson"]:
+            client = fake_api.get_connect(json_codec=codec)
+            assert client.http.JSON_CODEC.NAME == codec
+            path = tmp_path / f"{codec}.json"
+            client.devices.get(export="json", export_file=path, page_size=10, json_flat=json_flat)
+            text = path.read_text()
+            lines = text.splitlines() if json_flat else [text]
+            outputs.append([json.loads(x) for x in lines])
+        assert outputs[0] == outputs[1]
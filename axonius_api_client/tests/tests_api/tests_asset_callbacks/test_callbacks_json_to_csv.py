@@ -5,6 +5,8 @@ import io
 
 import pytest
 
+from axonius_api_client.exceptions import ApiError
+
 from .test_callbacks import Exports
 
 
@@ -39,3 +41,32 @@ class TestCallbacksJsonToCsv(Exports):
         start_val = io_fd.getvalue().splitlines()[0]
         for i in cbobj.final_columns:
             assert f'"{i}"' in start_val
+
+
+class TestCallbacksJsonToCsvFakeApi:
+    @pytest.mark.parametrize("spool_compress", [None, "gzip", "zstd"])
+    def test_json_to_csv_spool(self, fake_api, tmp_path, spool_compress):
+        if spool_compress == "zstd":
+            pytest.importorskip("zstandard")
+        client = fake_api.get_connect()
+        expected = tmp_path / "expected.csv"
+        client.devices.get(export="json_to_csv", export_file=expected, page_size=10)
+        path = tmp_path / "json_to_csv.csv"
+        spool_dir = tmp_path / "spool"
+        rows = client.devices.get(
+            export="json_to_csv",
+            export_file=path,
+            page_size=10,
+            spool_dir=spool_dir,
+            spool_compress=spool_compress,
+        )
+        assert len(rows) == 25
+        assert spool_dir.is_dir() and not list(spool_dir.iterdir())
+        assert path.read_bytes() == expected.read_bytes()
+
+    def test_json_to_csv_spool_invalid(self, fake_api, tmp_path):
+        client = fake_api.get_connect()
+        with pytest.raises(ApiError, match="spool_compress"):
+            client.devices.get(
+                export="json_to_csv", export_file=tmp_path / "x.csv", spool_compress="badwolf"
+            )
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""Test suite for assets."""
+import json
+import sqlite3
+
+
+class TestCallbacksSqliteFakeApi:
+    def test_sqlite(self, fake_api, tmp_path):
+        client = fake_api.get_connect()
+        path = tmp_path / "assets"
+        kwargs = {
+            "export": "sqlite",
+            "export_file": path,
+            "fields": ["network_interfaces"],
+            "page_size": 10,
+            "sqlite_indexes": ["internal_axon_id", "specific_data.data.hostname"],
+        }
+        rows = client.devices.get(**kwargs)
+        assert len(rows) == 25
+        client.devices.get(sqlite_append=True, **kwargs)
+        client.devices.get(sqlite_append=True, history_date_parsed="2020-01-01", **kwargs)
+
+        child = "devices__specific_data.data.network_interfaces"
+        with sqlite3.connect(f"{path}.sqlite") as conn:
+            counts = conn.execute(
+                'SELECT "history_date", COUNT(*) FROM "devices" GROUP BY 1 ORDER BY 1'
+            ).fetchall()
+            assert [x[1] for x in counts] == [25, 25]
+            assert counts[0][0] == "2020-01-01"
+            hostname, count = conn.execute(
+                'SELECT "specific_data.data.hostname", "adapter_list_length" FROM "devices"'
+                ' WHERE "internal_axon_id" = ?',
+                [rows[0]["internal_axon_id"]],
+            ).fetchone()
+            assert hostname == "host-0.example.com"
+            assert isinstance(count, int)
+            ips = conn.execute(
+                f'SELECT n."ips" FROM "devices" d JOIN "{child}" n'
+                ' USING ("internal_axon_id", "history_date") WHERE d."history_date" = ?',
+                [counts[1][0]],
+            ).fetchall()
+            assert ips and json.loads(ips[0][0])
+            indexes = [x[1] for x in conn.execute('PRAGMA index_list("devices")')]
+            assert "ix_devices_specific_data.data.hostname" in indexes
@@ -71,3 +71,25 @@ class TestCallbacksTable(Exports):
             cbobj.check_stop()
         assert cbobj.STATE["stop_fetch"]
         assert cbobj.STATE["stop_msg"]
+
+
+class TestCallbacksTableFakeApi:
+    @pytest.mark.parametrize("page_batch", [False, True])
+    def test_table_window(self, fake_api, tmp_path, page_batch):
+        client = fake_api.get_connect()
+        path = tmp_path / "devices.txt"
+        rows = client.devices.get(
+            export="table",
+            export_file=path,
+            page_size=10,
+            page_batch=page_batch,
+            table_max_rows=0,
+            table_window=10,
+        )
+        assert len(rows) == 25
+        lines = path.read_text().splitlines()
+        tops = [x for x in lines if x.startswith("╒")]
+        assert len(tops) == 3
+        assert len(set(tops)) == 1
+        assert len({len(x) for x in lines if x}) == 1
+        assert sum(x.startswith("│ host-") for x in lines) == 25
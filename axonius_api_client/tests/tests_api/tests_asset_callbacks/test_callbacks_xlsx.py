@@ -2,6 +2,7 @@
 """Test suite for assets."""
 
 import copy
+import zipfile
 
 import pytest
 
@@ -63,3 +64,27 @@ class TestCallbacksXlsx(Callbacks):
         with pytest.raises(ApiError):
             cbobj = self.get_cbobj(apiobj=apiobj, cbexport=cbexport, getargs={})
             cbobj.start()
+
+
+class TestCallbacksXlsxFakeApi:
+    def test_xlsx_rollover(self, fake_api, tmp_path):
+        client = fake_api.get_connect()
+        path = tmp_path / "devices.xlsx"
+        rows = client.devices.get(
+            export="xlsx",
+            export_file=path,
+            page_size=10,
+            xlsx_max_rows=10,
+            xlsx_column_formats=True,
+            xlsx_cell_max_len=5,
+        )
+        assert len(rows) == 25
+        with zipfile.ZipFile(path) as zf:
+            workbook = zf.read("xl/workbook.xml").decode()
+            sheets = [zf.read(f"xl/worksheets/sheet{x}.xml").decode() for x in [1, 2, 3]]
+            assert "xl/worksheets/sheet4.xml" not in zf.namelist()
+        assert all(f'name="{x}"' in workbook for x in ["Devices", "Devices_2", "Devices_3"])
+        assert [x.count("<row ") for x in sheets] == [10, 10, 8]
+        assert all("Asset Unique ID" in x for x in sheets)
+        assert all("host-0.example.com" not in x for x in sheets)
+        assert "<t>host-</t>" in sheets[0]
@@ -33,3 +33,17 @@ class TestCallbacksXml(Callbacks):
         cbobj.stop()
 
         assert export_file.is_file()
+
+
+class TestCallbacksXmlFakeApi:
+    @pytest.mark.parametrize("page_batch", [False, True])
+    def test_xml_stream(self, fake_api, tmp_path, page_batch):
+        xmltodict = pytest.importorskip("xmltodict")
+        client = fake_api.get_connect()
+        path = tmp_path / "devices.xml"
+        rows = client.devices.get(
+            export="xml", export_file=path, page_size=10, page_batch=page_batch
+        )
+        expected = xmltodict.unparse({"assets": {"devices": rows}}, pretty=True)
+        assert path.read_text() == f"{expected}\n"
+        assert client.devices.LAST_CALLBACKS._rows_written == 25
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 """Test suite for assets."""
+import concurrent.futures
 import datetime
+import json
 from typing import Any, List
 
 import pytest
@@ -8,8 +10,9 @@ import pytest
 from axonius_api_client.api import json_api, mixins, AssetMixin
 
 from axonius_api_client.exceptions import ApiError, NotFoundError, StopFetch, ToolsError
-from axonius_api_client.tools import listify
+from axonius_api_client.tools import get_profiler, listify
 
+from ...fake_api import FakeApi
 from ...meta import QUERIES
 from ...utils import FLAKY, check_asset, check_assets
 
@@ -416,3 +419,173 @@ class TestAssetsPublic(ModelMixinsBase):
 
         last_fields = apiobj.LAST_GET["fields"][apiobj.ASSET_TYPE]
         assert sq_fields == last_fields
+
+    @FLAKY()
+    def test_get_workers(self, apiobj):
+        rows_serial = apiobj.get(max_rows=6, page_size=2, use_cursor=False)
+        rows = apiobj.get(max_rows=6, page_size=2, workers=3)
+        check_assets(rows)
+        assert [x["internal_axon_id"] for x in rows] == [x["internal_axon_id"] for x in rows_serial]
+        state = apiobj.LAST_CALLBACKS.STATE
+        assert state["workers"] == 3
+        if rows:
+            assert state["workers_progress"]
+            assert sum(x["rows"] for x in state["workers_progress"].values()) == len(rows)
+
+    @FLAKY()
+    def test_get_prefetch(self, apiobj):
+        rows_serial = apiobj.get(max_rows=6, page_size=2)
+        rows = apiobj.get(max_rows=6, page_size=2, prefetch=2)
+        check_assets(rows)
+        assert [x["internal_axon_id"] for x in rows] == [x["internal_axon_id"] for x in rows_serial]
+        state = apiobj.LAST_CALLBACKS.STATE
+        assert state["prefetch"] == 2
+        assert 0 <= state["prefetch_queue_depth"] <= 2
+        assert state["process_seconds_total"] >= 0
+
+
+class TestAssetsPageOffsets:
+    """Pass."""
+
+    def test_get_page_offsets(self):
+        state = json_api.assets.AssetsPage.create_state(page_size=10, initial_count=35, workers=4)
+        assert state["workers"] == 4
+        assert AssetMixin.get_page_offsets(state=state) == [0, 10, 20, 30]
+
+    def test_get_page_offsets_max_rows(self):
+        state = json_api.assets.AssetsPage.create_state(
+            page_size=10, row_start=5, max_rows=20, initial_count=100
+        )
+        assert AssetMixin.get_page_offsets(state=state) == [5, 15]
+
+    def test_get_page_offsets_max_pages(self):
+        state = json_api.assets.AssetsPage.create_state(
+            page_size=10, max_pages=2, initial_count=100
+        )
+        assert AssetMixin.get_page_offsets(state=state) == [0, 10]
+
+    def test_create_state_prefetch(self):
+        state = json_api.assets.AssetsPage.create_state(prefetch=3)
+        assert state["prefetch"] == 3
+        assert state["prefetch_queue_depth"] == 0
+        assert state["process_seconds_total"] == 0
+
+    def test_get_page_offsets_empty(self):
+        state = json_api.assets.AssetsPage.create_state(page_size=10, initial_count=0)
+        assert AssetMixin.get_page_offsets(state=state) == []
+
+
+class TestAssetsFakeApi:
+    """Pass."""
+
+    def test_count_get(self, fake_api):
+        client = fake_api.get_connect()
+        assert client.devices.count() == 25
+        assets = client.devices.get(page_size=10)
+        assert len(assets) == 25
+        assert len({x["internal_axon_id"] for x in assets}) == 25
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{"use_cursor": False}, {"workers": 2}, {"prefetch": 2}, {"row_start": 20}],
+    )
+    def test_get_pagination(self, fake_api, kwargs):
+        client = fake_api.get_connect()
+        assets = client.devices.get(page_size=4, **kwargs)
+        assert len(assets) == 25 - kwargs.get("row_start", 0)
+
+    @pytest.mark.parametrize("grow_to", [37, 40])
+    def test_get_workers_count_grows(self, grow_to):
+        with FakeApi(rows=25) as server:
+            client = server.get_connect()
+            apiobj = client.devices
+            original = apiobj._get
+
+            def _get(**kwargs):
+                server.data.rows = grow_to
+                return original(**kwargs)
+
+            apiobj._get = _get
+            assets = apiobj.get(page_size=10, workers=2)
+            assert len(assets) == grow_to
+            assert len({x["internal_axon_id"] for x in assets}) == grow_to
+            assert server.requests["api/devices"] == -(-grow_to // 10)
+
+    def test_get_workers_count_grows_limits(self):
+        with FakeApi(rows=25) as server:
+            client = server.get_connect()
+            server.data.rows = 50
+            assert len(client.devices.get(page_size=10, workers=2, max_rows=35)) == 35
+            assert len(client.devices.get(page_size=10, workers=2, initial_count=25)) == 50
+            assert len(client.devices.get(page_size=10, workers=2, initial_count=0)) == 50
+
+    def test_profile(self, fake_api, tmp_path):
+        client = fake_api.get_connect()
+        path = tmp_path / "profile.json"
+        client.devices.get(
+            page_size=10, field_flatten=True, page_batch=True, profile=True, profile_export=path
+        )
+        stages = client.devices.LAST_CALLBACKS.PROFILER.metrics["stages"]
+        assert stages["process_page"]["calls"] == 3
+        assert stages["callback.do_flatten_fields"]["calls"] == 3
+        assert stages["http.send"]["calls"] >= 3
+        assert stages["http.json_decode"]["calls"] >= 3
+        assert stages["load_response.AssetsPage"]["calls"] == stages["http.send"]["calls"]
+        assert "process_page" in path.read_text()
+        assert get_profiler() is None
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_profile_concurrent(self, fake_api, workers):
+        client = fake_api.get_connect()
+        apiobjs = [client.devices, client.users]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(apiobjs[0].get, page_size=10, workers=workers, profile=True),
+                executor.submit(apiobjs[1].get, page_size=5, workers=workers),
+            ]
+            assert [len(x.result()) for x in futures] == [25, 25]
+        stages = apiobjs[0].LAST_CALLBACKS.PROFILER.metrics["stages"]
+        assert 3 <= stages["http.send"]["calls"] <= 4
+        assert stages["load_response.AssetsPage"]["calls"] == stages["http.send"]["calls"]
+        assert apiobjs[1].LAST_CALLBACKS.PROFILER is None
+
+    @pytest.mark.parametrize("export", ["csv", "json", "xml"])
+    def test_checkpoint_resume(self, fake_api, tmp_path, export):
+        client = fake_api.get_connect()
+        expected = tmp_path / f"expected.{export}"
+        client.devices.get(export=export, export_file=expected, page_size=10)
+
+        path = tmp_path / f"resumed.{export}"
+        ckpt = tmp_path / "devices.ckpt"
+        kwargs = {"export": export, "export_file": path, "page_size": 10, "checkpoint": ckpt}
+        gen = client.devices.get(generator=True, **kwargs)
+        assert len([next(gen) for _ in range(15)]) == 15
+        gen.close()
+        client.devices.LAST_CALLBACKS._fd.close()
+
+        data = json.loads(ckpt.read_text())
+        assert data["rows_offset"] == data["rows_processed_total"] == 10
+        assert data["export_position"] < path.stat().st_size
+        assert data["complete"] is False
+
+        rows = client.devices.get(resume_from=ckpt)
+        assert len(rows) == 15
+        assert path.read_bytes() == expected.read_bytes()
+        assert json.loads(ckpt.read_text())["complete"] is True
+        with pytest.raises(ApiError, match="already finished"):
+            client.devices.get(resume_from=ckpt)
+
+    def test_checkpoint_invalid(self, fake_api, tmp_path):
+        client = fake_api.get_connect()
+        ckpt = tmp_path / "devices.ckpt"
+        with pytest.raises(ApiError, match="not supported by the 'xlsx' export"):
+            client.devices.get(export="xlsx", export_file=tmp_path / "x", checkpoint=ckpt)
+        with pytest.raises(ApiError, match="not supported with checkpoint"):
+            client.devices.get(
+                export="csv", export_file=tmp_path / "x", export_compress="gzip", checkpoint=ckpt
+            )
+        with pytest.raises(ApiError, match="does not exist"):
+            client.devices.get(resume_from=ckpt)
+        client.devices.get(max_rows=5, checkpoint=ckpt)
+        with pytest.raises(ApiError, match="asset type 'devices', not 'users'"):
+            client.users.get(resume_from=ckpt)
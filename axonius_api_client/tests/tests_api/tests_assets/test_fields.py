@@ -1,13 +1,17 @@
 # -*- coding: utf-8 -*-
 """Test suite for assets."""
 import copy
+import os
+import types
 
 import pytest
 
 from axonius_api_client.api import json_api
+from axonius_api_client.api.assets import fields_cache
 from axonius_api_client.constants.fields import AGG_ADAPTER_ALTS, AGG_ADAPTER_NAME
 from axonius_api_client.exceptions import ApiError, NotFoundError
 
+from ...fake_api import FakeApiHandler
 from ...meta import FIELD_FORMATS, SCHEMA_FIELD_FORMATS, SCHEMA_TYPES
 from ...utils import get_schema, get_schemas
 
@@ -708,3 +712,129 @@ def val_source(obj):
 
         # assert not source, source
         # assert not source_options, source_options
+
+
+class TestFieldsFakeApi:
+    def test_fields_cache(self, fake_api, tmp_path, monkeypatch):
+        tmp_path.chmod(0o700)
+        monkeypatch.setenv("AX_FIELDS_CACHE_PATH", str(tmp_path))
+        monkeypatch.setenv("AX_FIELDS_CACHE", "yes")
+        path = "api/devices/fields"
+        before = fake_api.requests.get(path, 0)
+
+        client = fake_api.get_connect()
+        assert client.devices.fields.cache.path == tmp_path
+        fields = client.devices.fields.get()
+        assert fake_api.requests[path] == before + 1
+        entries = list(tmp_path.glob("*.fields"))
+        assert len(entries) == 1
+
+        client = fake_api.get_connect()
+        assert client.devices.fields.get() == fields
+        assert fake_api.requests[path] == before + 1
+
+        entries[0].write_bytes(b"badwolf")
+        client = fake_api.get_connect()
+        assert client.devices.fields.get() == fields
+        assert fake_api.requests[path] == before + 2
+
+        client = fake_api.get_connect()
+        client.devices.fields.cache.ttl = 1
+        with monkeypatch.context() as m:
+            m.setattr(fields_cache, "time", types.SimpleNamespace(time=lambda: 2**40))
+            assert client.devices.fields.get() == fields
+        assert fake_api.requests[path] == before + 3
+
+        route_about = FakeApiHandler.route_about
+
+        def _route_about(self, **kwargs):
+            status, data = route_about(self, **kwargs)
+            data["data"]["attributes"]["Installed Version"] = "6.0.1"
+            return status, data
+
+        with monkeypatch.context() as m:
+            m.setattr(FakeApiHandler, "route_about", _route_about)
+            client = fake_api.get_connect()
+            assert client.devices.fields.get() == fields
+            assert fake_api.requests[path] == before + 4
+
+        client = fake_api.get_connect()
+        assert client.devices.fields.invalidate_cache() == 1
+        assert not list(tmp_path.glob("*.fields"))
+
+    def test_fields_cache_requests(self, fake_api, tmp_path, monkeypatch):
+        tmp_path.chmod(0o700)
+        monkeypatch.setenv("AX_FIELDS_CACHE_PATH", str(tmp_path))
+        monkeypatch.setenv("AX_FIELDS_CACHE", "yes")
+        paths = ["api/settings/meta/about", "api/settings/metadata", "api/adapters", "api/login"]
+        client = fake_api.get_connect()
+        devices, users = client.devices.fields, client.users.fields
+        before = {x: fake_api.requests.get(x, 0) for x in paths}
+        devices.get()
+        users.get()
+        devices.invalidate_cache()
+        after = {x: fake_api.requests.get(x, 0) - before[x] for x in paths}
+        assert after == {x: 1 if x == paths[0] else 0 for x in paths}
+
+    def test_fields_cache_not_private(self, fake_api, tmp_path, monkeypatch):
+        if not hasattr(os, "getuid"):
+            pytest.skip("No POSIX ownership on this platform")
+        tmp_path.chmod(0o700)
+        monkeypatch.setenv("AX_FIELDS_CACHE_PATH", str(tmp_path))
+        monkeypatch.setenv("AX_FIELDS_CACHE", "yes")
+        path = "api/devices/fields"
+        before = fake_api.requests.get(path, 0)
+
+        client = fake_api.get_connect()
+        client.devices.fields.get()
+        tmp_path.chmod(0o777)
+        client = fake_api.get_connect()
+        assert client.devices.fields.get()
+        assert fake_api.requests[path] == before + 2
+        assert len(list(tmp_path.glob("*.fields"))) == 1
+
+    def test_fields_cache_disabled(self, fake_api, tmp_path, monkeypatch):
+        monkeypatch.setenv("AX_FIELDS_CACHE_PATH", str(tmp_path))
+        monkeypatch.delenv("AX_FIELDS_CACHE", raising=False)
+        client = fake_api.get_connect()
+        assert not client.devices.fields.cache.enabled
+        assert client.devices.fields.get()
+        assert not list(tmp_path.glob("*"))
+
+    def test_fields_cache_default_path(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("AX_FIELDS_CACHE_PATH", raising=False)
+        monkeypatch.setattr(fields_cache, "DEFAULT_PATH", str(tmp_path))
+        cache = fields_cache.FieldsCache()
+        assert cache.path == cache.get_default_path()
+        assert cache.path == tmp_path / "axonius_api_client_cache" / "fields"
+
+    def test_field_index(self, fake_api):
+        client = fake_api.get_connect()
+        apiobj = client.devices.fields
+        fields = apiobj.get()
+        index = apiobj.get_index()
+        assert index is apiobj.get_index()
+        assert index.fields is fields
+
+        for adapter, schemas in fields.items():
+            for schema in schemas:
+                for key in ["name", "name_base", "name_qual", "title"]:
+                    found = apiobj.get_field_schema(
+                        value=schema[key], schemas=schemas, selectable_only=False
+                    )
+                    assert index.get(adapter, schema[key].upper(), selectable_only=False) is found
+
+            for value in ["^host", "^os", "name", "^$", "^Host Name"]:
+                expected = apiobj.get_field_schemas(value=value, schemas=schemas)
+                assert index.find(adapter=adapter, value=value) == expected
+
+        assert apiobj.get_field_names_eq("hostname,Host Name,badwolf", fields_error=False) == [
+            "specific_data.data.hostname",
+            "badwolf",
+        ]
+        schemas = apiobj.get_field_names_eq("badwolf,badwolf", key=None, fields_error=False)
+        assert [x["name"] for x in schemas] == ["badwolf"]
+        assert apiobj.get_field_names_re("^host") == ["specific_data.data.hostname"]
+        assert apiobj.get_field_names_fuzzy("hostnme") == ["specific_data.data.hostname"]
+        with pytest.raises(NotFoundError, match="hostname"):
+            apiobj.get_field_name(value="hostnme")
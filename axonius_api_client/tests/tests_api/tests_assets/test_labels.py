@@ -1,8 +1,11 @@
 # -*- coding: utf-8 -*-
 """Test suite for axonapi.api.assets."""
+import threading
+
 import pytest
 
 from axonius_api_client.api import json_api
+from axonius_api_client.exceptions import ApiError
 
 
 class TestLabelsPrivate:
@@ -132,3 +135,66 @@ class LabelsPublic:
 
         for label in labels:
             assert label not in all_labels_post_remove
+
+
+class TestLabelsFakeApi:
+    @pytest.mark.parametrize("tags_background", [True, False])
+    def test_tags_stream(self, fake_api, tags_background):
+        client = fake_api.get_connect()
+        tag = f"stream_{tags_background}"
+        kwargs = {"page_size": 10, "tags_background": tags_background}
+        client.devices.get(tags_add=[tag], tags_chunk_size=10, **kwargs)
+        summary = client.devices.LAST_CALLBACKS.TAG_SUMMARY["add"]
+        assert summary["chunks"] == 3
+        assert summary["ids_supplied"] == summary["ids_sent"] == summary["modified"] == 25
+        assert not client.devices.LAST_CALLBACKS.TAG_WORKERS
+        assert tag in client.devices.labels.get()
+
+        client.devices.get(tags_remove=[tag], tags_chunk_size=0, **kwargs)
+        summary = client.devices.LAST_CALLBACKS.TAG_SUMMARY["remove"]
+        assert summary["chunks"] == 1
+        assert summary["modified"] == 25
+        assert tag not in client.devices.labels.get()
+
+    def test_tags_stream_error(self, fake_api, monkeypatch):
+        client = fake_api.get_connect()
+        labels_add = client.devices.labels._add
+        calls = []
+
+        def _add(**kwargs):
+            calls.append(kwargs["ids"])
+            if len(calls) == 2:
+                raise ValueError("badwolf")
+            return labels_add(**kwargs)
+
+        monkeypatch.setattr(client.devices.labels, "_add", _add)
+        with pytest.raises(ApiError, match="failed to add tags for 10 asset IDs in 1 API calls"):
+            client.devices.get(tags_add=["error"], tags_chunk_size=10, page_size=10)
+        summary = client.devices.LAST_CALLBACKS.TAG_SUMMARY["add"]
+        assert summary["chunks"] == 2
+        assert summary["modified"] == 15
+        assert len(calls) == 3
+
+    def test_tags_defaults(self, fake_api):
+        client = fake_api.get_connect()
+        client.devices.get(tags_add=["defaults"], page_size=10)
+        callbacks = client.devices.LAST_CALLBACKS
+        assert callbacks.get_arg_value("tags_chunk_size") == 0
+        assert callbacks.get_arg_value("tags_background") is False
+        assert callbacks.TAG_SUMMARY["add"]["chunks"] == 1
+        assert callbacks.TAG_SUMMARY["add"]["modified"] == 25
+
+    def test_tags_stream_abandoned(self, fake_api):
+        client = fake_api.get_connect()
+        gen = client.devices.get(
+            generator=True,
+            tags_add=["abandoned"],
+            tags_chunk_size=10,
+            tags_background=True,
+            page_size=10,
+        )
+        for _ in range(12):
+            next(gen)
+        gen.close()
+        assert not client.devices.LAST_CALLBACKS.TAG_WORKERS
+        assert not [x for x in threading.enumerate() if x.name.startswith("labels_")]
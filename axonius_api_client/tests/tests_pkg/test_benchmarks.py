@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""Test suite for axonius_api_client.tests.benchmarks."""
+from ..benchmarks import (
+    COLUMNS,
+    IMPORT_COLUMNS,
+    format_results,
+    main,
+    run_benchmarks,
+    run_import,
+    run_import_benchmarks,
+)
+
+
+class TestBenchmarks:
+    def test_run_benchmarks(self, fake_api):
+        results = run_benchmarks(exports=["json", "csv"], spawn=False, server=fake_api)
+        assert [x["export"] for x in results] == ["json", "csv"]
+        for result in results:
+            assert result["rows"] == 25
+            assert result["rows_per_second"] > 0
+            assert all(k in result for k, _ in COLUMNS)
+        assert len(format_results(results).splitlines()) == 4
+
+    def test_main(self, capsys):
+        results = main(["--rows", "3", "-e", "table", "--no-spawn", "--json"])
+        assert results[0]["rows"] == 3
+        assert '"export": "table"' in capsys.readouterr().out
+
+    def test_run_import_benchmarks(self):
+        results = run_import_benchmarks(repeat=1)
+        for result in results:
+            assert result["seconds"] > 0
+            assert all(k in result for k, _ in IMPORT_COLUMNS)
+        table = format_results(results, columns=IMPORT_COLUMNS)
+        assert len(table.splitlines()) == len(results) + 2
+
+    def test_import_package_lazy(self):
+        result = run_import(name="package", code="import axonius_api_client", repeat=1)
+        assert result["package_modules"] <= 5
+
+        code = "import axonius_api_client, sys; assert 'axonius_api_client.api' not in sys.modules"
+        assert run_import(name="package", code=code, repeat=1)["seconds"] > 0
+
+    def test_import_cli_command_lazy(self):
+        code = (
+            "import sys; from axonius_api_client.cli import cli; cli.get_command(None, 'devices')"
+            "; assert not [x for x in sys.modules if 'grp_system' in x or 'grp_tools' in x]"
+            "; assert 'axonius_api_client.api.json_api' not in sys.modules"
+        )
+        assert run_import(name="cli_command", code=code, repeat=1)["seconds"] > 0
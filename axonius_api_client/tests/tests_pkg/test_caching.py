@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+"""Test suite for axonius_api_client.caching."""
+import pytest
+from cachetools.keys import hashkey
+
+from axonius_api_client.caching import (
+    DEFAULT_MANAGER,
+    POLICIES,
+    CacheManager,
+    StatsLRUCache,
+    StatsTTLCache,
+    cached,
+    get_manager,
+)
+from axonius_api_client.exceptions import ApiError
+
+
+class Thing:
+    def __init__(self, caches=None):
+        self.CACHES = caches
+        self.calls = 0
+
+    @cached(name="test.thing.get", maxsize=2, ttl=0)
+    def get(self, value=1):
+        self.calls += 1
+        return value
+
+
+class TestCacheManager:
+    def test_cached(self):
+        manager = CacheManager()
+        obj = Thing(caches=manager)
+        assert POLICIES["test.thing.get"] == {"maxsize": 2, "ttl": 0}
+        assert get_manager(obj=obj) is manager
+        assert Thing.get.cache_name == "test.thing.get"
+
+        assert [obj.get(value=x) for x in [1, 1, 2, 3, 1]] == [1, 1, 2, 3, 1]
+        assert obj.calls == 4
+        assert isinstance(manager.get_cache(name="test.thing.get"), StatsLRUCache)
+        metrics = manager.metrics["test.thing.get"]
+        assert metrics["hits"] == 1
+        assert metrics["misses"] == 4
+        assert metrics["evictions"] == 2
+        assert metrics["currsize"] == 2
+
+        assert manager.invalidate("test.*") == 2
+        assert manager.metrics["test.thing.get"]["invalidations"] == 2
+        assert manager.metrics["test.thing.get"]["evictions"] == 2
+        manager.reset_metrics()
+        assert manager.metrics["test.thing.get"]["misses"] == 0
+
+    def test_managers_isolated(self):
+        one, two = Thing(caches=CacheManager()), Thing(caches=CacheManager())
+        one.get(), two.get()
+        assert one.calls == two.calls == 1
+        assert get_manager(obj=object()) is DEFAULT_MANAGER
+
+    def test_configure(self):
+        manager = CacheManager(policies={"test.*": {"ttl": 30}})
+        obj = Thing(caches=manager)
+        obj.get()
+        cache = manager.get_cache(name="test.thing.get")
+        assert isinstance(cache, StatsTTLCache)
+        assert cache.ttl == 30 and cache.maxsize == 2
+
+        assert manager.configure(name="test.thing.get", maxsize=0) == ["test.thing.get"]
+        obj.get(), obj.get()
+        assert obj.calls == 3
+        assert manager.metrics["test.thing.get"]["currsize"] == 0
+
+        with pytest.raises(ApiError, match="Invalid cache policy keys"):
+            manager.configure(name="test.*", badwolf=1)
+        with pytest.raises(ApiError, match="must be a number"):
+            manager.configure(name="test.*", ttl=-1)
+
+    def test_disabled(self):
+        obj = Thing(caches=CacheManager(enabled=False))
+        obj.get(), obj.get()
+        assert obj.calls == 2
+        assert not obj.CACHES.metrics
+
+    def test_set_pop(self):
+        manager = CacheManager()
+        obj = Thing(caches=manager)
+        manager.set(name="test.thing.get", key=hashkey(obj), value="seeded")
+        assert obj.get() == "seeded"
+        assert obj.calls == 0
+
+        assert manager.pop(name="test.thing.get", key=hashkey(obj)) is True
+        assert manager.pop(name="test.thing.get", key=hashkey(obj)) is False
+        assert obj.get() == 1
+        assert obj.calls == 1
+
+    def test_connect(self, fake_api):
+        client = fake_api.get_connect()
+        other = fake_api.get_connect()
+        assert client.CACHES is client.HTTP.CACHES
+        assert client.CACHES is not other.CACHES
+
+        shared = CacheManager(policies={"fields.get": {"ttl": 10}})
+        client = fake_api.get_connect(caches=shared)
+        other = fake_api.get_connect(caches=shared)
+        assert client.CACHES is other.CACHES is shared
+        client.devices.fields.get(), other.devices.fields.get()
+        assert shared.metrics["fields.get"]["misses"] == 2
+        assert shared.metrics["fields.get"]["currsize"] == 2
+        client = fake_api.get_connect(caches={"fields.get": {"ttl": 10}})
+        assert client.CACHES.get_policy(name="fields.get") == {"maxsize": 1024, "ttl": 10}
+
+    def test_invalidated_by_changes(self, fake_api):
+        client = fake_api.get_connect()
+        parser = client.devices.wizard.PARSER
+        path = "api/devices/labels"
+
+        before = fake_api.requests.get(path, 0)
+        tags = parser.get_asset_tags()
+        assert parser.get_asset_tags() == tags
+        assert fake_api.requests[path] == before + 1
+        assert client.CACHES.metrics["wizard.get_asset_tags"]["hits"] == 1
+
+        client.devices.labels.add(rows=client.devices.get(max_rows=1), labels=["cached"])
+        assert client.CACHES.metrics["wizard.get_asset_tags"]["invalidations"] == 1
+        assert "cached" in parser.get_asset_tags()
+        assert client.CACHES.metrics["wizard.get_asset_tags"]["misses"] == 2
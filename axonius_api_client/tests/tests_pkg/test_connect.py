@@ -194,3 +194,52 @@ class TestConnect:
         exc = Exception("badwolf")
         reason = Connect._get_exc_reason(exc)
         assert format(reason) == "badwolf"
+
+
+class TestConnectFakeApi:
+    def test_warmup(self, fake_api, tmp_path, monkeypatch):
+        monkeypatch.setenv("AX_FIELDS_CACHE_PATH", str(tmp_path))
+        client = fake_api.get_connect()
+        timings = client.warmup(assets=["devices"])
+        assert set(timings) == {
+            "devices.fields",
+            "devices.saved_queries",
+            "devices.labels",
+            "adapters",
+            "history_dates",
+            "instances",
+            "feature_flags",
+        }
+        assert client.WARMUP_ERRORS == {}
+
+        before = dict(fake_api.requests)
+        apiobj = client.devices
+        assert apiobj.fields.get()
+        assert apiobj.saved_query.get_cached(as_dataclass=True)
+        assert apiobj.adapters.get_basic_cached()
+        assert apiobj.history_dates()
+        assert apiobj.wizard.PARSER.get_sqs()
+        assert apiobj.wizard.PARSER.get_adapters()
+        assert fake_api.requests == before
+
+    def test_warmup_invalid(self, fake_api):
+        client = fake_api.get_connect()
+        with pytest.raises(ConnectError, match="Invalid asset types"):
+            client.warmup(assets=["badwolf"])
+        with pytest.raises(ConnectError, match="Invalid metadata"):
+            client.warmup(what=["badwolf"])
+
+    def test_warmup_error(self, fake_api, monkeypatch):
+        def fail(*args, **kwargs):
+            raise ConnectError("badwolf")
+
+        monkeypatch.setattr(axonapi.api.Instances, "_feature_flags", fail)
+        client = fake_api.get_connect()
+        timings = client.warmup(assets=["devices"], what=["adapters", "feature_flags"])
+        assert set(timings) == {"adapters"}
+        assert list(client.WARMUP_ERRORS) == ["feature_flags"]
+        assert isinstance(client.WARMUP_ERRORS["feature_flags"], ConnectError)
+
+        before = dict(fake_api.requests)
+        assert client.devices.adapters.get_basic_cached()
+        assert fake_api.requests == before
@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+"""Test suite for axonius_api_client.connect_async."""
+import asyncio
+import threading
+
+import pytest
+import requests
+
+from axonius_api_client.api import json_api
+from axonius_api_client.api.api_endpoints import ApiEndpoints
+from axonius_api_client.exceptions import ApiError, ResponseNotOk
+
+from ..fake_api import FakeApi
+
+pytest.importorskip("httpx")
+
+from axonius_api_client.connect_async import AsyncConnect, AsyncHttp  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def fake_api():
+    with FakeApi(rows=25, latency=0.05) as server:
+        yield server
+
+
+class TestAsyncHttp:
+    def test_call(self, fake_api):
+        client = fake_api.get_connect()
+        client.start()
+        http = AsyncHttp(http=client.http, max_connections=2)
+        assert http.max_connections == 2
+        assert str(http)
+
+        async def main():
+            try:
+                return await http(path="api/settings/meta/about")
+            finally:
+                await http.close()
+
+        response = asyncio.run(main())
+        assert isinstance(response, requests.Response)
+        assert response.status_code == 200
+        assert response.reason == "OK"
+        assert response.request.method == "GET"
+        assert response.json()["data"]["attributes"]["Installed Version"] == "6.0.0"
+        assert client.http.LAST_RESPONSE is response
+
+    def test_default_max_connections(self, fake_api):
+        http = AsyncHttp(http=fake_api.get_connect().http)
+        assert http.max_connections == AsyncHttp.MAX_CONNECTIONS
+        assert http.get_ssl_context() is False
+        asyncio.run(http.close())
+
+    def test_retry(self, fake_api):
+        client = fake_api.get_connect(max_retries=2, retry_backoff=0)
+        client.start()
+        http = AsyncHttp(http=client.http)
+
+        async def main():
+            try:
+                return await http(path="api/settings/meta/about")
+            finally:
+                await http.close()
+
+        fake_api.server.error_every = fake_api.server.requests_total + 1
+        try:
+            response = asyncio.run(main())
+        finally:
+            fake_api.server.error_every = 0
+        assert response.status_code == 200
+        assert client.http.RETRY_POLICY.metrics["retries_by_reason"] == {"503": 1}
+
+    def test_connect_error(self, fake_api):
+        client = fake_api.get_connect(url="http://127.0.0.1:9", max_retries=1)
+        http = AsyncHttp(http=client.http)
+
+        async def main():
+            try:
+                return await http(path="api/settings/meta/about")
+            finally:
+                await http.close()
+
+        with pytest.raises(requests.exceptions.ConnectionError):
+            asyncio.run(main())
+
+
+class TestAsyncConnect:
+    def test_connect_reuse(self, fake_api):
+        client = fake_api.get_connect()
+        aclient = AsyncConnect(connect=client)
+        assert aclient.connect is client
+        assert aclient.http.http is client.http
+        assert str(aclient)
+        asyncio.run(aclient.close())
+
+    def test_connect_kwargs(self, fake_api):
+        async def main():
+            async with AsyncConnect(
+                url=fake_api.url, key=fake_api.KEY, secret=fake_api.SECRET, certwarn=False
+            ) as aclient:
+                return aclient.connect.STARTED
+
+        assert asyncio.run(main()) is True
+
+    def test_get_apiobj_invalid(self, fake_api):
+        aclient = AsyncConnect(connect=fake_api.get_connect())
+        with pytest.raises(ApiError):
+            aclient.get_apiobj(asset_type="badwolf")
+        asyncio.run(aclient.close())
+
+    def test_perform_request(self, fake_api):
+        async def main():
+            async with AsyncConnect(connect=fake_api.get_connect()) as aclient:
+                about = await aclient.perform_request(ApiEndpoints.system_settings.meta_about)
+                raw = await aclient.perform_request(
+                    ApiEndpoints.system_settings.meta_about, raw=True
+                )
+                with pytest.raises(ResponseNotOk):
+                    await aclient.perform_request(
+                        ApiEndpoints.assets.count,
+                        request_obj=json_api.assets.CountRequest(),
+                        asset_type="badwolf",
+                    )
+            return about, raw
+
+        about, raw = asyncio.run(main())
+        assert about["Installed Version"] == "6.0.0"
+        assert isinstance(raw, requests.Response)
+
+    def test_gather(self, fake_api):
+        async def main():
+            async with AsyncConnect(connect=fake_api.get_connect(), max_connections=4) as aclient:
+                counts = await asyncio.gather(
+                    aclient.count(asset_type="devices"), aclient.count(asset_type="users")
+                )
+                rows = [x async for x in aclient.get_assets(asset_type="devices", max_rows=3)]
+                sqs = [x async for x in aclient.get_saved_queries(asset_type="devices")]
+                adapters = await aclient.get_adapters_basic()
+            return counts, rows, sqs, adapters
+
+        counts, rows, sqs, adapters = asyncio.run(main())
+        assert counts == [25, 25]
+        assert len(rows) == 3
+        assert all(isinstance(x, dict) and "internal_axon_id" in x for x in rows)
+        assert sqs and all(isinstance(x, json_api.saved_queries.SavedQuery) for x in sqs)
+        assert isinstance(adapters, json_api.adapters.AdaptersList)
+
+    @pytest.mark.parametrize("use_cursor", [True, False])
+    def test_get_pages(self, fake_api, use_cursor):
+        path = "api/devices/fields"
+
+        async def main():
+            aclient = AsyncConnect(connect=fake_api.get_connect())
+            try:
+                await aclient.start()
+                before = fake_api.requests.get(path, 0)
+                pages = [
+                    x
+                    async for x in aclient.get_pages(
+                        asset_type="devices", page_size=10, use_cursor=use_cursor
+                    )
+                ]
+                limited = [x async for x in aclient.get_pages(page_size=10, max_pages=2)]
+                fields_fetched = fake_api.requests.get(path, 0) - before
+            finally:
+                await aclient.close()
+            return pages, limited, fields_fetched
+
+        pages, limited, fields_fetched = asyncio.run(main())
+        assert [x.asset_count_page for x in pages] == [10, 10, 5]
+        assert len({y["internal_axon_id"] for x in pages for y in x.assets}) == 25
+        assert len(limited) == 2
+        assert fields_fetched == 1
+
+    def test_requests_overlap(self, fake_api):
+        """Requests are in flight at the same time without a thread per request."""
+
+        def get_threads():
+            # the fake API server handles each connection in a thread of its own
+            return {x for x in threading.enumerate() if "process_request" not in x.name}
+
+        async def main():
+            async with AsyncConnect(connect=fake_api.get_connect(), max_connections=8) as aclient:
+                await aclient.count()
+                threads = get_threads()
+                loop = asyncio.get_running_loop()
+                start = loop.time()
+                await asyncio.gather(*[aclient.count() for _ in range(8)])
+                return loop.time() - start, get_threads() - threads
+
+        elapsed, new_threads = asyncio.run(main())
+        assert elapsed < 4 * fake_api.server.latency
+        assert not new_threads
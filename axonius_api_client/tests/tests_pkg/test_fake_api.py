@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+"""Test suite for axonius_api_client.tests.fake_api."""
+import pytest
+
+from axonius_api_client.exceptions import ConnectError
+
+from ..fake_api import FakeData, get_axon_id
+
+
+class TestFakeData:
+    def test_deterministic(self):
+        data1 = FakeData(rows=5, seed=1)
+        data2 = FakeData(rows=5, seed=1)
+        assert data1.get_asset("devices", 3) == data2.get_asset("devices", 3)
+        assert data1.get_asset("devices", 3)["internal_axon_id"] == get_axon_id("devices", 3)
+
+    def test_get_assets(self):
+        data = FakeData(rows=5, extra_fields=2)
+        assets = data.get_assets(asset_type="devices", offset=3, limit=10)
+        assert len(assets) == 2
+        assert [x["internal_axon_id"] for x in assets] == [
+            get_axon_id("devices", 3),
+            get_axon_id("devices", 4),
+        ]
+
+
+class TestFakeApi:
+    def test_other_routes(self, fake_api):
+        client = fake_api.get_connect()
+        assert client.users.get(max_rows=2)
+        assert client.devices.saved_query.get()
+        assert client.adapters.get()
+        assert client.devices.labels.add(rows=client.devices.get(max_rows=2), labels=["x"]) == 2
+        assert "x" in client.devices.labels.get()
+
+    def test_bad_keys(self, fake_api):
+        client = fake_api.get_connect(secret="badwolf")
+        with pytest.raises(ConnectError, match="Invalid Credentials"):
+            client.start()
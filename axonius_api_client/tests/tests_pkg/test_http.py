@@ -1,18 +1,36 @@
 # -*- coding: utf-8 -*-
 """Test suite for axonius_api_client.http."""
+import datetime
+import http.server
+import ipaddress
 import logging
+import socket
+import ssl
+import threading
 
 import pytest
 import requests
 
 import urllib3.exceptions
-
-from axonius_api_client.exceptions import HttpError
-from axonius_api_client.http import Http
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+
+from axonius_api_client.exceptions import ConnectError, HttpError
+from axonius_api_client.http import (
+    Http,
+    HttpAdapter,
+    RateLimiter,
+    RetryPolicy,
+    TlsSessionContext,
+    get_keepalive_options,
+)
 from axonius_api_client.projects.url_parser import UrlParser
 from axonius_api_client.projects import cert_human
 from axonius_api_client.version import __version__
 
+from ..fake_api import FakeApi
 from ..meta import (
     TEST_CLIENT_CERT,
     TEST_CLIENT_CERT_NAME,
@@ -28,6 +46,344 @@ from ..utils import (
 InsecureRequestWarning = urllib3.exceptions.InsecureRequestWarning
 
 
+class LocalHandler(http.server.BaseHTTPRequestHandler):
+    """Respond to every request with a small body over a kept-alive connection.
+
+    Requests to /status/<code>/<count> respond with code for the first count requests.
+    """
+
+    protocol_version = "HTTP/1.1"
+    seen = {}
+
+    def respond(self):
+        status = 200
+        headers = {}
+        parts = self.path.strip("/").split("/")
+        if parts[0] == "status":
+            key = self.path
+            self.seen[key] = self.seen.get(key, 0) + 1
+            if self.seen[key] <= int(parts[2]):
+                status = int(parts[1])
+                headers["Retry-After"] = "0"
+
+        body = b"{}"
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = respond
+    do_POST = respond
+
+    def log_message(self, *args, **kwargs):
+        pass
+
+
+class ClosingHandler(LocalHandler):
+    """Respond like :obj:`LocalHandler` and close the connection after every response."""
+
+    protocol_version = "HTTP/1.0"
+
+
+def write_self_signed(path):
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "127.0.0.1")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(minutes=5))
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .add_extension(
+            x509.SubjectAlternativeName(
+                [x509.DNSName("localhost"), x509.IPAddress(ipaddress.ip_address("127.0.0.1"))]
+            ),
+            critical=False,
+        )
+        .add_extension(x509.BasicConstraints(ca=True, path_length=None), critical=True)
+        .sign(key, hashes.SHA256())
+    )
+    cert_path, key_path = path / "cert.pem", path / "key.pem"
+    cert_path.write_bytes(cert.public_bytes(serialization.Encoding.PEM))
+    key_path.write_bytes(
+        key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+    )
+    return cert_path, key_path
+
+
+@pytest.fixture
+def local_url():
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), LocalHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def local_https(tmp_path):
+    cert_path, key_path = write_self_signed(path=tmp_path)
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(certfile=str(cert_path), keyfile=str(key_path))
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), ClosingHandler)
+    server.socket = context.wrap_socket(server.socket, server_side=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"https://127.0.0.1:{server.server_address[1]}", cert_path
+    server.shutdown()
+    server.server_close()
+
+
+class TestHttpPool:
+    """Test Http connection pool settings."""
+
+    def test_defaults(self, local_url):
+        http = Http(url=local_url)
+        assert isinstance(http.ADAPTER, HttpAdapter)
+        assert http.session.get_adapter("https://x") is http.ADAPTER
+        assert http.ADAPTER.socket_options is None
+        assert http.ADAPTER.tls_session_reuse is False
+        assert http.pool_stats["connections_opened"] == 0
+
+    def test_connections_reused(self, local_url):
+        http = Http(url=local_url, pool_maxsize=2, tcp_keepalive=True, tls_session_reuse=True)
+        assert http.ADAPTER._pool_maxsize == 2
+        assert http.ADAPTER.socket_options == get_keepalive_options(
+            idle=http.TCP_KEEPALIVE_IDLE,
+            interval=http.TCP_KEEPALIVE_INTERVAL,
+            count=http.TCP_KEEPALIVE_COUNT,
+        )
+        for _ in range(3):
+            response = http(path="/")
+            assert response.status_code == 200
+        stats = http.pool_stats
+        assert stats["requests"] == 3
+        assert stats["connections_opened"] == 1
+        assert stats["connections_reused"] == 2
+        assert stats["tls_sessions_new"] == 0
+
+    def test_tls_sessions_reused(self, local_https):
+        url, cert_path = local_https
+        http = Http(url=url, certpath=cert_path, tls_session_reuse=True)
+        for _ in range(3):
+            response = http(path="/")
+            assert response.status_code == 200
+        stats = http.pool_stats
+        assert stats["connections_opened"] == 3
+        assert stats["tls_sessions_new"] == 1
+        assert stats["tls_sessions_reused"] == 2
+
+    def test_tls_context_per_pool(self, local_https):
+        url, cert_path = local_https
+        http = Http(url=url, certpath=cert_path, tls_session_reuse=True)
+        assert http(path="/").status_code == 200
+        other = url.replace("127.0.0.1", "localhost")
+        assert http.session.get(other, verify=str(cert_path)).status_code == 200
+        pools = http.ADAPTER.poolmanager.pools
+        contexts = [pools[x].conn_kw["ssl_context"] for x in pools.keys()]
+        assert len(contexts) == 2
+        assert all(isinstance(x, TlsSessionContext) for x in contexts)
+        assert contexts[0] is not contexts[1]
+        assert http.pool_stats["tls_sessions_new"] == 2
+
+    def test_tls_sessions_disabled(self, local_https):
+        url, cert_path = local_https
+        http = Http(url=url, certpath=cert_path)
+        assert http(path="/").status_code == 200
+        assert "tls_sessions_new" not in http.pool_stats
+
+    def test_keepalive_options(self):
+        options = get_keepalive_options(idle=30, interval=5, count=2)
+        assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in options
+        if hasattr(socket, "TCP_KEEPIDLE"):
+            assert (socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 30) in options
+
+
+class TestRetryPolicy:
+    """Test RetryPolicy."""
+
+    def test_backoff_jitter(self):
+        policy = RetryPolicy(backoff=2, backoff_max=5)
+        for attempt in range(1, 6):
+            cap = min(5, 2 * 2 ** (attempt - 1))
+            assert 0 <= policy.get_backoff(attempt=attempt) <= cap
+
+    def test_backoff_no_jitter(self):
+        policy = RetryPolicy(backoff=2, backoff_max=5, jitter=False)
+        assert [policy.get_backoff(attempt=x) for x in range(1, 5)] == [2, 4, 5, 5]
+
+    def test_retry_after(self):
+        policy = RetryPolicy(retry_after_max=30)
+        response = requests.Response()
+        response.headers["Retry-After"] = "12"
+        assert policy.get_backoff(attempt=1, response=response) == 12
+        response.headers["Retry-After"] = "900"
+        assert policy.get_backoff(attempt=1, response=response) == 30
+        response.headers["Retry-After"] = "Wed, 21 Oct 2015 07:28:00 GMT"
+        assert policy.get_retry_after(response=response) == 0
+
+    def test_idempotent(self):
+        policy = RetryPolicy()
+        assert policy.is_idempotent(method="get") is True
+        assert policy.is_idempotent(method="post") is False
+        assert policy.is_idempotent(method="post", idempotent=True) is True
+
+    def test_reason(self):
+        policy = RetryPolicy()
+        response = requests.Response()
+        response.status_code = 502
+        assert policy.get_reason(idempotent=True, response=response) == "502"
+        assert policy.get_reason(idempotent=False, response=response) is None
+        response.status_code = 429
+        assert policy.get_reason(idempotent=False, response=response) == "429"
+        response.status_code = 500
+        assert policy.get_reason(idempotent=True, response=response) is None
+        exc = requests.exceptions.ConnectTimeout()
+        assert policy.get_reason(idempotent=False, exc=exc) == "ConnectTimeout"
+        exc = requests.exceptions.ReadTimeout()
+        assert policy.get_reason(idempotent=False, exc=exc) is None
+
+    def test_total_time(self):
+        policy = RetryPolicy(max_retries=5, backoff=10, jitter=False, total_time=5)
+        response = requests.Response()
+        response.status_code = 503
+        started = policy.start()
+        backoff, msg = policy.get_retry(
+            attempt=1, started=started, idempotent=True, response=response
+        )
+        assert backoff is None
+        assert "budget" in msg
+        assert policy.metrics["budget_exhausted"] == 1
+
+    def test_http_retries_status(self, local_url):
+        policy = RetryPolicy(max_retries=3, backoff=0)
+        http = Http(url=local_url, retry_policy=policy)
+        response = http(path="/status/503/2/a")
+        assert response.status_code == 200
+        metrics = policy.metrics
+        assert metrics["requests"] == 1
+        assert metrics["attempts"] == 3
+        assert metrics["retries"] == 2
+        assert metrics["retries_by_reason"] == {"503": 2}
+
+    def test_http_gives_up(self, local_url):
+        policy = RetryPolicy(max_retries=2, backoff=0)
+        http = Http(url=local_url, retry_policy=policy)
+        response = http(path="/status/502/5/b")
+        assert response.status_code == 502
+        assert policy.metrics["gave_up"] == 1
+
+    def test_http_not_idempotent(self, local_url):
+        policy = RetryPolicy(max_retries=3, backoff=0)
+        http = Http(url=local_url, retry_policy=policy)
+        response = http(path="/status/502/1/c", method="post")
+        assert response.status_code == 502
+        assert policy.metrics["retries"] == 0
+        response = http(path="/status/502/1/d", method="post", idempotent=True)
+        assert response.status_code == 200
+        assert policy.metrics["retries"] == 1
+
+    def test_http_default(self):
+        http = Http(url="https://127.0.0.1:9", max_retries=4, retry_backoff=2)
+        assert isinstance(http.RETRY_POLICY, RetryPolicy)
+        assert http.RETRY_POLICY.max_retries == 4
+        assert http.RETRY_POLICY.backoff == 2
+        assert http.MAX_RETRIES == 4
+        assert http.RETRY_BACKOFF == 2
+
+        policy = RetryPolicy(max_retries=7, backoff=1)
+        http = Http(url="https://127.0.0.1:9", max_retries=4, retry_backoff=2, retry_policy=policy)
+        assert http.RETRY_POLICY is policy
+        assert http.MAX_RETRIES == 7
+        assert http.RETRY_BACKOFF == 1
+
+    def test_error_retried(self):
+        with FakeApi(rows=5, error_every=2) as server:
+            client = server.get_connect(retry_policy=RetryPolicy(max_retries=3, backoff=0))
+            assert len(client.devices.get()) == 5
+            assert client.http.RETRY_POLICY.metrics["retries"]
+
+    def test_error_not_retried(self):
+        with FakeApi(rows=5, error_rate=1, error_status=500) as server:
+            client = server.get_connect(max_retries=0)
+            with pytest.raises(ConnectError):
+                client.start()
+
+
+class TestRateLimiter:
+    """Test RateLimiter."""
+
+    def test_burst_then_wait(self):
+        limiter = RateLimiter(rate=20, burst=2, adaptive=False)
+        assert limiter.acquire() < 0.01
+        assert limiter.acquire() < 0.01
+        assert limiter.acquire() > 0.02
+        assert limiter.metrics["requests"] == 3
+        assert limiter.metrics["waits"] == 1
+
+    def test_decrease_on_429(self):
+        limiter = RateLimiter(rate=10, rate_min=2, decrease=0.5, cooldown=0)
+        response = requests.Response()
+        response.status_code = 429
+        limiter.release(latency=0.1, response=response)
+        assert limiter.rate == 5
+        limiter.release(latency=0.1, exc=requests.exceptions.ConnectionError())
+        assert limiter.rate == 2.5
+        limiter.release(latency=0.1, response=response)
+        assert limiter.rate == 2
+        assert limiter.metrics["decreases"] == 3
+
+    def test_cooldown(self):
+        limiter = RateLimiter(rate=10, decrease=0.5, cooldown=60)
+        response = requests.Response()
+        response.status_code = 503
+        limiter.release(latency=0.1, response=response)
+        limiter.release(latency=0.1, response=response)
+        assert limiter.rate == 5
+
+    def test_increase_and_latency(self):
+        limiter = RateLimiter(rate=10, rate_max=10.2, increase=1, latency_target=1, cooldown=0)
+        response = requests.Response()
+        response.status_code = 200
+        limiter.release(latency=0.1, response=response)
+        assert limiter.rate == 10.1
+        limiter.release(latency=0.1, response=response)
+        limiter.release(latency=0.1, response=response)
+        assert limiter.rate == 10.2
+        limiter.release(latency=2, response=response)
+        assert limiter.rate == 5.1
+
+    def test_max_concurrent(self):
+        limiter = RateLimiter(rate=1000, burst=10, max_concurrent=1)
+        limiter.acquire()
+        assert limiter.semaphore.acquire(blocking=False) is False
+        limiter.release(latency=0.1)
+        assert limiter.semaphore.acquire(blocking=False) is True
+
+    def test_http_shared(self, local_url):
+        limiter = RateLimiter(rate=50, burst=1)
+        http1 = Http(url=local_url, rate_limiter=limiter)
+        http2 = Http(url=local_url, rate_limiter=limiter)
+        assert http1(path="/").status_code == 200
+        assert http2(path="/").status_code == 200
+        assert http1(path="/status/503/1/e").status_code == 200
+        metrics = limiter.metrics
+        assert metrics["requests"] == 4
+        assert metrics["waits"] >= 1
+        assert metrics["decreases"] == 1
+
+
 class TestHttp:
     """Test Http."""
 
@@ -26,6 +26,8 @@ from axonius_api_client.setup_env import (
     get_env_csv,
     get_env_extra_warn,
     get_env_features,
+    get_env_int,
+    get_env_json_codec,
     get_env_path,
     get_env_str,
     get_env_user_agent,
@@ -150,6 +152,18 @@ class TestGetEnvUserAgent:
         assert ret == "abc"
 
 
+class TestGetEnvJsonCodec:
+    def test_default(self, monkeypatch):
+        monkeypatch.delenv("AX_JSON_CODEC", raising=False)
+        ret = get_env_json_codec()
+        assert ret == "auto"
+
+    def test_default_set(self, monkeypatch):
+        monkeypatch.setenv("AX_JSON_CODEC", "ORJSON")
+        ret = get_env_json_codec()
+        assert ret == "orjson"
+
+
 class TestGetEnvExtraWarn:
     def test_default(self, monkeypatch):
         ret = get_env_extra_warn()
@@ -212,6 +226,23 @@ class TestGetEnvBool:
         assert ret is True
 
 
+class TestGetEnvInt:
+    def test_set(self, monkeypatch):
+        monkeypatch.setenv("AX_TEST", "20")
+        ret = get_env_int("AX_TEST")
+        assert ret == 20
+
+    def test_default(self, monkeypatch):
+        monkeypatch.delenv("AX_TEST", raising=False)
+        ret = get_env_int("AX_TEST", default="10")
+        assert ret == 10
+
+    def test_err(self, monkeypatch):
+        monkeypatch.setenv("AX_TEST", "x")
+        with pytest.raises(ValueError):
+            get_env_int("AX_TEST")
+
+
 def del_connect_envs(monkeypatch):
     """Clear all connect envs."""
     for k, v in CONNECT_SCHEMAS.items():
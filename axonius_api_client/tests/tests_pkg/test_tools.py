@@ -1,18 +1,24 @@
 # -*- coding: utf-8 -*-
 """Test suite for axonius_api_client."""
 import codecs
+import importlib.util
 import io
 import tempfile
+import threading
 from datetime import timezone
 
 import dateutil.tz
 import pytest
+import requests
 
 from axonius_api_client.api.json_api.generic import IntValue
 from axonius_api_client.constants.api import GUI_PAGE_SIZES
 from axonius_api_client.constants.general import IS_WINDOWS
 from axonius_api_client.exceptions import ToolsError
 from axonius_api_client.tools import (
+    JsonCodec,
+    Profiler,
+    ThreadedWriter,
     bom_strip,
     calc_perc_gb,
     calc_percent,
@@ -41,7 +47,9 @@ from axonius_api_client.tools import (
     get_backup_filename,
     get_backup_path,
     get_cls_path,
+    get_json_codec,
     get_path,
+    get_profiler,
     get_paths_format,
     get_raw_version,
     get_type_str,
@@ -58,6 +66,7 @@ from axonius_api_client.tools import (
     kv_dump,
     listify,
     longest_str,
+    open_compressed,
     parse_int_min_max,
     parse_ip_address,
     parse_ip_network,
@@ -67,6 +76,7 @@ from axonius_api_client.tools import (
     path_write,
     pathlib,
     prettify_obj,
+    profile_stage,
     read_stream,
     split_str,
     strip_left,
@@ -74,6 +84,7 @@ from axonius_api_client.tools import (
     strip_str,
     sysinfo,
     token_parse,
+    use_profiler,
 )
 
 BOM_BYTES = codecs.BOM_UTF8
@@ -1223,6 +1234,73 @@ class TestJsonDump:
         ret = json_dump(obj)
         assert ret.splitlines() == exp
 
+    def test_codec(self):
+        obj = {"x": [1, {"y": None}]}
+        assert json_dump(obj, codec=JsonCodec()) == json_dump(obj)
+
+
+class TestJsonCodec:
+    @pytest.fixture(params=["json", "orjson"])
+    def codec(self, request):
+        if request.param == "orjson":
+            pytest.importorskip("orjson")
+        return get_json_codec(codec=request.param)
+
+    def test_name(self, codec, request):
+        assert codec.NAME == request.node.callspec.params["codec"]
+        assert get_json_codec(codec=codec) is codec
+
+    def test_dumps_indent(self, codec):
+        obj = [{"x": [1, 2.5, True, None], "y": {"z": "v"}}, {}]
+        for indent in [None, 2, 4]:
+            exp = JsonCodec().dumps(obj=obj, indent=indent)
+            assert codec.loads(codec.dumps(obj=obj, indent=indent)) == obj
+            if indent:
+                assert codec.dumps(obj=obj, indent=indent) == exp
+
+    def test_dumps_serial(self, codec):
+        class Moofasa:
+            def to_dict(self):
+                return {"x": "v"}
+
+        now = datetime.datetime.now(timezone.utc)
+        obj = {"now": now, "has_dict": Moofasa(), "fallback": json_dump, 1: 2**70}
+        exp = {
+            "now": now.isoformat(),
+            "has_dict": {"x": "v"},
+            "fallback": str(json_dump),
+            "1": 2**70,
+        }
+        assert codec.loads(codec.dumps(obj=obj)) == exp
+
+    def test_dumps_sort_keys(self, codec):
+        assert codec.dumps(obj={"b": 1, "a": 2}, sort_keys=True, indent=2) == (
+            '{\n  "a": 2,\n  "b": 1\n}'
+        )
+
+    def test_dumps_no_fallback(self, codec):
+        with pytest.raises(TypeError):
+            codec.dumps(obj={"x": object()}, fallback=None)
+
+    def test_loads_response(self, codec):
+        response = requests.Response()
+        response._content = b'{"x": [1, NaN]}'
+        response.encoding = "utf-8"
+        data = codec.loads_response(response)
+        assert data["x"][0] == 1
+
+    def test_env(self, monkeypatch):
+        monkeypatch.setenv("AX_JSON_CODEC", "json")
+        assert get_json_codec().NAME == "json"
+
+    def test_auto(self):
+        exp = "orjson" if importlib.util.find_spec("orjson") else "json"
+        assert get_json_codec(codec="auto").NAME == exp
+
+    def test_invalid(self):
+        with pytest.raises(ToolsError, match="Invalid JSON codec"):
+            get_json_codec(codec="badwolf")
+
 
 class TestDtParseTmpl:
     def test_valid(self):
@@ -1499,3 +1577,91 @@ class TestGetPathsFormat:
         exp = pathlib.Path("/x/xxx/z/ddd_xxx.txt")
         ret = get_paths_format("/x", "{DATE}", "z", "ddd_{DATE}.txt", mapping={"{DATE}": "xxx"})
         assert exp == ret
+
+
+class TestProfiler:
+    def test_stage(self):
+        profiler = Profiler()
+        for _ in range(3):
+            with profiler.stage(name="a"):
+                pass
+        profiler.add(name="b", seconds=5, calls=2)
+        metrics = profiler.metrics
+        assert list(metrics["stages"]) == ["b", "a"]
+        assert metrics["stages"]["a"]["calls"] == 3
+        assert metrics["stages"]["b"]["seconds_per_call"] == 2.5
+        assert json_load(profiler.to_json())["stages"]["b"]["calls"] == 2
+        assert len(profiler.to_lines()) == 3
+
+    def test_stage_exception(self):
+        profiler = Profiler()
+        with pytest.raises(ValueError):
+            with profiler.stage(name="a"):
+                raise ValueError("x")
+        assert profiler.metrics["stages"]["a"]["calls"] == 1
+        profiler.reset()
+        assert profiler.metrics["stages"] == {}
+
+    def test_profile_stage(self):
+        profiler = Profiler()
+        with profile_stage(profiler=profiler, name="a"):
+            pass
+        with profile_stage(profiler=None, name="b"):
+            pass
+        assert list(profiler.metrics["stages"]) == ["a"]
+
+    def test_use_profiler(self):
+        profiler = Profiler()
+        seen = []
+        assert get_profiler() is None
+        with use_profiler(profiler):
+            assert get_profiler() is profiler
+            thread = threading.Thread(target=lambda: seen.append(get_profiler()))
+            thread.start()
+            thread.join()
+        assert get_profiler() is None
+        assert seen == [None]
+
+
+class TestOpenCompressed:
+    @pytest.mark.parametrize("method", ["gzip", "bz2", "xz", "zstd"])
+    def test_round_trip(self, tmp_path, method):
+        if method == "zstd":
+            pytest.importorskip("zstandard")
+        path = tmp_path / f"data.{method}"
+        with open_compressed(path=path, method=method, level=1) as fh:
+            fh.write(b"data\n" * 100)
+        assert path.stat().st_size < 500
+        with open_compressed(path=path, method=method, mode="rb") as fh:
+            assert fh.read() == b"data\n" * 100
+
+    def test_invalid(self, tmp_path):
+        with pytest.raises(ToolsError):
+            open_compressed(path=tmp_path / "data", method="rar")
+
+
+class TestThreadedWriter:
+    def test_write(self):
+        fh = io.BytesIO()
+        fh_close = fh.close
+        fh.close = lambda: None
+        stream = ThreadedWriter(stream=fh, max_chunks=2)
+        for _ in range(10):
+            assert stream.write(b"ab") == 2
+        stream.close()
+        assert stream.closed
+        assert fh.getvalue() == b"ab" * 10
+        fh_close()
+
+    def test_error(self):
+        class Broken(io.RawIOBase):
+            def writable(self):
+                return True
+
+            def write(self, data):
+                raise ValueError("broken")
+
+        stream = ThreadedWriter(stream=Broken())
+        stream.write(b"ab")
+        with pytest.raises(ValueError, match="broken"):
+            stream.close()
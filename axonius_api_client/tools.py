@@ -1,18 +1,25 @@
 """Utilities and tools."""
+import bz2
 import codecs
 import contextlib
+import contextvars
 import csv
 import dataclasses
 import datetime
+import gzip
 import inspect
 import io
 import ipaddress
 import json
 import logging
+import lzma
 import pathlib
 import platform
+import queue
 import re
 import sys
+import threading
+import time
 import types
 import typing as t
 import uuid
@@ -38,6 +45,8 @@ from .constants.ctypes import (
     TypeFloat,
 )
 from .constants.general import (
+    COMPRESS_LEVELS,
+    COMPRESS_SUFFIXES,
     DAYS_MAP,
     DEBUG_ARGS,
     DEBUG_TMPL,
@@ -62,7 +71,7 @@ from .constants.general import (
 )
 from .constants.logs import MAX_BODY_LEN
 from .exceptions import FormatError, ToolsError
-from .setup_env import find_dotenv, get_env_ax
+from .setup_env import find_dotenv, get_env_ax, get_env_json_codec
 
 LOG: logging.Logger = logging.getLogger(PACKAGE_ROOT).getChild("tools")
 
@@ -477,6 +486,7 @@ def json_dump(
     fallback: t.Any = str,
     to_dict: bool = True,
     cls: t.Type = AxJSONEncoder,
+    codec: t.Optional["JsonCodec"] = None,
     **kwargs,
 ) -> t.Any:
     """Serialize an object into json str.
@@ -486,6 +496,7 @@ def json_dump(
         indent: json str indent level
         sort_keys: sort dict keys
         error: if json error happens, raise it
+        codec: JSON codec to serialize with, ignored if cls or kwargs are supplied
         **kwargs: passed to :func:`json.dumps`
     """
     obj = bytes_to_str(value=obj)
@@ -494,6 +505,8 @@ def json_dump(
         obj = obj.to_dict()
 
     try:
+        if codec is not None and cls is AxJSONEncoder and not kwargs:
+            return codec.dumps(obj=obj, indent=indent, sort_keys=sort_keys, fallback=fallback)
         return json.dumps(
             obj,
             indent=indent,
@@ -508,6 +521,188 @@ def json_dump(
         return obj
 
 
+def json_default(obj: t.Any, fallback: t.Any = str) -> t.Any:
+    """Serialize an object that JSON does not support the same way :class:`AxJSONEncoder` does.
+
+    Args:
+        obj: object to serialize
+        fallback: callable to serialize objects that are not datetimes and have no to_dict
+    """
+    if isinstance(obj, datetime.datetime):
+        return obj.isoformat()
+
+    if has_to_dict(obj):
+        return obj.to_dict()
+
+    if callable(fallback):
+        return fallback(obj)
+
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class JsonCodec:
+    """JSON codec using the standard library :mod:`json` module."""
+
+    NAME: str = "json"
+    """name of this codec"""
+
+    def loads(self, value: t.Union[str, bytes]) -> t.Any:
+        """Deserialize a JSON str into an object.
+
+        Args:
+            value: JSON str to deserialize
+        """
+        return json.loads(value)
+
+    def loads_response(self, response: t.Any) -> t.Any:
+        """Deserialize the JSON body of a response.
+
+        Args:
+            response: :obj:`requests.Response` to deserialize the body of
+        """
+        return response.json()
+
+    def dumps(
+        self,
+        obj: t.Any,
+        indent: t.Optional[int] = None,
+        sort_keys: bool = False,
+        fallback: t.Any = str,
+    ) -> str:
+        """Serialize an object into a JSON str using the semantics of :class:`AxJSONEncoder`.
+
+        Args:
+            obj: object to serialize
+            indent: JSON str indent level
+            sort_keys: sort dict keys
+            fallback: callable to serialize objects that are not datetimes and have no to_dict
+        """
+        return json.dumps(
+            obj, indent=indent, sort_keys=sort_keys, cls=AxJSONEncoder, fallback=fallback
+        )
+
+    def __repr__(self) -> str:
+        """Pass."""
+        return f"{self.__class__.__name__}(name={self.NAME!r})"
+
+
+class OrjsonCodec(JsonCodec):
+    """JSON codec using the ``orjson`` package.
+
+    Notes:
+        Output is valid JSON but not byte for byte the same as :class:`JsonCodec`, non-ASCII
+        characters are not escaped and no spaces are added after separators. Indent levels
+        other than 2 and ints larger than 64 bits are serialized with :class:`JsonCodec`.
+    """
+
+    NAME: str = "orjson"
+    """name of this codec"""
+
+    def __init__(self):
+        """Import orjson."""
+        import orjson
+
+        self._orjson = orjson
+        self._option: int = (
+            orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+            | orjson.OPT_NON_STR_KEYS
+        )
+
+    def loads(self, value: t.Union[str, bytes]) -> t.Any:
+        """Deserialize a JSON str into an object.
+
+        Args:
+            value: JSON str to deserialize
+        """
+        return self._orjson.loads(value)
+
+    def loads_response(self, response: t.Any) -> t.Any:
+        """Deserialize the JSON body of a response.
+
+        Args:
+            response: :obj:`requests.Response` to deserialize the body of
+        """
+        try:
+            return self._orjson.loads(response.content)
+        except self._orjson.JSONDecodeError:
+            # let requests handle what orjson rejects, i.e. NaN or other encodings
+            return response.json()
+
+    def dumps(
+        self,
+        obj: t.Any,
+        indent: t.Optional[int] = None,
+        sort_keys: bool = False,
+        fallback: t.Any = str,
+    ) -> str:
+        """Serialize an object into a JSON str using the semantics of :class:`AxJSONEncoder`.
+
+        Args:
+            obj: object to serialize
+            indent: JSON str indent level
+            sort_keys: sort dict keys
+            fallback: callable to serialize objects that are not datetimes and have no to_dict
+        """
+        if indent not in (None, 2):
+            return super().dumps(obj=obj, indent=indent, sort_keys=sort_keys, fallback=fallback)
+
+        orjson = self._orjson
+        option = self._option
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+
+        try:
+            value = orjson.dumps(
+                obj, default=lambda x: json_default(obj=x, fallback=fallback), option=option
+            )
+        except TypeError:
+            return super().dumps(obj=obj, indent=indent, sort_keys=sort_keys, fallback=fallback)
+        return value.decode("utf-8")
+
+
+JSON_CODECS: t.Dict[str, t.Type[JsonCodec]] = {
+    JsonCodec.NAME: JsonCodec,
+    OrjsonCodec.NAME: OrjsonCodec,
+}
+"""Map of JSON codec names to codec classes, from slowest to fastest."""
+
+
+def get_json_codec(codec: t.Optional[t.Union[str, JsonCodec]] = None) -> JsonCodec:
+    """Get a JSON codec.
+
+    Args:
+        codec: codec object or name of codec from :data:`JSON_CODECS`, or 'auto' to use the
+            fastest installed codec, if not supplied will be taken from the OS env var
+            :data:`axonius_api_client.setup_env.KEY_JSON_CODEC`
+
+    Raises:
+        :exc:`ToolsError`: if codec is an invalid name or the codec's package is not installed
+    """
+    if isinstance(codec, JsonCodec):
+        return codec
+
+    name = codec if isinstance(codec, str) and codec.strip() else get_env_json_codec()
+    name = name.strip().lower()
+
+    if name == "auto":
+        for cls in reversed(list(JSON_CODECS.values())):
+            try:
+                return cls()
+            except ImportError:
+                continue
+
+    if name not in JSON_CODECS:
+        raise ToolsError(f"Invalid JSON codec {name!r}, valid codecs: {['auto', *JSON_CODECS]}")
+
+    try:
+        return JSON_CODECS[name]()
+    except ImportError as exc:
+        raise ToolsError(f"JSON codec {name!r} is not installed: {exc}") from exc
+
+
 def lens(value: t.Any) -> t.Optional[int]:
     """Pass."""
     try:
@@ -2798,3 +2993,264 @@ def coerce_date_delta(
         parsed = parsed or dt_now()
         parsed -= subtract
     return parsed
+
+
+class Profiler:
+    """Thread safe tracker of cumulative seconds and call counts for named stages.
+
+    Examples:
+        >>> profiler = Profiler()
+        >>> with profiler.stage("parse"):
+        ...     parse()
+        >>> profiler.metrics["stages"]["parse"]["calls"]
+        1
+
+    Notes:
+        Stages timed in more than one thread at once (i.e. when fetching pages with workers)
+        add up their seconds, so the seconds of a stage can be more than the wall seconds.
+    """
+
+    def __init__(self):
+        """Thread safe tracker of cumulative seconds and call counts for named stages."""
+        self.lock: threading.Lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Reset all stages and the wall clock."""
+        with self.lock:
+            self.stages: t.Dict[str, t.List[t.Union[int, float]]] = {}
+            self.started: float = time.perf_counter()
+
+    def add(self, name: str, seconds: float, calls: int = 1):
+        """Add seconds and calls to a stage.
+
+        Args:
+            name: name of stage
+            seconds: seconds to add
+            calls: calls to add
+        """
+        with self.lock:
+            totals = self.stages.setdefault(name, [0, 0.0])
+            totals[0] += calls
+            totals[1] += seconds
+
+    @contextlib.contextmanager
+    def stage(self, name: str) -> t.Generator[None, None, None]:
+        """Time the body of a with block as one call of a stage.
+
+        Args:
+            name: name of stage
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name=name, seconds=time.perf_counter() - started)
+
+    @property
+    def metrics(self) -> dict:
+        """Get the wall seconds and the calls and seconds of each stage, slowest first."""
+        with self.lock:
+            items = sorted(self.stages.items(), key=lambda x: x[1][1], reverse=True)
+            wall = time.perf_counter() - self.started
+        stages = {
+            name: {"calls": calls, "seconds": seconds, "seconds_per_call": seconds / calls}
+            for name, (calls, seconds) in items
+        }
+        return {"wall_seconds": wall, "stages": stages}
+
+    def to_json(self, **kwargs) -> str:
+        """Get :attr:`metrics` as JSON.
+
+        Args:
+            **kwargs: passed to :func:`json_dump`
+        """
+        return json_dump(obj=self.metrics, **kwargs)
+
+    def to_lines(self) -> t.List[str]:
+        """Get :attr:`metrics` as a list of aligned strs."""
+        metrics = self.metrics
+        lines = [f"Wall seconds: {metrics['wall_seconds']:.3f}"]
+        longest = longest_str(list(metrics["stages"]) or [""])
+        for name, stage in metrics["stages"].items():
+            lines.append(
+                f"{name:{longest}} {stage['seconds']:10.3f} seconds"
+                f" {stage['calls']:>9} calls {stage['seconds_per_call'] * 1000:10.4f} ms/call"
+            )
+        return lines
+
+    def __str__(self) -> str:
+        """Pass."""
+        return f"{self.__class__.__name__}(stages={len(self.stages)})"
+
+    def __repr__(self) -> str:
+        """Pass."""
+        return self.__str__()
+
+
+PROFILER_CONTEXT: contextvars.ContextVar = contextvars.ContextVar("profiler", default=None)
+"""Profiler of the fetch sending requests in the current thread, see :func:`use_profiler`."""
+
+
+def get_profiler() -> t.Optional[Profiler]:
+    """Get the profiler set by :func:`use_profiler` in the current thread, if any."""
+    return PROFILER_CONTEXT.get()
+
+
+@contextlib.contextmanager
+def use_profiler(profiler: t.Optional[Profiler]) -> t.Generator[None, None, None]:
+    """Time the requests sent in the body of a with block using a profiler.
+
+    Notes:
+        The profiler is set in a context variable, so it only applies to the current thread
+        and fetches running in other threads at the same time do not share it.
+
+    Args:
+        profiler: profiler to time requests with, if None requests are not timed
+    """
+    token: contextvars.Token = PROFILER_CONTEXT.set(profiler)
+    try:
+        yield
+    finally:
+        PROFILER_CONTEXT.reset(token)
+
+
+def profile_stage(profiler: t.Optional[Profiler], name: str) -> t.ContextManager:
+    """Get a context manager that times a stage if a profiler is supplied.
+
+    Args:
+        profiler: profiler to time the stage with, if None nothing is timed
+        name: name of stage
+    """
+    if isinstance(profiler, Profiler):
+        return profiler.stage(name=name)
+    return contextlib.nullcontext()
+
+
+def get_compress_suffix(method: str) -> str:
+    """Get the file name suffix for a compression method.
+
+    Args:
+        method: compression method, one of :data:`COMPRESS_SUFFIXES`
+
+    Raises:
+        :exc:`ToolsError`: if method is not a valid compression method
+    """
+    if method not in COMPRESS_SUFFIXES:
+        raise ToolsError(
+            f"Invalid compression method {method!r}, valids: {list(COMPRESS_SUFFIXES)}"
+        )
+    return COMPRESS_SUFFIXES[method]
+
+
+def open_compressed(
+    path: PathLike, method: str, level: t.Optional[int] = None, mode: str = "wb"
+) -> t.BinaryIO:
+    """Open a file as a binary stream that is compressed using a compression method.
+
+    Args:
+        path: path of file to open
+        method: compression method, one of :data:`COMPRESS_SUFFIXES`
+        level: compression level to use, default from :data:`COMPRESS_LEVELS` if None
+        mode: 'wb' or 'rb'
+
+    Raises:
+        :exc:`ToolsError`: if method is not a valid compression method or method is 'zstd'
+            and the zstandard package is not installed
+    """
+    get_compress_suffix(method=method)
+    path = str(get_path(obj=path))
+    level = COMPRESS_LEVELS[method] if level is None else level
+    writing = mode.startswith("w")
+
+    if method == "gzip":
+        return gzip.open(path, mode, compresslevel=level) if writing else gzip.open(path, mode)
+    if method == "bz2":
+        return bz2.open(path, mode, compresslevel=level) if writing else bz2.open(path, mode)
+    if method == "xz":
+        return lzma.open(path, mode, preset=level) if writing else lzma.open(path, mode)
+
+    try:
+        import zstandard
+    except ImportError:  # pragma: no cover
+        raise ToolsError("Compression method 'zstd' requires the 'zstandard' package")
+
+    if writing:
+        return zstandard.open(path, mode, cctx=zstandard.ZstdCompressor(level=level))
+    return zstandard.open(path, mode)
+
+
+class ThreadedWriter(io.RawIOBase):
+    """Binary stream that writes to another binary stream in a background thread.
+
+    Examples:
+        Compress data in a background thread while the calling thread does other work
+
+        >>> stream = ThreadedWriter(stream=open_compressed(path="data.gz", method="gzip"))
+        >>> stream.write(b"data")
+        4
+        >>> stream.close()
+
+    Notes:
+        The compressors from the standard library release the GIL, so writing to a compressed
+        stream in a background thread lets compression overlap with other work.
+    """
+
+    def __init__(self, stream: t.BinaryIO, max_chunks: int = 16):
+        """Binary stream that writes to another binary stream in a background thread.
+
+        Args:
+            stream: stream to write to, will be closed when this stream is closed
+            max_chunks: number of writes to queue before a write blocks
+        """
+        super().__init__()
+        self.stream: t.BinaryIO = stream
+        self.error: t.Optional[Exception] = None
+        self.queue: queue.Queue = queue.Queue(maxsize=max_chunks)
+        self.thread: threading.Thread = threading.Thread(
+            target=self._run, name="axonius_threaded_writer", daemon=True
+        )
+        self.thread.start()
+
+    def writable(self) -> bool:
+        """Pass."""
+        return True
+
+    def write(self, data: bytes) -> int:
+        """Queue data to be written by the background thread.
+
+        Args:
+            data: data to write
+        """
+        self._check_error()
+        self.queue.put(bytes(data))
+        return len(data)
+
+    def close(self):
+        """Wait for the background thread to write all queued data and close the stream."""
+        if self.closed:
+            return
+        self.queue.put(None)
+        self.thread.join()
+        try:
+            self.stream.close()
+        finally:
+            super().close()
+        self._check_error()
+
+    def _run(self):
+        """Write queued data to the stream until None is queued."""
+        while True:
+            data = self.queue.get()
+            if data is None:
+                break
+            if self.error is None:
+                try:
+                    self.stream.write(data)
+                except Exception as exc:
+                    self.error = exc
+
+    def _check_error(self):
+        """Raise the error that the background thread got while writing, if any."""
+        if self.error is not None:
+            raise self.error